@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""
+ATEMAsyncMax: Blackmagic ATEM switcher manager class for asyncio applications.
+Part of the PyATEMMax library.
+"""
+
+# pylint: disable=protected-access
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
+
+import asyncio
+import functools
+import logging
+import socket
+import time
+
+from .ATEMCommandQueue import ATEMCommandConfirmation
+from .ATEMEventQueue import ATEMEventSubscription
+from .ATEMMax import ATEMMaxBase
+from .ATEMSetterMethods import ATEMSetterMethods
+from .ATEMSocket import ATEMUDPSocket
+from .ATEMUtils import hexStr
+
+
+class ATEMAsyncUDPSocket(ATEMUDPSocket, asyncio.DatagramProtocol):
+    """
+    UDP socket living in an asyncio datagram endpoint.
+
+    Datagrams are pushed by the event loop (no polling) and handed to the
+    switcher object through the same buffer interface as ATEMUDPSocket.
+    """
+
+    def __init__(self, switcher: 'ATEMAsyncMax'):
+        """Create a ATEMAsyncUDPSocket object.
+
+        Args:
+            switcher (ATEMAsyncMax): switcher object to notify on datagram reception
+        """
+
+        self._switcher = switcher
+        self._transport: Optional[asyncio.DatagramTransport] = None
+
+        super().__init__()
+
+
+    def _openSocket(self) -> Optional[socket.socket]:
+        """The endpoint socket is created by the event loop"""
+
+        return None
+
+
+    def connect(self, ip: str) -> None:
+        """The endpoint is connected by ATEMAsyncMax.connect()"""
+
+        self.connected = self._transport is not None
+
+
+    def stop(self) -> Any:
+        """Close the endpoint."""
+
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+        self.connected = False
+        self.flushInputBuffer()
+
+
+    def parsePacket(self) -> int:
+        """Datagrams are pushed by the event loop, just report what's left."""
+
+        return self.available()
+
+
+    def write(self, payload: Union[List[int], bytes], length: Optional[int] =None):
+        """Send data to the switcher."""
+
+        if self._transport is None:
+            return 0
+
+        outbuf = bytes(payload) if isinstance(payload, List) else payload
+        outbuf = outbuf[:length] if length else outbuf
+
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"Sending buffer [{hexStr(outbuf)}]")
+        self._transport.sendto(outbuf)
+        return len(outbuf)
+
+
+    # #######################################################################
+    #
+    #  asyncio.DatagramProtocol
+    #
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        # The event loop datagram transports don't subclass asyncio.DatagramTransport
+        self._transport = cast(asyncio.DatagramTransport, transport)
+
+
+    def loadDatagram(self, data: bytes) -> int:
+        """Put a datagram in the buffer (to be read again)"""
+
+        self._bufferView = memoryview(data)
+        self._bufferLen = len(data)
+        self._bufferPos = 0
+        return self.available()
+
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        self._bufferView = memoryview(data)
+        self._bufferLen = len(data)
+        self._bufferPos = 0
+
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"Received {self._bufferLen} new bytes [{hexStr(data)}]")
+
+        self._switcher._onDatagram()
+
+
+    def error_received(self, exc: Exception) -> None:
+        self.log.debug(f"Socket error: {exc}")
+
+
+class ATEMAsyncMax(ATEMMaxBase):
+    """Blackmagic ATEM switcher manager for asyncio applications
+
+    Works like ATEMMax (same state data, set/exec methods and events), but
+    runs on the asyncio event loop instead of using its own comms and event
+    threads, so any number of switchers can share a single event loop.
+
+    connect(), ping(), waitForConnection() and all set/exec methods are
+    coroutines. Event callbacks are called from the event loop; coroutine
+    callbacks are scheduled as tasks. set/exec methods return command
+    confirmations that can be awaited with waitAsync().
+    """
+
+    def __init__(self):
+        """Create a new ATEMAsyncMax object."""
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timeoutCheck: Optional[asyncio.TimerHandle] = None
+        self._commandCheck: Optional[asyncio.TimerHandle] = None
+        self._packetRequestCheck: Optional[asyncio.TimerHandle] = None
+        self._aliveEvent: Optional[asyncio.Event] = None
+        self._connectedEvent: Optional[asyncio.Event] = None
+
+        # UDP communication object (the datagram endpoint protocol, also in _udp)
+        self._asyncUDP: ATEMAsyncUDPSocket = ATEMAsyncUDPSocket(self)
+
+        super().__init__()
+
+
+    def _createUDPSocket(self) -> ATEMUDPSocket:
+        """Create the UDP communication object"""
+
+        return self._asyncUDP
+
+
+    async def ping(self, ip: str, timeout: int =5) -> None:
+        """Ping the switcher.
+
+        Args:
+            ip (str): IP address of the switcher
+            timeout (int): timeout (seconds)
+        """
+
+        await self.connect(ip, timeout, pingMode=True)
+
+
+    async def connect(self, ip: str, connTimeout: int =5, pingMode: bool = False) -> None:
+        """Connect to the switcher.
+
+        Returns as soon as the HELLO packet is sent, use waitForConnection()
+        to wait for the switcher.
+
+        Args:
+            ip (str): IP address of the switcher
+            connTimeout (int): connection timeout (seconds)
+            pingMode (bool): connect in "ping" mode? (ignore data, just wait for UDP conn)
+        """
+
+        if self.started:
+            self.log.debug("Closing previous connection")
+            self.disconnect()
+
+        self._prepareConnection(ip, connTimeout, pingMode)
+
+        loop = self._loop = asyncio.get_event_loop()
+        self._aliveEvent = asyncio.Event()
+        self._connectedEvent = asyncio.Event()
+
+        await loop.create_datagram_endpoint(
+            lambda: self._asyncUDP, remote_addr=(ip, self.atem.UDPPort))
+        self.started = True
+
+        self._neverConnected = False
+        self._connect()
+        self._scheduleTimeoutCheck()
+
+
+    def disconnect(self) -> None:
+        """Close the connection with the switcher."""
+
+        if not self.started:
+            return
+
+        self.log.debug("Stopping connection")
+
+        if self._timeoutCheck is not None:
+            self._timeoutCheck.cancel()
+            self._timeoutCheck = None
+
+        if self._commandCheck is not None:
+            self._commandCheck.cancel()
+            self._commandCheck = None
+
+        if self._packetRequestCheck is not None:
+            self._packetRequestCheck.cancel()
+            self._packetRequestCheck = None
+
+        self._udp.stop()
+        self._discardCommands()
+        self._resetInternalData()
+
+
+    async def waitForConnection(self, infinite: bool =True, timeout: float =0.0, waitForFullHandshake: bool =True) -> bool:
+        """Waits until the switcher initializes.
+
+        Args:
+            infinite (bool, default=True): Infinite wait?
+            timeout (int, optional): max seconds to wait. If not specified will use protocol defaults.
+            waitForFullHandshake (bool, default=True): If False the function will return on initial UDP connection.
+        """
+
+        if self._aliveEvent is None or self._connectedEvent is None:
+            return False
+
+        if self._pingMode:
+            infinite = False
+            waitForFullHandshake = False
+
+        if timeout:
+            infinite = False
+        elif not infinite:
+            if waitForFullHandshake:
+                timeout = self.atem.defaultConnectionTimeout
+            else:
+                timeout = self.atem.defaultHandshakeTimeout
+
+        event = self._connectedEvent if waitForFullHandshake else self._aliveEvent
+
+        try:
+            await asyncio.wait_for(event.wait(), None if infinite else timeout)
+        except asyncio.TimeoutError:
+            self.log.debug("Timeout waiting for connection")
+            return False
+
+        self.log.debug("Finished waiting for initialization")
+        return True
+
+
+    def _connect(self):
+        """Internal connect method"""
+
+        if self._aliveEvent is not None and self._connectedEvent is not None:
+            self._aliveEvent.clear()
+            self._connectedEvent.clear()
+
+        super()._connect()
+
+
+    def _onDatagram(self) -> None:
+        """Process a datagram pushed by the event loop"""
+
+        while self._udp.available():
+            self._processPacket()
+
+        self._requestMissedInitPackets()
+        self._processHeldPackets()
+
+        if self._aliveEvent is not None and self._connectedEvent is not None:
+            if self.switcherAlive:
+                self._aliveEvent.set()
+            if self.connected:
+                self._connectedEvent.set()
+
+
+    def _scheduleTimeoutCheck(self) -> None:
+        """Schedule the next connection timeout check"""
+
+        if self._loop is None:
+            return
+
+        deadline = self._lastContact + self._connTimeout
+        self._timeoutCheck = self._loop.call_later(
+            max(0.0, deadline - time.time()), self._onTimeoutCheck)
+
+
+    def _onTimeoutCheck(self) -> None:
+        self._checkConnectionTimeout()
+        self._scheduleTimeoutCheck()
+
+
+    def _schedulePacketRequestCheck(self) -> None:
+        """Schedule the next retry of unanswered missed packet requests"""
+
+        deadline = self._nextPacketRequestDeadline()
+        if self._loop is None or deadline is None:
+            return
+
+        when = self._loop.time() + max(0.0, deadline - time.monotonic())
+        if self._packetRequestCheck is not None:
+            if self._packetRequestCheck.when() <= when:
+                return
+            self._packetRequestCheck.cancel()
+
+        self._packetRequestCheck = self._loop.call_at(when, self._onPacketRequestCheck)
+
+
+    def _onPacketRequestCheck(self) -> None:
+        self._packetRequestCheck = None
+        self._requestMissedInitPackets()
+        self._processHeldPackets()
+
+
+    def _scheduleCommandCheck(self) -> None:
+        """Schedule the next command deadline check (retransmissions, echoes, pacing)"""
+
+        deadline = self._nextCommandDeadline()
+        if self._loop is None or deadline is None:
+            return
+
+        when = self._loop.time() + max(0.0, deadline - time.monotonic())
+        if self._commandCheck is not None:
+            if self._commandCheck.when() <= when:
+                return
+            self._commandCheck.cancel()
+
+        self._commandCheck = self._loop.call_at(when, self._onCommandCheck)
+
+
+    def _onCommandCheck(self) -> None:
+        self._commandCheck = None
+        self._checkCommandDeadlines()
+        self._scheduleCommandCheck()
+
+
+    def _scheduleBundleFlush(self) -> None:
+        """Send the command bundle when the auto bundling window ends"""
+
+        if self._loop is not None:
+            self._loop.call_later(self._autoBundleWindow, self._flushCommandBundle)
+
+
+    def _queueEvent(self, name: str, args: Dict[str, Any], key: Optional[Any] =None) -> None:
+        """Queue an event to be emitted by the event loop"""
+
+        loop = self._loop
+        if loop is not None and name in self._subscribedEvents:
+            if self._eventThreadEventQ.put({"name": name, "args": args, "key": key}, key):
+                loop.call_soon(self._emitQueuedEvents)
+
+
+    def _emitQueuedEvents(self) -> None:
+        """Emit all queued events (coalesced while waiting for the event loop)"""
+
+        try:
+            event = self._eventThreadEventQ.get(0)
+            while event is not None:
+                self._emitEvent(event)
+                event = self._eventThreadEventQ.get(0)
+        finally:
+            # A callback raised: keep emitting in the next loop iteration
+            if self._loop is not None and len(self._eventThreadEventQ):
+                self._loop.call_soon(self._emitQueuedEvents)
+
+
+    def _callEventSubscriber(self, subscription: ATEMEventSubscription, args: Dict[str, Any]) -> None:
+        result = subscription.callback(args)
+        if self._loop is not None and asyncio.iscoroutine(result):
+            self._loop.create_task(result)
+
+
+    def _deferEvent(self, due: float, subscription: ATEMEventSubscription, key: Any) -> None:
+        """Schedule a delayed call for a rate limited subscription"""
+
+        if self._loop is not None:
+            self._loop.call_later(max(0.0, due - time.monotonic()), self._emitDeferredEvent, subscription, key)
+
+
+# #######################################################################
+#
+#  Coroutine versions of all set/exec methods
+#
+
+def _asyncCommand(method: Callable[..., None]) -> Callable[..., Any]:
+    """Build a coroutine version of a set/exec method"""
+
+    @functools.wraps(method)
+    async def wrapper(self: ATEMAsyncMax, *args: Any, **kwargs: Any) -> Optional[ATEMCommandConfirmation]:
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+_COMMAND_METHODS = {
+    **{name: method for name, method in vars(ATEMSetterMethods).items() if name.startswith('set')},
+    **{name: method for name, method in vars(ATEMMaxBase).items() if name.startswith('exec')},
+    }
+
+for _name, _method in _COMMAND_METHODS.items():
+    setattr(ATEMAsyncMax, _name, _asyncCommand(_method))
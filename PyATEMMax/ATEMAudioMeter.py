@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""
+ATEMAudioMeter: Blackmagic ATEM audio level meter (AMLv frames in NumPy arrays).
+Part of the PyATEMMax library.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+import math
+import threading
+import time
+
+from .ATEMConstant import ATEMConstant
+from .ATEMException import ATEMException
+from .ATEMProtocol import ATEMProtocol
+
+
+# Level columns in the meter frames
+LEFT = 0
+RIGHT = 1
+PEAK_LEFT = 2
+PEAK_RIGHT = 3
+
+# Non-source rows in the meter frames (before the audio sources)
+MASTER = 'master'
+MONITOR = 'monitor'
+
+# Levels are sent as 24 bit linear values (in 32 bit fields), full scale is 0dBFS
+_LEVEL_MASK = 0xFFFFFF
+_FULL_SCALE = float(1 << 23)
+
+# Level of a zero value (the lowest one the switcher can send, about -138.5dB)
+SILENCE = 20 * math.log10(1 / _FULL_SCALE)
+
+# AMLv: number of sources (2), padding (2), master and monitor levels (2 x 4 x U32)
+_HEADER_LENGTH = 36
+
+
+class ATEMAudioMeter():
+    """Audio level meter
+
+    Each AMLv command is decoded (in one step) into a frame of dB levels:
+    one row for the master output, one for the monitor and one for each
+    audio source (in the order sent by the switcher, see `sources`), with
+    LEFT, RIGHT, PEAK_LEFT and PEAK_RIGHT columns.
+
+    The last `historyLength` frames are kept in a ring buffer, and can be
+    read as arrays (oldest frame first) for one row or for all of them.
+
+    Rows are selected with MASTER, MONITOR or an audio source (see ATEMAudioSources).
+
+    Needs NumPy (not installed with PyATEMMax, use `pip install PyATEMMax[meter]`).
+
+    Args:
+        historyLength (int, optional): number of frames kept
+    """
+
+    def __init__(self, historyLength: int =100):
+        # Optional dependency (pip install PyATEMMax[meter]), imported when a meter is created
+        try:
+            import numpy    # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ATEMException("ATEMAudioMeter needs NumPy (pip install PyATEMMax[meter])") from e
+
+        self._numpy = numpy
+
+        if historyLength < 1:
+            raise ATEMException(f"Wrong historyLength for ATEMAudioMeter: [{historyLength}]")
+
+        self.historyLength: int = historyLength
+
+        # Frames received (since the meter was created)
+        self.frameCount: int = 0
+
+        # Frames are written by the comms thread
+        self._lock = threading.Lock()
+
+        # Audio sources in the frames (AMLv source list) and frame row by audio source
+        self._sourceList: bytes = b""
+        self._sources: List[int] = []
+        self._rows: Dict[Any, int] = { MASTER: 0, MONITOR: 1 }
+
+        # Ring buffer: levels (frame, row, column) and frame times, next frame position, frames in buffer
+        self._history = self._numpy.full((historyLength, 2, 4), SILENCE, dtype=self._numpy.float32)
+        self._times = self._numpy.zeros(historyLength)
+        self._next: int = 0
+        self._count: int = 0
+
+
+    @property
+    def sources(self) -> List[int]:
+        """Audio sources in the meter frames (rows after MASTER and MONITOR)"""
+
+        return list(self._sources)
+
+
+    def update(self, payload: Union[bytes, bytearray, memoryview], timestamp: Optional[float] =None) -> None:
+        """Add a frame to the meter
+
+        If the audio source list changed, the history is cleared.
+
+        Args:
+            payload (bytes): AMLv command data
+            timestamp (float, optional): frame time (default: now, as time.time())
+        """
+
+        numSources = int.from_bytes(payload[0:2], 'big')
+        levelsOffset = _HEADER_LENGTH + ((numSources * 2 + 3) & ~3)  # Source list is padded to 4 bytes
+        if len(payload) < levelsOffset + numSources * 16:
+            raise ATEMException(f"Wrong AMLv length for {numSources} audio sources: [{len(payload)}]")
+
+        values = self._numpy.concatenate((
+            self._numpy.frombuffer(payload, dtype='>u4', count=8, offset=4),
+            self._numpy.frombuffer(payload, dtype='>u4', count=numSources*4, offset=levelsOffset),
+            ))
+        values &= _LEVEL_MASK
+        frame = 20 * self._numpy.log10(self._numpy.maximum(values, 1) / _FULL_SCALE)
+
+        sourceList = bytes(payload[_HEADER_LENGTH:_HEADER_LENGTH + numSources*2])
+        with self._lock:
+            if sourceList != self._sourceList:
+                self._setSources(sourceList)
+
+            self._history[self._next] = frame.reshape(-1, 4)
+            self._times[self._next] = time.time() if timestamp is None else timestamp
+            self._next = (self._next + 1) % self.historyLength
+            self._count = min(self._count + 1, self.historyLength)
+            self.frameCount += 1
+
+
+    def reset(self) -> None:
+        """Clear the meter history"""
+
+        with self._lock:
+            self._history.fill(SILENCE)
+            self._count = 0
+
+
+    def levels(self, source: Optional[Union[ATEMConstant, str, int]] =None) -> Any:
+        """Get the levels of the last frame
+
+        Args:
+            source (optional): MASTER, MONITOR or audio source (None: all rows)
+
+        Returns:
+            (numpy.ndarray): dB levels (LEFT, RIGHT, PEAK_LEFT, PEAK_RIGHT), one row per source if source is None
+        """
+
+        with self._lock:
+            frame = self._history[(self._next - 1) % self.historyLength]
+            return (frame if source is None else frame[self._getRow(source)]).copy()
+
+
+    def history(self, source: Optional[Union[ATEMConstant, str, int]] =None, frames: Optional[int] =None) -> Any:
+        """Get the levels of the last frames
+
+        Args:
+            source (optional): MASTER, MONITOR or audio source (None: all rows)
+            frames (int, optional): number of frames (default: all frames in the history)
+
+        Returns:
+            (numpy.ndarray): dB levels by frame (oldest first) and column (and row if source is None)
+        """
+
+        with self._lock:
+            history = self._history[self._getHistoryIndexes(frames)]
+            return history if source is None else history[:, self._getRow(source)]
+
+
+    def times(self, frames: Optional[int] =None) -> Any:
+        """Get the times of the last frames
+
+        Args:
+            frames (int, optional): number of frames (default: all frames in the history)
+
+        Returns:
+            (numpy.ndarray): frame times (as time.time(), oldest first)
+        """
+
+        with self._lock:
+            return self._times[self._getHistoryIndexes(frames)]
+
+
+    def rms(self, source: Optional[Union[ATEMConstant, str, int]] =None, frames: Optional[int] =None) -> Any:
+        """Get the RMS level of the last frames
+
+        Args:
+            source (optional): MASTER, MONITOR or audio source (None: all rows)
+            frames (int, optional): number of frames (default: all frames in the history)
+
+        Returns:
+            (numpy.ndarray): dB RMS levels (LEFT, RIGHT), one row per source if source is None
+        """
+
+        levels = self.history(source, frames)[..., LEFT:RIGHT+1]
+        if not len(levels):
+            return self._numpy.full(levels.shape[1:], SILENCE, dtype=self._numpy.float32)
+
+        power = self._numpy.mean(self._numpy.power(10, levels / 10, dtype=self._numpy.float64), axis=0)
+        return (10 * self._numpy.log10(power)).astype(self._numpy.float32)
+
+
+    def peakHold(self, source: Optional[Union[ATEMConstant, str, int]] =None, frames: Optional[int] =None) -> Any:
+        """Get the peak level of the last frames
+
+        Args:
+            source (optional): MASTER, MONITOR or audio source (None: all rows)
+            frames (int, optional): number of frames (default: all frames in the history)
+
+        Returns:
+            (numpy.ndarray): dB peak levels (LEFT, RIGHT), one row per source if source is None
+        """
+
+        history = self.history(source, frames)
+        peaks = self._numpy.maximum(history[..., LEFT:RIGHT+1], history[..., PEAK_LEFT:PEAK_RIGHT+1])
+        if not len(peaks):
+            return self._numpy.full(peaks.shape[1:], SILENCE, dtype=self._numpy.float32)
+
+        return peaks.max(axis=0)
+
+
+    def _setSources(self, sourceList: bytes) -> None:
+        """Set the audio sources in the frames (clears the history)"""
+
+        self._sourceList = sourceList
+        self._sources = self._numpy.frombuffer(sourceList, dtype='>u2').tolist()
+        self._rows = { MASTER: 0, MONITOR: 1 }
+        self._rows.update((audioSource, row) for row, audioSource in enumerate(self._sources, 2))
+
+        self._history = self._numpy.full((self.historyLength, len(self._sources) + 2, 4), SILENCE, dtype=self._numpy.float32)
+        self._count = 0
+
+
+    def _getRow(self, source: Union[ATEMConstant, str, int]) -> int:
+        """Get the frame row of MASTER, MONITOR or an audio source"""
+
+        if source in (MASTER, MONITOR):
+            return self._rows[source]
+
+        audioSource = ATEMProtocol.audioSources[source]
+        row = self._rows.get(audioSource.value)
+        if row is None:
+            raise ATEMException(f"Audio source [{audioSource}] not in the audio meter frames")
+
+        return row
+
+
+    def _getHistoryIndexes(self, frames: Optional[int]) -> Any:
+        """Get the ring buffer positions of the last frames (oldest first)"""
+
+        count = self._count if frames is None else max(0, min(frames, self._count))
+        return (self._next - count + self._numpy.arange(count)) % self.historyLength
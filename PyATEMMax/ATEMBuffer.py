@@ -7,7 +7,7 @@ Part of the PyATEMMax library.
 
 # pyright: reportGeneralTypeIssues=false, reportUnknownVariableType=false
 
-from typing import List, Callable, Union
+from typing import Any, Dict, Callable, Tuple, Union
 
 import struct
 
@@ -17,6 +17,9 @@ from .ATEMException import ATEMException
 class ATEMBuffer():
     """ATEM Buffer manager"""
 
+    # Precompiled struct.Struct objects for integer types, by (signed, bits)
+    _structs: Dict[Tuple[bool, int], struct.Struct] = {}
+
 
     # #######################################################################
     #
@@ -30,11 +33,13 @@ class ATEMBuffer():
             size (int): size of the buffer
         """
 
-        self._buf: List[int]
+        # Own (writable) data, and data read by the get methods (own data or external data, see setData())
+        self._buf: bytearray = bytearray()
+        self._data: Union[bytes, bytearray, memoryview] = self._buf
         self.size = size
         self._userOffsetCallback: Callable[[int], int]
         self._userOffsetCallbackSet: bool = False
-        self.reset()
+        self.reset(size)
 
 
     def setUserOffsetCallback(self, callback: Callable[[int], int]) -> None:
@@ -53,31 +58,28 @@ class ATEMBuffer():
         self._userOffsetCallbackSet = True
 
 
+    def clearUserOffsetCallback(self) -> None:
+        """Remove the callback used to calculate buffer offsets (offsets are used as they are)."""
+
+        self._userOffsetCallbackSet = False
+
+
 
     # #######################################################################
     #
     #  List methods
     #
 
-    def __getitem__(self, i: Union[int, slice]) -> Union[int, List[int]]:
-        return self._buf.__getitem__(i)
+    def __getitem__(self, i: Union[int, slice]) -> Union[int, bytes, bytearray, memoryview]:
+        return self._data.__getitem__(i)
 
 
-    def __setitem__(self, i: Union[int, slice], v: int) -> None:
+    def __setitem__(self, i: int, v: int) -> None:
+        self._checkWritable("__setitem__")
         return self._buf.__setitem__(i, v)
 
-    def pop(self, i: int = ...) -> int:
-        """Remove the byte at the given position in the list, and return it (default last)"""
-
-        return self._buf.pop(i)
-
-    def append(self, v: int) -> None:
-        """Append byte to buffer"""
-
-        self._buf.append(v)
-
     def __len__(self) -> int:
-        return len(self._buf)
+        return len(self._data)
 
 
     # #######################################################################
@@ -89,13 +91,36 @@ class ATEMBuffer():
         """Reset the buffer
 
         Args:
-            size (int): size of the buffer
+            size (int): size of the buffer (default: keep the current one)
+        """
+
+        if size == -1:
+            size = len(self._buf)
+
+        self._buf = bytearray(size)
+        self._data = self._buf
+        self.size = size
+
+
+    def setData(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Point the buffer to external data (no copy is made)
+
+        Used by the UDP socket to hand received datagram slices to the buffer.
+        The buffer can only be read until reset() is called.
+
+        Args:
+            data (bytes-like): data to read from
         """
 
-        if size != -1:
-            self.size = size
+        self._data = data
+        self.size = len(data)
+
+
+    def _checkWritable(self, methodName: str) -> None:
+        """Raise an ATEMException if the buffer is pointed to external data"""
 
-        self._buf = [0 for _ in range(self.size)]
+        if self._data is not self._buf:
+            raise ATEMException(f"ATEMBuffer.{methodName}(): Can't write external data (see setData())")
 
 
     def _getFormatChar(self, signed: bool, bits: int) -> str:
@@ -120,6 +145,16 @@ class ATEMBuffer():
         # return fmtChr
 
 
+    def _getStruct(self, signed: bool, bits: int) -> struct.Struct:
+        """Get the (cached) struct.Struct for an integer type"""
+
+        intStruct = self._structs.get((signed, bits))
+        if intStruct is None:
+            intStruct = struct.Struct(self._getFormatChar(signed, bits))
+            self._structs[(signed, bits)] = intStruct
+        return intStruct
+
+
 
     # #######################################################################
     #
@@ -134,9 +169,10 @@ class ATEMBuffer():
         else:
             bufferIndex = offset
 
-        numBytes = int(bits / 8)
+        intStruct = self._getStruct(signed, bits)
+        numBytes = intStruct.size
 
-        if 0 < bufferIndex >= (self.size - numBytes):
+        if bufferIndex < 0 or bufferIndex + numBytes > self.size:
             raise ATEMException(f"ATEMBuffer.getInt(): Can't get" \
                                 f" {'S' if signed else 'U'}{bits}" \
                                 f" @offset[{offset}]" \
@@ -144,12 +180,10 @@ class ATEMBuffer():
                                 f" - numBytes[{numBytes}]" \
                                 f" - buffLen[{self.size}]")
 
-        packedValue = bytes(self._buf[bufferIndex:bufferIndex + numBytes])
-
         # If struct.unpack fails, return 0 to resolve the issue and restore normal function
         # The actual cause of this failure should be investigated more deeply
         try:
-            return struct.unpack(self._getFormatChar(signed, bits), packedValue)[0]
+            return intStruct.unpack_from(self._data, bufferIndex)[0]
         except struct.error:
             return 0
 
@@ -161,9 +195,12 @@ class ATEMBuffer():
         else:
             bufferIndex = offset
 
-        numBytes = int(bits/8)
+        self._checkWritable("setInt")
+
+        intStruct = self._getStruct(signed, bits)
+        numBytes = intStruct.size
 
-        if 0 < bufferIndex >= (self.size - numBytes):
+        if bufferIndex < 0 or bufferIndex + numBytes > self.size:
             raise ATEMException(f"ATEMBuffer.setInt(): Can't set" \
                             f" {'S' if signed else 'U'}{bits}" \
                             f" @offset[{offset}]" \
@@ -172,9 +209,7 @@ class ATEMBuffer():
                             f" - numBytes[{numBytes}]" \
                             f" - buffLen[{self.size}]")
 
-        packedValue = struct.pack(self._getFormatChar(signed, bits), value)
-
-        self._buf[bufferIndex:bufferIndex+numBytes] = list(packedValue)
+        intStruct.pack_into(self._buf, bufferIndex, value)
 
 
     def changeInt(self, offset: int, signed: bool, bits: int, func: Callable[[int], int]) -> None:
@@ -216,20 +251,19 @@ class ATEMBuffer():
         else:
             bufferIndex = offset
 
-        if 0 < bufferIndex >= (self.size - numBytes):
+        if bufferIndex < 0 or bufferIndex + numBytes > self.size:
             raise ATEMException(f"ATEMBuffer.getString(): Can't set string" \
                             f" @offset[{offset}]" \
                             f" - buffIndex[{bufferIndex}]" \
                             f" - numBytes[{numBytes}]" \
                             f" - buffLen[{self.size}]")
 
-        valueBuff = []
-        index = bufferIndex
-        while index < (bufferIndex + numBytes) and self._buf[index]:
-            valueBuff.append(self._buf[index])
-            index += 1
+        valueBuff = bytes(self._data[bufferIndex:bufferIndex + numBytes])
+        end = valueBuff.find(0)
+        if end != -1:
+            valueBuff = valueBuff[:end]
 
-        cstring = bytes(valueBuff).decode('utf8', "ignore")
+        cstring = valueBuff.decode('utf8', "ignore")
         return cstring
 
 
@@ -242,18 +276,60 @@ class ATEMBuffer():
         else:
             bufferIndex = offset
 
-        if 0 < bufferIndex >= (self.size - numBytes):
+        self._checkWritable("setString")
+
+        if bufferIndex < 0 or bufferIndex + numBytes > self.size:
             raise ATEMException(f"ATEMBuffer.setString(): Can't set string" \
                             f" @offset[{offset}]" \
                             f" - buffIndex[{bufferIndex}]" \
                             f" - numBytes[{numBytes}]" \
                             f" - buffLen[{self.size}]")
 
-        buf = value.encode('utf8')
-        buf += bytes([0 for _ in range(numBytes)])
-        buf = buf[:numBytes]
+        buf = value.encode('utf8')[:numBytes].ljust(numBytes, b'\0')
+
+        self._buf[bufferIndex:bufferIndex+numBytes] = buf
+
+
+    def unpack(self, packer: struct.Struct, offset: int = 0) -> Tuple[Any, ...]:
+        """Get all values of a precompiled struct.Struct at once"""
+
+        if self._userOffsetCallbackSet:
+            bufferIndex = self._userOffsetCallback(offset)
+        else:
+            bufferIndex = offset
+
+        try:
+            return packer.unpack_from(self._data, bufferIndex)
+        except struct.error as e:
+            raise ATEMException(f"ATEMBuffer.unpack(): Can't get" \
+                                f" {packer.size} bytes" \
+                                f" @offset[{offset}]" \
+                                f" - buffIndex[{bufferIndex}]" \
+                                f" - dataLen[{len(self._data)}]") from e
+
+
+    def pack(self, packer: struct.Struct, offset: int, *values: Any) -> None:
+        """Set all values of a precompiled struct.Struct at once"""
+
+        if self._userOffsetCallbackSet:
+            bufferIndex = self._userOffsetCallback(offset)
+        else:
+            bufferIndex = offset
 
-        self._buf[bufferIndex:bufferIndex+numBytes-1] = list(buf)
+        self._checkWritable("pack")
+
+        if bufferIndex < 0 or bufferIndex + packer.size > self.size:
+            raise ATEMException(f"ATEMBuffer.pack(): Can't set" \
+                                f" {packer.size} bytes" \
+                                f" @offset[{offset}]" \
+                                f" - buffIndex[{bufferIndex}]" \
+                                f" - buffLen[{self.size}]")
+
+        try:
+            packer.pack_into(self._buf, bufferIndex, *values)
+        except struct.error as e:
+            raise ATEMException(f"ATEMBuffer.pack(): Invalid values {values}" \
+                                f" @offset[{offset}]: {e}") from e
 
 
     # #######################################################################
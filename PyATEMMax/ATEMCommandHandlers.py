@@ -4,16 +4,26 @@
 ATEMCommandHandlers: Blackmagic ATEM switcher command handlers.
 Part of the PyATEMMax library.
 Methods do keep the order in https://www.skaarhoj.com/fileadmin/BMDPROTOCOL.html
+Commands with a fixed layout are decoded by ATEMCommandLayouts.
 """
 
 # pylint: disable=too-many-lines, wildcard-import, unused-wildcard-import, protected-access
 # pyright: reportPrivateUsage=false, reportUnusedFunction=false, reportUnboundVariable=false
 
-from typing import Callable
+from typing import Any, Callable, Dict, List, Tuple
+
+import functools
+import struct
 
 from .ATEMUtils import boolBit, mapValue
+from .ATEMCommandLayouts import COMMAND_DECODERS
 from .ATEMProtocolEnums import *
 from .ATEMException import ATEMException
+from .StateData.Tally import PROGRAM_BIT, PREVIEW_BIT
+
+# AMLv levels: master (left, right, peak left, peak right) and monitor, audio source (left, right, peak left, peak right)
+_AMLV_MASTER = struct.Struct('!5I')
+_AMLV_SOURCE = struct.Struct('!4I')
 
 # --------------------------------------------------
 # This is a trick to have type hints from classes
@@ -43,9 +53,6 @@ class ATEMCommandHandlers():
     This class is a port of Skårhøj's ATEMmax class.
     """
 
-    # These handlers manage their initial buffer read by themselves
-    _AUTOMANAGED_HANDLERS = [ 'AMLv', 'TlSr' ]
-
     # All command handler methods MUST have this prefix
     _HANDLER_PREFIX = "_handle"
 
@@ -59,6 +66,12 @@ class ATEMCommandHandlers():
 
         self.cmdStr:str = ""
 
+        # State changes made by the current command: (path, old value, new value)
+        self._changes: List[Tuple[str, Any, Any]] = switcher._stateChanges
+
+        # Handler methods by command name (built by registerAllHandlers())
+        self._handlers: Dict[str, Callable[[], None]] = {}
+
 
     # #######################################################################
     #
@@ -75,31 +88,43 @@ class ATEMCommandHandlers():
             if funcname[:len(self._HANDLER_PREFIX)] == self._HANDLER_PREFIX:
                 funccmd = funcname[len(self._HANDLER_PREFIX):]
                 if funccmd != 'NOTIMPLEMENTED':
-                    self._sw._registerCmdHandler(funccmd, self._mainHandler)
+                    self._handlers[funccmd] = getattr(self, funcname)
+
+        # Compiled layout decoders
+        for funccmd, decoder in COMMAND_DECODERS.items():
+            self._handlers[funccmd] = functools.partial(decoder, self._d, self._inBuf, self._changes)
 
         for funccmd in self._p.commands:
-            if funccmd not in self._sw._cmdHandlers:
-                self._sw._registerCmdHandler(funccmd, self._mainHandler)
+            if funccmd not in self._handlers:
+                self._handlers[funccmd] = self._handleNOTIMPLEMENTED
+
+        for funccmd in self._handlers:
+            self._sw._registerCmdHandler(funccmd, self._mainHandler)
 
 
     def _mainHandler(self, cmdStr:str) -> None:
         '''This is the main handler, it redirects calls'''
 
-        if cmdStr not in self._AUTOMANAGED_HANDLERS:
-            self._sw._read2InBuf()
+        self._sw._read2InBuf()
 
         self.cmdStr = cmdStr
-        self._getHandler(cmdStr)()  # Call specific handler
+        self._handlers[cmdStr]()    # Call specific handler
+
 
+    def _setState(self, target: Any, attr: str, value: Any, path: str) -> None:
+        """Set a state value, recording the change (if any)
 
-    def _getHandler(self, cmdStr:str) -> Callable[[], None]:
-        """Get handler by command name"""
+        Args:
+            target (Any): state object
+            attr (str): attribute name
+            value (Any): new value
+            path (str): path of the state object (e.g. "cameraControl[1].lift")
+        """
 
-        funcname = self._HANDLER_PREFIX + cmdStr
-        if funcname in dir(self):
-            return self.__getattribute__(funcname)
-        else:
-            return self._handleNOTIMPLEMENTED
+        oldValue = getattr(target, attr)
+        if oldValue != value:
+            self._changes.append((f"{path}.{attr}", oldValue, value))
+            setattr(target, attr, value)
 
 
     def _getBufEnum(self, offset: int, bits: int, enum: ATEMConstantList) -> ATEMConstant:
@@ -152,425 +177,40 @@ class ATEMCommandHandlers():
     #  Command handler methods
     #
 
-    def _handle_InCm(self) -> None:
+    def _handleInCm(self) -> None:
         self._sw.setPayloadSent()
 
 
-    def _handle_ver(self) -> None:
-        self._d.protocolVersion.major = self._inBuf.getU16(0)
-        self._d.protocolVersion.minor = self._inBuf.getU16(2)
-
-
-    def _handle_pin(self) -> None:
-        self._d.atemModel = self._inBuf.getString(0, 44)
-
-
-    def _handleWarn(self) -> None:
-        self._d.warningText = self._inBuf.getString(0, 44)
-
-
-    def _handle_top(self) -> None:
-        self._d.topology.mEs = self._inBuf.getU8(0)
-        self._d.topology.sources = self._inBuf.getU8(1)
-        self._d.topology.colorGenerators = self._inBuf.getU8(2)
-        self._d.topology.auxBusses = self._inBuf.getU8(3)
-        self._d.topology.downstreamKeyers = self._inBuf.getU8(4)
-        self._d.topology.stingers = self._inBuf.getU8(5)
-        self._d.topology.dVEs = self._inBuf.getU8(6)
-        self._d.topology.superSources = self._inBuf.getU8(7)
-        self._d.topology.hasSDOutput = self._inBuf.getU8Flag(9, 0)
-
-
-    def _handle_MeC(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.mixEffect.config[mE].keyers = self._inBuf.getU8(1)
-
-
-    def _handle_mpl(self) -> None:
-        self._d.mediaPlayer.stillBanks = self._inBuf.getU8(0)
-        self._d.mediaPlayer.clipBanks = self._inBuf.getU8(1)
-
-
-    def _handle_MvC(self) -> None:
-        self._d.multiViewer.config.multiViewers = self._inBuf.getU8(0)
-
-
-    def _handle_SSC(self) -> None:
-        self._d.superSource.config.boxes = self._inBuf.getU8(0)
-
-
-    def _handle_TlC(self) -> None:
-        self._d.tally.channelConfig.tallyChannels = self._inBuf.getU8(4)
-
-
-    def _handle_AMC(self) -> None:
-        self._d.audioMixer.config.audioChannels = self._inBuf.getU8(0)
-        self._d.audioMixer.config.hasMonitor = self._inBuf.getU8Flag(1, 0)
-
-
     def _handle_VMC(self) -> None:
         # Trick to get 3 byte integer from position 1
         flags:int = self._inBuf.getInt(0, False, 32) & 0x00FFFFFF
 
-        self._d.videoMixer.config.modes.f525i59_94_NTSC = boolBit(flags, 0)
-        self._d.videoMixer.config.modes.f625i_50_PAL = boolBit(flags, 1)
-        self._d.videoMixer.config.modes.f525i59_94_NTSC_16_9 = boolBit(flags, 2)
-        self._d.videoMixer.config.modes.f625i_50_PAL_16_9 = boolBit(flags, 3)
-        self._d.videoMixer.config.modes.f720p50 = boolBit(flags, 4)
-        self._d.videoMixer.config.modes.f720p59_94 = boolBit(flags, 5)
-        self._d.videoMixer.config.modes.f1080i50 = boolBit(flags, 6)
-        self._d.videoMixer.config.modes.f1080i59_94 = boolBit(flags, 7)
-        self._d.videoMixer.config.modes.f1080p23_98 = boolBit(flags, 8)
-        self._d.videoMixer.config.modes.f1080p24 = boolBit(flags, 9)
-        self._d.videoMixer.config.modes.f1080p25 = boolBit(flags, 10)
-        self._d.videoMixer.config.modes.f1080p29_97 = boolBit(flags, 11)
-        self._d.videoMixer.config.modes.f1080p50 = boolBit(flags, 12)
-        self._d.videoMixer.config.modes.f1080p59_94 = boolBit(flags, 13)
-        self._d.videoMixer.config.modes.f2160p23_98 = boolBit(flags, 14)
-        self._d.videoMixer.config.modes.f2160p24 = boolBit(flags, 15)
-        self._d.videoMixer.config.modes.f2160p25 = boolBit(flags, 16)
-        self._d.videoMixer.config.modes.f2160p29_97 = boolBit(flags, 17)
-
-
-    def _handle_MAC(self) -> None:
-        self._d.macro.pool.banks = self._inBuf.getU8(0)
-
-
-    def _handlePowr(self) -> None:
-        self._d.power.status.main = self._inBuf.getU8Flag(0, 0)
-        self._d.power.status.backup = self._inBuf.getU8Flag(0, 1)
-
-
-    def _handleDcOt(self) -> None:
-        self._d.downConverter.mode = self._getBufEnum(0, 8, self._p.downConverterModes)
-
-
-    def _handleVidM(self) -> None:
-        self._d.videoMode.format = self._getBufEnum(0, 8, self._p.videoModeFormats)
-
-
-    def _handleInPr(self) -> None:
-        videoSource = self._getBufVideoSource(0)
-
-        self._d.inputProperties[videoSource].longName = self._inBuf.getString(2, 20)
-        self._d.inputProperties[videoSource].shortName = self._inBuf.getString(22, 4)
-
-        self._d.inputProperties[videoSource].availableExternalPortTypes.sdi = self._inBuf.getU8Flag(27, 0)
-        self._d.inputProperties[videoSource].availableExternalPortTypes.hdmi = self._inBuf.getU8Flag(27, 1)
-        self._d.inputProperties[videoSource].availableExternalPortTypes.component = self._inBuf.getU8Flag(27, 2)
-        self._d.inputProperties[videoSource].availableExternalPortTypes.composite = self._inBuf.getU8Flag(27, 3)
-        self._d.inputProperties[videoSource].availableExternalPortTypes.sVideo = self._inBuf.getU8Flag(27, 4)
-
-        self._d.inputProperties[videoSource].externalPortType = self._getBufEnum(29, 8, self._p.externalPortTypes)
-
-        self._d.inputProperties[videoSource].portType = self._getBufEnum(30, 8, self._p.switcherPortTypes)
-
-        self._d.inputProperties[videoSource].availability.auxiliary = self._inBuf.getU8Flag(34, 0)
-        self._d.inputProperties[videoSource].availability.multiviewer = self._inBuf.getU8Flag(34, 1)
-        self._d.inputProperties[videoSource].availability.superSourceArt = self._inBuf.getU8Flag(34, 2)
-        self._d.inputProperties[videoSource].availability.superSourceBox = self._inBuf.getU8Flag(34, 3)
-        self._d.inputProperties[videoSource].availability.keySourcesEverywhere = self._inBuf.getU8Flag(34, 4)
-
-        self._d.inputProperties[videoSource].mEAvailability.mE1FillSources = self._inBuf.getU8Flag(35, 0)
-        self._d.inputProperties[videoSource].mEAvailability.mE2FillSources = self._inBuf.getU8Flag(35, 1)
-
-
-    def _handleMvPr(self) -> None:
-        multiViewer = self._getBufEnum(0, 8, self._p.multiViewers)
-        self._d.multiViewer.properties[multiViewer].layout = self._getBufEnum(1, 8, self._p.multiViewerLayouts)
-
-
-    def _handleMvIn(self) -> None:
-        multiViewer = self._getBufEnum(0, 8, self._p.multiViewers)
-        windowIndex = self._getBufEnum(1, 8, self._p.windows)
-        self._d.multiViewer.input[multiViewer][windowIndex].videoSource = self._getBufVideoSource(2)
-
-
-    def _handlePrgI(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.programInput[mE].videoSource = self._getBufVideoSource(2)
-
-
-    def _handlePrvI(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.previewInput[mE].videoSource = self._getBufVideoSource(2)
-
-
-    def _handleTrSS(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.transition[mE].style = self._getBufEnum(1, 8, self._p.transitionStyles)
-        self._d.transition[mE].nextTransition.background = self._inBuf.getU8Flag(2, 0)
-        self._d.transition[mE].nextTransition.key1 = self._inBuf.getU8Flag(2, 1)
-        self._d.transition[mE].nextTransition.key2 = self._inBuf.getU8Flag(2, 2)
-        self._d.transition[mE].nextTransition.key3 = self._inBuf.getU8Flag(2, 3)
-        self._d.transition[mE].nextTransition.key4 = self._inBuf.getU8Flag(2, 4)
-        self._d.transition[mE].styleNext = self._getBufEnum(3, 8, self._p.transitionStyles)
-        self._d.transition[mE].nextTransitionNext.background = self._inBuf.getU8Flag(4, 0)
-        self._d.transition[mE].nextTransitionNext.key1 = self._inBuf.getU8Flag(4, 1)
-        self._d.transition[mE].nextTransitionNext.key2 = self._inBuf.getU8Flag(4, 2)
-        self._d.transition[mE].nextTransitionNext.key3 = self._inBuf.getU8Flag(4, 3)
-        self._d.transition[mE].nextTransitionNext.key4 = self._inBuf.getU8Flag(4, 4)
-
-
-    def _handleTrPr(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.transition[mE].preview.enabled = self._inBuf.getU8Flag(1, 0)
-
-
-    def _handleTrPs(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.transition[mE].inTransition = self._inBuf.getU8Flag(1, 0)
-        self._d.transition[mE].framesRemaining = self._inBuf.getU8(2)
-        self._d.transition[mE].position = self._inBuf.getU16(4)
-
-
-    def _handleTMxP(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.transition[mE].mix.rate = self._inBuf.getU8(1)
-
-
-    def _handleTDpP(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.transition[mE].dip.rate = self._inBuf.getU8(1)
-        self._d.transition[mE].dip.input = self._getBufVideoSource(2)
-
-
-    def _handleTWpP(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.transition[mE].wipe.rate = self._inBuf.getU8(1)
-        self._d.transition[mE].wipe.pattern = self._getBufEnum(2, 8, self._p.patternStyles)
-        self._d.transition[mE].wipe.width = self._inBuf.getFloat(4, False, 16, 100)
-        self._d.transition[mE].wipe.fillSource = self._getBufVideoSource(6)
-        self._d.transition[mE].wipe.symmetry = self._inBuf.getFloat(8, False, 16, 100)
-        self._d.transition[mE].wipe.softness = self._inBuf.getFloat(10, False, 16, 100)
-        self._d.transition[mE].wipe.position.x = self._inBuf.getFloat(12, False, 16, 10000)
-        self._d.transition[mE].wipe.position.y = self._inBuf.getFloat(14, False, 16, 10000)
-        self._d.transition[mE].wipe.reverse = self._inBuf.getU8Flag(16, 0)
-        self._d.transition[mE].wipe.flipFlop = self._inBuf.getU8Flag(17, 0)
-
-
-    def _handleTDvP(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.transition[mE].dVE.rate = self._inBuf.getU8(1)
-        self._d.transition[mE].dVE.style = self._getBufEnum(3, 8, self._p.dVETransitionStyles)
-        self._d.transition[mE].dVE.fillSource = self._getBufVideoSource(4)
-        self._d.transition[mE].dVE.keySource = self._getBufVideoSource(6)
-        self._d.transition[mE].dVE.enableKey = self._inBuf.getU8Flag(8, 0)
-        self._d.transition[mE].dVE.preMultiplied = self._inBuf.getU8Flag(9, 0)
-        self._d.transition[mE].dVE.clip = self._inBuf.getFloat(10, False, 16, 10)
-        self._d.transition[mE].dVE.gain = self._inBuf.getFloat(12, False, 16, 10)
-        self._d.transition[mE].dVE.invertKey = self._inBuf.getU8Flag(14, 0)
-        self._d.transition[mE].dVE.reverse = self._inBuf.getU8Flag(15, 0)
-        self._d.transition[mE].dVE.flipFlop = self._inBuf.getU8Flag(16, 0)
-
-
-    def _handleTStP(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.transition[mE].stinger.source = self._getBufEnum(1, 8, self._p.mediaPlayers)
-        self._d.transition[mE].stinger.preMultiplied = self._inBuf.getU8Flag(2, 0)
-        self._d.transition[mE].stinger.clip = self._inBuf.getFloat(4, False, 16, 10)
-        self._d.transition[mE].stinger.gain = self._inBuf.getFloat(6, False, 16, 10)
-        self._d.transition[mE].stinger.invertKey = self._inBuf.getU8Flag(8, 0)
-        self._d.transition[mE].stinger.preRoll = self._inBuf.getU16(10)
-        self._d.transition[mE].stinger.clipDuration = self._inBuf.getU16(12)
-        self._d.transition[mE].stinger.triggerPoint = self._inBuf.getU16(14)
-        self._d.transition[mE].stinger.mixRate = self._inBuf.getU16(16)
-
-
-    def _handleKeOn(self) -> None:
-        mE = self._getBufMixEffect(0)
-        keyer = self._getBufKeyer(1)
-        self._d.keyer[mE][keyer].onAir.enabled = self._inBuf.getU8Flag(2, 0)
-
-
-    def _handleKeBP(self) -> None:
-        mE = self._getBufMixEffect(0)
-        keyer = self._getBufKeyer(1)
-        self._d.keyer[mE][keyer].type = self._getBufEnum(2, 8, self._p.keyerTypes)
-        self._d.keyer[mE][keyer].fly.enabled = self._inBuf.getU8Flag(5, 0)
-        self._d.keyer[mE][keyer].fillSource = self._getBufVideoSource(6)
-        self._d.keyer[mE][keyer].keySource = self._getBufVideoSource(8)
-        self._d.keyer[mE][keyer].masked = self._inBuf.getU8Flag(10, 0)
-        self._d.keyer[mE][keyer].top = self._inBuf.getFloat(12, True, 16, 1000)
-        self._d.keyer[mE][keyer].bottom = self._inBuf.getFloat(14, True, 16, 1000)
-
-        value = self._inBuf.getS16(16)
-        self._d.keyer[mE][keyer].left = mapValue(value, -16000, 16000, -9.0, 9.0)
-
-        value = self._inBuf.getS16(18)
-        self._d.keyer[mE][keyer].right = mapValue(value, -16000, 16000, -9.0, 9.0)
-
-
-    def _handleKeLm(self) -> None:
-        mE = self._getBufMixEffect(0)
-        keyer = self._getBufKeyer(1)
-        self._d.key[mE][keyer].luma.preMultiplied = self._inBuf.getU8Flag(2, 0)
-        self._d.key[mE][keyer].luma.clip = self._inBuf.getFloat(4, False, 16, 10)
-        self._d.key[mE][keyer].luma.gain = self._inBuf.getFloat(6, False, 16, 10)
-        self._d.key[mE][keyer].luma.invertKey = self._inBuf.getU8Flag(8, 0)
-
-
-    def _handleKeCk(self) -> None:
-        mE = self._getBufMixEffect(0)
-        keyer = self._getBufKeyer(1)
-        self._d.key[mE][keyer].chroma.hue = self._inBuf.getFloat(2, False, 16, 10)
-        self._d.key[mE][keyer].chroma.gain = self._inBuf.getFloat(4, False, 16, 10)
-        self._d.key[mE][keyer].chroma.ySuppress = self._inBuf.getFloat(6, False, 16, 10)
-        self._d.key[mE][keyer].chroma.lift = self._inBuf.getFloat(8, False, 16, 10)
-        self._d.key[mE][keyer].chroma.narrow = self._inBuf.getU8Flag(10, 0)
-
-
-    def _handleKePt(self) -> None:
-        mE = self._getBufMixEffect(0)
-        keyer = self._getBufKeyer(1)
-        self._d.key[mE][keyer].pattern.pattern = self._getBufEnum(2, 8, self._p.patternStyles)
-        self._d.key[mE][keyer].pattern.size = self._inBuf.getFloat(4, False, 16, 100)
-        self._d.key[mE][keyer].pattern.symmetry = self._inBuf.getFloat(6, False, 16, 100)
-        self._d.key[mE][keyer].pattern.softness = self._inBuf.getFloat(8, False, 16, 100)
-        self._d.key[mE][keyer].pattern.position.x = self._inBuf.getFloat(10, False, 16, 10000)
-        self._d.key[mE][keyer].pattern.position.y = self._inBuf.getFloat(12, False, 16, 10000)
-        self._d.key[mE][keyer].pattern.invertPattern = self._inBuf.getU8Flag(14, 0)
-
-
-    def _handleKeDV(self) -> None:
-        mE = self._getBufMixEffect(0)
-        keyer = self._getBufKeyer(1)
-        self._d.key[mE][keyer].dVE.size.x = self._inBuf.getFloat(4, False, 32, 1000)
-        self._d.key[mE][keyer].dVE.size.y = self._inBuf.getFloat(8, False, 32, 1000)
-        self._d.key[mE][keyer].dVE.position.x = self._inBuf.getFloat(12, True, 32, 1000)
-        self._d.key[mE][keyer].dVE.position.y = self._inBuf.getFloat(16, True, 32, 1000)
-        self._d.key[mE][keyer].dVE.rotation = self._inBuf.getFloat(20, False, 32, 10)
-        self._d.key[mE][keyer].dVE.border.enabled = self._inBuf.getU8Flag(24, 0)
-        self._d.key[mE][keyer].dVE.shadow = self._inBuf.getU8Flag(25, 0)
-        self._d.key[mE][keyer].dVE.border.bevel.type = self._getBufEnum(26, 8, self._p.borderBevels)
-        self._d.key[mE][keyer].dVE.border.outer.width = self._inBuf.getFloat(28, False, 16, 100)
-        self._d.key[mE][keyer].dVE.border.inner.width = self._inBuf.getFloat(30, False, 16, 100)
-        self._d.key[mE][keyer].dVE.border.outer.softness = self._inBuf.getU8(32)
-        self._d.key[mE][keyer].dVE.border.inner.softness = self._inBuf.getU8(33)
-        self._d.key[mE][keyer].dVE.border.bevel.softness = self._inBuf.getFloat(34, False, 8, 100)
-        self._d.key[mE][keyer].dVE.border.bevel.position = self._inBuf.getFloat(35, False, 8, 100)
-        self._d.key[mE][keyer].dVE.border.opacity = self._inBuf.getU8(36)
-        self._d.key[mE][keyer].dVE.border.hue = self._inBuf.getFloat(38, False, 16, 10)
-        self._d.key[mE][keyer].dVE.border.saturation = self._inBuf.getFloat(40, False, 16, 10)
-        self._d.key[mE][keyer].dVE.border.luma = self._inBuf.getFloat(42, False, 16, 10)
-        self._d.key[mE][keyer].dVE.lightSource.direction = self._inBuf.getFloat(44, False, 16, 10)
-        self._d.key[mE][keyer].dVE.lightSource.altitude = self._inBuf.getU8(46)
-        self._d.key[mE][keyer].dVE.masked = self._inBuf.getU8Flag(47, 0)
-        self._d.key[mE][keyer].dVE.top = self._inBuf.getFloat(48, True, 16, 1000)
-        self._d.key[mE][keyer].dVE.bottom = self._inBuf.getFloat(50, True, 16, 1000)
-
-        value = self._inBuf.getS16(52)
-        self._d.key[mE][keyer].dVE.left = mapValue(value, -16000, 16000, -9.0, 9.0)
-
-        value = self._inBuf.getS16(54)
-        self._d.key[mE][keyer].dVE.right = mapValue(value, -16000, 16000, -9.0, 9.0)
-
-        self._d.key[mE][keyer].dVE.rate = self._inBuf.getU8(56)
-
-
-    def _handleKeFS(self) -> None:
-        mE = self._getBufMixEffect(0)
-        keyer = self._getBufKeyer(1)
-        self._d.keyer[mE][keyer].fly.isASet = self._inBuf.getU8Flag(2, 0)
-        self._d.keyer[mE][keyer].fly.isBSet = self._inBuf.getU8Flag(3, 0)
-        self._d.keyer[mE][keyer].fly.isAtKeyFrame.a = self._inBuf.getU8Flag(6, 0)
-        self._d.keyer[mE][keyer].fly.isAtKeyFrame.b = self._inBuf.getU8Flag(6, 1)
-        self._d.keyer[mE][keyer].fly.isAtKeyFrame.full = self._inBuf.getU8Flag(6, 2)
-        self._d.keyer[mE][keyer].fly.isAtKeyFrame.runToInfinite = self._inBuf.getU8Flag(6, 3)
-        self._d.keyer[mE][keyer].fly.runtoInfiniteindex = self._inBuf.getU8(7)
-
-
-    def _handleKKFP(self) -> None:
-        mE = self._getBufMixEffect(0)
-        keyer = self._getBufKeyer(1)
-        keyFrame = self._getBufEnum(2, 8, self._p.keyFrames)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].size.x = self._inBuf.getFloat(4, False, 32, 1000)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].size.y = self._inBuf.getFloat(8, False, 32, 1000)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].position.x = self._inBuf.getFloat(12, True, 32, 1000)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].position.y = self._inBuf.getFloat(16, True, 32, 1000)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].rotation = self._inBuf.getFloat(20, False, 32, 10)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].border.outer.width = self._inBuf.getFloat(24, False, 16, 100)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].border.inner.width = self._inBuf.getFloat(26, False, 16, 100)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].border.outer.softness = self._inBuf.getU8(28)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].border.inner.softness = self._inBuf.getU8(29)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].border.bevel.softness = self._inBuf.getFloat(30, False, 8, 100)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].border.bevel.position = self._inBuf.getFloat(31, False, 8, 100)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].border.opacity = self._inBuf.getU8(32)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].border.hue = self._inBuf.getFloat(34, False, 16, 10)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].border.saturation = self._inBuf.getFloat(36, False, 16, 10)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].border.luma = self._inBuf.getFloat(38, False, 16, 10)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].lightSource.direction = self._inBuf.getFloat(40, False, 16, 10)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].lightSource.altitude = self._inBuf.getU8(42)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].top = self._inBuf.getFloat(44, True, 16, 1000)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].bottom = self._inBuf.getFloat(46, True, 16, 1000)
-
-        value = self._inBuf.getS16(48)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].left = mapValue(value, -16000, 16000, -9.0, 9.0)
-
-        value = self._inBuf.getS16(50)
-        self._d.keyer[mE][keyer].fly.keyFrame[keyFrame].right = mapValue(value, -16000, 16000, -9.0, 9.0)
-
-
-
-    def _handleDskB(self) -> None:
-        dsk = self._getBufDsk(0)
-        self._d.downstreamKeyer[dsk].fillSource = self._getBufVideoSource(2)
-        self._d.downstreamKeyer[dsk].keySource = self._getBufVideoSource(4)
-
-
-    def _handleDskP(self) -> None:
-        dsk = self._getBufDsk(0)
-        self._d.downstreamKeyer[dsk].tie = self._inBuf.getU8Flag(1, 0)
-        self._d.downstreamKeyer[dsk].rate = self._inBuf.getU8(2)
-        self._d.downstreamKeyer[dsk].preMultiplied = self._inBuf.getU8Flag(3, 0)
-        self._d.downstreamKeyer[dsk].clip = self._inBuf.getFloat(4, False, 16, 10)
-        self._d.downstreamKeyer[dsk].gain = self._inBuf.getFloat(6, False, 16, 10)
-        self._d.downstreamKeyer[dsk].invertKey = self._inBuf.getU8Flag(8, 0)
-        self._d.downstreamKeyer[dsk].masked = self._inBuf.getU8Flag(9, 0)
-        self._d.downstreamKeyer[dsk].top = self._inBuf.getFloat(10, True, 16, 1000)
-        self._d.downstreamKeyer[dsk].bottom = self._inBuf.getFloat(12, True, 16, 1000)
-
-        value = self._inBuf.getS16(4)
-        self._d.downstreamKeyer[dsk].left = mapValue(value, -16000, 16000, -9.0, 9.0)
-
-        value = self._inBuf.getS16(16)
-        self._d.downstreamKeyer[dsk].right = mapValue(value, -16000, 16000, -9.0, 9.0)
-
-
-    def _handleDskS(self) -> None:
-        dsk = self._getBufDsk(0)
-        self._d.downstreamKeyer[dsk].onAir = self._inBuf.getU8Flag(1, 0)
-        self._d.downstreamKeyer[dsk].inTransition = self._inBuf.getU8Flag(2, 0)
-        self._d.downstreamKeyer[dsk].isAutoTransitioning = self._inBuf.getU8Flag(3, 0)
-        self._d.downstreamKeyer[dsk].framesRemaining = self._inBuf.getU8(4)
-
-
-    def _handleFtbP(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.fadeToBlack[mE].rate = self._inBuf.getU8(1)
-
-
-    def _handleFtbS(self) -> None:
-        mE = self._getBufMixEffect(0)
-        self._d.fadeToBlack[mE].state.fullyBlack = self._inBuf.getU8Flag(1, 0)
-        self._d.fadeToBlack[mE].state.inTransition = self._inBuf.getU8Flag(2, 0)
-        self._d.fadeToBlack[mE].state.framesRemaining = self._inBuf.getU8(3)
-
-
-    def _handleColV(self) -> None:
-        colorGenerator = self._getBufEnum(0, 8, self._p.colorGenerators)
-        self._d.colorGenerator[colorGenerator].hue = self._inBuf.getFloat(2, False, 16, 10)
-        self._d.colorGenerator[colorGenerator].saturation = self._inBuf.getFloat(4, False, 16, 10)
-        self._d.colorGenerator[colorGenerator].luma = self._inBuf.getFloat(6, False, 16, 10)
-
-
-    def _handleAuxS(self) -> None:
-        aUXChannel = self._getBufEnum(0, 8, self._p.auxChannels)
-        self._d.auxSource[aUXChannel].input = self._getBufVideoSource(2)
+        modes = self._d.videoMixer.config.modes
+        path = "videoMixer.config.modes"
+        self._setState(modes, 'f525i59_94_NTSC', boolBit(flags, 0), path)
+        self._setState(modes, 'f625i_50_PAL', boolBit(flags, 1), path)
+        self._setState(modes, 'f525i59_94_NTSC_16_9', boolBit(flags, 2), path)
+        self._setState(modes, 'f625i_50_PAL_16_9', boolBit(flags, 3), path)
+        self._setState(modes, 'f720p50', boolBit(flags, 4), path)
+        self._setState(modes, 'f720p59_94', boolBit(flags, 5), path)
+        self._setState(modes, 'f1080i50', boolBit(flags, 6), path)
+        self._setState(modes, 'f1080i59_94', boolBit(flags, 7), path)
+        self._setState(modes, 'f1080p23_98', boolBit(flags, 8), path)
+        self._setState(modes, 'f1080p24', boolBit(flags, 9), path)
+        self._setState(modes, 'f1080p25', boolBit(flags, 10), path)
+        self._setState(modes, 'f1080p29_97', boolBit(flags, 11), path)
+        self._setState(modes, 'f1080p50', boolBit(flags, 12), path)
+        self._setState(modes, 'f1080p59_94', boolBit(flags, 13), path)
+        self._setState(modes, 'f2160p23_98', boolBit(flags, 14), path)
+        self._setState(modes, 'f2160p24', boolBit(flags, 15), path)
+        self._setState(modes, 'f2160p25', boolBit(flags, 16), path)
+        self._setState(modes, 'f2160p29_97', boolBit(flags, 17), path)
 
 
     def _handleCCdP(self) -> None:
         camera = self._getBufEnum(0, 8, self._p.cameras)
+        cameraControl = self._d.cameraControl[camera]
+        path = f"cameraControl[{camera.value}]"
         feature = self._inBuf.getU8(2)
         adjustmentDomain = self._inBuf.getU8(1)
         DOM_LENS = 0
@@ -586,14 +226,14 @@ class ATEMCommandHandlers():
             FEAT_LENS_ZOOM = 9
 
             if feature == FEAT_LENS_IRIS:
-                self._d.cameraControl[camera].iris = self._inBuf.getS16(16)
+                self._setState(cameraControl, 'iris', self._inBuf.getS16(16), path)
             elif feature == FEAT_LENS_FOCUS:
-                self._d.cameraControl[camera].focus = self._inBuf.getS16(16)
+                self._setState(cameraControl, 'focus', self._inBuf.getS16(16), path)
             elif feature == FEAT_LENS_ZOOMNORMALIZED:
-                self._d.cameraControl[camera].zoom.normalized = self._inBuf.getFloat(16, True, 16, 10)
+                self._setState(cameraControl.zoom, 'normalized', self._inBuf.getFloat(16, True, 16, 10), f"{path}.zoom")
             elif feature == FEAT_LENS_ZOOM:
                 value = self._inBuf.getS16(16)
-                self._d.cameraControl[camera].zoom.speed = mapValue(value, -2048, 2048, -1.0, 1.0)
+                self._setState(cameraControl.zoom, 'speed', mapValue(value, -2048, 2048, -1.0, 1.0), f"{path}.zoom")
             else:
                 self._sw.log.warn(f"UNKNOWN lens feature ({feature})")
 
@@ -604,13 +244,13 @@ class ATEMCommandHandlers():
             FEAT_CAMERA_DETAIL = 8 # Documented in LibAtem/LibAtem
 
             if feature == FEAT_CAMERA_GAIN:
-                self._d.cameraControl[camera].gain.value = self._inBuf.getS16(16)
+                self._setState(cameraControl.gain, 'value', self._inBuf.getS16(16), f"{path}.gain")
             elif feature == FEAT_CAMERA_WHITEBALANCE:
-                self._d.cameraControl[camera].whiteBalance = self._inBuf.getS16(16)
+                self._setState(cameraControl, 'whiteBalance', self._inBuf.getS16(16), path)
             elif feature == FEAT_CAMERA_SHUTTER:
-                self._d.cameraControl[camera].shutter = self._inBuf.getFloat(18, True, 16, 1000000)
+                self._setState(cameraControl, 'shutter', self._inBuf.getFloat(18, True, 16, 1000000), path)
             elif feature == FEAT_CAMERA_DETAIL:
-                self._d.cameraControl[camera].sharpeningLevel = self._inBuf.getS16(16)
+                self._setState(cameraControl, 'sharpeningLevel', self._inBuf.getS16(16), path)
             else:
                 self._sw.log.warn(f"UNKNOWN camera feature ({feature})")
 
@@ -618,7 +258,7 @@ class ATEMCommandHandlers():
             FEAT_COLORBARS = 4 # Not documented
 
             if feature == FEAT_COLORBARS:
-                self._d.cameraControl[camera].colorbars = self._inBuf.getS16(16)
+                self._setState(cameraControl, 'colorbars', self._inBuf.getS16(16), path)
             else:
                 self._sw.log.warn(f"UNKNOWN colorBars feature ({feature})")
 
@@ -636,216 +276,92 @@ class ATEMCommandHandlers():
                 valueG = self._inBuf.getS16(18)
                 valueB = self._inBuf.getS16(20)
                 valueY = self._inBuf.getS16(22)
-                self._d.cameraControl[camera].lift.r = mapValue(valueR, -4096, 4096, -1.0, 1.0)
-                self._d.cameraControl[camera].lift.g = mapValue(valueG, -4096, 4096, -1.0, 1.0)
-                self._d.cameraControl[camera].lift.b = mapValue(valueB, -4096, 4096, -1.0, 1.0)
-                self._d.cameraControl[camera].lift.y = mapValue(valueY, -4096, 4096, -1.0, 1.0)
+                self._setState(cameraControl.lift, 'r', mapValue(valueR, -4096, 4096, -1.0, 1.0), f"{path}.lift")
+                self._setState(cameraControl.lift, 'g', mapValue(valueG, -4096, 4096, -1.0, 1.0), f"{path}.lift")
+                self._setState(cameraControl.lift, 'b', mapValue(valueB, -4096, 4096, -1.0, 1.0), f"{path}.lift")
+                self._setState(cameraControl.lift, 'y', mapValue(valueY, -4096, 4096, -1.0, 1.0), f"{path}.lift")
             elif feature == FEAT_CHIP_GAMMA:
                 valueR = self._inBuf.getS16(16)
                 valueG = self._inBuf.getS16(18)
                 valueB = self._inBuf.getS16(20)
                 valueY = self._inBuf.getS16(22)
-                self._d.cameraControl[camera].gamma.r = mapValue(valueR, -8192, 8192, -1.0, 1.0)
-                self._d.cameraControl[camera].gamma.g = mapValue(valueG, -8192, 8192, -1.0, 1.0)
-                self._d.cameraControl[camera].gamma.b = mapValue(valueB, -8192, 8192, -1.0, 1.0)
-                self._d.cameraControl[camera].gamma.y = mapValue(valueY, -8192, 8192, -1.0, 1.0)
+                self._setState(cameraControl.gamma, 'r', mapValue(valueR, -8192, 8192, -1.0, 1.0), f"{path}.gamma")
+                self._setState(cameraControl.gamma, 'g', mapValue(valueG, -8192, 8192, -1.0, 1.0), f"{path}.gamma")
+                self._setState(cameraControl.gamma, 'b', mapValue(valueB, -8192, 8192, -1.0, 1.0), f"{path}.gamma")
+                self._setState(cameraControl.gamma, 'y', mapValue(valueY, -8192, 8192, -1.0, 1.0), f"{path}.gamma")
             elif feature == FEAT_CHIP_GAIN:
                 valueR = self._inBuf.getS16(16)
                 valueG = self._inBuf.getS16(18)
                 valueB = self._inBuf.getS16(20)
                 valueY = self._inBuf.getS16(22)
-                self._d.cameraControl[camera].gain.r = mapValue(valueR, 0, 32767, 0.0, 16.0)
-                self._d.cameraControl[camera].gain.g = mapValue(valueG, 0, 32767, 0.0, 16.0)
-                self._d.cameraControl[camera].gain.b = mapValue(valueB, 0, 32767, 0.0, 16.0)
-                self._d.cameraControl[camera].gain.y = mapValue(valueY, 0, 32767, 0.0, 16.0)
+                self._setState(cameraControl.gain, 'r', mapValue(valueR, 0, 32767, 0.0, 16.0), f"{path}.gain")
+                self._setState(cameraControl.gain, 'g', mapValue(valueG, 0, 32767, 0.0, 16.0), f"{path}.gain")
+                self._setState(cameraControl.gain, 'b', mapValue(valueB, 0, 32767, 0.0, 16.0), f"{path}.gain")
+                self._setState(cameraControl.gain, 'y', mapValue(valueY, 0, 32767, 0.0, 16.0), f"{path}.gain")
             elif feature == FEAT_CHIP_CONTRAST:
-                self._d.cameraControl[camera].contrast = self._inBuf.getS16(18)
+                self._setState(cameraControl, 'contrast', self._inBuf.getS16(18), path)
             elif feature == FEAT_CHIP_LUMMIX:
                 lummix_value = self._inBuf.getS16(16)
-                self._d.cameraControl[camera].lumMix = mapValue(lummix_value, 0, 2048, 0, 100)
+                self._setState(cameraControl, 'lumMix', mapValue(lummix_value, 0, 2048, 0, 100), path)
             elif feature == FEAT_CHIP_HUESATURATION:
                 hue_value = self._inBuf.getS16(16)
                 saturation_value = self._inBuf.getS16(18)
-                self._d.cameraControl[camera].hue = mapValue(hue_value, -2048, 2048, 0, 360)
-                self._d.cameraControl[camera].saturation = mapValue(saturation_value, 0, 4096, 0, 100)
+                self._setState(cameraControl, 'hue', mapValue(hue_value, -2048, 2048, 0, 360), path)
+                self._setState(cameraControl, 'saturation', mapValue(saturation_value, 0, 4096, 0, 100), path)
             else:
                 self._sw.log.warn(f"UNKNOWN chip feature ({feature})")
 
 
-    def _handleRCPS(self) -> None:
-        mediaPlayer = self._getBufEnum(0, 8, self._p.mediaPlayers)
-        self._d.clipPlayer[mediaPlayer].playing = self._inBuf.getU8Flag(1, 0)
-        self._d.clipPlayer[mediaPlayer].loop = self._inBuf.getU8Flag(2, 0)
-        self._d.clipPlayer[mediaPlayer].atBeginning = self._inBuf.getU8Flag(3, 0)
-        self._d.clipPlayer[mediaPlayer].clipFrame = self._inBuf.getU16(4)
-
-
-    def _handleMPCE(self) -> None:
-        mediaPlayer = self._getBufEnum(0, 8, self._p.mediaPlayers)
-        self._d.mediaPlayer.source[mediaPlayer].type = self._getBufEnum(1, 8, self._p.mediaPlayerSourceTypes)
-        self._d.mediaPlayer.source[mediaPlayer].stillIndex = self._inBuf.getU8(2)
-        self._d.mediaPlayer.source[mediaPlayer].clipIndex = self._inBuf.getU8(3)
-
-
-    def _handleMPSp(self) -> None:
-        self._d.mediaPoolStorage.clip1MaxLength = self._inBuf.getU16(0)
-        self._d.mediaPoolStorage.clip2MaxLength = self._inBuf.getU16(2)
-
-
-    def _handleMPCS(self) -> None:
-        clipBank = self._getBufEnum(0, 8, self._p.clipBanks)
-        self._d.mediaPlayer.clipSource[clipBank].isUsed = self._inBuf.getU8Flag(1, 0)
-        self._d.mediaPlayer.clipSource[clipBank].fileName = self._inBuf.getString(2, 16)
-        self._d.mediaPlayer.clipSource[clipBank].frames = self._inBuf.getU16(66)
-
-
-    def _handleMPAS(self) -> None:
-        clipBank = self._getBufEnum(0, 8, self._p.clipBanks)
-        self._d.mediaPlayer.audioSource[clipBank].isUsed = self._inBuf.getU8Flag(1, 0)
-        self._d.mediaPlayer.audioSource[clipBank].fileName = self._inBuf.getString(18, 16)
-
-
     def _handleMPfe(self) -> None:
         stillBank = self._getBufEnum(3, 8, self._p.stillBanks)
         if self._inBuf.getU8(0) == 0:
-            self._d.mediaPlayer.stillFile[stillBank].isUsed = self._inBuf.getU8Flag(4, 0)
+            stillFile = self._d.mediaPlayer.stillFile[stillBank]
+            path = f"mediaPlayer.stillFile[{stillBank.value}]"
+            self._setState(stillFile, 'isUsed', self._inBuf.getU8Flag(4, 0), path)
             fileNameLen = self._inBuf.getU8(23)
             if fileNameLen > 0:
-                self._d.mediaPlayer.stillFile[stillBank].fileName = self._inBuf.getString(24, fileNameLen)
-
-
-    def _handleMRPr(self) -> None:
-        self._d.macro.runStatus.state.running = self._inBuf.getU8Flag(0, 0)
-        self._d.macro.runStatus.state.waiting = self._inBuf.getU8Flag(0, 1)
-        self._d.macro.runStatus.isLooping = self._inBuf.getU8Flag(1, 0)
-        self._d.macro.runStatus.index = self._inBuf.getU16(2)
+                self._setState(stillFile, 'fileName', self._inBuf.getString(24, fileNameLen), path)
 
 
     def _handleMPrp(self) -> None:
         macroIndex = self._getBufEnum(1, 8, self._p.macros)
-        self._d.macro.properties[macroIndex].isUsed = self._inBuf.getU8Flag(2, 0)
+        properties = self._d.macro.properties[macroIndex]
+        path = f"macro.properties[{macroIndex.value}]"
+        self._setState(properties, 'isUsed', self._inBuf.getU8Flag(2, 0), path)
         bytecount = self._inBuf.getU8(5)
-        self._d.macro.properties[macroIndex].name = self._inBuf.getString(8, bytecount)
-
-
-    def _handleMRcS(self) -> None:
-        self._d.macro.recordingStatus.isRecording = self._inBuf.getU8Flag(0, 0)
-        self._d.macro.recordingStatus.index = self._inBuf.getU16(2)
-
-
-    def _handleSSrc(self) -> None:
-        self._d.superSource.fillSource = self._getBufVideoSource(0)
-        self._d.superSource.keySource = self._getBufVideoSource(2)
-        self._d.superSource.foreground = self._inBuf.getU8Flag(4, 0)
-        self._d.superSource.preMultiplied = self._inBuf.getU8Flag(5, 0)
-        self._d.superSource.clip = self._inBuf.getFloat(6, False, 16, 10)
-        self._d.superSource.gain = self._inBuf.getFloat(8, False, 16, 10)
-        self._d.superSource.invertKey = self._inBuf.getU8Flag(10, 0)
-        self._d.superSource.border.enabled = self._inBuf.getU8Flag(11, 0)
-        self._d.superSource.border.bevel.value = self._getBufEnum(12, 8, self._p.borderBevels)
-        self._d.superSource.border.outer.width = self._inBuf.getFloat(14, False, 16, 100)
-        self._d.superSource.border.inner.width = self._inBuf.getFloat(16, False, 16, 100)
-        self._d.superSource.border.outer.softness = self._inBuf.getU8(18)
-        self._d.superSource.border.inner.softness = self._inBuf.getU8(19)
-        self._d.superSource.border.bevel.softness = self._inBuf.getFloat(20, False, 8, 100)
-        self._d.superSource.border.bevel.position = self._inBuf.getFloat(21, False, 8, 100)
-        self._d.superSource.border.hue = self._inBuf.getFloat(22, False, 16, 10)
-        self._d.superSource.border.saturation = self._inBuf.getFloat(24, False, 16, 10)
-        self._d.superSource.border.luma = self._inBuf.getFloat(26, False, 16, 10)
-        self._d.superSource.lightSource.direction = self._inBuf.getFloat(28, False, 16, 10)
-        self._d.superSource.lightSource.altitude = self._inBuf.getU8(30)
-
-
-    def _handleSSBP(self) -> None:
-        """
-        Super Source Box Parameters.
-        Get 24 bytes.
-        | Byte # |  Description |    Value Range     |
-        ---------------------------------------------|
-        |   0    |    Unknown   |         -          |
-        |   1    |     Box      |  0 - 3 (Box 1-4)   |
-        |   2    |    Enabled   |  Bit 0 (On / Off)  |
-        |   3    |    Unknown   |         -          |
-        |  4-5   | Input Source |  ATEMVideoSources  |
-        |  6-7   | Position X   | from -4800 to 4800 |
-        |  8-9   | Position Y   | from -4800 to 4800 |
-        | 10-11  |     Size     |  from -70 to 1000  |
-        |   12   |   Cropped    |  from -70 to 1000  |
-        |   13   |    Unknown   |         -          |
-        | 14-15  |  Crop Top    |  from 0 to 18000   |
-        | 16-17  | Crop Bottom  |  from 0 to 18000   |
-        | 18-19  |  Crop Left   |  from 0 to 18000   |
-        | 20-21  |  Crop Right  |  from 0 to 18000   |
-        | 20-21  |  Crop Right  |  from 0 to 18000   |
-        | 22-24  |    Unknown   |         -          |
-        ---
-        @s-kol-gg
-        """
-        box = self._getBufEnum(1, 8, self._p.boxes)
-        current_box = self._d.superSource.boxParameters[box]
-        current_box.enabled = self._inBuf.getU8Flag(2, 0)
-        current_box.inputSource = self._getBufVideoSource(4)
-        current_box.position.x = self._inBuf.getFloat(6, True, 16, 100)
-        current_box.position.y = self._inBuf.getFloat(8, True, 16, 100)
-        current_box.size = self._inBuf.getFloat(10, False, 16, 1000)
-        current_box.cropped = self._inBuf.getU8Flag(12, 0)
-        current_box.crop.top = self._inBuf.getFloat(14, False, 16, 1000)
-        current_box.crop.bottom = self._inBuf.getFloat(16, False, 16, 1000)
-        current_box.crop.left = self._inBuf.getFloat(18, False, 16, 1000)
-        current_box.crop.right = self._inBuf.getFloat(20, False, 16, 1000)
-
-
-    def _handleAMIP(self) -> None:
-        audioSource = self._getBufAudioSource(0)
-        self._d.audioMixer.input[audioSource].type = self._getBufEnum(2, 8, self._p.audioMixerInputTypes)
-        self._d.audioMixer.input[audioSource].fromMediaPlayer = self._inBuf.getU8Flag(6, 0)
-        self._d.audioMixer.input[audioSource].plugtype = self._getBufEnum(7, 8, self._p.audioMixerInputPlugTypes)
-        self._d.audioMixer.input[audioSource].mixOption = self._getBufEnum(8, 8, self._p.audioMixerInputMixOptions)
-        self._d.audioMixer.input[audioSource].volume = self._p.audioWord2Db(self._inBuf.getU16(10))
-        self._d.audioMixer.input[audioSource].balance = self._inBuf.getFloat(12, True, 16, 10000)
-
-
-    def _handleAMMO(self) -> None:
-        self._d.audioMixer.master.volume = self._p.audioWord2Db(self._inBuf.getU16(0))
-
-
-    def _handleAMmO(self) -> None:
-        self._d.audioMixer.monitor.monitorAudio = self._inBuf.getU8Flag(0, 0)
-        self._d.audioMixer.monitor.volume = self._p.audioWord2Db(self._inBuf.getU16(2))
-        self._d.audioMixer.monitor.mute = self._inBuf.getU8Flag(4, 0)
-        self._d.audioMixer.monitor.solo = self._inBuf.getU8Flag(5, 0)
-        self._d.audioMixer.monitor.soloInput = self._getBufAudioSource(6)
-        self._d.audioMixer.monitor.dim = self._inBuf.getU8Flag(8, 0)
+        self._setState(properties, 'name', self._inBuf.getString(8, bytecount), path)
 
 
     def _handleAMLv(self) -> None:
+        numSources = self._inBuf.getU16(0)
+        levelsOffset = 36 + ((numSources * 2 + 3) & ~3)    # Source list is padded to 4 bytes
+        if len(self._inBuf) < levelsOffset + numSources * 16:
+            self._sw.log.debug(f"UNKNOWN numSources ({numSources}) in [{self.cmdStr}]")
+            return
 
-        # This handler does NOT use autoReadBuffer
-        self._sw._read2InBuf(36)
+        # Levels are 24 bit values in 4 byte fields, the state keeps their 16 upper bits
+        payload = self._inBuf[0:levelsOffset + numSources * 16]
+        levels = self._d.audioMixer.levels
+        levels.numSources = numSources
 
-        numSources = self._inBuf.getU16(0)
-        self._d.audioMixer.levels.numSources = numSources
-        self._d.audioMixer.levels.master.left = self._inBuf.getU16(5)         # 4 bytes in docs (?)
-        self._d.audioMixer.levels.master.right = self._inBuf.getU16(9)        # 4 bytes in docs (?)
-        self._d.audioMixer.levels.master.peak.left = self._inBuf.getU16(13)   # 4 bytes in docs (?)
-        self._d.audioMixer.levels.master.peak.right = self._inBuf.getU16(17)  # 4 bytes in docs (?)
-        self._d.audioMixer.levels.monitor = self._inBuf.getU16(21)            # 4 bytes in docs (?)
-
-        self._sw._read2InBuf(numSources*2)
-        audioSources = []
-        for a in range(numSources):
-            audioSources[a] = self._inBuf.getU16(a<<1)
-
-        # We must read 4-byte chunks, so compensate if sources was an odd number
-        if numSources & 1:
-            self._sw._read2InBuf(2)
-
-        for a in range(numSources):
-            self._sw._read2InBuf(16)
-            self._d.audioMixer.levels.sources[audioSources[a]].left = self._inBuf.getU16(1)         # 4 bytes in docs (?)
-            self._d.audioMixer.levels.sources[audioSources[a]].right = self._inBuf.getU16(5)        # 4 bytes in docs (?)
-            self._d.audioMixer.levels.sources[audioSources[a]].peak.left = self._inBuf.getU16(9)    # 4 bytes in docs (?)
-            self._d.audioMixer.levels.sources[audioSources[a]].peak.right = self._inBuf.getU16(13)  # 4 bytes in docs (?)
+        master = levels.master
+        master.left, master.right, master.peak.left, master.peak.right, levels.monitor = \
+            ( (value >> 8) & 0xFFFF for value in _AMLV_MASTER.unpack_from(payload, 4) )
+
+        audioSources = struct.unpack_from(f'!{numSources}H', payload, 36)
+        sourceLevels = _AMLV_SOURCE.iter_unpack(payload[levelsOffset:])
+        for audioSource, (left, right, peakLeft, peakRight) in zip(audioSources, sourceLevels):
+            source = levels.sources[audioSource]
+            source.left = (left >> 8) & 0xFFFF
+            source.right = (right >> 8) & 0xFFFF
+            source.peak.left = (peakLeft >> 8) & 0xFFFF
+            source.peak.right = (peakRight >> 8) & 0xFFFF
+
+        # Levels are not reported as state changes (they come many times per second)
+        self._d._markStateChange("audioMixer.levels")
+
+        if self._sw.audioMeter:
+            self._sw.audioMeter.update(payload)
 
 
     def _handleAMTl(self) -> None:
@@ -854,12 +370,14 @@ class ATEMCommandHandlers():
             self._sw.log.debug(f"UNKNOWN numAudioSources ({numAudioSources}) in [{self.cmdStr}]")
             return
 
-        self._d.audioMixer.tally.numSources = numAudioSources
+        tally = self._d.audioMixer.tally
+        self._setState(tally, 'numSources', numAudioSources, "audioMixer.tally")
 
         for a in range(numAudioSources):
             byteOffset = 2+(3*a)
             audioSource = self._getBufAudioSource(byteOffset).value
-            self._d.audioMixer.tally.sources[audioSource].isMixedIn = self._inBuf.getU8Flag(byteOffset+2, 0)
+            self._setState(tally.sources[audioSource], 'isMixedIn', self._inBuf.getU8Flag(byteOffset+2, 0),
+                            f"audioMixer.tally.sources[{audioSource}]")
 
 
     def _handleTlIn(self) -> None:
@@ -868,43 +386,30 @@ class ATEMCommandHandlers():
             self._sw.log.debug(f"UNKNOWN numVideoSources ({numVideoSources}) in [{self.cmdStr}]")
             return
 
-        self._d.tally.byIndex.sources = numVideoSources
-        for a in range(numVideoSources):
-            self._d.tally.byIndex.flags[a].program = self._inBuf.getU8Flag(2+a, 0)
-            self._d.tally.byIndex.flags[a].preview = self._inBuf.getU8Flag(2+a, 1)
+        byIndex = self._d.tally.byIndex
+        self._setState(byIndex, 'sources', numVideoSources, "tally.byIndex")
+        for index, oldFlags, newFlags in byIndex.update(self._inBuf[2:2+numVideoSources]):
+            self._addTallyChanges(f"tally.byIndex.flags[{index}]", oldFlags, newFlags)
 
 
     def _handleTlSr(self) -> None:
-
-        # This handler does NOT use autoReadBuffer
-        readBytesForTlSr = int(((self._p.inputBufferLength-2)/3)*3+2)
-        self._sw._read2InBuf(readBytesForTlSr)
-
         numVideoSources = self._inBuf.getU16(0)
         if numVideoSources >= len(self._p.videoSources):
             self._sw.log.debug(f"UNKNOWN numVideoSources ({numVideoSources}) in [{self.cmdStr}]")
             return
 
-        self._d.tally.bySource.sources = numVideoSources
-
-        readBytesForTlSr = len(self._inBuf)
-        readComp = 2
-        for a in range(numVideoSources):
-            if 2+(3*a) == readBytesForTlSr:
-                readComp -= readBytesForTlSr
-                self._sw._read2InBuf()
+        bySource = self._d.tally.bySource
+        self._setState(bySource, 'sources', numVideoSources, "tally.bySource")
+        for videoSource, oldFlags, newFlags in bySource.update(self._inBuf[2:2+3*numVideoSources]):
+            self._addTallyChanges(f"tally.bySource.flags[{videoSource}]", oldFlags, newFlags)
 
-            byteOffset = readComp+(3*a)
-            videoSource = self._getBufVideoSource(byteOffset).value
-            self._d.tally.bySource.flags[videoSource].program = self._inBuf.getU8Flag(byteOffset+2, 0)
-            self._d.tally.bySource.flags[videoSource].preview = self._inBuf.getU8Flag(byteOffset+2, 1)
 
+    def _addTallyChanges(self, path: str, oldFlags: int, newFlags: int) -> None:
+        """Record the changes of a tally flags byte (already stored by the tally bitmaps)"""
 
-    def _handleTime(self) -> None:
-        self._d.lastStateChange.timeCode.hour = self._inBuf.getU8(0)
-        self._d.lastStateChange.timeCode.minute = self._inBuf.getU8(1)
-        self._d.lastStateChange.timeCode.second = self._inBuf.getU8(2)
-        self._d.lastStateChange.timeCode.frame = self._inBuf.getU8(3)
+        for attr, bit in (('program', PROGRAM_BIT), ('preview', PREVIEW_BIT)):
+            if (oldFlags ^ newFlags) & bit:
+                self._changes.append((f"{path}.{attr}", bool(oldFlags & bit), bool(newFlags & bit)))
 
 
     def _handleNOTIMPLEMENTED(self) -> None:
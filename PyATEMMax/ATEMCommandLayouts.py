@@ -0,0 +1,796 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""
+ATEMCommandLayouts: Blackmagic ATEM switcher command layouts (declarative decoders).
+Part of the PyATEMMax library.
+Layouts do keep the order in https://www.skaarhoj.com/fileadmin/BMDPROTOCOL.html
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import re
+import struct
+
+from .ATEMBuffer import ATEMBuffer
+from .ATEMConstant import ATEMConstant, ATEMConstantList
+from .ATEMException import ATEMException
+from .ATEMProtocol import ATEMProtocol
+from .ATEMUtils import mapValue
+
+
+# Decoder function type: decoder(switcherState, inputBuffer, stateChanges)
+ATEMCommandDecoder = Callable[[Any, ATEMBuffer, List[Tuple[str, Any, Any]]], None]
+
+# struct format characters for each field type (same names as ATEMBuffer get methods)
+_FIELD_FORMATS = {
+    'U8': 'B', 'S8': 'b',
+    'U16': 'H', 'S16': 'h',
+    'U32': 'L', 'S32': 'l',
+    'U64': 'Q', 'S64': 'q',
+}
+
+_INDEX_NAME_RE = re.compile(r'^[A-Za-z]\w*$')
+_TARGET_RE = re.compile(r'^[A-Za-z]\w*(\.[A-Za-z]\w*|\[[A-Za-z]\w*\])*$')
+_PATH_RE = re.compile(r'^[A-Za-z]\w*(\.[A-Za-z]\w*)*$')
+_TARGET_INDEX_RE = re.compile(r'\[([A-Za-z]\w*)\]')
+
+
+# #######################################################################
+#
+#  Decoder helpers (used by compiled decoders)
+#
+
+def _getEnum(constants: ATEMConstantList, raw: int) -> ATEMConstant:
+    """Get an enumerated value (same checks as ATEMCommandHandlers._getBufEnum)"""
+
+    found = constants.byValue(raw)
+    if found.value is None:
+        raise ATEMException(f"UNKNOWN {constants.__class__.__name__} {raw}")
+    return found
+
+
+def _getCString(data: bytes) -> str:
+    """Get a string from a fixed size, zero terminated, field"""
+
+    end = data.find(0)
+    if end != -1:
+        data = data[:end]
+    return data.decode('utf8', "ignore")
+
+
+def _mapEdge(raw: int) -> float:
+    """Map a mask edge value (left/right) to the [-9.0, 9.0] range"""
+
+    return mapValue(raw, -16000, 16000, -9.0, 9.0)
+
+
+# #######################################################################
+#
+#  Fields
+#
+
+class ATEMLayoutField():
+    """A field in a command layout
+
+    Args:
+        path (str): attribute path (relative to the layout target) or index name
+        offset (int): byte offset in the command data
+        fieldType (str): field type ('U8', 'S16', ...)
+    """
+
+    def __init__(self, path: str, offset: int, fieldType: str):
+        if fieldType not in _FIELD_FORMATS:
+            raise ATEMException(f"Invalid layout field type [{fieldType}] for [{path}]")
+
+        self.path = path
+        self.offset = offset
+        self.fieldType = fieldType
+        self.format = _FIELD_FORMATS[fieldType]
+
+
+    def expression(self, var: str, context: Dict[str, Any]) -> str:
+        """Get the Python expression converting the raw value
+
+        Args:
+            var (str): name of the variable holding the raw value
+            context (Dict[str, Any]): globals for the compiled decoder (add needed objects here)
+        """
+
+        return var
+
+
+class _ValueField(ATEMLayoutField):
+    def __init__(self, path: str, offset: int, fieldType: str,
+                 factor: Optional[int] = None, convert: Optional[Callable[[Any], Any]] = None):
+        super().__init__(path, offset, fieldType)
+        self.factor = factor
+        self.convert = convert
+
+    def expression(self, var: str, context: Dict[str, Any]) -> str:
+        if self.convert is not None:
+            name = f"_convert{len(context)}"
+            context[name] = self.convert
+            return f"{name}({var})"
+        if self.factor is not None:
+            return f"{var} / {self.factor}"
+        return var
+
+
+class _FlagField(ATEMLayoutField):
+    def __init__(self, path: str, offset: int, bit: int, fieldType: str):
+        super().__init__(path, offset, fieldType)
+        self.bit = bit
+
+    def expression(self, var: str, context: Dict[str, Any]) -> str:
+        return f"({var} & {1 << self.bit}) != 0"
+
+
+class _LookupField(ATEMLayoutField):
+    def __init__(self, path: str, offset: int, listName: str, fieldType: str,
+                 checkEnum: bool = False, isIndex: bool = False):
+        super().__init__(path, offset, fieldType)
+        if not isinstance(getattr(ATEMProtocol, listName, None), ATEMConstantList):
+            raise ATEMException(f"Invalid layout value list [{listName}] for [{path}]")
+        self.listName = listName
+        self.checkEnum = checkEnum
+        self.isIndex = isIndex
+
+    def expression(self, var: str, context: Dict[str, Any]) -> str:
+        name = f"_{self.listName}"
+        context[name] = getattr(ATEMProtocol, self.listName)
+        if self.checkEnum:
+            context['_getEnum'] = _getEnum
+            return f"_getEnum({name}, {var})"
+        return f"{name}[{var}]"
+
+
+class _StringField(ATEMLayoutField):
+    def __init__(self, path: str, offset: int, length: int):
+        super().__init__(path, offset, 'U8')
+        self.format = f"{length}s"
+
+    def expression(self, var: str, context: Dict[str, Any]) -> str:
+        context['_getCString'] = _getCString
+        return f"_getCString({var})"
+
+
+def index(name: str, offset: int, listName: str, fieldType: str = 'U8') -> ATEMLayoutField:
+    """Index value: a value from a protocol list, used in the layout target (e.g. "mE")"""
+
+    return _LookupField(name, offset, listName, fieldType, isIndex=True)
+
+
+def value(path: str, offset: int, fieldType: str,
+          factor: Optional[int] = None, convert: Optional[Callable[[Any], Any]] = None) -> ATEMLayoutField:
+    """Integer value, optionally divided by a factor (float) or converted by a function"""
+
+    return _ValueField(path, offset, fieldType, factor, convert)
+
+
+def flag(path: str, offset: int, bit: int = 0, fieldType: str = 'U8') -> ATEMLayoutField:
+    """Individual bit in an integer"""
+
+    return _FlagField(path, offset, bit, fieldType)
+
+
+def enum(path: str, offset: int, listName: str, fieldType: str = 'U8') -> ATEMLayoutField:
+    """Enumerated value from a protocol list (unknown values raise an ATEMException)"""
+
+    return _LookupField(path, offset, listName, fieldType, checkEnum=True)
+
+
+def videoSource(path: str, offset: int) -> ATEMLayoutField:
+    """Video source (U16)"""
+
+    return _LookupField(path, offset, 'videoSources', 'U16')
+
+
+def audioSource(path: str, offset: int) -> ATEMLayoutField:
+    """Audio source (U16)"""
+
+    return _LookupField(path, offset, 'audioSources', 'U16')
+
+
+def string(path: str, offset: int, length: int) -> ATEMLayoutField:
+    """Zero terminated string in a fixed size field"""
+
+    return _StringField(path, offset, length)
+
+
+# #######################################################################
+#
+#  Layouts
+#
+
+class ATEMCommandLayout():
+    """Declarative layout of a command
+
+    Args:
+        target (str): path of the target state object, using index names
+                      as keys (e.g. "transition[mE].wipe"), empty for the
+                      switcher state itself
+        fields (ATEMLayoutField): index and value fields
+    """
+
+    def __init__(self, target: str, *fields: ATEMLayoutField):
+        self.target = target
+        self.indexes: List[ATEMLayoutField] = []
+        self.fields: List[ATEMLayoutField] = []
+
+        for field in fields:
+            if isinstance(field, _LookupField) and field.isIndex:
+                self.indexes.append(field)
+            else:
+                self.fields.append(field)
+
+
+    def compile(self, cmdStr: str) -> ATEMCommandDecoder:
+        """Compile the layout into a decoder function
+
+        The decoder reads all fields with a single struct.unpack_from() call
+        and then assigns them to the target state object.
+        Only values that differ from the current state are assigned, each
+        change is appended to stateChanges as (path, old value, new value),
+        using the raw index values in the path (e.g. "programInput[0].videoSource").
+
+        Args:
+            cmdStr (str): command name (used for the function name and error messages)
+
+        Returns:
+            (ATEMCommandDecoder): decoder(switcherState, inputBuffer, stateChanges)
+        """
+
+        if self.target and not _TARGET_RE.match(self.target):
+            raise ATEMException(f"Invalid layout target [{self.target}] for [{cmdStr}]")
+
+        for field in self.indexes:
+            if not _INDEX_NAME_RE.match(field.path):
+                raise ATEMException(f"Invalid layout index name [{field.path}] for [{cmdStr}]")
+
+        for field in self.fields:
+            if not _PATH_RE.match(field.path):
+                raise ATEMException(f"Invalid layout field path [{field.path}] for [{cmdStr}]")
+
+        # Raw values: one per (offset, format), shared by flags in the same byte
+        slots: Dict[int, str] = {}
+        for field in self.indexes + self.fields:
+            if slots.setdefault(field.offset, field.format) != field.format:
+                raise ATEMException(f"Overlapping fields @offset[{field.offset}] in [{cmdStr}] layout")
+
+        structFormat = '!'
+        slotVars: Dict[int, str] = {}
+        position = 0
+        for offset in sorted(slots):
+            if offset < position:
+                raise ATEMException(f"Overlapping fields @offset[{offset}] in [{cmdStr}] layout")
+            if offset > position:
+                structFormat += f"{offset - position}x"
+            structFormat += slots[offset]
+            slotVars[offset] = f"_v{len(slotVars)}"
+            position = struct.calcsize(structFormat)
+
+        context: Dict[str, Any] = { '_struct': struct.Struct(structFormat) }
+
+        # State change paths use raw index values: "transition[{_v0}].wipe."
+        indexVars = { field.path: slotVars[field.offset] for field in self.indexes }
+        for indexName in _TARGET_INDEX_RE.findall(self.target):
+            if indexName not in indexVars:
+                raise ATEMException(f"Undeclared layout index [{indexName}] in target for [{cmdStr}]")
+        pathPrefix = _TARGET_INDEX_RE.sub(lambda m: f"[{{{indexVars[m.group(1)]}}}]", self.target)
+        pathPrefix = f"{pathPrefix}." if pathPrefix else ""
+        pathQuote = "f'" if indexVars else "'"
+
+        lines = [ f"def _decode{cmdStr}(_d, _buf, _changes):" ]
+        lines.append(f"    {', '.join(slotVars.values())}, = _buf.unpack(_struct)")
+
+        for field in self.indexes:
+            lines.append(f"    {field.path} = {field.expression(slotVars[field.offset], context)}")
+
+        lines.append(f"    _t = _d.{self.target}" if self.target else "    _t = _d")
+
+        for field in self.fields:
+            lines.append(f"    _n = {field.expression(slotVars[field.offset], context)}")
+            lines.append(f"    if _t.{field.path} != _n:")
+            lines.append(f"        _changes.append(({pathQuote}{pathPrefix}{field.path}', _t.{field.path}, _n))")
+            lines.append(f"        _t.{field.path} = _n")
+
+        source = '\n'.join(lines) + '\n'
+        exec(compile(source, f"<ATEMCommandLayout {cmdStr}>", 'exec'), context)   # pylint: disable=exec-used
+
+        decoder = context[f"_decode{cmdStr}"]
+        decoder.source = source
+        return decoder
+
+
+# #######################################################################
+#
+#  Command layouts
+#
+#  Commands not listed here are decoded by ATEMCommandHandlers methods.
+#
+
+COMMAND_LAYOUTS: Dict[str, ATEMCommandLayout] = {
+
+    '_ver': ATEMCommandLayout('protocolVersion',
+                value('major', 0, 'U16'),
+                value('minor', 2, 'U16'),
+            ),
+
+    '_pin': ATEMCommandLayout('',
+                string('atemModel', 0, 44),
+            ),
+
+    'Warn': ATEMCommandLayout('',
+                string('warningText', 0, 44),
+            ),
+
+    '_top': ATEMCommandLayout('topology',
+                value('mEs', 0, 'U8'),
+                value('sources', 1, 'U8'),
+                value('colorGenerators', 2, 'U8'),
+                value('auxBusses', 3, 'U8'),
+                value('downstreamKeyers', 4, 'U8'),
+                value('stingers', 5, 'U8'),
+                value('dVEs', 6, 'U8'),
+                value('superSources', 7, 'U8'),
+                flag('hasSDOutput', 9, 0),
+            ),
+
+    '_MeC': ATEMCommandLayout('mixEffect.config[mE]',
+                index('mE', 0, 'mixEffects'),
+                value('keyers', 1, 'U8'),
+            ),
+
+    '_mpl': ATEMCommandLayout('mediaPlayer',
+                value('stillBanks', 0, 'U8'),
+                value('clipBanks', 1, 'U8'),
+            ),
+
+    '_MvC': ATEMCommandLayout('multiViewer.config',
+                value('multiViewers', 0, 'U8'),
+            ),
+
+    '_SSC': ATEMCommandLayout('superSource.config',
+                value('boxes', 0, 'U8'),
+            ),
+
+    '_TlC': ATEMCommandLayout('tally.channelConfig',
+                value('tallyChannels', 4, 'U8'),
+            ),
+
+    '_AMC': ATEMCommandLayout('audioMixer.config',
+                value('audioChannels', 0, 'U8'),
+                flag('hasMonitor', 1, 0),
+            ),
+
+    '_MAC': ATEMCommandLayout('macro.pool',
+                value('banks', 0, 'U8'),
+            ),
+
+    'Powr': ATEMCommandLayout('power.status',
+                flag('main', 0, 0),
+                flag('backup', 0, 1),
+            ),
+
+    'DcOt': ATEMCommandLayout('downConverter',
+                enum('mode', 0, 'downConverterModes'),
+            ),
+
+    'VidM': ATEMCommandLayout('videoMode',
+                enum('format', 0, 'videoModeFormats'),
+            ),
+
+    'InPr': ATEMCommandLayout('inputProperties[videoSource]',
+                index('videoSource', 0, 'videoSources', 'U16'),
+                string('longName', 2, 20),
+                string('shortName', 22, 4),
+                flag('availableExternalPortTypes.sdi', 27, 0),
+                flag('availableExternalPortTypes.hdmi', 27, 1),
+                flag('availableExternalPortTypes.component', 27, 2),
+                flag('availableExternalPortTypes.composite', 27, 3),
+                flag('availableExternalPortTypes.sVideo', 27, 4),
+                enum('externalPortType', 29, 'externalPortTypes'),
+                enum('portType', 30, 'switcherPortTypes'),
+                flag('availability.auxiliary', 34, 0),
+                flag('availability.multiviewer', 34, 1),
+                flag('availability.superSourceArt', 34, 2),
+                flag('availability.superSourceBox', 34, 3),
+                flag('availability.keySourcesEverywhere', 34, 4),
+                flag('mEAvailability.mE1FillSources', 35, 0),
+                flag('mEAvailability.mE2FillSources', 35, 1),
+            ),
+
+    'MvPr': ATEMCommandLayout('multiViewer.properties[multiViewer]',
+                index('multiViewer', 0, 'multiViewers'),
+                enum('layout', 1, 'multiViewerLayouts'),
+            ),
+
+    'MvIn': ATEMCommandLayout('multiViewer.input[multiViewer][windowIndex]',
+                index('multiViewer', 0, 'multiViewers'),
+                index('windowIndex', 1, 'windows'),
+                videoSource('videoSource', 2),
+            ),
+
+    'PrgI': ATEMCommandLayout('programInput[mE]',
+                index('mE', 0, 'mixEffects'),
+                videoSource('videoSource', 2),
+            ),
+
+    'PrvI': ATEMCommandLayout('previewInput[mE]',
+                index('mE', 0, 'mixEffects'),
+                videoSource('videoSource', 2),
+            ),
+
+    'TrSS': ATEMCommandLayout('transition[mE]',
+                index('mE', 0, 'mixEffects'),
+                enum('style', 1, 'transitionStyles'),
+                flag('nextTransition.background', 2, 0),
+                flag('nextTransition.key1', 2, 1),
+                flag('nextTransition.key2', 2, 2),
+                flag('nextTransition.key3', 2, 3),
+                flag('nextTransition.key4', 2, 4),
+                enum('styleNext', 3, 'transitionStyles'),
+                flag('nextTransitionNext.background', 4, 0),
+                flag('nextTransitionNext.key1', 4, 1),
+                flag('nextTransitionNext.key2', 4, 2),
+                flag('nextTransitionNext.key3', 4, 3),
+                flag('nextTransitionNext.key4', 4, 4),
+            ),
+
+    'TrPr': ATEMCommandLayout('transition[mE].preview',
+                index('mE', 0, 'mixEffects'),
+                flag('enabled', 1, 0),
+            ),
+
+    'TrPs': ATEMCommandLayout('transition[mE]',
+                index('mE', 0, 'mixEffects'),
+                flag('inTransition', 1, 0),
+                value('framesRemaining', 2, 'U8'),
+                value('position', 4, 'U16'),
+            ),
+
+    'TMxP': ATEMCommandLayout('transition[mE].mix',
+                index('mE', 0, 'mixEffects'),
+                value('rate', 1, 'U8'),
+            ),
+
+    'TDpP': ATEMCommandLayout('transition[mE].dip',
+                index('mE', 0, 'mixEffects'),
+                value('rate', 1, 'U8'),
+                videoSource('input', 2),
+            ),
+
+    'TWpP': ATEMCommandLayout('transition[mE].wipe',
+                index('mE', 0, 'mixEffects'),
+                value('rate', 1, 'U8'),
+                enum('pattern', 2, 'patternStyles'),
+                value('width', 4, 'U16', factor=100),
+                videoSource('fillSource', 6),
+                value('symmetry', 8, 'U16', factor=100),
+                value('softness', 10, 'U16', factor=100),
+                value('position.x', 12, 'U16', factor=10000),
+                value('position.y', 14, 'U16', factor=10000),
+                flag('reverse', 16, 0),
+                flag('flipFlop', 17, 0),
+            ),
+
+    'TDvP': ATEMCommandLayout('transition[mE].dVE',
+                index('mE', 0, 'mixEffects'),
+                value('rate', 1, 'U8'),
+                enum('style', 3, 'dVETransitionStyles'),
+                videoSource('fillSource', 4),
+                videoSource('keySource', 6),
+                flag('enableKey', 8, 0),
+                flag('preMultiplied', 9, 0),
+                value('clip', 10, 'U16', factor=10),
+                value('gain', 12, 'U16', factor=10),
+                flag('invertKey', 14, 0),
+                flag('reverse', 15, 0),
+                flag('flipFlop', 16, 0),
+            ),
+
+    'TStP': ATEMCommandLayout('transition[mE].stinger',
+                index('mE', 0, 'mixEffects'),
+                enum('source', 1, 'mediaPlayers'),
+                flag('preMultiplied', 2, 0),
+                value('clip', 4, 'U16', factor=10),
+                value('gain', 6, 'U16', factor=10),
+                flag('invertKey', 8, 0),
+                value('preRoll', 10, 'U16'),
+                value('clipDuration', 12, 'U16'),
+                value('triggerPoint', 14, 'U16'),
+                value('mixRate', 16, 'U16'),
+            ),
+
+    'KeOn': ATEMCommandLayout('keyer[mE][keyer].onAir',
+                index('mE', 0, 'mixEffects'),
+                index('keyer', 1, 'keyers'),
+                flag('enabled', 2, 0),
+            ),
+
+    'KeBP': ATEMCommandLayout('keyer[mE][keyer]',
+                index('mE', 0, 'mixEffects'),
+                index('keyer', 1, 'keyers'),
+                enum('type', 2, 'keyerTypes'),
+                flag('fly.enabled', 5, 0),
+                videoSource('fillSource', 6),
+                videoSource('keySource', 8),
+                flag('masked', 10, 0),
+                value('top', 12, 'S16', factor=1000),
+                value('bottom', 14, 'S16', factor=1000),
+                value('left', 16, 'S16', convert=_mapEdge),
+                value('right', 18, 'S16', convert=_mapEdge),
+            ),
+
+    'KeLm': ATEMCommandLayout('key[mE][keyer].luma',
+                index('mE', 0, 'mixEffects'),
+                index('keyer', 1, 'keyers'),
+                flag('preMultiplied', 2, 0),
+                value('clip', 4, 'U16', factor=10),
+                value('gain', 6, 'U16', factor=10),
+                flag('invertKey', 8, 0),
+            ),
+
+    'KeCk': ATEMCommandLayout('key[mE][keyer].chroma',
+                index('mE', 0, 'mixEffects'),
+                index('keyer', 1, 'keyers'),
+                value('hue', 2, 'U16', factor=10),
+                value('gain', 4, 'U16', factor=10),
+                value('ySuppress', 6, 'U16', factor=10),
+                value('lift', 8, 'U16', factor=10),
+                flag('narrow', 10, 0),
+            ),
+
+    'KePt': ATEMCommandLayout('key[mE][keyer].pattern',
+                index('mE', 0, 'mixEffects'),
+                index('keyer', 1, 'keyers'),
+                enum('pattern', 2, 'patternStyles'),
+                value('size', 4, 'U16', factor=100),
+                value('symmetry', 6, 'U16', factor=100),
+                value('softness', 8, 'U16', factor=100),
+                value('position.x', 10, 'U16', factor=10000),
+                value('position.y', 12, 'U16', factor=10000),
+                flag('invertPattern', 14, 0),
+            ),
+
+    'KeDV': ATEMCommandLayout('key[mE][keyer].dVE',
+                index('mE', 0, 'mixEffects'),
+                index('keyer', 1, 'keyers'),
+                value('size.x', 4, 'U32', factor=1000),
+                value('size.y', 8, 'U32', factor=1000),
+                value('position.x', 12, 'S32', factor=1000),
+                value('position.y', 16, 'S32', factor=1000),
+                value('rotation', 20, 'U32', factor=10),
+                flag('border.enabled', 24, 0),
+                flag('shadow', 25, 0),
+                enum('border.bevel.type', 26, 'borderBevels'),
+                value('border.outer.width', 28, 'U16', factor=100),
+                value('border.inner.width', 30, 'U16', factor=100),
+                value('border.outer.softness', 32, 'U8'),
+                value('border.inner.softness', 33, 'U8'),
+                value('border.bevel.softness', 34, 'U8', factor=100),
+                value('border.bevel.position', 35, 'U8', factor=100),
+                value('border.opacity', 36, 'U8'),
+                value('border.hue', 38, 'U16', factor=10),
+                value('border.saturation', 40, 'U16', factor=10),
+                value('border.luma', 42, 'U16', factor=10),
+                value('lightSource.direction', 44, 'U16', factor=10),
+                value('lightSource.altitude', 46, 'U8'),
+                flag('masked', 47, 0),
+                value('top', 48, 'S16', factor=1000),
+                value('bottom', 50, 'S16', factor=1000),
+                value('left', 52, 'S16', convert=_mapEdge),
+                value('right', 54, 'S16', convert=_mapEdge),
+                value('rate', 56, 'U8'),
+            ),
+
+    'KeFS': ATEMCommandLayout('keyer[mE][keyer].fly',
+                index('mE', 0, 'mixEffects'),
+                index('keyer', 1, 'keyers'),
+                flag('isASet', 2, 0),
+                flag('isBSet', 3, 0),
+                flag('isAtKeyFrame.a', 6, 0),
+                flag('isAtKeyFrame.b', 6, 1),
+                flag('isAtKeyFrame.full', 6, 2),
+                flag('isAtKeyFrame.runToInfinite', 6, 3),
+                value('runtoInfiniteindex', 7, 'U8'),
+            ),
+
+    'KKFP': ATEMCommandLayout('keyer[mE][keyer].fly.keyFrame[keyFrame]',
+                index('mE', 0, 'mixEffects'),
+                index('keyer', 1, 'keyers'),
+                index('keyFrame', 2, 'keyFrames'),
+                value('size.x', 4, 'U32', factor=1000),
+                value('size.y', 8, 'U32', factor=1000),
+                value('position.x', 12, 'S32', factor=1000),
+                value('position.y', 16, 'S32', factor=1000),
+                value('rotation', 20, 'U32', factor=10),
+                value('border.outer.width', 24, 'U16', factor=100),
+                value('border.inner.width', 26, 'U16', factor=100),
+                value('border.outer.softness', 28, 'U8'),
+                value('border.inner.softness', 29, 'U8'),
+                value('border.bevel.softness', 30, 'U8', factor=100),
+                value('border.bevel.position', 31, 'U8', factor=100),
+                value('border.opacity', 32, 'U8'),
+                value('border.hue', 34, 'U16', factor=10),
+                value('border.saturation', 36, 'U16', factor=10),
+                value('border.luma', 38, 'U16', factor=10),
+                value('lightSource.direction', 40, 'U16', factor=10),
+                value('lightSource.altitude', 42, 'U8'),
+                value('top', 44, 'S16', factor=1000),
+                value('bottom', 46, 'S16', factor=1000),
+                value('left', 48, 'S16', convert=_mapEdge),
+                value('right', 50, 'S16', convert=_mapEdge),
+            ),
+
+    'DskB': ATEMCommandLayout('downstreamKeyer[dsk]',
+                index('dsk', 0, 'dsks'),
+                videoSource('fillSource', 2),
+                videoSource('keySource', 4),
+            ),
+
+    'DskP': ATEMCommandLayout('downstreamKeyer[dsk]',
+                index('dsk', 0, 'dsks'),
+                flag('tie', 1, 0),
+                value('rate', 2, 'U8'),
+                flag('preMultiplied', 3, 0),
+                value('clip', 4, 'U16', factor=10),
+                value('gain', 6, 'U16', factor=10),
+                flag('invertKey', 8, 0),
+                flag('masked', 9, 0),
+                value('top', 10, 'S16', factor=1000),
+                value('bottom', 12, 'S16', factor=1000),
+                value('left', 14, 'S16', convert=_mapEdge),
+                value('right', 16, 'S16', convert=_mapEdge),
+            ),
+
+    'DskS': ATEMCommandLayout('downstreamKeyer[dsk]',
+                index('dsk', 0, 'dsks'),
+                flag('onAir', 1, 0),
+                flag('inTransition', 2, 0),
+                flag('isAutoTransitioning', 3, 0),
+                value('framesRemaining', 4, 'U8'),
+            ),
+
+    'FtbP': ATEMCommandLayout('fadeToBlack[mE]',
+                index('mE', 0, 'mixEffects'),
+                value('rate', 1, 'U8'),
+            ),
+
+    'FtbS': ATEMCommandLayout('fadeToBlack[mE].state',
+                index('mE', 0, 'mixEffects'),
+                flag('fullyBlack', 1, 0),
+                flag('inTransition', 2, 0),
+                value('framesRemaining', 3, 'U8'),
+            ),
+
+    'ColV': ATEMCommandLayout('colorGenerator[colorGenerator]',
+                index('colorGenerator', 0, 'colorGenerators'),
+                value('hue', 2, 'U16', factor=10),
+                value('saturation', 4, 'U16', factor=10),
+                value('luma', 6, 'U16', factor=10),
+            ),
+
+    'AuxS': ATEMCommandLayout('auxSource[aUXChannel]',
+                index('aUXChannel', 0, 'auxChannels'),
+                videoSource('input', 2),
+            ),
+
+    'RCPS': ATEMCommandLayout('clipPlayer[mediaPlayer]',
+                index('mediaPlayer', 0, 'mediaPlayers'),
+                flag('playing', 1, 0),
+                flag('loop', 2, 0),
+                flag('atBeginning', 3, 0),
+                value('clipFrame', 4, 'U16'),
+            ),
+
+    'MPCE': ATEMCommandLayout('mediaPlayer.source[mediaPlayer]',
+                index('mediaPlayer', 0, 'mediaPlayers'),
+                enum('type', 1, 'mediaPlayerSourceTypes'),
+                value('stillIndex', 2, 'U8'),
+                value('clipIndex', 3, 'U8'),
+            ),
+
+    'MPSp': ATEMCommandLayout('mediaPoolStorage',
+                value('clip1MaxLength', 0, 'U16'),
+                value('clip2MaxLength', 2, 'U16'),
+            ),
+
+    'MPCS': ATEMCommandLayout('mediaPlayer.clipSource[clipBank]',
+                index('clipBank', 0, 'clipBanks'),
+                flag('isUsed', 1, 0),
+                string('fileName', 2, 16),
+                value('frames', 66, 'U16'),
+            ),
+
+    'MPAS': ATEMCommandLayout('mediaPlayer.audioSource[clipBank]',
+                index('clipBank', 0, 'clipBanks'),
+                flag('isUsed', 1, 0),
+                string('fileName', 18, 16),
+            ),
+
+    'MRPr': ATEMCommandLayout('macro.runStatus',
+                flag('state.running', 0, 0),
+                flag('state.waiting', 0, 1),
+                flag('isLooping', 1, 0),
+                value('index', 2, 'U16'),
+            ),
+
+    'MRcS': ATEMCommandLayout('macro.recordingStatus',
+                flag('isRecording', 0, 0),
+                value('index', 2, 'U16'),
+            ),
+
+    'SSrc': ATEMCommandLayout('superSource',
+                videoSource('fillSource', 0),
+                videoSource('keySource', 2),
+                flag('foreground', 4, 0),
+                flag('preMultiplied', 5, 0),
+                value('clip', 6, 'U16', factor=10),
+                value('gain', 8, 'U16', factor=10),
+                flag('invertKey', 10, 0),
+                flag('border.enabled', 11, 0),
+                enum('border.bevel.value', 12, 'borderBevels'),
+                value('border.outer.width', 14, 'U16', factor=100),
+                value('border.inner.width', 16, 'U16', factor=100),
+                value('border.outer.softness', 18, 'U8'),
+                value('border.inner.softness', 19, 'U8'),
+                value('border.bevel.softness', 20, 'U8', factor=100),
+                value('border.bevel.position', 21, 'U8', factor=100),
+                value('border.hue', 22, 'U16', factor=10),
+                value('border.saturation', 24, 'U16', factor=10),
+                value('border.luma', 26, 'U16', factor=10),
+                value('lightSource.direction', 28, 'U16', factor=10),
+                value('lightSource.altitude', 30, 'U8'),
+            ),
+
+    'SSBP': ATEMCommandLayout('superSource.boxParameters[box]',
+                index('box', 1, 'boxes'),
+                flag('enabled', 2, 0),
+                videoSource('inputSource', 4),
+                value('position.x', 6, 'S16', factor=100),
+                value('position.y', 8, 'S16', factor=100),
+                value('size', 10, 'U16', factor=1000),
+                flag('cropped', 12, 0),
+                value('crop.top', 14, 'U16', factor=1000),
+                value('crop.bottom', 16, 'U16', factor=1000),
+                value('crop.left', 18, 'U16', factor=1000),
+                value('crop.right', 20, 'U16', factor=1000),
+            ),
+
+    'AMIP': ATEMCommandLayout('audioMixer.input[audioSource]',
+                index('audioSource', 0, 'audioSources', 'U16'),
+                enum('type', 2, 'audioMixerInputTypes'),
+                flag('fromMediaPlayer', 6, 0),
+                enum('plugtype', 7, 'audioMixerInputPlugTypes'),
+                enum('mixOption', 8, 'audioMixerInputMixOptions'),
+                value('volume', 10, 'U16', convert=ATEMProtocol.audioWord2Db),
+                value('balance', 12, 'S16', factor=10000),
+            ),
+
+    'AMMO': ATEMCommandLayout('audioMixer.master',
+                value('volume', 0, 'U16', convert=ATEMProtocol.audioWord2Db),
+            ),
+
+    'AMmO': ATEMCommandLayout('audioMixer.monitor',
+                flag('monitorAudio', 0, 0),
+                value('volume', 2, 'U16', convert=ATEMProtocol.audioWord2Db),
+                flag('mute', 4, 0),
+                flag('solo', 5, 0),
+                audioSource('soloInput', 6),
+                flag('dim', 8, 0),
+            ),
+
+    'Time': ATEMCommandLayout('lastStateChange.timeCode',
+                value('hour', 0, 'U8'),
+                value('minute', 1, 'U8'),
+                value('second', 2, 'U8'),
+                value('frame', 3, 'U8'),
+            ),
+}
+
+
+# Compiled decoders for all command layouts
+COMMAND_DECODERS: Dict[str, ATEMCommandDecoder] = {
+    cmdStr: layout.compile(cmdStr) for cmdStr, layout in COMMAND_LAYOUTS.items()
+}
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""
+ATEMCommandQueue: Blackmagic ATEM switcher outgoing command packet queue.
+Part of the PyATEMMax library.
+"""
+
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import asyncio
+import collections
+import threading
+
+from .ATEMProtocol import ATEMProtocol
+
+# Creation of confirmation wait events (they are created only when needed)
+_waitEventLock = threading.Lock()
+
+
+class ATEMCommandConfirmation():
+    """Confirmation of a command sent to the switcher (returned by set/exec methods)
+
+    A command is confirmed when the switcher sends back its state with the
+    requested value (commands with a state echo, e.g. PrgI for
+    setProgramInputVideoSource()) or, for commands with no echo, when the
+    switcher acks the packet. It fails if the packet is lost, the connection
+    is reset or the echo doesn't come in ATEMProtocol.commandEchoTimeout
+    seconds after the ack.
+
+    State echoes are only checked for commands someone waits for (the
+    state may have the requested value before wait() is called).
+
+    wait() blocks the calling thread, waitAsync() is its coroutine version
+    (for the asyncio event loop, e.g. with ATEMAsyncMax).
+
+    Args:
+        cmdStr (str): command name
+        echoCmdStr (str, optional): state command sent back by the switcher (None: confirmed by the ack)
+        check (Callable[[], bool], optional): does the switcher state have the requested value?
+        watch (Callable[[ATEMCommandConfirmation], None], optional): start checking the state echoes
+    """
+
+    def __init__(self, cmdStr: str, echoCmdStr: Optional[str] =None, check: Optional[Callable[[], bool]] =None,
+                 watch: Optional[Callable[['ATEMCommandConfirmation'], None]] =None):
+        self.cmdStr = cmdStr
+        self.echoCmdStr = echoCmdStr
+        self.check = check
+        self._watch = watch
+
+        # Result: None while waiting, True if confirmed, False if failed
+        self.confirmed: Optional[bool] = None
+
+        # Time (time.monotonic()) when waiting for the echo fails (set when the packet is acked)
+        self.expires: Optional[float] = None
+
+        self._event: Optional[threading.Event] = None
+        self._future: Optional['asyncio.Future[bool]'] = None
+
+
+    def __repr__(self) -> str:
+        return f"<ATEMCommandConfirmation {self.cmdStr} confirmed={self.confirmed}>"
+
+
+    def done(self) -> bool:
+        """Is the command confirmed (or failed)?"""
+
+        return self.confirmed is not None
+
+
+    def wait(self, timeout: Optional[float] =None) -> bool:
+        """Wait until the command is confirmed (or fails)
+
+        Args:
+            timeout (float, optional): max seconds to wait (None: wait forever)
+
+        Returns:
+            True if the command was confirmed
+        """
+
+        self.watchEcho()
+
+        if self.confirmed is None:
+            with _waitEventLock:
+                if self._event is None:
+                    self._event = threading.Event()
+
+            # Checked again: resolve() may have been called before the event was created
+            if self.confirmed is None:
+                self._event.wait(timeout)
+
+        return bool(self.confirmed)
+
+
+    async def waitAsync(self, timeout: Optional[float] =None) -> bool:
+        """Wait until the command is confirmed (or fails), without blocking the event loop
+
+        Args:
+            timeout (float, optional): max seconds to wait (None: wait forever)
+
+        Returns:
+            True if the command was confirmed
+        """
+
+        self.watchEcho()
+
+        if self.confirmed is None:
+            with _waitEventLock:
+                if self._future is None:
+                    self._future = asyncio.get_running_loop().create_future()
+                future = self._future
+
+            # Checked again: resolve() may have been called before the future was created
+            if self.confirmed is None:
+                try:
+                    await asyncio.wait_for(asyncio.shield(future), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+        return bool(self.confirmed)
+
+
+    def watchEcho(self) -> None:
+        """Start checking the state echoes (called when waiting)"""
+
+        if self.confirmed is None and self.echoCmdStr is not None and self._watch is not None:
+            watch = self._watch
+            self._watch = None
+            watch(self)
+
+
+    def acked(self, now: float, echoTimeout: float) -> None:
+        """The packet with the command was acked by the switcher
+
+        Args:
+            now (float): current time (time.monotonic())
+            echoTimeout (float): seconds to wait for the state echo
+        """
+
+        if self.echoCmdStr is None:
+            self.resolve(True)
+        else:
+            self.expires = now + echoTimeout
+
+
+    def resolve(self, confirmed: bool) -> None:
+        """Set the result (and wake up the waiters)
+
+        Args:
+            confirmed (bool): True if confirmed, False if failed
+        """
+
+        if self.confirmed is not None:
+            return
+
+        self.confirmed = confirmed
+        event = self._event
+        if event is not None:
+            event.set()
+
+        future = self._future
+        if future is not None:
+            # resolve() may be called from another thread (e.g. the ATEMMax comms thread)
+            future.get_loop().call_soon_threadsafe(self._setFutureResult, future, confirmed)
+
+
+    @staticmethod
+    def _setFutureResult(future: 'asyncio.Future[bool]', confirmed: bool) -> None:
+        """Wake up the waitAsync() callers (in the future's event loop)"""
+
+        if not future.done():
+            future.set_result(confirmed)
+
+
+class ATEMCommandQueue():
+    """Outgoing command packet queue, with an in-flight window of unacked packets
+
+    Command packets wait in the queue until there is room in the in-flight
+    window (ATEMProtocol.maxCommandPacketsInFlight, never more than
+    ATEMProtocol.switcherPacketWindow) and the send rate allows it (token
+    bucket: ATEMProtocol.maxCommandPacketRate, ATEMProtocol.commandPacketBurst).
+
+    There is a queue for each priority (ATEMProtocol.commandPriorities):
+    queued packets with lower priority values are sent first, packets with
+    the same priority are sent in order. Packets queued one after another
+    with the same priority are merged while they fit in a packet, so the
+    command rate keeps up when the packet rate is limited.
+
+    Packets in flight are retransmitted (with the resend flag) when the
+    switcher does not ack them in ATEMProtocol.commandAckTimeout seconds, and
+    dropped (lost) after ATEMProtocol.maxCommandRetransmits retransmissions
+    with no acks.
+
+    Packet ids are assigned by the caller when the packet is sent.
+
+    Args:
+        protocol (ATEMProtocol): protocol settings (read when used, so they can be changed anytime)
+    """
+
+    def __init__(self, protocol: ATEMProtocol):
+        self.atem = protocol
+
+        # Packets waiting to be sent, by priority: (header space + commands, confirmations)
+        self._queued: Dict[int, Deque[Tuple[bytearray, List[ATEMCommandConfirmation]]]] = {}
+        self._queuedCount: int = 0
+
+        # Send rate token bucket: available packets and last refill time (time.monotonic())
+        self._tokens: float = float(self.atem.commandPacketBurst)
+        self._tokensUpdated: Optional[float] = None
+
+        # Packets in flight by packet id: [packet, first send time, last send time, retransmissions, confirmations]
+        self._inFlight: collections.OrderedDict[int, List] = collections.OrderedDict()
+
+        # Recent ack latencies: (packet id, seconds since the packet was first sent)
+        self.ackLatencies: Deque[Tuple[int, float]] = collections.deque(maxlen=self.atem.ackLatencyHistory)
+
+        # Retransmitted/lost (never acked) packet counters
+        self.retransmittedPackets: int = 0
+        self.lostPackets: int = 0
+
+
+    def __len__(self) -> int:
+        return self._queuedCount
+
+
+    @property
+    def inFlight(self) -> int:
+        """Number of packets waiting for an ack"""
+
+        return len(self._inFlight)
+
+
+    def reset(self) -> None:
+        """Discard all queued and in-flight packets (e.g. on reconnection), their commands fail"""
+
+        for queued in self._queued.values():
+            for _, confirmations in queued:
+                for confirmation in confirmations:
+                    confirmation.resolve(False)
+
+        for inFlight in self._inFlight.values():
+            for confirmation in inFlight[4]:
+                confirmation.resolve(False)
+
+        self._queued.clear()
+        self._queuedCount = 0
+        self._inFlight.clear()
+        self._tokens = float(self.atem.commandPacketBurst)
+        self._tokensUpdated = None
+
+
+    def put(self, packet: bytearray, confirmations: List[ATEMCommandConfirmation]) -> None:
+        """Queue a command packet
+
+        The packet gets the priority of its most urgent command, and is
+        merged into the previous queued packet of that priority if it fits.
+
+        Args:
+            packet (bytearray): packet (header space + commands)
+            confirmations (List[ATEMCommandConfirmation]): confirmations of the commands in the packet
+        """
+
+        priorities = self.atem.commandPriorities
+        priority = min(priorities.get(confirmation.cmdStr, 0) for confirmation in confirmations)
+
+        queued = self._queued.get(priority)
+        if queued is None:
+            queued = self._queued[priority] = collections.deque()
+        elif len(queued[-1][0]) + len(packet) - self.atem.headerLen <= self.atem.outputBufferLength:
+            lastPacket, lastConfirmations = queued[-1]
+            lastPacket += memoryview(packet)[self.atem.headerLen:]
+            lastConfirmations.extend(confirmations)
+            return
+
+        queued.append((packet, confirmations))
+        self._queuedCount += 1
+
+
+    def pop(self, now: float) -> Optional[Tuple[bytearray, List[ATEMCommandConfirmation]]]:
+        """Take the next packet to send (if there's room in the in-flight window and the send rate allows it)
+
+        Args:
+            now (float): current time (time.monotonic())
+
+        Returns:
+            The packet and its confirmations, None if there are no packets or they can't be sent now
+        """
+
+        if not self._queuedCount or self._windowFull():
+            return None
+
+        if self.atem.maxCommandPacketRate > 0:
+            self._refillTokens(now)
+            if self._tokens < 1.0:
+                return None
+            self._tokens -= 1.0
+
+        priority = min(self._queued)
+        queued = self._queued[priority]
+        packet = queued.popleft()
+        if not queued:
+            del self._queued[priority]
+
+        self._queuedCount -= 1
+        return packet
+
+
+    def nextSendTime(self, now: float) -> Optional[float]:
+        """Get the time (time.monotonic()) when the send rate allows sending the next queued packet
+
+        Args:
+            now (float): current time (time.monotonic())
+
+        Returns:
+            The time, None if there are no packets or they wait for room in the in-flight window (acks)
+        """
+
+        if not self._queuedCount or self._windowFull():
+            return None
+
+        rate = self.atem.maxCommandPacketRate
+        if rate <= 0:
+            return now
+
+        self._refillTokens(now)
+        return now + max(0.0, 1.0 - self._tokens) / rate
+
+
+    def _windowFull(self) -> bool:
+        """Is the in-flight window full?"""
+
+        return len(self._inFlight) >= min(self.atem.maxCommandPacketsInFlight, self.atem.switcherPacketWindow)
+
+
+    def _refillTokens(self, now: float) -> None:
+        """Add the send rate tokens earned since the last refill"""
+
+        if self._tokensUpdated is not None:
+            self._tokens = min(float(self.atem.commandPacketBurst),
+                               self._tokens + (now - self._tokensUpdated) * self.atem.maxCommandPacketRate)
+        self._tokensUpdated = now
+
+
+    def sent(self, packetId: int, packet: bytearray, confirmations: List[ATEMCommandConfirmation], now: float) -> None:
+        """Register a sent packet as in flight
+
+        Args:
+            packetId (int): local packet id
+            packet (bytearray): packet as sent
+            confirmations (List[ATEMCommandConfirmation]): confirmations of the commands in the packet
+            now (float): current time (time.monotonic())
+        """
+
+        self._inFlight[packetId] = [packet, now, now, 0, confirmations]
+
+
+    def ack(self, ackId: int, now: float) -> List[int]:
+        """Process an ack from the switcher
+
+        Acks are cumulative: all packets up to ackId (15 bit wrapping) are acked.
+
+        Args:
+            ackId (int): acked packet id
+            now (float): current time (time.monotonic())
+
+        Returns:
+            Acked packet ids
+        """
+
+        acked = [ packetId for packetId in self._inFlight if (ackId - packetId) & 0x7FFF < 0x4000 ]
+
+        for packetId in acked:
+            _, firstSent, _, _, confirmations = self._inFlight.pop(packetId)
+            self.ackLatencies.append((packetId, now - firstSent))
+            for confirmation in confirmations:
+                confirmation.acked(now, self.atem.commandEchoTimeout)
+
+        # Newer packets can't be acked before the older ones:
+        # retransmissions only count while the switcher makes no progress
+        if acked:
+            for inFlight in self._inFlight.values():
+                inFlight[3] = 0
+
+        return acked
+
+
+    def takeRetransmits(self, now: float) -> Tuple[List[bytearray], List[int]]:
+        """Take the packets to retransmit (not acked in time)
+
+        Packets retransmitted too many times (since the last ack) are
+        dropped (lost).
+
+        Args:
+            now (float): current time (time.monotonic())
+
+        Returns:
+            Packets to retransmit (resend flag already set), lost packet ids
+        """
+
+        retransmits: List[bytearray] = []
+        lost: List[int] = []
+
+        for packetId, inFlight in self._inFlight.items():
+            packet, _, lastSent, retransmissions, _ = inFlight
+            if lastSent + self.atem.commandAckTimeout > now:
+                continue
+
+            if retransmissions >= self.atem.maxCommandRetransmits:
+                lost.append(packetId)
+                continue
+
+            packet[0] |= self.atem.cmdFlags.resend.value << 3
+            inFlight[2] = now
+            inFlight[3] = retransmissions + 1
+            retransmits.append(packet)
+
+        for packetId in lost:
+            for confirmation in self._inFlight.pop(packetId)[4]:
+                confirmation.resolve(False)
+
+        self.retransmittedPackets += len(retransmits)
+        self.lostPackets += len(lost)
+        return retransmits, lost
+
+
+    def nextDeadline(self) -> Optional[float]:
+        """Get the time (time.monotonic()) of the next retransmission check
+
+        Returns:
+            The time, None if there are no packets in flight
+        """
+
+        if not self._inFlight:
+            return None
+
+        return min(inFlight[2] for inFlight in self._inFlight.values()) + self.atem.commandAckTimeout
@@ -7,29 +7,48 @@ Part of the PyATEMMax library.
 
 # pyright: reportGeneralTypeIssues=false, reportUnknownMemberType=false
 
-from typing import Callable, Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Any
 
 import abc
+import contextlib
+import functools
 import time
 import threading
 import queue
 import logging
+import selectors
+import socket
+import struct
 
 from .ATEMProtocol import ATEMProtocol
 from .ATEMUtils import hexStr, hasTimedOut
 from .ATEMSocket import ATEMUDPSocket
 from .ATEMBuffer import ATEMBuffer
+from .ATEMCommandQueue import ATEMCommandQueue, ATEMCommandConfirmation
+from .ATEMEventQueue import ATEMEventQueue, ATEMEventSubscription
 from .ATEMException import ATEMException
+from .ATEMSwitcherState import ATEMSwitcherState
 
 THREAD_EXIT_MSG = 'exit'
 
+# Separator for event filters ("receive:PrgI", "change:programInput[0]")
+EVENT_FILTER_SEPARATOR = ':'
+
+# Precompiled structs for packet and command headers
+_PACKET_HEADER = struct.Struct('!HHH')      # Command bits + length, session ID, remote packet ID
+_PACKET_ID = struct.Struct('!H')            # Local packet ID (@offset 10)
+_COMMAND_PACKET_HEADER = struct.Struct('!HHH4xH')  # Command bits + length, session ID, remote packet ID, local packet ID
+_COMMAND_HEADER = struct.Struct('!H2x4s')   # Command length, command string
+
 
 class ATEMConnectionManager():
     """Blackmagic ATEM switcher connection manager
 
     ATEMConnectionManager is meant to be used as a base class for specific
     implementations (such as ATEMMax).
-    It manages the connection and parsing part of the protocol.
+    It manages the connection and parsing part of the protocol, the
+    transport (threads or event loop) is left to the subclasses
+    (see ATEMThreadedConnectionManager and ATEMAsyncMax).
 
     This class is a port of Skårhøj's ATEMbase class.
     """
@@ -50,32 +69,84 @@ class ATEMConnectionManager():
         self._cmdHandlers: Dict[str, Any] = {}
 
         # Event subscriptions
-        self._eventSubscriptions: Dict[str, List[Any]] = {}
+        self._eventSubscriptions: Dict[str, List[ATEMEventSubscription]] = {}
 
-        # Event Thread
-        self._eventThread = threading.Thread(target=self._eventThreadHandler)
-        self._eventThreadCmdQ: queue.Queue[Dict[str, Any]] = queue.Queue()
-        self._eventThreadEventQ: queue.Queue[Dict[str, Any]] = queue.Queue()
+        # Subscription index, checked before building events
+        # (event names with subscriptions, commands with receive subscriptions - None means all)
+        self._subscribedEvents: Set[str] = set()
+        self._subscribedCommands: Optional[Set[str]] = set()
+
+        # State changes made by the command being processed: (path, old value, new value)
+        # (never regenerated, command handlers keep a reference to it)
+        self._stateChanges: List[Tuple[str, Any, Any]] = []
+
+        # State the received commands are applied to, for its snapshots
+        # (set by the implementations keeping the state, such as ATEMMax)
+        self._snapshotState: Optional[ATEMSwitcherState] = None
+
+        # Events waiting to be emitted (by the event thread or the event loop of the transport)
+        # (data events waiting in the queue are coalesced by event key)
+        self._eventThreadEventQ: ATEMEventQueue = ATEMEventQueue()
+
+        # Buffers for storing segments of the packets from ATEM and creating answer packets.
+        # (never regenerated, command handlers keep a reference to them)
+        self._inBuf: ATEMBuffer = ATEMBuffer(self.atem.inputBufferLength)
+        self._outBuf: ATEMBuffer = ATEMBuffer(self.atem.outputBufferLength)
+
+        # Buffer for the control packets (hello, acks, resend requests) sent by the comms thread
+        # (never shared with the commands being built in the user thread)
+        self._controlBuf: ATEMBuffer = ATEMBuffer(self.atem.outputBufferLength)
+
+        # Auto bundling window (seconds, 0: disabled)
+        self._autoBundleWindow: float = 0.0
+
+        # Outgoing command packets: queue and in-flight window (packets waiting for an ack)
+        self.commandQueue: ATEMCommandQueue = ATEMCommandQueue(self.atem)
+
+        # Commands waiting for their state echo, by echo command
+        self._pendingEchoes: Dict[str, List[ATEMCommandConfirmation]] = {}
+
+        # Command packets are sent by the user thread and the comms thread (acks/retransmissions)
+        self._commandLock = threading.Lock()
 
         # Initialize all data members
         self._resetInternalData()
 
         # Udp communication object
-        self._udp = ATEMUDPSocket()
+        self._udp: ATEMUDPSocket = self._createUDPSocket()
 
 
-    def registerEvent(self, event: str, callback: Callable[[Dict[Any, Any]], None])-> None:
+    def registerEvent(self, event: str, callback: Callable[[Dict[Any, Any]], None], maxRate: float =0.0)-> None:
         """Register an event handler
 
+        Receive events can be filtered by command, adding it after the event
+        name (e.g. "receive:PrgI").
+        State change events can be filtered by path prefix, adding it after
+        the event name (e.g. "change:programInput[0]" or "change:tally.bySource").
+
+        With maxRate, the callback is called at most maxRate times per second
+        for each command (receive) or path (change). Events arriving faster
+        are coalesced and the newest one is delivered when the interval ends.
+
         Args:
-            event (str): name of the event (see docs)
+            event (str): name of the event (see docs), with an optional filter
             callback (Callable[[Dict[Any, Any]], None]): user callback
+            maxRate (float, default=0.0): max calls per second (0.0 means no limit)
         """
 
         if event not in self._eventSubscriptions:
             self._eventSubscriptions[event] = []
 
-        self._eventSubscriptions[event].append(callback)
+        self._eventSubscriptions[event].append(ATEMEventSubscription(callback, maxRate))
+
+        # Update the subscription index (replacing the sets, the comms thread may be reading them)
+        eventName, _, eventFilter = event.partition(EVENT_FILTER_SEPARATOR)
+        self._subscribedEvents = self._subscribedEvents | { eventName }
+        if eventName == self.atem.events.receive:
+            if not eventFilter:
+                self._subscribedCommands = None
+            elif self._subscribedCommands is not None:
+                self._subscribedCommands = self._subscribedCommands | { eventFilter }
 
 
     def _registerCmdHandler(self, command: str, callback: Callable[[str], None]) -> None:
@@ -84,17 +155,6 @@ class ATEMConnectionManager():
         self._cmdHandlers[command] = { "callback": callback }
 
 
-    def __del__(self) -> None:
-        """Things to do when killed :)"""
-
-        self.log.debug("Destroying object, cleaning up")
-        if self.started:
-            self.log.debug('Stopping comms')
-            self.disconnect()
-            self.log.debug('Comms stopped')
-        self.log.debug('Finished cleanup')
-
-
     # pylint: disable=attribute-defined-outside-init
     def _resetInternalData(self):
         """Reset value of all internal variables. Useful for reconnections"""
@@ -121,10 +181,6 @@ class ATEMConnectionManager():
         # IP address of the switcher
         self.ip: str = ""
 
-        # Comms Thread
-        self._commsThread = threading.Thread(target=self._commsThreadHandler)
-        self._commsThreadCmdQ: queue.Queue = queue.Queue()
-
         # This is our counter for the command packets we might like to send to ATEM.
         self._localPacketIdCounter: int = 0
 
@@ -161,21 +217,37 @@ class ATEMConnectionManager():
         # Used when parsing packets.
         self._cmdPointer: int = 0
 
-        # If set, we are building a set-command bundle.
-        self._cBundle: bool = False
+        # Nested command bundles (batch()/commandBundleStart()) in progress.
+        self._bundleDepth: int = 0
 
-        # Bundle Buffer Offset; This is an offset if you want to add more commands.
-        self._cBBO: int = 0
+        # Commands waiting to be sent in a bundle: (raw command header + data, confirmation).
+        self._bundledCommands: List[Tuple[bytes, ATEMCommandConfirmation]] = []
+
+        # Time (monotonic) when the auto bundling window ends (None: no window open).
+        self._bundleDeadline: Optional[float] = None
 
         # Used for auto-connection.
         self._neverConnected: bool = True
 
-        # Are we waiting for missed packets ?
-        self._waitingForIncoming: bool = False
+        # Missed initialization packets requested to the switcher: packet id -> request time (monotonic)
+        self._initPacketRequests: Dict[int, float] = {}
 
-        # Buffers for storing segments of the packets from ATEM and creating answer packets.
-        self._inBuf: ATEMBuffer = ATEMBuffer(self.atem.inputBufferLength)
-        self._outBuf: ATEMBuffer = ATEMBuffer(self.atem.outputBufferLength)
+        # Highest remote packet id received during the initialization
+        self._highestRemotePacketID: int = 0
+
+        # Next remote packet id expected in order (once connected)
+        self._nextRemotePacketID: int = 0
+
+        # Packets received after a gap, waiting for the missing ones: packet id -> datagram
+        self._heldRemotePackets: Dict[int, bytes] = {}
+
+        # Missing packets requested to the switcher: packet id -> [request time (monotonic), requests]
+        self._missedPacketRequests: Dict[int, List] = {}
+
+        # Clear packet buffers
+        self._inBuf.reset()
+        self._outBuf.reset()
+        self._controlBuf.reset()
 
 
     def setPayloadSent(self):
@@ -185,33 +257,12 @@ class ATEMConnectionManager():
             self.log.debug(f"Initial payload received @rpID 0x{self._initPayloadSentAtPacketId:X} sessionId 0x{self.sessionID:X}")
 
 
-    def ping(self, ip: str, timeout: int =5) -> None:
-        """Ping the switcher.
-
-        Args:
-            ip (str): IP address of the switcher
-            timeout (int): timeout (seconds)
-        """
-
-        self.connect(ip, timeout, pingMode=True)
-
-
-    def connect(self, ip: str, connTimeout: int =5, pingMode: bool = False) -> None:
-        """Connect to the switcher.
-
-        Args:
-            ip (str): IP address of the switcher
-            connTimeout (int): connection timeout (seconds)
-            pingMode (bool): connect in "ping" mode? (ignore data, just wait for UDP conn)
-        """
-
-        if self.started:
-            self.log.debug("Closing previous connection")
-            self.disconnect()
+    def _prepareConnection(self, ip: str, connTimeout: int, pingMode: bool) -> None:
+        """Set connection parameters before starting the connection process"""
 
         self.log.info(f"Starting connection with ATEM switcher on {ip}")
         self._neverConnected = True
-        self._waitingForIncoming = False
+        self._initPacketRequests = {}
 
         self.ip = ip
         self._connTimeout = connTimeout
@@ -220,33 +271,11 @@ class ATEMConnectionManager():
 
         self.resetCommandBundle()
 
-        self._eventThread = threading.Thread(target=self._eventThreadHandler)
-        self._commsThread = threading.Thread(target=self._commsThreadHandler)
-
-        self._eventThread.start()
-        self._commsThread.start()
-        self.started = True
-
-
-    def disconnect(self) -> None:
-        """Close the connection with the switcher."""
-
-        if not self.started:
-            return
-
-        self.log.debug("Stopping connection")
-        self.started = False
-
-        self._commsThreadCmdQ.put(THREAD_EXIT_MSG)
-        self._commsThread.join()
-        self._commsThread = threading.Thread(target=self._commsThreadHandler)
 
-        self._eventThreadCmdQ.put(THREAD_EXIT_MSG)
-        self._eventThread.join()
-        self._eventThread = threading.Thread(target=self._eventThreadHandler)
+    def _createUDPSocket(self) -> ATEMUDPSocket:
+        """Create the UDP communication object"""
 
-        self._udp.stop()
-        self._resetInternalData()
+        return ATEMUDPSocket()
 
 
     @abc.abstractmethod
@@ -263,8 +292,10 @@ class ATEMConnectionManager():
     def _connect(self):
         """Internal connect method"""
 
-        # Init localPacketIDCounter to 0
-        self._localPacketIdCounter = 0
+        # Init localPacketIDCounter to 0 (commands from the previous session are discarded)
+        with self._commandLock:
+            self._localPacketIdCounter = 0
+            self._discardSentCommands()
 
         # Will be true after initial payload of data is delivered
         #  (regular 12-byte ping packets are transmitted.)
@@ -290,411 +321,596 @@ class ATEMConnectionManager():
             0xFF for _ in range(int((self.atem.maxInitPacketCount+7)/8)) ]
 
         self._initPayloadSentAtPacketId = self.atem.maxInitPacketCount    # The max value it can be
+        self._initPacketRequests = {}
+
+        self._highestRemotePacketID = 0
+        self._heldRemotePackets = {}
+        self._missedPacketRequests = {}
 
         self._udp.connect(self.ip)
 
         # Send connectString to ATEM:
         self.log.info("Sending HELLO packet")
 
-        self._outBuf.reset()
+        self._controlBuf.reset()
         self._setCommandHeader(self.atem.cmdFlags.helloPacket.value, self.atem.headerLen+self.atem.cmdHeaderLen)
-        self._outBuf.setU8(9, 0x3a)     # Expected on first request.
-        self._outBuf.setU8(12, 0x01)    # Expected on first request.
+        self._controlBuf.setU8(9, 0x3a)     # Expected on first request.
+        self._controlBuf.setU8(12, 0x01)    # Expected on first request.
         self._sendCommand(self.atem.headerLen+self.atem.cmdHeaderLen)
 
-        self._eventThreadEventQ.put({"name": "connectAttempt", "args": {
+        self._queueEvent("connectAttempt", {
             "switcher": self,
-            }})
+            })
 
 
-    def _commsThreadHandler(self):
-        self.log.debug("Comms thread started")
+    def _processPacket(self) -> bool:
+        """Process the packet waiting in the UDP socket buffer
 
-        while self._runLoop():
-            time.sleep(0.001)
+        Returns:
+            (bool): True if more packets can be processed right now
+        """
 
-        self.log.debug("Comms thread FINISHED")
+        packetSize = self._udp.available()
 
+        # When we receive the first UDP packet from the switcher:
+        if not self.switcherAlive:
+            # We know the switcher is alive
+            self.log.debug("Basic UDP connection established, switcher is alive.")
+            self.switcherAlive = True
+            # Returning here forces the loop to exit, giving the user a chance to
+            #  disconnect() the connection without sending any ACKs (disturbing our switcher)
+            return False
 
-    def _runLoop(self, delayTime: float = 0) -> bool:
-        """Keep connection to the switcher alive
+        # If we're in "ping" mode, ignore ALL data...
+        if self._pingMode:
+            self.log.debug("PING mode active, ignoring received data")
+            self._udp.flushInputBuffer()
+            return False
 
-        This method is called by the internal thread.
+        self._udp.read(self._inBuf, self.atem.headerLen)   # Read header
 
-        Args:
-            delayTime (int, optional): time to spend listening. Defaults to 0.
+        packetSessionID = self._inBuf.getU16(2)
 
-        Returns:
-            (bool): True if we should continue running, False if we have to exit
-        """
+        if not self.sessionID and packetSessionID:
+            # Get sessionId from the packet ONLY if we don't have a sessionId
+            self.log.debug(f"Received new SessionId: 0x{packetSessionID:x}")
+            self.sessionID = packetSessionID
+        elif packetSessionID != self.sessionID:
+            # Ignore packets from different sessionIds
+            self.log.debug(f"Ignoring packet for SessionId: 0x{packetSessionID:x}")
+            self._udp.flushInputBuffer()
+            return False
 
-        if self._neverConnected:
-            self._neverConnected = False
-            self.log.info("Connecting for the first time")
-            self._connect()
+        headerBitmask = self._inBuf.getU8(0) >> 3
+        self.lastRemotePacketID = self._inBuf.getU16(10)
 
-        enterTime = time.time()
+        # Duplicates are dropped, packets after a gap wait for the missing ones
+        deliver = self._checkRemotePacketOrder(headerBitmask)
 
-        while True:         # This is a "do...while" (see the "break" at the end!)
-            while True:     # Iterate until UDP buffer is empty
+        if self.lastRemotePacketID < self.atem.maxInitPacketCount:
+            self._missedInitializationPackets[self.lastRemotePacketID>>3] &= ~(1<<(self.lastRemotePacketID & 0x07))
 
-                # ------------------------------------------------
-                # Check if a thread exit was requested
-                try:
-                    msg:str = self._commsThreadCmdQ.get_nowait()
-                    if msg == THREAD_EXIT_MSG:
-                        self.log.debug("Thread exit requested, closing...")
-                        self._commsThreadCmdQ.task_done()
-                        # Stop thread loop
-                        return False
-                except queue.Empty:
-                    pass
-                # ------------------------------------------------
+        packetLength = self._inBuf.getU16(0) & 0x07FF
+
+        if packetSize >= packetLength:  # Just to make sure we have enough info in the buffer
+            self._lastContact = time.time()
+
+            # Acks for our command packets
+            if headerBitmask & self.atem.cmdFlags.ack.value:
+                self._onCommandPacketAck(self._inBuf.getU16(4))
+
+            if headerBitmask & self.atem.cmdFlags.helloPacket.value:    # Respond to "Hello" packets:
+                # The ATEM will return a "2" in this return packet of same length. If the ATEM returns "3" it means "fully booked" (no more clients can connect)
+                #   and a "4" seems to be a kind of reconnect (seen when you drop the connection and the ATEM desperately tries to figure out what happened...)
+                # self.log.debug(f"- HELLO.bookStatus {helloExtraInfo[0]}")
+
+                # This number seems to increment with about 3 each time a new client tries to connect to ATEM.
+                #   It may be used to judge how many client connections has been made during the up-time of the switcher?
+                # self.log.debug(f"- HELLO.connectionCount {helloExtraInfo[3]}")
+
+                helloExtraInfo = self._udp.flushInputBuffer()
+                helloBookStatus = helloExtraInfo[0]
+                helloConnectionCount = helloExtraInfo[3]
+
+                self.log.debug(f"Received HELLO. bookStatus {helloBookStatus} connectionCount {helloConnectionCount} Extra info: [{hexStr(helloExtraInfo)}]")
+
+                if helloBookStatus == 3:
+                    self.log.warning("Switcher seems to be fully booked, trying to reconnect")
 
-                packetSize = self._udp.parsePacket()
-                if not self._udp.available():
-                    break
                 else:
-                    # When we receive the first UDP packet from the switcher:
-                    if not self.switcherAlive:
-                        # We know the switcher is alive
-                        self.log.debug("Basic UDP connection established, switcher is alive.")
-                        self.switcherAlive = True
-                        # This break forces the loop to exit, giving the user a chance to
-                        #  disconnect() the connection without sending any ACKs (disturbing our switcher)
-                        break
+                # elif helloBookStatus == 2:
+                    self.log.info("Connected to switcher")
+                    self.handshakeStarted = True
 
-                    # If we're in "ping" mode, ignore ALL data...
-                    if self._pingMode:
-                        self.log.debug("PING mode active, ignoring received data")
-                        self._udp.flushInputBuffer()
-                        break
+                    self.log.debug("Sending HELLO ACK")
+                    self._controlBuf.reset()
+                    self._setCommandHeader(self.atem.cmdFlags.ack.value, self.atem.headerLen)
+                    self._controlBuf.setU8(9, 0x03)    # This seems to be what the client should send upon first request.
+                    self._sendCommand(self.atem.headerLen)
 
-                    self._udp.read(self._inBuf, self.atem.headerLen)   # Read header
 
-                    packetSessionID = self._inBuf.getU16(2)
+                # elif helloBookStatus == 4:
+                #     self.log.debug("Ignored HELLO response with bookStatus 4")
 
-                    if not self.sessionID and packetSessionID:
-                        # Get sessionId from the packet ONLY if we don't have a sessionId
-                        self.log.debug(f"Received new SessionId: 0x{packetSessionID:x}")
-                        self.sessionID = packetSessionID
-                    elif packetSessionID != self.sessionID:
-                        # Ignore packets from different sessionIds
-                        self.log.debug(f"Ignoring packet for SessionId: 0x{packetSessionID:x}")
-                        break
 
-                    headerBitmask = self._inBuf.getU8(0) >> 3
-                    self.lastRemotePacketID = self._inBuf.getU16(10)
+            # If a packet is 12 bytes long it indicates that all the initial information
+            # has been delivered from the ATEM and we can begin to answer back on every request
+            # Currently we don't know any other way to decide if an answer should be sent back...
+            # The QT lib uses the "InCm" command to indicate this, but in the latest version of the firmware (2.14)
+            # all the camera control information comes AFTER this command, so it's not a clear ending token anymore.
+            # However, I'm not sure if I checked the lastRemotePacketID of the packets with the additional camera control info - if it was a resend,
+            # "InCm" may still indicate the number of the last init-packet and that's all I need to request the missing ones....
 
-                    if self.lastRemotePacketID < self.atem.maxInitPacketCount:
-                        self._missedInitializationPackets[self.lastRemotePacketID>>3] &= ~(1<<(self.lastRemotePacketID & 0x07))
+            # CHANGED as per https://github.com/clvLabs/PyATEMMax/issues/12:
+            # The ATEMCommandHandlers::_handleInCm() method will also call self.setPayloadSent()
 
-                    packetLength = self._inBuf.getU16(0) & 0x07FF
+            # BTW: It has been observed on an old 10Mbit hub that packets could arrive in a different order than sent and this may
+            # mess things up a bit on the initialization. So it's recommended to has as direct routes as possible.
 
-                    if packetSize >= packetLength:  # Just to make sure we have enough info in the buffer
-                        self._lastContact = time.time()
-                        self._waitingForIncoming = False
+            if not self._initPayloadSent and \
+                packetLength == self.atem.headerLen and \
+                self.lastRemotePacketID > 1:
 
-                        if headerBitmask & self.atem.cmdFlags.helloPacket.value:    # Respond to "Hello" packets:
-                            # The ATEM will return a "2" in this return packet of same length. If the ATEM returns "3" it means "fully booked" (no more clients can connect)
-                            #   and a "4" seems to be a kind of reconnect (seen when you drop the connection and the ATEM desperately tries to figure out what happened...)
-                            # self.log.debug(f"- HELLO.bookStatus {helloExtraInfo[0]}")
+                self.setPayloadSent()
 
-                            # This number seems to increment with about 3 each time a new client tries to connect to ATEM.
-                            #   It may be used to judge how many client connections has been made during the up-time of the switcher?
-                            # self.log.debug(f"- HELLO.connectionCount {helloExtraInfo[3]}")
+            # Respond to request for acknowledge    (and to resends also, whatever)...
+            if (headerBitmask & self.atem.cmdFlags.ackRequest.value) and \
+                (self.connected or not (headerBitmask & self.atem.cmdFlags.resend.value)):
 
-                            helloExtraInfo = self._udp.flushInputBuffer()
-                            helloBookStatus = helloExtraInfo[0]
-                            helloConnectionCount = helloExtraInfo[3]
+                # self.log.debug(f"Sending requested ACK for rpID 0x{self.lastRemotePacketID:X}")
+                self._controlBuf.reset()
+                self._setCommandHeaderWithPckId(self.atem.cmdFlags.ack.value, self.atem.headerLen, self.lastRemotePacketID)
+                self._sendCommand(self.atem.headerLen)
 
-                            self.log.debug(f"Received HELLO. bookStatus {helloBookStatus} connectionCount {helloConnectionCount} Extra info: [{hexStr(helloExtraInfo)}]")
 
-                            if helloBookStatus == 3:
-                                self.log.warning("Switcher seems to be fully booked, trying to reconnect")
+            # ATEM is requesting a previously sent packet which must have dropped out of the order.
+            #   We return an empty one so the ATEM doesnt' crash (which some models will,
+            #     if it doesn't get an answer before another 63 commands gets sent from the controller.)
+            elif self._initPayloadSent and \
+                (headerBitmask & self.atem.cmdFlags.requestNextAfter.value) and \
+                self.connected:
 
-                            else:
-                            # elif helloBookStatus == 2:
-                                self.log.info("Connected to switcher")
-                                self.handshakeStarted = True
+                packetId = self._inBuf.getU16(6)
+                self._controlBuf.reset()
+                self._setCommandHeaderWithPckId(self.atem.cmdFlags.ack.value, self.atem.headerLen, 0)
 
-                                self.log.debug("Sending HELLO ACK")
-                                self._outBuf.reset()
-                                self._setCommandHeader(self.atem.cmdFlags.ack.value, self.atem.headerLen)
-                                self._outBuf.setU8(9, 0x03)    # This seems to be what the client should send upon first request.
-                                self._sendCommand(self.atem.headerLen)
+                # Overruling this. A small trick because createCommandHeader shouldn't increment local packet ID counter
+                self._controlBuf.setU8(0, self.atem.cmdFlags.ackRequest.value << 3)
 
+                self._controlBuf.setU16(10, packetId)
+                self._sendCommand(self.atem.headerLen)
+                self.log.debug(f"Received request to resend rpID 0x{packetId:X}")
 
-                            # elif helloBookStatus == 4:
-                            #     self.log.debug("Ignored HELLO response with bookStatus 4")
+            else:
+                # Regular message
+                # self.log.debug("Message considered 'regular', passing")
+                pass
 
+            if packetLength > self.atem.headerLen and deliver:
+                if not (headerBitmask & self.atem.cmdFlags.helloPacket.value):
+                    # Packet contains extra data, parse
+                    # self._parsePacket(packetLength)
+                    self._parsePacket(packetSize) # Parse EVERYTHING, don't trust packetLength !!
 
-                        # If a packet is 12 bytes long it indicates that all the initial information
-                        # has been delivered from the ATEM and we can begin to answer back on every request
-                        # Currently we don't know any other way to decide if an answer should be sent back...
-                        # The QT lib uses the "InCm" command to indicate this, but in the latest version of the firmware (2.14)
-                        # all the camera control information comes AFTER this command, so it's not a clear ending token anymore.
-                        # However, I'm not sure if I checked the lastRemotePacketID of the packets with the additional camera control info - if it was a resend,
-                        # "InCm" may still indicate the number of the last init-packet and that's all I need to request the missing ones....
 
-                        # CHANGED as per https://github.com/clvLabs/PyATEMMax/issues/12:
-                        # The ATEMCommandHandlers::_handle_InCm() method will also call self.setPayloadSent()
+            if self._udp.available():
+                self.log.debug(f"Flushing remaining {self._udp.available()} bytes from socket buffer")
+                self._udp.flushInputBuffer()
 
-                        # BTW: It has been observed on an old 10Mbit hub that packets could arrive in a different order than sent and this may
-                        # mess things up a bit on the initialization. So it's recommended to has as direct routes as possible.
+        else:
+            self.log.error(f"Not enough data received: packetSize ({packetSize}) != packetLength ({packetLength})")
+            self.log.debug("Flushing input buffer")
+            self._udp.flushInputBuffer()
 
-                        if not self._initPayloadSent and \
-                            packetLength == self.atem.headerLen and \
-                            self.lastRemotePacketID > 1:
+        return True
 
-                            self.setPayloadSent()
 
-                        # Respond to request for acknowledge    (and to resends also, whatever)...
-                        if (headerBitmask & self.atem.cmdFlags.ackRequest.value) and \
-                            (self.connected or not (headerBitmask & self.atem.cmdFlags.resend.value)):
+    def _requestMissedInitPackets(self) -> None:
+        """Ask the switcher for initialization packets we missed
 
-                            # self.log.debug(f"Sending requested ACK for rpID 0x{self.lastRemotePacketID:X}")
-                            self._outBuf.reset()
-                            self._setCommandHeaderWithPckId(self.atem.cmdFlags.ack.value, self.atem.headerLen, self.lastRemotePacketID)
-                            self._sendCommand(self.atem.headerLen)
+        All the missed packets are requested at once (up to
+        ATEMProtocol.initPacketRequestWindow requests waiting for an answer).
+        Requests not answered in ATEMProtocol.initPacketRequestTimeout seconds
+        are sent again.
+        """
 
+        if self.connected or not self._initPayloadSent:
+            return
 
-                        # ATEM is requesting a previously sent packet which must have dropped out of the order.
-                        #   We return an empty one so the ATEM doesnt' crash (which some models will,
-                        #     if it doesn't get an answer before another 63 commands gets sent from the controller.)
-                        elif self._initPayloadSent and \
-                            (headerBitmask & self.atem.cmdFlags.requestNextAfter.value) and \
-                            self.connected:
+        missed = self._getMissedInitPackets()
+        if not missed:
+            self._initPacketRequests = {}
+            self._nextRemotePacketID = (self._highestRemotePacketID + 1) & 0x7FFF
+            self.connected = True
+            self._queueEvent("connect", {
+                "switcher": self,
+                })
+            return
 
-                            packetId = self._inBuf.getU16(6)
-                            self._outBuf.reset()
-                            self._setCommandHeaderWithPckId(self.atem.cmdFlags.ack.value, self.atem.headerLen, 0)
+        now = time.monotonic()
+        timeout = self.atem.initPacketRequestTimeout
+        missedSet = set(missed)
+        requests = { packetId: requested for packetId, requested in self._initPacketRequests.items()
+                     if packetId in missedSet and requested + timeout > now }
 
-                            # Overruling this. A small trick because createCommandHeader shouldn't increment local packet ID counter
-                            self._outBuf.setU8(0, self.atem.cmdFlags.ackRequest.value << 3)
+        for packetId in missed:
+            if len(requests) >= self.atem.initPacketRequestWindow:
+                break
 
-                            self._outBuf.setU16(10, packetId)
-                            self._sendCommand(self.atem.headerLen)
-                            self.log.debug(f"Received request to resend rpID 0x{packetId:X}")
+            if packetId in requests:
+                continue
 
-                        else:
-                            # Regular message
-                            # self.log.debug("Message considered 'regular', passing")
-                            pass
+            self._requestRemotePacket(packetId, packetId in self._initPacketRequests)
+            requests[packetId] = now
 
-                        if packetLength > self.atem.headerLen:
-                            if not (headerBitmask & self.atem.cmdFlags.helloPacket.value):
-                                # Packet contains extra data, parse
-                                # self._parsePacket(packetLength)
-                                self._parsePacket(packetSize) # Parse EVERYTHING, don't trust packetLength !!
+        self._initPacketRequests = requests
+        self._schedulePacketRequestCheck()
 
 
-                        if self._udp.available():
-                            self.log.debug(f"Flushing remaining {self._udp.available()} bytes from socket buffer")
-                            self._udp.flushInputBuffer()
+    def _getMissedInitPackets(self) -> List[int]:
+        """Get the ids of the initialization packets we missed
 
-                    else:
-                        self.log.error(f"Not enough data received: packetSize ({packetSize}) != packetLength ({packetLength})")
-                        self.log.debug("Flushing input buffer")
-                        self._udp.flushInputBuffer()
+        Returns:
+            (List[int]): missed packet ids (ascending)
+        """
 
+        lastPacketId = min(self._initPayloadSentAtPacketId - 1, self.atem.maxInitPacketCount)
+        missed = []
+        for index, bits in enumerate(self._missedInitializationPackets[:(lastPacketId >> 3) + 1]):
+            if bits:
+                missed.extend(packetId for packetId in range(max(index << 3, 1), min((index << 3) + 8, lastPacketId + 1))
+                              if bits & (1 << (packetId & 0x07)))
 
-            # After initialization, we check which packets were missed and ask for them:
-            if not self.connected and self._initPayloadSent and not self._waitingForIncoming:
-                for i in range(1, self._initPayloadSentAtPacketId):
-                    if i <= self.atem.maxInitPacketCount:
-                        if self._missedInitializationPackets[i>>3] & (1<<(i & 0x7)):
-                            self.log.debug(f"Asking for rpID 0x{i:x}")
-                            self._outBuf.reset()
-                            self._setCommandHeader(self.atem.cmdFlags.requestNextAfter.value, self.atem.headerLen)
-                            self._outBuf.setU16(6, i-1)  # Resend Packet ID
-                            self._outBuf.setU8(8, 0x01)
-                            self._sendCommand(self.atem.headerLen)
-                            self._waitingForIncoming = True
-                            break
-                    else:
-                        break
-
-                if not self._waitingForIncoming:
-                    self.connected = True
-                    self._eventThreadEventQ.put({"name": "connect", "args": {
-                        "switcher": self,
-                        }})
+        return missed
 
 
-            # This makes the first "while True:" behave as a do...while.
-            if delayTime <= 0 or hasTimedOut(enterTime, delayTime):
-                break
+    def _checkRemotePacketOrder(self, headerBitmask: int) -> bool:
+        """Check the order of the packet being processed (lastRemotePacketID)
 
-        # If connection is gone anyway, try to reconnect:
-        if hasTimedOut(self._lastContact, self._connTimeout):
-            self.log.warning("Connection has timed out - reconnecting")
-            if self.connected:
-                self._eventThreadEventQ.put({"name": "disconnect", "args": {
-                    "switcher": self,
-                    }})
-            self._connect()
+        Duplicates (already received) are dropped. Once connected, packets
+        received after a gap are held (and the missing ones requested to
+        the switcher) until they can be processed in order.
 
-        # Everything OK, continue running
-        return True
+        Args:
+            headerBitmask (int): packet header flags
 
+        Returns:
+            (bool): True if the packet must be processed now
+        """
 
-    def _eventThreadHandler(self):
-        self.log.debug("Event thread started")
+        if not headerBitmask & self.atem.cmdFlags.ackRequest.value:
+            return True
 
-        while True:
-            self._emitEvents()
+        packetId = self.lastRemotePacketID
 
-            # ------------------------------------------------
-            # Check if a thread exit was requested
-            try:
-                msg:str = self._eventThreadCmdQ.get_nowait()
-                if msg == THREAD_EXIT_MSG:
-                    self.log.debug("Thread exit requested, closing...")
-                    self._eventThreadCmdQ.task_done()
-                    # Stop thread loop
-                    break
-            except queue.Empty:
-                pass
+        if not self.connected:
+            if packetId > self._highestRemotePacketID:
+                self._highestRemotePacketID = packetId
 
-            time.sleep(0.001)
+            if headerBitmask & self.atem.cmdFlags.resend.value and \
+                packetId < self.atem.maxInitPacketCount and \
+                not self._missedInitializationPackets[packetId>>3] & (1<<(packetId & 0x07)):
+                self.log.debug(f"Dropping duplicate rpID 0x{packetId:X}")
+                return False
 
-        self.log.debug("Event thread FINISHED")
+            return True
 
+        distance = (packetId - self._nextRemotePacketID) & 0x7FFF     # Packet IDs are 15 bit
+        if distance == 0:
+            self._nextRemotePacketID = (packetId + 1) & 0x7FFF
+            self._missedPacketRequests.pop(packetId, None)
+            return True
 
-    def _emitEvents(self) -> None:
-        while not self._eventThreadEventQ.empty():
-            event: Dict[str, Any] = self._eventThreadEventQ.get_nowait()
-            eventName = event['name']
+        if distance >= 0x4000 or packetId in self._heldRemotePackets:
+            self.log.debug(f"Dropping duplicate rpID 0x{packetId:X}")
+            return False
 
-            if eventName in self._eventSubscriptions:
-                for cb in self._eventSubscriptions[eventName]:
-                    cb(event['args'])
+        self._heldRemotePackets[packetId] = self._udp.datagram()
 
-            self._eventThreadEventQ.task_done()
+        if distance >= self.atem.maxRemotePacketGap:
+            # Skip the missing packets, the held ones are processed from the oldest one
+            self.log.warning(f"Too many packets missed before rpID 0x{packetId:X}, skipping them")
+            self._nextRemotePacketID = min(self._heldRemotePackets,
+                                           key=lambda heldId: (heldId - self._nextRemotePacketID) & 0x7FFF)
+            self._missedPacketRequests = {}
 
+        return False
 
-    def waitForConnection(self, infinite: bool =True, timeout: float =0.0, waitForFullHandshake: bool =True) -> bool:
-        """Waits until the switcher initializes.
 
-        Args:
-            infinite (bool, default=True): Infinite wait?
-            timeout (int, optional): max seconds to wait. If not specified will use protocol defaults.
-            waitForFullHandshake (bool, default=True): If False the function will return on initial UDP connection.
+    def _processHeldPackets(self) -> None:
+        """Process the held packets that are next in order, request the missing ones
+
+        Missing packets not received after ATEMProtocol.maxMissedPacketRequests
+        requests are skipped.
         """
 
-        if self._pingMode:
-            infinite = False
-            waitForFullHandshake = False
+        if not self._heldRemotePackets:
+            return
 
-        if timeout:
-            infinite = False
-        elif not infinite:
-            if waitForFullHandshake:
-                timeout = self.atem.defaultConnectionTimeout
-            else:
-                timeout = self.atem.defaultHandshakeTimeout
+        while self._heldRemotePackets:
+            datagram = self._heldRemotePackets.pop(self._nextRemotePacketID, None)
+            if datagram is None:
+                if self._requestMissedPackets():
+                    break
+                continue
 
-        waitstr: str = f"waiting for {'connection' if waitForFullHandshake else 'first UDP packet' } "
-        if infinite:
-            waitstr += " (infinite)"
-        else:
-            waitstr += f" ({timeout}s)"
+            # Process it as if it had just been received (in order now)
+            self._udp.loadDatagram(datagram)
+            self._processPacket()
 
-        startTime = time.time()
-        self.log.debug(f"Started {waitstr} ")
+        self._schedulePacketRequestCheck()
 
-        # Step 1 - wait for basic UDP connection
-        while not self.switcherAlive:
-            if timeout and time.time() - startTime >= timeout:
-                self.log.debug(f"Timeout {waitstr}")
-                return False
-            time.sleep(0.01)
 
-        if waitForFullHandshake:
-            # Step 2 - wait for full handshake
-            while not self.connected:
-                if timeout and time.time() - startTime >= timeout:
-                    self.log.debug(f"Timeout {waitstr}")
-                    return False
-                time.sleep(0.01)
+    def _requestMissedPackets(self) -> bool:
+        """Request the missing packets before the last held one (again, if not received in time)
+
+        Returns:
+            (bool): False if the next packet was skipped (the held ones after it can be processed)
+        """
+
+        now = time.monotonic()
+        timeout = self.atem.missedPacketRequestTimeout
+        lastPacketId = max(self._heldRemotePackets, key=lambda packetId: (packetId - self._nextRemotePacketID) & 0x7FFF)
+
+        packetId = self._nextRemotePacketID
+        while packetId != lastPacketId:
+            if packetId not in self._heldRemotePackets:
+                request = self._missedPacketRequests.get(packetId)
+                if request is None:
+                    self._requestRemotePacket(packetId, False)
+                    self._missedPacketRequests[packetId] = [now, 1]
+                elif request[0] + timeout <= now:
+                    if request[1] >= self.atem.maxMissedPacketRequests and packetId == self._nextRemotePacketID:
+                        self.log.warning(f"Packet rpID 0x{packetId:X} lost (not received after {request[1]} requests), skipping it")
+                        del self._missedPacketRequests[packetId]
+                        self._nextRemotePacketID = (packetId + 1) & 0x7FFF
+                        return False
+                    if request[1] < self.atem.maxMissedPacketRequests:
+                        self._requestRemotePacket(packetId, True)
+                        request[0] = now
+                        request[1] += 1
+
+            packetId = (packetId + 1) & 0x7FFF
 
-        self.log.debug("Finished waiting for initialization")
         return True
 
 
-    def setSocketLogLevel(self, level: int) -> None:
-        """Set the logging output level for the internal socket.
+    def _requestRemotePacket(self, packetId: int, retry: bool) -> None:
+        """Ask the switcher to send a packet again
 
         Args:
-            level (int): logging level as per Python's logging library
+            packetId (int): remote packet id
+            retry (bool): True if the packet was requested before
         """
 
-        self._udp.setLogLevel(level)
+        self.log.debug(f"Asking {'again ' if retry else ''}for rpID 0x{packetId:x}")
+        self._controlBuf.reset()
+        self._setCommandHeader(self.atem.cmdFlags.requestNextAfter.value, self.atem.headerLen)
+        self._controlBuf.setU16(6, (packetId-1) & 0x7FFF)  # Resend Packet ID
+        self._controlBuf.setU8(8, 0x01)
+        self._sendCommand(self.atem.headerLen)
 
 
-    def commandBundleStart(self) -> None:
-        """Start a command bundle"""
+    def _nextPacketRequestDeadline(self) -> Optional[float]:
+        """Get the time (time.monotonic()) when unanswered missed packet requests must be sent again
 
-        self.resetCommandBundle()
-        self._outBuf.reset()
-        self._cBundle = True
+        Returns:
+            The time, None if there are no requests waiting for an answer
+        """
 
+        deadlines = []
+        if self._initPacketRequests and not self.connected:
+            deadlines.append(min(self._initPacketRequests.values()) + self.atem.initPacketRequestTimeout)
+        if self._missedPacketRequests and self._heldRemotePackets:
+            # Requests made too many times only matter when the packet is the next one (to skip it)
+            requested = [ request[0] for packetId, request in self._missedPacketRequests.items()
+                          if request[1] < self.atem.maxMissedPacketRequests or packetId == self._nextRemotePacketID ]
+            if requested:
+                deadlines.append(min(requested) + self.atem.missedPacketRequestTimeout)
 
-    def commandBundleEnd(self) -> None:
-        """End a command bundle"""
+        return min(deadlines) if deadlines else None
 
-        if self._cBundle and self._returnPacketLength > 0:
-            self._setCommandHeader(self.atem.cmdFlags.ackRequest.value, self._returnPacketLength)
-            self._sendCommand(self._returnPacketLength)
-            self._returnPacketLength = 0
 
-        self.resetCommandBundle()
+    @abc.abstractmethod
+    def _schedulePacketRequestCheck(self) -> None:
+        """Make sure unanswered missed packet requests are sent again in time (transport hook)"""
 
 
-    def resetCommandBundle(self) -> None:
-        """Reset the command bundle"""
+    def _checkConnectionTimeout(self) -> None:
+        """Reconnect if the switcher has been silent for too long"""
 
-        self._cBundle = False
-        self._cBBO = 0
+        if hasTimedOut(self._lastContact, self._connTimeout):
+            self.log.warning("Connection has timed out - reconnecting")
+            if self.connected:
+                self._queueEvent("disconnect", {
+                    "switcher": self,
+                    })
+            self._connect()
 
 
-    # #######################################################################
-    #
-    #  Protected methods
-    #
-    def _setCommandHeader(self, headerCmdFlags: int, lengthOfData: int) -> None:
-        """Skårhøj: void _createCommandHeader(const uint8_t headerCmd, const uint16_t lengthOfData)"""
+    def _queueEvent(self, name: str, args: Dict[str, Any], key: Optional[Any] =None) -> None:
+        """Queue an event to be emitted by the event thread (if subscribed)
 
-        self._setCommandHeaderWithPckId(headerCmdFlags, lengthOfData, 0)
+        Args:
+            name (str): event name
+            args (Dict[str, Any]): event args
+            key (Any, optional): coalescing key, events with the same key waiting
+                                 in the queue are replaced by the newest one
+        """
 
+        if name in self._subscribedEvents:
+            self._eventThreadEventQ.put({"name": name, "args": args, "key": key}, key)
 
-    def _setCommandHeaderWithPckId(self, headerCmdFlags: int, lengthOfData: int, remotePacketID: int) -> None:
-        """Skårhøj: void _createCommandHeader(const uint8_t headerCmd, const uint16_t lengthOfData, const uint16_t remotePacketID)"""
 
-        self._outBuf.setU16(0, (headerCmdFlags << 8+3) | (lengthOfData & 0x07FF))   # Command bits + length
-        self._outBuf.setU16(2, self.sessionID)
-        self._outBuf.setU16(4, remotePacketID)
+    def _emitEvent(self, event: Dict[str, Any]) -> None:
+        now = time.monotonic()
 
-        if not (headerCmdFlags & (self.atem.cmdFlags.helloPacket.value | self.atem.cmdFlags.ack.value | self.atem.cmdFlags.requestNextAfter.value)):
-            self._localPacketIdCounter += 1
+        for subscription in self._getEventSubscriptions(event):
+            due = subscription.offer(event['key'], event['args'], now) if subscription.minInterval else 0.0
+            if due == 0.0:
+                self._callEventSubscriber(subscription, event['args'])
+            elif due is not None:
+                self._deferEvent(due, subscription, event['key'])
 
-            # Uncommenting this block will jump the local packet ID counter every 15 command - thereby introducing
-            #   a stress test of the robustness of the "resent packet" function from the ATEM switcher.
-            # - - - - - - - - - - - - - - - - - - - -
-            # if self._localPacketIdCounter & 0xF == 0xF:
-            #   self._localPacketIdCounter += 1
-            # - - - - - - - - - - - - - - - - - - - -
 
-            self._outBuf.setU16(10, self._localPacketIdCounter)
+    def _callEventSubscriber(self, subscription: ATEMEventSubscription, args: Dict[str, Any]) -> None:
+        subscription.callback(args)
 
-        # self.log.debug(f"Prepared command header: cmdFlags 0x{headerCmdFlags:x} len {lengthOfData} rpID 0x{remotePacketID:x}")
+
+    def _deferEvent(self, due: float, subscription: ATEMEventSubscription, key: Any) -> None:
+        """Schedule a delayed call for a rate limited subscription"""
+
+        self._eventThreadEventQ.defer(due, self._emitDeferredEvent, subscription, key)
+
+
+    def _emitDeferredEvent(self, subscription: ATEMEventSubscription, key: Any) -> None:
+        args = subscription.takePending(key, time.monotonic())
+        if args is not None:
+            self._callEventSubscriber(subscription, args)
+
+
+    def _getEventSubscriptions(self, event: Dict[str, Any]) -> List[ATEMEventSubscription]:
+        """Get the subscriptions to an event (including filtered subscriptions)"""
+
+        eventName = event['name']
+        subscriptions = self._eventSubscriptions.get(eventName, [])
+
+        if eventName == self.atem.events.receive:
+            subscriptions = subscriptions + self._eventSubscriptions.get(f"{eventName}{EVENT_FILTER_SEPARATOR}{event['args']['cmd']}", [])
+        elif eventName == self.atem.events.change:
+            for filteredName in self._getChangeFilteredNames(event['args']['path']):
+                subscriptions = subscriptions + self._eventSubscriptions.get(filteredName, [])
+
+        return subscriptions
+
+
+    def _getChangeFilteredNames(self, path: str) -> List[str]:
+        """Get the filtered change event names matching a path
+
+        Path prefixes are split on attribute/index boundaries: "a", "a.b", "a.b[1]", "a.b[1].c"
+        """
+
+        prefix = f"{self.atem.events.change}{EVENT_FILTER_SEPARATOR}"
+        names = [ f"{prefix}{path[:pos]}" for pos, char in enumerate(path) if char in '.[' ]
+        names.append(f"{prefix}{path}")
+        return names
+
+
+    def _isChangeSubscribed(self, path: str) -> bool:
+        """Is there any subscription for a state change at this path?"""
+
+        if self.atem.events.change in self._eventSubscriptions:
+            return True
+
+        return any(name in self._eventSubscriptions for name in self._getChangeFilteredNames(path))
+
+
+    def setSocketLogLevel(self, level: int) -> None:
+        """Set the logging output level for the internal socket.
+
+        Args:
+            level (int): logging level as per Python's logging library
+        """
+
+        self._udp.setLogLevel(level)
+
+
+    def setAutoBundleWindow(self, microseconds: int) -> None:
+        """Set the auto bundling window.
+
+        Commands set within the window (starting with the first one) are
+        bundled and sent together, in as few packets as possible.
+
+        Args:
+            microseconds (int): window length (0: disabled, each command is sent right away)
+        """
+
+        self._autoBundleWindow = max(0, microseconds) / 1000000
+        if not self._autoBundleWindow and not self._bundleDepth:
+            self._flushCommandBundle()
+
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Bundle all commands set inside a `with` block
+
+        The commands are sent when the (outermost) block ends, in as few
+        packets as possible. Commands set before an exception is raised
+        inside the block are sent anyway.
+        """
+
+        self.commandBundleStart()
+        try:
+            yield
+        finally:
+            self.commandBundleEnd()
+
+
+    def commandBundleStart(self) -> None:
+        """Start a command bundle"""
+
+        self._bundleDepth += 1
+
+
+    def commandBundleEnd(self) -> None:
+        """End a command bundle (send its commands if it's the outermost one)"""
+
+        if self._bundleDepth > 0:
+            self._bundleDepth -= 1
+
+        if not self._bundleDepth:
+            self._flushCommandBundle()
+
+
+    def resetCommandBundle(self) -> None:
+        """Reset the command bundle (bundled commands are discarded)"""
+
+        with self._commandLock:
+            for _, confirmation in self._bundledCommands:
+                confirmation.resolve(False)
+
+            self._bundleDepth = 0
+            self._bundledCommands = []
+            self._bundleDeadline = None
+
+
+    # #######################################################################
+    #
+    #  Protected methods
+    #
+    def _setCommandHeader(self, headerCmdFlags: int, lengthOfData: int) -> None:
+        """Skårhøj: void _createCommandHeader(const uint8_t headerCmd, const uint16_t lengthOfData)"""
+
+        self._setCommandHeaderWithPckId(headerCmdFlags, lengthOfData, 0)
+
+
+    def _setCommandHeaderWithPckId(self, headerCmdFlags: int, lengthOfData: int, remotePacketID: int) -> None:
+        """Skårhøj: void _createCommandHeader(const uint8_t headerCmd, const uint16_t lengthOfData, const uint16_t remotePacketID)"""
+
+        self._controlBuf.pack(_PACKET_HEADER, 0,
+                              (headerCmdFlags << 8+3) | (lengthOfData & 0x07FF),   # Command bits + length
+                              self.sessionID,
+                              remotePacketID)
+
+        if not (headerCmdFlags & (self.atem.cmdFlags.helloPacket.value | self.atem.cmdFlags.ack.value | self.atem.cmdFlags.requestNextAfter.value)):
+            self._localPacketIdCounter = (self._localPacketIdCounter + 1) & 0x7FFF     # Packet IDs are 15 bit
+
+            # Uncommenting this block will jump the local packet ID counter every 15 command - thereby introducing
+            #   a stress test of the robustness of the "resent packet" function from the ATEM switcher.
+            # - - - - - - - - - - - - - - - - - - - -
+            # if self._localPacketIdCounter & 0xF == 0xF:
+            #   self._localPacketIdCounter += 1
+            # - - - - - - - - - - - - - - - - - - - -
+
+            self._controlBuf.pack(_PACKET_ID, 10, self._localPacketIdCounter)
+
+        # self.log.debug(f"Prepared command header: cmdFlags 0x{headerCmdFlags:x} len {lengthOfData} rpID 0x{remotePacketID:x}")
 
 
     def _sendCommand(self, bufferlength: int) -> None:
         """Skårhøj: void _sendPacketBuffer(uint8_t length)"""
 
-        payload = bytes(self._outBuf[:bufferlength])
+        payload = bytes(self._controlBuf[:bufferlength])
         self._udp.write(payload)
 
 
@@ -710,12 +926,13 @@ class ATEMConnectionManager():
             self._cmdPointer = 0
 
             # Get the "command string", basically this is the 4 char variable name in the ATEM memory holding the various state values of the system:
-            cmdStr = ''.join([chr(x) for x in [ self._inBuf[4], self._inBuf[5], self._inBuf[6], self._inBuf[7]]])
+            cmdStr = bytes(self._inBuf[4:8]).decode('latin-1')
 
-            if cmdStr in self.atem.commands:
-                self.log.debug(f"Received: [{cmdStr}] ({self.atem.commands[cmdStr]})")
-            else:
-                self.log.debug(f"Received: UNKNOWN command [{cmdStr}]")
+            if self.log.isEnabledFor(logging.DEBUG):
+                if cmdStr in self.atem.commands:
+                    self.log.debug(f"Received: [{cmdStr}] ({self.atem.commands[cmdStr]})")
+                else:
+                    self.log.debug(f"Received: UNKNOWN command [{cmdStr}]")
 
             # If length of segment larger than 8 (should always be...!)
             if self._cmdLength > self.atem.cmdHeaderLen:
@@ -728,26 +945,57 @@ class ATEMConnectionManager():
             else:
                 self.log.error(f"Bad CMD length ({self._cmdLength}), flushing input buffer")
                 self._udp.flushInputBuffer()
-                return
+                break
+
+        # All the commands in the packet are applied: publish them together
+        snapshotState = self._snapshotState
+        if snapshotState is not None:
+            snapshotState._publishStateSnapshot()     # pylint: disable=protected-access
 
 
     def _parseGetCommands(self, cmdStr: str) -> None:
         """Skårhøj: virtual void _parseGetCommands(const char *cmdString)"""
 
-        if cmdStr in self._cmdHandlers:
+        handler = self._cmdHandlers.get(cmdStr)
+        if handler is not None:
             try:
-                self._cmdHandlers[cmdStr]["callback"](cmdStr)  # Call method
+                handler["callback"](cmdStr)  # Call method
+                received = True
 
-                # Avoid emitting events for handshake data
-                if self.connected:
-                    self._eventThreadEventQ.put({"name": "receive", "args": {
+            except ATEMException as e:
+                self.log.warning(f"{str(e)} - processing [{cmdStr}]")
+                received = False
+
+            # Commands waiting for this state echo
+            if cmdStr in self._pendingEchoes:
+                self._checkPendingEchoes(cmdStr)
+
+            # Avoid emitting events for handshake data (or events with no subscriptions)
+            if self.connected:
+                if self._stateChanges and "change" in self._subscribedEvents:
+                    for path, oldValue, newValue in self._stateChanges:
+                        if self._isChangeSubscribed(path):
+                            self._queueEvent("change", {
+                                "switcher": self,
+                                "cmd": cmdStr,
+                                "path": path,
+                                "old": oldValue,
+                                "new": newValue,
+                                }, ("change", path))
+
+                if received and (self._subscribedCommands is None or cmdStr in self._subscribedCommands):
+                    self._queueEvent("receive", {
                         "switcher": self,
                         "cmd": cmdStr,
                         "cmdName": self.atem.commands[cmdStr] if cmdStr in self.atem.commands else ""
-                        }})
+                        }, ("receive", cmdStr))
 
-            except ATEMException as e:
-                self.log.warning(f"{str(e)} - processing [{cmdStr}]")
+            snapshotState = self._snapshotState
+            if snapshotState is not None:
+                for path, _, _ in self._stateChanges:
+                    snapshotState._markStateChange(path)     # pylint: disable=protected-access
+
+            self._stateChanges.clear()
         else:
             self.log.warning(f"Received UNKNOWN command: [{cmdStr}]")
 
@@ -777,47 +1025,649 @@ class ATEMConnectionManager():
     def _prepareCommandPacket(self, cmdString: str, cmdBytes: int, indexMatch: Optional[bool]=True) -> None:
         """Skårhøj: void _prepareCommandPacket(const char *cmdString, uint8_t cmdBytes, bool indexMatch=true)"""
 
-        cmdStrPos = self.atem.headerLen + self._cBBO + self.atem.cmdStrOffset
-
-        # First, in case of a command bundle, check if indexes are different OR if it's an entirely different command, then increase offset to accommodate new command:
-        if self._cBundle:
-            packetCmdString = self._outBuf[cmdStrPos:cmdStrPos+self.atem.cmdStrLen]
-            if self._returnPacketLength > 0 and (not indexMatch or packetCmdString != cmdString):
-                self._cBBO = self._returnPacketLength - self.atem.headerLen
-        else:
-            self._outBuf.reset()    # For command bundles, this is already done...
+        # Command header offsets are absolute (also after a setter failed before _finishCommandPacket())
+        self._outBuf.clearUserOffsetCallback()
+        self._outBuf.reset()
 
-        self._returnPacketLength = self.atem.headerLen + self._cBBO + self.atem.cmdHeaderLen + cmdBytes
+        self._returnPacketLength = self.atem.headerLen + self.atem.cmdHeaderLen + cmdBytes
 
-        # Because we increased length of command, we need to check for buffer overflow:
+        # Check for buffer overflow (bundled commands are split in packets when sent):
         if self._returnPacketLength > self.atem.outputBufferLength:
-            raise ATEMException("Packet Buffer Overflow in the ATEM Library! Too long or too many commands bundled")
+            raise ATEMException("Packet Buffer Overflow in the ATEM Library! Command too long")
 
-        # Copy Command String:
-        if len(cmdString) == self.atem.cmdStrLen:
-            self._outBuf.setString(cmdStrPos, self.atem.cmdStrLen, cmdString)
-        else:
+        if len(cmdString) != self.atem.cmdStrLen:
             raise ATEMException(f"BAD CMD [{cmdString}]: length ({len(cmdString)})" \
                             f" - should be {self.atem.cmdStrLen}")
 
-        # Command length:
+        # Command length and command string:
         commandLength = self.atem.cmdHeaderLen + cmdBytes
-        self._outBuf.setU16(self.atem.headerLen + self._cBBO, commandLength)
+        self._outBuf.pack(_COMMAND_HEADER, self.atem.headerLen, commandLength, cmdString.encode('latin-1'))
 
         # Give control to user: set offset handler for output buffer
-        self._outBuf.setUserOffsetCallback(lambda offset : self.atem.headerLen + self._cBBO + self.atem.cmdHeaderLen + offset)
+        self._outBuf.setUserOffsetCallback(self._commandDataOffset)
+
+
+    def _commandDataOffset(self, offset: int) -> int:
+        """Output buffer offset callback: offsets are relative to the data of the command being prepared"""
+
+        return self.atem.headerLen + self.atem.cmdHeaderLen + offset
+
+
+    def _packCommandPacket(self, packer: struct.Struct, values: Tuple[Any, ...],
+                           echo: Optional[Tuple[str, Callable[..., bool]]] =None) -> ATEMCommandConfirmation:
+        """Add a whole command (header and data) with a single precompiled struct
+
+        Used by the setters generated from ATEMSetterLayouts. Works like
+        _prepareCommandPacket() + setting the data + _finishCommandPacket().
+
+        Args:
+            packer (struct.Struct): struct for the command header and data
+            values (Tuple[Any, ...]): values to pack (command length, command string, data)
+            echo (Tuple[str, Callable[..., bool]], optional): state echo command and check(switcher, values)
+
+        Returns:
+            (ATEMCommandConfirmation): command confirmation
+        """
+
+        self._outBuf.clearUserOffsetCallback()
+        self._outBuf.reset()
+
+        self._returnPacketLength = self.atem.headerLen + packer.size
+
+        if self._returnPacketLength > self.atem.outputBufferLength:
+            raise ATEMException("Packet Buffer Overflow in the ATEM Library! Command too long")
 
+        self._outBuf.pack(packer, self.atem.headerLen, *values)
 
-    def _finishCommandPacket(self) -> None:
+        if echo is None:
+            confirmation = self._createCommandConfirmation(values[1].decode('latin-1'))
+        else:
+            confirmation = self._createCommandConfirmation(values[1].decode('latin-1'), echo[0],
+                                                           functools.partial(echo[1], self, values))
+
+        self._sendCommandPacket(confirmation)
+        return confirmation
+
+
+    def _finishCommandPacket(self) -> ATEMCommandConfirmation:
         """Skårhøj: void _finishCommandPacket()"""
 
-        # Reset control to user: set offset handler for output buffer
-        self._outBuf.setUserOffsetCallback(lambda offset : offset)
+        # Reset control to user: remove offset handler for output buffer
+        self._outBuf.clearUserOffsetCallback()
 
-        if self._cBundle:
-            self.log.warning("[_finishCommandPacket] ignoring attempt to finish command bundle, please use commandBundleEnd()")
-            return
+        cmdStrPos = self.atem.headerLen + self.atem.cmdStrOffset
+        confirmation = self._createCommandConfirmation(
+            bytes(self._outBuf[cmdStrPos:cmdStrPos+self.atem.cmdStrLen]).decode('latin-1'))
+
+        self._sendCommandPacket(confirmation)
+        return confirmation
+
+
+    def _createCommandConfirmation(self, cmdStr: str, echoCmdStr: Optional[str] =None,
+                                   check: Optional[Callable[[], bool]] =None) -> ATEMCommandConfirmation:
+        """Create the confirmation of a command"""
+
+        return ATEMCommandConfirmation(cmdStr, echoCmdStr, check, self._watchCommandEcho)
+
+
+    def _sendCommandPacket(self, confirmation: ATEMCommandConfirmation) -> None:
+        """Send the command in the output buffer (or add it to the command bundle)
+
+        Args:
+            confirmation (ATEMCommandConfirmation): command confirmation
+        """
+
+        if self._bundleDepth or self._autoBundleWindow:
+            self._bundleCommand(bytes(self._outBuf[self.atem.headerLen:self._returnPacketLength]), confirmation)
+        else:
+            with self._commandLock:
+                self.commandQueue.put(bytearray(self._outBuf[:self._returnPacketLength]), [ confirmation ])
+                self._sendQueuedCommandPackets()
 
-        self._setCommandHeader(self.atem.cmdFlags.ackRequest.value, self._returnPacketLength)
-        self._sendCommand(self._returnPacketLength)
         self._returnPacketLength = 0
+
+
+    def _watchCommandEcho(self, confirmation: ATEMCommandConfirmation) -> None:
+        """Start checking the state echoes for a command (someone is waiting for it)
+
+        Args:
+            confirmation (ATEMCommandConfirmation): command confirmation
+        """
+
+        echoCmdStr = confirmation.echoCmdStr
+        if echoCmdStr is None:
+            return
+
+        with self._commandLock:
+            if not self._checkCommandEcho(confirmation, time.monotonic()):
+                return
+
+            self._pendingEchoes.setdefault(echoCmdStr, []).append(confirmation)
+
+        self._scheduleCommandCheck()
+
+
+    def _checkPendingEchoes(self, cmdStr: str) -> None:
+        """Check the commands waiting for a state echo after it has been received
+
+        Args:
+            cmdStr (str): received state command
+        """
+
+        with self._commandLock:
+            now = time.monotonic()
+            waiting = [ confirmation for confirmation in self._pendingEchoes.pop(cmdStr, [])
+                        if self._checkCommandEcho(confirmation, now) ]
+
+            if waiting:
+                self._pendingEchoes[cmdStr] = waiting
+
+
+    @staticmethod
+    def _checkCommandEcho(confirmation: ATEMCommandConfirmation, now: float) -> bool:
+        """Check if the switcher state has the value set by a command
+
+        Args:
+            confirmation (ATEMCommandConfirmation): command confirmation
+            now (float): current time (time.monotonic())
+
+        Returns:
+            True if the command is still waiting for its echo
+        """
+
+        if confirmation.done():
+            return False
+
+        check = confirmation.check
+        if check is not None and check():
+            confirmation.resolve(True)
+        elif confirmation.expires is not None and confirmation.expires <= now:
+            confirmation.resolve(False)
+
+        return not confirmation.done()
+
+
+    def _discardCommands(self) -> None:
+        """Discard all commands not confirmed yet (bundled and sent, they fail)"""
+
+        self.resetCommandBundle()
+
+        with self._commandLock:
+            self._discardSentCommands()
+
+
+    def _discardSentCommands(self) -> None:
+        """Discard the commands sent to the switcher (they fail)
+
+        Must be called with _commandLock held.
+        """
+
+        self.commandQueue.reset()
+
+        for pending in self._pendingEchoes.values():
+            for confirmation in pending:
+                confirmation.resolve(False)
+
+        self._pendingEchoes.clear()
+
+
+    def _bundleCommand(self, command: bytes, confirmation: ATEMCommandConfirmation) -> None:
+        """Add a command to the command bundle
+
+        Args:
+            command (bytes): command header and data
+            confirmation (ATEMCommandConfirmation): command confirmation
+        """
+
+        with self._commandLock:
+            self._bundledCommands.append((command, confirmation))
+            openWindow = not self._bundleDepth and self._bundleDeadline is None
+
+            if openWindow:
+                self._bundleDeadline = time.monotonic() + self._autoBundleWindow
+
+        if openWindow:
+            self._scheduleBundleFlush()
+
+
+    @abc.abstractmethod
+    def _scheduleBundleFlush(self) -> None:
+        """Make sure the command bundle is sent when the auto bundling window ends (transport hook)"""
+
+
+    def _flushCommandBundle(self) -> None:
+        """Send the bundled commands, packed in as few packets as possible"""
+
+        with self._commandLock:
+            commands = self._bundledCommands
+            self._bundledCommands = []
+            self._bundleDeadline = None
+
+            packet = bytearray(self.atem.headerLen)
+            confirmations: List[ATEMCommandConfirmation] = []
+            for command, confirmation in commands:
+                if len(packet) + len(command) > self.atem.outputBufferLength:
+                    self.commandQueue.put(packet, confirmations)
+                    packet = bytearray(self.atem.headerLen)
+                    confirmations = []
+                packet += command
+                confirmations.append(confirmation)
+
+            if confirmations:
+                self.commandQueue.put(packet, confirmations)
+
+            self._sendQueuedCommandPackets()
+
+
+    def _sendQueuedCommandPackets(self) -> None:
+        """Send the queued command packets that fit in the in-flight window (and the send rate)
+
+        Must be called with _commandLock held.
+        """
+
+        wasIdle = not self.commandQueue.inFlight
+        now = time.monotonic()
+
+        queued = self.commandQueue.pop(now)
+        while queued is not None:
+            packet, confirmations = queued
+            self._localPacketIdCounter = (self._localPacketIdCounter + 1) & 0x7FFF     # Packet IDs are 15 bit
+
+            _COMMAND_PACKET_HEADER.pack_into(packet, 0,
+                                             (self.atem.cmdFlags.ackRequest.value << 8+3) | (len(packet) & 0x07FF),
+                                             self.sessionID,
+                                             0,
+                                             self._localPacketIdCounter)
+
+            self.commandQueue.sent(self._localPacketIdCounter, packet, confirmations, now)
+            self._udp.write(bytes(packet))
+            queued = self.commandQueue.pop(now)
+
+        # Packets held back by the send rate are sent later (the ones waiting for acks are sent on ack)
+        if (wasIdle and self.commandQueue.inFlight) or self.commandQueue.nextSendTime(now) is not None:
+            self._scheduleCommandCheck()
+
+
+    def _onCommandPacketAck(self, ackId: int) -> None:
+        """Process an ack for our command packets (free room in the in-flight window)
+
+        Args:
+            ackId (int): acked packet id
+        """
+
+        if not self.commandQueue.inFlight:
+            return
+
+        with self._commandLock:
+            if self.commandQueue.ack(ackId, time.monotonic()):
+                self._sendQueuedCommandPackets()
+
+
+    def _nextCommandDeadline(self) -> Optional[float]:
+        """Get the time (time.monotonic()) of the next command ack/echo/pacing check
+
+        The command lock must be held (unless called from the event loop in ATEMAsyncMax).
+
+        Returns:
+            The time, None if no commands are waiting for acks, echoes or the send rate
+        """
+
+        deadlines = [ confirmation.expires for pending in self._pendingEchoes.values()
+                      for confirmation in pending if confirmation.expires is not None ]
+        retransmitDeadline = self.commandQueue.nextDeadline()
+        if retransmitDeadline is not None:
+            deadlines.append(retransmitDeadline)
+        sendTime = self.commandQueue.nextSendTime(time.monotonic())
+        if sendTime is not None:
+            deadlines.append(sendTime)
+
+        return min(deadlines) if deadlines else None
+
+
+    def _checkCommandDeadlines(self) -> None:
+        """Retransmit unacked command packets, fail missing echoes and send the packets held back by the send rate"""
+
+        with self._commandLock:
+            now = time.monotonic()
+            for cmdStr in list(self._pendingEchoes):
+                waiting = [ confirmation for confirmation in self._pendingEchoes.pop(cmdStr)
+                            if self._checkCommandEcho(confirmation, now) ]
+                if waiting:
+                    self._pendingEchoes[cmdStr] = waiting
+
+            retransmits, lost = self.commandQueue.takeRetransmits(now)
+
+            for packet in retransmits:
+                self._udp.write(bytes(packet))
+
+            for packetId in lost:
+                self.log.warning(f"Command packet 0x{packetId:x} lost (not acked after {self.atem.maxCommandRetransmits} retransmissions)")
+
+            self._sendQueuedCommandPackets()
+
+
+    @abc.abstractmethod
+    def _scheduleCommandCheck(self) -> None:
+        """Make sure the command deadlines (retransmissions, echoes, pacing) are checked in time (transport hook)"""
+
+
+class ATEMThreadedConnectionManager(ATEMConnectionManager):    # pylint: disable=abstract-method
+    """Blackmagic ATEM switcher connection manager (running on its own threads)
+
+    The connection is kept alive by a comms thread (sleeping in a selector
+    until there is data, a wakeup request or a deadline), and events are
+    emitted by an event thread.
+    """
+
+    def __init__(self):
+        """Create a new ATEMThreadedConnectionManager object."""
+
+        super().__init__()
+
+        # Event Thread
+        # (its queue receives events to emit and THREAD_EXIT_MSG to finish,
+        #  it also makes the delayed calls for rate limited subscriptions)
+        self._eventThread = threading.Thread(target=self._eventThreadHandler)
+
+        # Wakeup channel for the comms thread (it sleeps in a selector, the channel is kept between connections)
+        self._commsWakeupReader, self._commsWakeupWriter = socket.socketpair()
+        self._commsWakeupReader.setblocking(False)
+        self._commsWakeupWriter.setblocking(False)
+
+
+    def __del__(self) -> None:
+        """Things to do when killed :)"""
+
+        self.log.debug("Destroying object, cleaning up")
+        if self.started:
+            self.log.debug('Stopping comms')
+            self.disconnect()
+            self.log.debug('Comms stopped')
+        self._commsWakeupReader.close()
+        self._commsWakeupWriter.close()
+        self.log.debug('Finished cleanup')
+
+
+    # pylint: disable=attribute-defined-outside-init
+    def _resetInternalData(self):
+        """Reset value of all internal variables. Useful for reconnections"""
+
+        super()._resetInternalData()
+
+        # Comms Thread
+        self._commsThread = threading.Thread(target=self._commsThreadHandler)
+        self._commsThreadCmdQ: queue.Queue = queue.Queue()
+
+
+    def ping(self, ip: str, timeout: int =5) -> None:
+        """Ping the switcher.
+
+        Args:
+            ip (str): IP address of the switcher
+            timeout (int): timeout (seconds)
+        """
+
+        self.connect(ip, timeout, pingMode=True)
+
+
+    def connect(self, ip: str, connTimeout: int =5, pingMode: bool = False) -> None:
+        """Connect to the switcher.
+
+        Args:
+            ip (str): IP address of the switcher
+            connTimeout (int): connection timeout (seconds)
+            pingMode (bool): connect in "ping" mode? (ignore data, just wait for UDP conn)
+        """
+
+        if self.started:
+            self.log.debug("Closing previous connection")
+            self.disconnect()
+
+        self._prepareConnection(ip, connTimeout, pingMode)
+        self._drainCommsWakeup()    # Wakeup requests made while disconnected
+
+        self._eventThread = threading.Thread(target=self._eventThreadHandler)
+        self._commsThread = threading.Thread(target=self._commsThreadHandler)
+
+        self._eventThread.start()
+        self._commsThread.start()
+        self.started = True
+
+
+    def disconnect(self) -> None:
+        """Close the connection with the switcher."""
+
+        if not self.started:
+            return
+
+        self.log.debug("Stopping connection")
+        self.started = False
+
+        self._commsThreadCmdQ.put(THREAD_EXIT_MSG)
+        self._wakeupCommsThread()
+        self._commsThread.join()
+        self._commsThread = threading.Thread(target=self._commsThreadHandler)
+
+        self._eventThreadEventQ.put(THREAD_EXIT_MSG)
+        self._eventThread.join()
+        self._eventThread = threading.Thread(target=self._eventThreadHandler)
+
+        self._udp.stop()
+        self._discardCommands()
+        self._resetInternalData()
+
+
+    def waitForConnection(self, infinite: bool =True, timeout: float =0.0, waitForFullHandshake: bool =True) -> bool:
+        """Waits until the switcher initializes.
+
+        Args:
+            infinite (bool, default=True): Infinite wait?
+            timeout (int, optional): max seconds to wait. If not specified will use protocol defaults.
+            waitForFullHandshake (bool, default=True): If False the function will return on initial UDP connection.
+        """
+
+        if self._pingMode:
+            infinite = False
+            waitForFullHandshake = False
+
+        if timeout:
+            infinite = False
+        elif not infinite:
+            if waitForFullHandshake:
+                timeout = self.atem.defaultConnectionTimeout
+            else:
+                timeout = self.atem.defaultHandshakeTimeout
+
+        waitstr: str = f"waiting for {'connection' if waitForFullHandshake else 'first UDP packet' } "
+        if infinite:
+            waitstr += " (infinite)"
+        else:
+            waitstr += f" ({timeout}s)"
+
+        startTime = time.time()
+        self.log.debug(f"Started {waitstr} ")
+
+        # Step 1 - wait for basic UDP connection
+        while not self.switcherAlive:
+            if timeout and time.time() - startTime >= timeout:
+                self.log.debug(f"Timeout {waitstr}")
+                return False
+            time.sleep(0.01)
+
+        if waitForFullHandshake:
+            # Step 2 - wait for full handshake
+            while not self.connected:
+                if timeout and time.time() - startTime >= timeout:
+                    self.log.debug(f"Timeout {waitstr}")
+                    return False
+                time.sleep(0.01)
+
+        self.log.debug("Finished waiting for initialization")
+        return True
+
+
+    def _commsThreadHandler(self):
+        self.log.debug("Comms thread started")
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._udp, selectors.EVENT_READ)
+            selector.register(self._commsWakeupReader, selectors.EVENT_READ)
+
+            while self._runLoop():
+                # Sleep until there is incoming data, a wakeup request or a deadline
+                for key, _ in selector.select(self._getCommsTimeout()):
+                    if key.fileobj is self._commsWakeupReader:
+                        self._drainCommsWakeup()
+
+        self.log.debug("Comms thread FINISHED")
+
+
+    def _getCommsTimeout(self) -> float:
+        """Get the time (seconds) the comms thread can sleep waiting for data
+
+        Returns:
+            (float): time until the next deadline (connection timeout, missed packet requests, auto bundling window, command acks/echoes/pacing)
+        """
+
+        if self._udp.available():
+            return 0
+
+        deadline = self._lastContact + self._connTimeout
+        timeout = deadline - time.time()
+
+        bundleDeadline = self._bundleDeadline
+        if bundleDeadline is not None:
+            timeout = min(timeout, bundleDeadline - time.monotonic())
+
+        with self._commandLock:
+            commandDeadline = self._nextCommandDeadline()
+        if commandDeadline is not None:
+            timeout = min(timeout, commandDeadline - time.monotonic())
+
+        requestDeadline = self._nextPacketRequestDeadline()
+        if requestDeadline is not None:
+            timeout = min(timeout, requestDeadline - time.monotonic())
+
+        return max(0.0, timeout)
+
+
+    def _wakeupCommsThread(self) -> None:
+        """Wake up the comms thread if it's waiting for data"""
+
+        try:
+            self._commsWakeupWriter.send(b'\0')
+        except (BlockingIOError, InterruptedError):
+            pass    # Wakeup channel full, the thread will wake up anyway
+
+
+    def _drainCommsWakeup(self) -> None:
+        """Empty the comms thread wakeup channel"""
+
+        try:
+            while self._commsWakeupReader.recv(1024):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+
+    def _runLoop(self, delayTime: float = 0) -> bool:
+        """Keep connection to the switcher alive
+
+        This method is called by the internal thread.
+
+        Args:
+            delayTime (int, optional): time to spend listening. Defaults to 0.
+
+        Returns:
+            (bool): True if we should continue running, False if we have to exit
+        """
+
+        if self._neverConnected:
+            self._neverConnected = False
+            self.log.info("Connecting for the first time")
+            self._connect()
+
+        enterTime = time.time()
+
+        while True:         # This is a "do...while" (see the "break" at the end!)
+            while True:     # Iterate until UDP buffer is empty
+
+                # ------------------------------------------------
+                # Check if a thread exit was requested
+                try:
+                    msg:str = self._commsThreadCmdQ.get_nowait()
+                    if msg == THREAD_EXIT_MSG:
+                        self.log.debug("Thread exit requested, closing...")
+                        self._commsThreadCmdQ.task_done()
+                        # Stop thread loop
+                        return False
+                except queue.Empty:
+                    pass
+                # ------------------------------------------------
+
+                self._udp.parsePacket()
+                if not self._udp.available():
+                    break
+
+                if not self._processPacket():
+                    break
+
+            # After initialization, we check which packets were missed and ask for them:
+            self._requestMissedInitPackets()
+
+            # Once connected, packets received after a gap wait for the missing ones
+            self._processHeldPackets()
+
+            # Send the commands bundled by the auto bundling window when it ends
+            bundleDeadline = self._bundleDeadline
+            if bundleDeadline is not None and bundleDeadline <= time.monotonic():
+                self._flushCommandBundle()
+
+            # Retransmit the command packets the switcher didn't ack in time, fail missing echoes
+            # and send the packets held back by the send rate limit
+            with self._commandLock:
+                commandDeadline = self._nextCommandDeadline()
+            if commandDeadline is not None and commandDeadline <= time.monotonic():
+                self._checkCommandDeadlines()
+
+            # This makes the first "while True:" behave as a do...while.
+            if delayTime <= 0 or hasTimedOut(enterTime, delayTime):
+                break
+
+        # If connection is gone anyway, try to reconnect:
+        self._checkConnectionTimeout()
+
+        # Everything OK, continue running
+        return True
+
+
+    def _schedulePacketRequestCheck(self) -> None:
+        """Make sure unanswered missed packet requests are sent again in time"""
+
+        # The comms thread checks the missed packets on every loop
+        #  (and its timeout includes the request deadline)
+
+
+    def _scheduleBundleFlush(self) -> None:
+        """Make sure the command bundle is sent when the auto bundling window ends"""
+
+        # The comms thread checks the window deadline (wake it up to recalculate its timeout)
+        if self.started:
+            self._wakeupCommsThread()
+
+
+    def _scheduleCommandCheck(self) -> None:
+        """Make sure the command deadlines (retransmissions, echoes, pacing) are checked in time"""
+
+        # The comms thread checks the command deadlines (wake it up to recalculate its timeout)
+        if self.started:
+            self._wakeupCommsThread()
+
+
+
+    def _eventThreadHandler(self):
+        self.log.debug("Event thread started")
+
+        self._eventThreadEventQ.run(self._emitEvent, THREAD_EXIT_MSG)
+
+        self.log.debug("Event thread FINISHED")
@@ -5,7 +5,8 @@ ATEMConstant: Blackmagic ATEM protocol definitions - constant value base class
 Part of the PyATEMMax library.
 """
 
-from typing import Any, Optional, Union
+from typing import Any, Dict, Mapping, Optional, Union
+from types import MappingProxyType
 
 from .ATEMException import ATEMException
 
@@ -13,6 +14,8 @@ from .ATEMException import ATEMException
 class ATEMConstant:
     """Meta-class to generate constant values"""
 
+    __slots__ = ('name', 'value')
+
     def __init__(self, name: str = "", value: Any = None):
         self.name = name
         self.value = value
@@ -26,6 +29,13 @@ class ATEMConstant:
     def __format__(self, format_spec: str) -> str:
         return format(str(self), format_spec)
 
+    # Constants are shared, never copied (value dictionaries compare them by identity)
+    def __copy__(self) -> 'ATEMConstant':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'ATEMConstant':
+        return self
+
 
 class ATEMConstantList:
     """Meta-class to generate value lists"""
@@ -51,46 +61,62 @@ class ATEMConstantList:
             raise StopIteration
 
 
-    def __init__(self):
-        self._values = {
-                prop: self.__getattribute__(prop)
-                for prop in self.__class__.__dict__
-                if isinstance(self.__getattribute__(prop), ATEMConstant)
+    # Lookup indexes, built once for each list class (see __init_subclass__)
+    _nameIndex: Mapping[str, ATEMConstant] = MappingProxyType({})
+    _valueIndex: Mapping[Any, ATEMConstant] = MappingProxyType({})
+
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+
+        names: Dict[str, ATEMConstant] = {
+                prop: value
+                for prop, value in cls.__dict__.items()
+                if isinstance(value, ATEMConstant)
             }
 
+        # If a value is repeated, the first constant declared wins
+        values: Dict[Any, ATEMConstant] = {}
+        for constant in names.values():
+            values.setdefault(constant.value, constant)
+
+        cls._nameIndex = MappingProxyType(names)
+        cls._valueIndex = MappingProxyType(values)
+
+
+    def __init__(self):
+        self._values = self._nameIndex
+
 
     def __len__(self):
         return len(self._values)
 
 
     def __getitem__(self, item: Union[ATEMConstant, str, int]) -> Any:
-        key: str
-
-        if isinstance(item, ATEMConstant):
-            found = self._byValue(item)
-            if found is None:
-                raise ATEMException(f"Wrong value for {self.__class__.__name__}: [{item}] ({type(item)})")
-            else:
-                key = found.name
-        elif isinstance(item, str):
+        if isinstance(item, str):
             found = self.byName(item)
-            if found is None:
-                raise ATEMException(f"Wrong value for {self.__class__.__name__}: [{item}] ({type(item)})")
-            key = item
-        else: # int
+        else:   # ATEMConstant / int
             found = self._byValue(item)
-            if found is None:
-                raise ATEMException(f"Wrong value for {self.__class__.__name__}: [{item}] ({type(item)})")
-            else:
-                key = found.name
 
-        return self._values[key]     # retval hit TypeValue o como sea de typing
+        if found is None:
+            raise ATEMException(f"Wrong value for {self.__class__.__name__}: [{item}] ({type(item)})")
+
+        return found
 
 
     def __iter__(self):
         return ATEMConstantList.Iterator(self)
 
 
+    # Constant lists are shared, never copied
+    def __copy__(self) -> 'ATEMConstantList':
+        return self
+
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'ATEMConstantList':
+        return self
+
+
     def __next__(self):
         pass
 
@@ -105,7 +131,7 @@ class ATEMConstantList:
     def byName(self, name: str) -> Optional[Any]:
         """Get ATEMConstant name from name"""
 
-        return self._values[name]
+        return self._nameIndex.get(name)
 
 
     def _byValue(self, value: Union[ATEMConstant, int]) -> Optional[ATEMConstant]:
@@ -113,13 +139,7 @@ class ATEMConstantList:
 
         if isinstance(value, ATEMConstant):
             value = value.value
-        found = None
-        for k in self._values:
-            v = self._values[k].value
-            if v == value:
-                found = self._values[k]
-                break
-        return found
+        return self._valueIndex.get(value)
 
 
     def byValue(self, value: Union[ATEMConstant, int]) -> ATEMConstant:
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""
+ATEMDiscovery: Blackmagic ATEM switcher discovery (network range scan).
+Part of the PyATEMMax library.
+"""
+
+from typing import Dict, Iterable, List, Union
+
+import ipaddress
+import logging
+import selectors
+import socket
+import struct
+import time
+
+from .ATEMProtocol import ATEMProtocol
+from .ATEMBuffer import ATEMBuffer
+from .ATEMCommandLayouts import COMMAND_DECODERS
+from .StateData.ProtocolVersion import ProtocolVersion
+
+
+_PACKET_HEADER = struct.Struct('!HHHHHH')   # Command bits + length, session ID, ack ID, resend ID, unknown, packet ID
+_COMMAND_HEADER = struct.Struct('!H2x4s')   # Command length, command string
+
+# Commands read from the switchers in query mode
+_QUERY_COMMANDS = ('_ver', '_pin')
+
+log = logging.getLogger('ATEMDiscovery')
+
+
+class ATEMDiscoveredSwitcher():
+    """A switcher found by discover()
+
+    Args:
+        ip (str): switcher IP address
+    """
+
+    def __init__(self, ip: str):
+        self.ip: str = ip
+
+        # HELLO answer: book status (2: available, 3: fully booked) and connection count
+        self.bookStatus: int = 0
+        self.connectionCount: int = 0
+
+        # Time (seconds) from the HELLO packet to the answer
+        self.responseTime: float = 0.0
+
+        # Switcher info (only in query mode)
+        self.atemModel: str = ""
+        self.protocolVersion: ProtocolVersion = ProtocolVersion()
+
+
+    def __repr__(self) -> str:
+        model = f" {self.atemModel} {self.protocolVersion}" if self.atemModel else ""
+        return f"<ATEMDiscoveredSwitcher {self.ip}{model} bookStatus={self.bookStatus}>"
+
+
+def discover(addresses: Union[str, Iterable[str]],
+             timeout: float =ATEMProtocol.defaultHandshakeTimeout,
+             query: bool =False) -> List[ATEMDiscoveredSwitcher]:
+    """Find the ATEM switchers in a network range
+
+    A HELLO packet is sent to every address from a single socket, and the
+    answers are matched by source address, so the whole range takes about
+    one handshake timeout.
+
+    In query mode the handshake goes on with the switchers that answered
+    (unless they are fully booked) to read their model (_pin) and protocol
+    version (_ver) from the first initialization packet. The session is
+    then abandoned (the switcher drops it after its own timeout).
+
+    Args:
+        addresses (str or Iterable[str]): network ("192.168.1.0/24"), 3 octet range
+            ("192.168.1": .1 to .254) or list of addresses
+        timeout (float, optional): seconds to wait for answers (and for the switcher info in query mode)
+        query (bool, optional): read the switcher model and protocol version
+
+    Returns:
+        (List[ATEMDiscoveredSwitcher]): switchers found (in address order)
+    """
+
+    atem = ATEMProtocol()
+    targets = _getAddresses(addresses)
+    found: Dict[str, ATEMDiscoveredSwitcher] = {}
+    querying: Dict[str, float] = {}     # Switchers being queried: ip -> query deadline
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    selector = selectors.DefaultSelector()
+    selector.register(sock, selectors.EVENT_READ)
+
+    try:
+        helloPacket = _getPacket(atem, atem.cmdFlags.helloPacket.value, 0, atem.cmdHeaderLen)
+        helloPacket[9] = 0x3a   # Expected on first request.
+        helloPacket[12] = 0x01  # Expected on first request.
+
+        start = time.monotonic()
+        for ip in targets:
+            try:
+                sock.sendto(helloPacket, (ip, atem.UDPPort))
+            except OSError as e:
+                log.debug(f"Can't send HELLO to {ip}: {e}")
+
+        deadline = start + timeout
+        while True:
+            now = time.monotonic()
+            waitUntil = max([ deadline ] + list(querying.values()))
+            if now >= waitUntil:
+                break
+
+            for _ in selector.select(waitUntil - now):
+                while True:
+                    try:
+                        data, (ip, _) = sock.recvfrom(atem.inputBufferLength)
+                    except (BlockingIOError, InterruptedError):
+                        break
+                    except OSError as e:
+                        log.debug(f"Socket error: {e}")
+                        break
+
+                    if ip in targets:
+                        _processAnswer(atem, sock, ip, data, found, querying, start, timeout, query)
+
+    finally:
+        selector.close()
+        sock.close()
+
+    return [ found[ip] for ip in targets if ip in found ]
+
+
+def _getAddresses(addresses: Union[str, Iterable[str]]) -> Dict[str, None]:
+    """Get the (ordered, unique) addresses to scan"""
+
+    if isinstance(addresses, str):
+        if addresses.count('.') == 2:
+            return { f"{addresses}.{i}": None for i in range(1, 255) }
+
+        network = ipaddress.ip_network(addresses, strict=False)
+        hosts = network.hosts() if network.num_addresses > 1 else iter([ network.network_address ])
+        return { str(host): None for host in hosts }
+
+    return { str(ipaddress.ip_address(ip)): None for ip in addresses }
+
+
+def _getPacket(atem: ATEMProtocol, headerCmdFlags: int, sessionID: int, dataLength: int =0) -> bytearray:
+    """Create a packet (header + empty data)"""
+
+    packet = bytearray(atem.headerLen + dataLength)
+    _PACKET_HEADER.pack_into(packet, 0, (headerCmdFlags << 8+3) | len(packet), sessionID, 0, 0, 0, 0)
+    return packet
+
+
+def _processAnswer(atem: ATEMProtocol, sock: socket.socket, ip: str, data: bytes,
+                   found: Dict[str, ATEMDiscoveredSwitcher], querying: Dict[str, float],
+                   start: float, timeout: float, query: bool) -> None:
+    """Process a packet received from a scanned address"""
+
+    if len(data) < atem.headerLen:
+        return
+
+    headerBitmask = data[0] >> 3
+    sessionID = _PACKET_HEADER.unpack_from(data)[1]
+
+    if headerBitmask & atem.cmdFlags.helloPacket.value:
+        if ip in found or len(data) < atem.headerLen + 4:
+            return
+
+        switcher = found[ip] = ATEMDiscoveredSwitcher(ip)
+        switcher.bookStatus = data[atem.headerLen]
+        switcher.connectionCount = data[atem.headerLen + 3]
+        switcher.responseTime = time.monotonic() - start
+        log.debug(f"Found {switcher}")
+
+        if query and switcher.bookStatus != 3:
+            ackPacket = _getPacket(atem, atem.cmdFlags.ack.value, sessionID)
+            ackPacket[9] = 0x03     # This seems to be what the client should send upon first request.
+            sock.sendto(ackPacket, (ip, atem.UDPPort))
+            querying[ip] = time.monotonic() + timeout
+
+    elif ip in querying:
+        switcher = found[ip]
+        buffer = ATEMBuffer(0)
+        offset = atem.headerLen
+        while offset + atem.cmdHeaderLen <= len(data):
+            cmdLength, cmdStr = _COMMAND_HEADER.unpack_from(data, offset)
+            if cmdLength <= atem.cmdHeaderLen:
+                break
+
+            cmdStr = cmdStr.decode('latin-1')
+            if cmdStr in _QUERY_COMMANDS:
+                buffer.setData(memoryview(data)[offset+atem.cmdHeaderLen:offset+cmdLength])
+                COMMAND_DECODERS[cmdStr](switcher, buffer, [])
+
+            offset += cmdLength
+
+        if switcher.atemModel and switcher.protocolVersion.major:
+            del querying[ip]
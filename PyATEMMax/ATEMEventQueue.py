@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""
+ATEMEventQueue: Blackmagic ATEM switcher event queue and subscriptions.
+Part of the PyATEMMax library.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import collections
+import heapq
+import itertools
+import threading
+import time
+
+
+class ATEMEventQueue():
+    """Event queue, coalescing events with the same key
+
+    While an event waits in the queue, newer events with the same key
+    replace it (keeping its position), so the queue never holds more than
+    one event per key. Events without a key are always queued.
+
+    State change events keep the "old" value of the first coalesced event
+    (and are dropped if the value went back to it).
+
+    The event thread consumes the queue with run(), which also makes the
+    delayed calls scheduled with defer() (rate limited subscriptions).
+    """
+
+    def __init__(self):
+        self._events: collections.OrderedDict[Any, Any] = collections.OrderedDict()
+        self._uniqueKeys = itertools.count()
+        self._condition = threading.Condition()
+
+        # Delayed calls (only used by the thread in run()): (due time, sequence, function, args)
+        self._deferredCalls: List[Tuple[float, int, Callable[..., None], Tuple[Any, ...]]] = []
+        self._deferredCallSequence = itertools.count()
+
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+    def put(self, event: Any, key: Optional[Any] =None) -> bool:
+        """Queue an event
+
+        Args:
+            event (Any): event to queue ({"name": ..., "args": ...} if it has a key)
+            key (Any, optional): coalescing key (None: never coalesce)
+
+        Returns:
+            True if the queue was empty
+        """
+
+        with self._condition:
+            wasEmpty = not self._events
+
+            if key is None:
+                key = ('_unique', next(self._uniqueKeys))
+            elif key in self._events:
+                event = dict(event, args=_coalesceArgs(self._events[key]["args"], event["args"]))
+
+            self._events[key] = event
+            self._condition.notify()
+
+        return wasEmpty
+
+
+    def get(self, timeout: Optional[float] =None) -> Optional[Any]:
+        """Get the oldest event
+
+        Args:
+            timeout (float, optional): max seconds to wait (None: wait forever, 0: don't wait)
+
+        Returns:
+            The event, None if the timeout expired
+        """
+
+        with self._condition:
+            if not self._events and timeout != 0:
+                self._condition.wait_for(lambda: self._events, timeout)
+
+            while self._events:
+                event = self._events.popitem(last=False)[1]
+                if not _isNoChange(event.get("args") if isinstance(event, dict) else None):
+                    return event
+
+            return None
+
+
+    def defer(self, due: float, func: Callable[..., None], *args: Any) -> None:
+        """Schedule a delayed call (only from the thread in run(), e.g. in its emit function)
+
+        Args:
+            due (float): call time (time.monotonic())
+            func (Callable[..., None]): function to call
+            *args (Any): function args
+        """
+
+        heapq.heappush(self._deferredCalls, (due, next(self._deferredCallSequence), func, args))
+
+
+    def run(self, emit: Callable[[Any], None], exitMsg: Any) -> None:
+        """Emit the queued events and make the delayed calls (until exitMsg is queued)
+
+        Delayed calls still waiting when exitMsg arrives are made before returning.
+
+        Args:
+            emit (Callable[[Any], None]): function called with each event
+            exitMsg (Any): event that finishes the loop
+        """
+
+        while True:
+            # Sleep until there's an event to emit, a delayed call is due (or a thread exit request)
+            timeout = None
+            if self._deferredCalls:
+                timeout = max(0.0, self._deferredCalls[0][0] - time.monotonic())
+
+            event = self.get(timeout)
+
+            if event is exitMsg:
+                break
+
+            if event is not None:
+                emit(event)
+
+            self._makeDeferredCalls(time.monotonic())
+
+        # Deliver delayed calls before leaving
+        self._makeDeferredCalls(float('inf'))
+
+
+    def _makeDeferredCalls(self, until: float) -> None:
+        """Make all delayed calls due until the given time"""
+
+        while self._deferredCalls and self._deferredCalls[0][0] <= until:
+            _, _, func, args = heapq.heappop(self._deferredCalls)
+            func(*args)
+
+
+class ATEMEventSubscription():
+    """Event subscription: a user callback, with an optional max rate
+
+    Args:
+        callback (Callable[[Dict[Any, Any]], Any]): user callback
+        maxRate (float): max calls per second for each event key (0: unlimited)
+    """
+
+    def __init__(self, callback: Callable[[Dict[Any, Any]], Any], maxRate: float =0.0):
+        self.callback = callback
+        self.minInterval: float = 1.0 / maxRate if maxRate > 0 else 0.0
+
+        # Last call time and event args waiting for the next call, by event key
+        self._lastCall: Dict[Any, float] = {}
+        self._pending: Dict[Any, Dict[str, Any]] = {}
+
+
+    def offer(self, key: Any, args: Dict[str, Any], now: float) -> Optional[float]:
+        """Offer event args to a rate limited subscription
+
+        Args:
+            key (Any): event key
+            args (Dict[str, Any]): event args
+            now (float): current time (time.monotonic())
+
+        Returns:
+            0.0 if the callback must be called now,
+            the time when takePending() must be called for a new delayed call,
+            None if the args replaced the ones waiting for a delayed call
+        """
+
+        if key is None:
+            return 0.0
+
+        if key in self._pending:
+            self._pending[key] = _coalesceArgs(self._pending[key], args)
+            return None
+
+        lastCall = self._lastCall.get(key)
+        if lastCall is None or lastCall + self.minInterval <= now:
+            self._lastCall[key] = now
+            return 0.0
+
+        self._pending[key] = args
+        return lastCall + self.minInterval
+
+
+    def takePending(self, key: Any, now: float) -> Optional[Dict[str, Any]]:
+        """Take the args waiting for a delayed call (the callback must be called with them)
+
+        Args:
+            key (Any): event key
+            now (float): current time (time.monotonic())
+
+        Returns:
+            The event args, None if there are none
+        """
+
+        args = self._pending.pop(key, None)
+        if args is None or _isNoChange(args):
+            return None
+
+        self._lastCall[key] = now
+        return args
+
+
+def _coalesceArgs(oldArgs: Dict[str, Any], newArgs: Dict[str, Any]) -> Dict[str, Any]:
+    """Coalesce the args of two events with the same key (the newest one wins)"""
+
+    if "old" in newArgs:
+        return dict(newArgs, old=oldArgs["old"])
+    return newArgs
+
+
+def _isNoChange(args: Optional[Dict[str, Any]]) -> bool:
+    """Is this a (coalesced) state change back to its original value?"""
+
+    return args is not None and "old" in args and args["old"] == args["new"]
@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""
+ATEMFleet: Blackmagic ATEM switcher fleet manager (many switchers, two threads).
+Part of the PyATEMMax library.
+"""
+
+# pylint: disable=protected-access
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import logging
+import queue
+import selectors
+import socket
+import threading
+import time
+
+from .ATEMCommandQueue import ATEMCommandConfirmation
+from .ATEMEventQueue import ATEMEventQueue, ATEMEventSubscription
+from .ATEMException import ATEMException
+from .ATEMMax import ATEMMax
+from .ATEMProtocol import ATEMProtocol
+
+THREAD_EXIT_MSG = 'exit'
+
+
+class ATEMFleetSwitcher(ATEMMax):
+    """Switcher in an ATEMFleet
+
+    Works like ATEMMax (same state data, set/exec methods and events), but
+    has no threads of its own: its connection is kept alive by the fleet
+    loop thread and its events are emitted by the fleet event thread.
+
+    Args:
+        fleet (ATEMFleet): fleet running the switcher
+    """
+
+    def __init__(self, fleet: 'ATEMFleet'):
+        """Create a new ATEMFleetSwitcher object."""
+
+        self._fleet = fleet
+
+        super().__init__()
+
+
+    def connect(self, ip: str, connTimeout: int =5, pingMode: bool = False) -> None:
+        """Connect to the switcher (in the fleet loop).
+
+        Args:
+            ip (str): IP address of the switcher
+            connTimeout (int): connection timeout (seconds)
+            pingMode (bool): connect in "ping" mode? (ignore data, just wait for UDP conn)
+        """
+
+        if self.started:
+            self.log.debug("Closing previous connection")
+            self.disconnect()
+
+        self._prepareConnection(ip, connTimeout, pingMode)
+        self.started = True
+        self._fleet._attach(self)
+
+
+    def disconnect(self) -> None:
+        """Close the connection with the switcher (the fleet loop stops running it)."""
+
+        if not self.started:
+            return
+
+        self.log.debug("Stopping connection")
+        self.started = False
+
+        self._fleet._detach(self)
+
+        self._udp.stop()
+        self._discardCommands()
+        self._resetInternalData()
+
+
+    def _wakeupCommsThread(self) -> None:
+        """Wake up the fleet loop thread if it's waiting for data"""
+
+        self._fleet._wakeup()
+
+
+    def _queueEvent(self, name: str, args: Dict[str, Any], key: Optional[Any] =None) -> None:
+        """Queue an event to be emitted by the fleet event thread (if subscribed)"""
+
+        if name in self._subscribedEvents:
+            self._fleet._queueEvent(self, {"name": name, "args": args, "key": key}, key)
+
+
+    def _deferEvent(self, due: float, subscription: ATEMEventSubscription, key: Any) -> None:
+        """Schedule a delayed call for a rate limited subscription (in the fleet event thread)"""
+
+        self._fleet._deferEvent(due, self, subscription, key)
+
+
+class ATEMFleet():
+    """Blackmagic ATEM switcher fleet manager
+
+    Keeps any number of switcher sessions running on two threads: a loop
+    thread waiting on the sockets of all switchers with a single selector,
+    and an event thread emitting the events of all switchers (instead of
+    the 2 threads per switcher of ATEMMax).
+
+    Each switcher is an ATEMFleetSwitcher (an ATEMMax) with its own state
+    data, available by IP address (fleet["192.168.1.111"]).
+    """
+
+    def __init__(self):
+        """Create a new ATEMFleet object."""
+
+        self.log = logging.getLogger('ATEMFleet')
+        self.log.debug("Initializing")
+        self.log.setLevel(logging.CRITICAL)     # Initially silent
+
+        # Protocol object (default timeouts)
+        self.atem: ATEMProtocol = ATEMProtocol()
+
+        # Switchers by IP address
+        self._switchers: Dict[str, ATEMFleetSwitcher] = {}
+
+        # Logging level for the switchers
+        self._switcherLogLevel: int = logging.CRITICAL
+
+        # Fleet-wide event subscriptions: (event, callback, max rate), registered on every switcher
+        self._eventRegistrations: List[Tuple[str, Callable[[Dict[Any, Any]], None], float]] = []
+
+        # Is the fleet started? (threads running)
+        self.started: bool = False
+
+        # Loop thread
+        # (its queue receives switchers to add/remove and THREAD_EXIT_MSG to finish)
+        self._loopThread = threading.Thread(target=self._loopThreadHandler)
+        self._loopThreadCmdQ: queue.Queue = queue.Queue()
+
+        # Wakeup channel for the loop thread (it sleeps in a selector, the channel is kept while the fleet exists)
+        self._wakeupReader, self._wakeupWriter = socket.socketpair()
+        self._wakeupReader.setblocking(False)
+        self._wakeupWriter.setblocking(False)
+
+        # Event thread
+        # (events from all switchers, coalesced by switcher and event key,
+        #  and delayed calls for their rate limited subscriptions)
+        self._eventThread = threading.Thread(target=self._eventThreadHandler)
+        self._eventThreadEventQ: ATEMEventQueue = ATEMEventQueue()
+
+
+    def __del__(self) -> None:
+        """Things to do when killed"""
+
+        self._wakeupReader.close()
+        self._wakeupWriter.close()
+
+
+    def __getitem__(self, ip: str) -> ATEMFleetSwitcher:
+        return self._switchers[ip]
+
+
+    def __contains__(self, ip: str) -> bool:
+        return ip in self._switchers
+
+
+    def __iter__(self) -> Iterator[ATEMFleetSwitcher]:
+        return iter(list(self._switchers.values()))
+
+
+    def __len__(self) -> int:
+        return len(self._switchers)
+
+
+    @property
+    def switchers(self) -> Dict[str, ATEMFleetSwitcher]:
+        """Switchers by IP address"""
+
+        return dict(self._switchers)
+
+
+    def add(self, ip: str, connTimeout: int =5) -> ATEMFleetSwitcher:
+        """Add a switcher to the fleet and connect to it.
+
+        Use waitForConnection() (on the fleet or on the switcher) to wait
+        for the connection.
+
+        Args:
+            ip (str): IP address of the switcher
+            connTimeout (int): connection timeout (seconds)
+
+        Returns:
+            (ATEMFleetSwitcher): the switcher (the existing one if it was already in the fleet)
+        """
+
+        switcher = self._switchers.get(ip)
+        if switcher is not None:
+            return switcher
+
+        if not self.started:
+            self._start()
+
+        switcher = ATEMFleetSwitcher(self)
+        switcher.setLogLevel(self._switcherLogLevel)
+        for event, callback, maxRate in self._eventRegistrations:
+            switcher.registerEvent(event, callback, maxRate)
+
+        self._switchers[ip] = switcher
+        switcher.connect(ip, connTimeout)
+        return switcher
+
+
+    def remove(self, ip: str) -> None:
+        """Disconnect a switcher and remove it from the fleet.
+
+        Args:
+            ip (str): IP address of the switcher
+        """
+
+        switcher = self._switchers.pop(ip, None)
+        if switcher is not None:
+            switcher.disconnect()
+
+
+    def connect(self, ips: List[str], connTimeout: int =5) -> None:
+        """Add switchers to the fleet and connect to them (all at once).
+
+        Args:
+            ips (List[str]): IP addresses of the switchers
+            connTimeout (int): connection timeout (seconds)
+        """
+
+        for ip in ips:
+            self.add(ip, connTimeout)
+
+
+    def disconnect(self) -> None:
+        """Disconnect all switchers, remove them from the fleet and stop the fleet threads."""
+
+        for ip in list(self._switchers):
+            self.remove(ip)
+
+        if not self.started:
+            return
+
+        self.log.debug("Stopping fleet")
+        self.started = False
+
+        self._loopThreadCmdQ.put(THREAD_EXIT_MSG)
+        self._wakeup()
+        self._loopThread.join()
+        self._loopThread = threading.Thread(target=self._loopThreadHandler)
+
+        self._eventThreadEventQ.put(THREAD_EXIT_MSG)
+        self._eventThread.join()
+        self._eventThread = threading.Thread(target=self._eventThreadHandler)
+
+
+    def waitForConnection(self, infinite: bool =True, timeout: float =0.0, waitForFullHandshake: bool =True) -> bool:
+        """Waits until all switchers initialize.
+
+        Args:
+            infinite (bool, default=True): Infinite wait?
+            timeout (int, optional): max seconds to wait. If not specified will use protocol defaults.
+            waitForFullHandshake (bool, default=True): If False the function will return on initial UDP connection.
+
+        Returns:
+            (bool): True if all switchers are connected
+        """
+
+        if timeout:
+            infinite = False
+        elif not infinite:
+            if waitForFullHandshake:
+                timeout = self.atem.defaultConnectionTimeout
+            else:
+                timeout = self.atem.defaultHandshakeTimeout
+
+        startTime = time.time()
+
+        while not all(switcher.connected if waitForFullHandshake else switcher.switcherAlive
+                      for switcher in self):
+            if not infinite and time.time() - startTime >= timeout:
+                self.log.debug("Timeout waiting for connection")
+                return False
+            time.sleep(0.01)
+
+        return True
+
+
+    def registerEvent(self, event: str, callback: Callable[[Dict[Any, Any]], None], maxRate: float =0.0)-> None:
+        """Register an event handler on all switchers (current and future)
+
+        Works like ATEMMax.registerEvent() (same events, filters and max
+        rates, per switcher). The switcher is in the "switcher" event arg.
+
+        Args:
+            event (str): name of the event (see docs), with an optional filter
+            callback (Callable[[Dict[Any, Any]], None]): user callback
+            maxRate (float, default=0.0): max calls per second (0.0 means no limit)
+        """
+
+        self._eventRegistrations.append((event, callback, maxRate))
+
+        for switcher in self:
+            switcher.registerEvent(event, callback, maxRate)
+
+
+    def apply(self, setter: Union[str, Callable[[ATEMFleetSwitcher], Optional[ATEMCommandConfirmation]]],
+              *args: Any, switchers: Optional[List[str]] =None, timeout: Optional[float] =None,
+              **kwargs: Any) -> Dict[str, bool]:
+        """Call a set/exec method on several switchers and wait for the confirmations
+
+        The commands are sent to all the switchers first and then their
+        confirmations are waited for, so all the switchers are updated
+        concurrently.
+
+        Args:
+            setter (str or Callable[[ATEMFleetSwitcher], Optional[ATEMCommandConfirmation]]):
+                set/exec method name (e.g. "setProgramInputVideoSource", called with args and kwargs)
+                or a function called with each switcher (e.g. to use different values)
+            switchers (List[str], optional): IP addresses of the switchers (None: all the switchers)
+            timeout (float, optional): max seconds to wait for all the confirmations (None: wait until they are confirmed or fail)
+
+        Returns:
+            (Dict[str, bool]): results by switcher IP address: True if the command was confirmed
+                (False if it failed, timed out, the switcher is disconnected or the method raised an ATEMException)
+        """
+
+        ips = list(self._switchers) if switchers is None else switchers
+        for ip in ips:
+            if ip not in self._switchers:
+                raise ATEMException(f"Unknown switcher {ip}")
+
+        confirmations: Dict[str, Optional[ATEMCommandConfirmation]] = {}
+        for ip in ips:
+            switcher = self._switchers[ip]
+            try:
+                if isinstance(setter, str):
+                    confirmations[ip] = getattr(switcher, setter)(*args, **kwargs)
+                else:
+                    confirmations[ip] = setter(switcher)
+            except ATEMException as e:
+                self.log.warning(f"Command failed on {ip}: {e}")
+                confirmations[ip] = None
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        results: Dict[str, bool] = {}
+        for ip, confirmation in confirmations.items():
+            if confirmation is None:
+                results[ip] = False
+            else:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                results[ip] = confirmation.wait(remaining)
+
+        return results
+
+
+    def setLogLevel(self, level: int) -> None:
+        """Set the logging output level for the fleet and its switchers.
+
+        Args:
+            level (int): logging level as per Python's logging library
+        """
+
+        self.log.setLevel(level)
+        self._switcherLogLevel = level
+
+        for switcher in self:
+            switcher.setLogLevel(level)
+
+
+    # #######################################################################
+    #
+    #  Protected methods
+    #
+    def _start(self) -> None:
+        """Start the fleet threads"""
+
+        self.log.debug("Starting fleet")
+        self._drainWakeup()     # Wakeup requests made while stopped
+
+        self._loopThread = threading.Thread(target=self._loopThreadHandler)
+        self._eventThread = threading.Thread(target=self._eventThreadHandler)
+
+        self._loopThread.start()
+        self._eventThread.start()
+        self.started = True
+
+
+    def _attach(self, switcher: ATEMFleetSwitcher) -> None:
+        """Start running a switcher in the loop thread"""
+
+        if not self.started:
+            self._start()
+
+        self._loopThreadCmdQ.put(("add", switcher, None))
+        self._wakeup()
+
+
+    def _detach(self, switcher: ATEMFleetSwitcher) -> None:
+        """Stop running a switcher in the loop thread (waits until the loop drops it)"""
+
+        if not self.started:
+            return
+
+        done = threading.Event()
+        self._loopThreadCmdQ.put(("remove", switcher, done))
+        self._wakeup()
+
+        if threading.current_thread() is not self._loopThread:
+            done.wait()
+
+
+    def _wakeup(self) -> None:
+        """Wake up the loop thread if it's waiting for data"""
+
+        try:
+            self._wakeupWriter.send(b'\0')
+        except (BlockingIOError, InterruptedError):
+            pass    # Wakeup channel full, the thread will wake up anyway
+
+
+    def _drainWakeup(self) -> None:
+        """Empty the loop thread wakeup channel"""
+
+        try:
+            while self._wakeupReader.recv(1024):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+
+    def _loopThreadHandler(self) -> None:
+        self.log.debug("Loop thread started")
+
+        running: List[ATEMFleetSwitcher] = []
+        timeout: Optional[float] = 0.0
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._wakeupReader, selectors.EVENT_READ)
+
+            while True:
+                # Sleep until there is incoming data, a wakeup request or a switcher deadline
+                ready: Set[ATEMFleetSwitcher] = set()
+                for key, _ in selector.select(timeout):
+                    if key.fileobj is self._wakeupReader:
+                        self._drainWakeup()
+                    else:
+                        ready.add(key.data)
+
+                if not self._updateRunning(selector, running):
+                    break
+
+                # Run the switchers with incoming data or a due deadline
+                timeout = None
+                for switcher in running:
+                    switcherTimeout = switcher._getCommsTimeout()
+                    if switcher in ready or switcherTimeout <= 0:
+                        self._runSwitcher(switcher)
+                        switcherTimeout = switcher._getCommsTimeout()
+
+                    if timeout is None or switcherTimeout < timeout:
+                        timeout = switcherTimeout
+
+        self.log.debug("Loop thread FINISHED")
+
+
+    def _updateRunning(self, selector: selectors.BaseSelector, running: List[ATEMFleetSwitcher]) -> bool:
+        """Add/remove the switchers requested to the loop thread
+
+        Returns:
+            (bool): True if the loop thread should continue running, False if it has to exit
+        """
+
+        while True:
+            try:
+                msg = self._loopThreadCmdQ.get_nowait()
+            except queue.Empty:
+                return True
+
+            if msg == THREAD_EXIT_MSG:
+                self.log.debug("Thread exit requested, closing...")
+                return False
+
+            action, switcher, done = msg
+            if action == "add":
+                if switcher not in running:
+                    selector.register(switcher._udp, selectors.EVENT_READ, switcher)
+                    running.append(switcher)
+            elif switcher in running:
+                selector.unregister(switcher._udp)
+                running.remove(switcher)
+
+            if done is not None:
+                done.set()
+
+
+    def _runSwitcher(self, switcher: ATEMFleetSwitcher) -> None:
+        """Process the incoming data and deadlines of a switcher"""
+
+        # A failing switcher must not stop the others
+        try:
+            switcher._runLoop()
+        except Exception:     # pylint: disable=broad-except
+            self.log.exception(f"Error running switcher {switcher.ip}")
+
+
+    def _eventThreadHandler(self) -> None:
+        self.log.debug("Event thread started")
+
+        self._eventThreadEventQ.run(self._emitEvent, THREAD_EXIT_MSG)
+
+        self.log.debug("Event thread FINISHED")
+
+
+    def _emitEvent(self, event: Dict[str, Any]) -> None:
+        """Emit a switcher event (to the subscriptions of its switcher)"""
+
+        event["switcher"]._emitEvent(event)
+
+
+    def _queueEvent(self, switcher: ATEMFleetSwitcher, event: Dict[str, Any], key: Optional[Any]) -> None:
+        """Queue a switcher event (coalesced with the events of the same switcher and key)"""
+
+        event["switcher"] = switcher
+        self._eventThreadEventQ.put(event, None if key is None else (switcher, key))
+
+
+    def _deferEvent(self, due: float, switcher: ATEMFleetSwitcher, subscription: ATEMEventSubscription, key: Any) -> None:
+        """Schedule a delayed call for a rate limited subscription"""
+
+        self._eventThreadEventQ.defer(due, switcher._emitDeferredEvent, subscription, key)
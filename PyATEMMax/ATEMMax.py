@@ -8,12 +8,14 @@ Part of the PyATEMMax library.
 # pylint: disable=too-many-lines, wildcard-import, unused-wildcard-import, protected-access
 
 
-from typing import Dict, Any, Union
+from typing import Dict, Any, Optional, Union
 
 import logging
 
+from .ATEMAudioMeter import ATEMAudioMeter
 from .ATEMConstant import ATEMConstant
-from .ATEMConnectionManager import ATEMConnectionManager
+from .ATEMCommandQueue import ATEMCommandConfirmation
+from .ATEMConnectionManager import ATEMConnectionManager, ATEMThreadedConnectionManager
 from .ATEMCommandHandlers import ATEMCommandHandlers
 from .ATEMSetterMethods import ATEMSetterMethods
 from .ATEMSwitcherState import ATEMSwitcherState
@@ -21,30 +23,39 @@ from .ATEMProtocolEnums import *
 from .StateData import *
 
 
-class ATEMMax(ATEMConnectionManager, ATEMSwitcherState, ATEMSetterMethods):
-    """Blackmagic ATEM switcher manager
+class ATEMMaxBase(ATEMConnectionManager, ATEMSwitcherState, ATEMSetterMethods):    # pylint: disable=abstract-method
+    """Blackmagic ATEM switcher manager (without a transport)
+
+    Switcher state, command handlers and set/exec methods, shared by
+    ATEMMax (threads) and ATEMAsyncMax (asyncio event loop).
 
     This class is a port of Skårhøj's ATEMmax class.
     """
 
     def __init__(self):
-        """Create a new ATEMMax object."""
+        """Create a new ATEMMaxBase object."""
 
         self.log = logging.getLogger('ATEMMax')
         self.log.debug("Initializing")
         self.setLogLevel(logging.CRITICAL)  # Initially silent
 
-        super(ATEMMax, self).__init__()
+        super().__init__()
 
         self.switcher:ATEMConnectionManager = self
 
+        # Received commands are applied to this object's state (and its snapshots)
+        self._snapshotState = self
+
+        # Audio level meter (see enableAudioMeter())
+        self.audioMeter: Optional[ATEMAudioMeter] = None
+
         # Init command handlers
         self._commandHandlers = ATEMCommandHandlers(self, self, self.atem)
         self._commandHandlers.registerAllHandlers()
 
         # Init event handlers
         self.registerEvent(self.atem.events.connect, self._onConnect)
-        self.registerEvent(self.atem.events.receive, self._onReceive)
+        self.registerEvent(f"{self.atem.events.receive}:Warn", self._onWarningReceived)
 
 
     def setLogLevel(self, level: int) -> None:
@@ -58,6 +69,33 @@ class ATEMMax(ATEMConnectionManager, ATEMSwitcherState, ATEMSetterMethods):
         self.log.setLevel(level)
 
 
+    # #######################################################################
+    #
+    #  Audio level meter
+    #
+
+    def enableAudioMeter(self, historyLength: int =100) -> ATEMAudioMeter:
+        """Keep the audio levels in an ATEMAudioMeter (needs NumPy).
+
+        The switcher only sends audio levels after `setAudioLevelsEnable(True)`.
+
+        Args:
+            historyLength (int, optional): number of frames kept by the meter
+
+        Returns:
+            (ATEMAudioMeter): the new meter (also in `audioMeter`)
+        """
+
+        self.audioMeter = ATEMAudioMeter(historyLength)
+        return self.audioMeter
+
+
+    def disableAudioMeter(self) -> None:
+        """Stop keeping the audio levels in an ATEMAudioMeter."""
+
+        self.audioMeter = None
+
+
     # #######################################################################
     #
     #  ATEMConnectionManager events
@@ -68,14 +106,13 @@ class ATEMMax(ATEMConnectionManager, ATEMSwitcherState, ATEMSetterMethods):
         self.log.debug(f"ATEM protocol version: {self.protocolVersion.major}.{self.protocolVersion.minor}")
 
 
-    def _onReceive(self, params: Dict[Any, Any]) -> None:
-        if params['cmd'] == "Warn":
-            if self.warningText:
-                self.log.debug(f"ATEM warning: {self.warningText}")
-                self._eventThreadEventQ.put({"name": "warning", "args": {
-                    "switcher": self,
-                    "msg": self.warningText,
-                    }})
+    def _onWarningReceived(self, params: Dict[Any, Any]) -> None:
+        if self.warningText:
+            self.log.debug(f"ATEM warning: {self.warningText}")
+            self._queueEvent("warning", {
+                "switcher": self,
+                "msg": self.warningText,
+                })
 
 
     # #######################################################################
@@ -83,7 +120,7 @@ class ATEMMax(ATEMConnectionManager, ATEMSwitcherState, ATEMSetterMethods):
     #  "exec" methods
     #
 
-    def execCutME(self, mE: Union[ATEMConstant, str, int]) -> None:
+    def execCutME(self, mE: Union[ATEMConstant, str, int]) -> Optional[ATEMCommandConfirmation]:
         """Execute: Cut
 
         Args:
@@ -92,16 +129,16 @@ class ATEMMax(ATEMConnectionManager, ATEMSwitcherState, ATEMSetterMethods):
 
         if not self.connected:
             self.log.warning("execCutME() IGNORED - switcher disconnected")
-            return
+            return None
 
         mE_val = self.atem.mixEffects[mE].value
 
         self._prepareCommandPacket("DCut", 4)
         self._outBuf.setU8(0, mE_val)
-        self._finishCommandPacket()
+        return self._finishCommandPacket()
 
 
-    def execAutoME(self, mE: Union[ATEMConstant, str, int]) -> None:
+    def execAutoME(self, mE: Union[ATEMConstant, str, int]) -> Optional[ATEMCommandConfirmation]:
         """Execute: AutoMixEffect
 
         Args:
@@ -110,16 +147,16 @@ class ATEMMax(ATEMConnectionManager, ATEMSwitcherState, ATEMSetterMethods):
 
         if not self.connected:
             self.log.warning("execAutoME() IGNORED - switcher disconnected")
-            return
+            return None
 
         mE_val = self.atem.mixEffects[mE].value
 
         self._prepareCommandPacket("DAut", 4)
         self._outBuf.setU8(0, mE_val)
-        self._finishCommandPacket()
+        return self._finishCommandPacket()
 
 
-    def execDownstreamKeyerAutoKeyer(self, dsk: Union[ATEMConstant, int]) -> None:
+    def execDownstreamKeyerAutoKeyer(self, dsk: Union[ATEMConstant, int]) -> Optional[ATEMCommandConfirmation]:
         """Execute: DownstreamKeyer AutoKeyer
 
         Args:
@@ -128,16 +165,16 @@ class ATEMMax(ATEMConnectionManager, ATEMSwitcherState, ATEMSetterMethods):
 
         if not self.connected:
             self.log.warning("execDownstreamKeyerAutoKeyer() IGNORED - switcher disconnected")
-            return
+            return None
 
         dsk_val = self.atem.dsks[dsk].value
 
         self._prepareCommandPacket("DDsA", 4)
         self._outBuf.setU8(0, dsk_val)
-        self._finishCommandPacket()
+        return self._finishCommandPacket()
 
 
-    def execFadeToBlackME(self, mE: Union[ATEMConstant, str, int]) -> None:
+    def execFadeToBlackME(self, mE: Union[ATEMConstant, str, int]) -> Optional[ATEMCommandConfirmation]:
         """Execute: FadeToBlack
 
         Args:
@@ -146,17 +183,17 @@ class ATEMMax(ATEMConnectionManager, ATEMSwitcherState, ATEMSetterMethods):
 
         if not self.connected:
             self.log.warning("execFadeToBlackME() IGNORED - switcher disconnected")
-            return
+            return None
 
         mE_val = self.atem.mixEffects[mE].value
 
         self._prepareCommandPacket("FtbA", 4)
         self._outBuf.setU8(0, mE_val)
         self._outBuf.setU8(1, 0x02)
-        self._finishCommandPacket()
+        return self._finishCommandPacket()
 
 
-    def execMacroRecord(self, macro: Union[ATEMConstant, str, int], name: str = '', description: str = '') -> None:
+    def execMacroRecord(self, macro: Union[ATEMConstant, str, int], name: str = '', description: str = '') -> Optional[ATEMCommandConfirmation]:
         """Execute: Macro Record (use macro.stop to stop recording)
 
         Args:
@@ -165,7 +202,7 @@ class ATEMMax(ATEMConnectionManager, ATEMSwitcherState, ATEMSetterMethods):
 
         if not self.connected:
             self.log.warning("execMacroRecord() IGNORED - switcher disconnected")
-            return
+            return None
 
         name_len = len(name)
         description_len = len(description)
@@ -186,18 +223,28 @@ class ATEMMax(ATEMConnectionManager, ATEMSwitcherState, ATEMSetterMethods):
         self.switcher._outBuf.setU16(4, len(description))
         self.switcher._outBuf.setString(name_pos, len(name), name)
         self.switcher._outBuf.setString(description_pos, len(description), description)
-        self.switcher._finishCommandPacket()
+        return self.switcher._finishCommandPacket()
 
 
-    def execMacroStopRecording(self) -> None:
+    def execMacroStopRecording(self) -> Optional[ATEMCommandConfirmation]:
         """Execute: Macro Stop Recording"""
 
         if not self.connected:
             self.log.warning("execMacroRecord() IGNORED - switcher disconnected")
-            return
+            return None
 
         self.switcher._prepareCommandPacket("MAct", 4)
         self.switcher._outBuf.setU8(0, 0xff)
         self.switcher._outBuf.setU8(1, 0xff)
         self.switcher._outBuf.setU8(2, 0x02)
-        self.switcher._finishCommandPacket()
+        return self.switcher._finishCommandPacket()
+
+
+class ATEMMax(ATEMThreadedConnectionManager, ATEMMaxBase):
+    """Blackmagic ATEM switcher manager
+
+    The connection runs on its own threads (see ATEMThreadedConnectionManager),
+    use ATEMAsyncMax in asyncio applications.
+
+    This class is a port of Skårhøj's ATEMmax class.
+    """
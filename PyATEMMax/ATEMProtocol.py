@@ -7,7 +7,7 @@ Part of the PyATEMMax library.
 
 # pylint: disable=wildcard-import, unused-wildcard-import
 
-from typing import Union
+from typing import Dict, Union
 
 import math
 
@@ -41,6 +41,51 @@ class ATEMProtocol:
     inputBufferLength: int = 10240
     outputBufferLength: int = 250
 
+    # Max command packets waiting for an ack from the switcher (more packets wait in a queue)
+    maxCommandPacketsInFlight: int = 16
+
+    # Max unacked packets a switcher can take (some models crash with more), maxCommandPacketsInFlight never exceeds it
+    switcherPacketWindow: int = 63
+
+    # Max command packets sent per second (0: no limit) and max packets sent at once after some idle time
+    maxCommandPacketRate: float = 1000.0
+    commandPacketBurst: int = 32
+
+    # Command send priorities (queued commands with lower values are sent first), other commands: 0
+    commandPriorities: Dict[str, int] = {
+        "CCmd": 1,      # Camera control
+        "CAMI": 1,      # Audio mixer input
+        "CAMM": 1,      # Audio mixer master
+        "CAMm": 1,      # Audio mixer monitor
+    }
+
+    # Time (seconds) to wait for a command packet ack before retransmitting it
+    commandAckTimeout: float = 0.06
+
+    # Max retransmissions of a command packet (then it's considered lost)
+    maxCommandRetransmits: int = 10
+
+    # Time (seconds) to wait for the state echo of a command after its ack (then it's not confirmed)
+    commandEchoTimeout: float = 1.0
+
+    # Number of recent command packet ack latencies to keep
+    ackLatencyHistory: int = 256
+
+    # Max missed initialization packet requests waiting for an answer from the switcher
+    initPacketRequestWindow: int = 16
+
+    # Time (seconds) to wait for a missed initialization packet before requesting it again
+    initPacketRequestTimeout: float = 0.1
+
+    # Time (seconds) to wait for a missed packet (after a gap in the packet ids) before requesting it again
+    missedPacketRequestTimeout: float = 0.05
+
+    # Max requests for a missed packet (then it's skipped)
+    maxMissedPacketRequests: int = 5
+
+    # Max gap in the packet ids to wait for the missed packets (larger gaps are skipped)
+    maxRemotePacketGap: int = 64
+
     # The maximum number of initialization packets.
     # By observation on a 2M/E 4K can be up to (not fixed!) 32. We allocate a f more then...
     maxInitPacketCount: int = 500
@@ -20,6 +20,7 @@ class ATEMEvents:
     connect:str = 'connect'
     disconnect:str = 'disconnect'
     receive:str = 'receive'
+    change:str = 'change'
     warning:str = 'warning'
 
 
@@ -0,0 +1,1973 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""
+ATEMSetterDeclarations: Blackmagic ATEM switcher setter declarations.
+Part of the PyATEMMax library.
+Generated from ATEMSetterLayouts by tools/generate-setter-declarations.py, do not edit.
+"""
+
+# pylint: disable=too-many-lines, too-many-public-methods, line-too-long, unnecessary-ellipsis
+
+from typing import Union
+
+from .ATEMCommandQueue import ATEMCommandConfirmation
+from .ATEMConstant import ATEMConstant
+
+
+class ATEMSetterDeclarations():
+    """Blackmagic ATEM switcher setter declarations
+
+    Signatures and docstrings of the setters compiled from ATEMSetterLayouts
+    (ATEMSetterMethods replaces these declarations with the compiled methods).
+    """
+
+
+    def setDownConverterMode(self, mode: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Down Converter Mode
+
+        Args:
+            mode: see ATEMDownConverterModes
+        """
+        ...
+
+
+    def setVideoModeFormat(self, format_: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Video Mode Format
+
+        Args:
+            format_: see ATEMVideoModeFormats
+        """
+        ...
+
+
+    def setInputLongName(self, videoSource: Union[ATEMConstant, str, int], longName: str) -> ATEMCommandConfirmation:
+        """Set Input Properties Long Name
+
+        Args:
+            videoSource: see ATEMVideoSources
+            longName (str): long name
+        """
+        ...
+
+
+    def setInputShortName(self, videoSource: Union[ATEMConstant, str, int], shortName: str) -> ATEMCommandConfirmation:
+        """Set Input Properties Short Name
+
+        Args:
+            videoSource: see ATEMVideoSources
+            shortName (str): short name
+        """
+        ...
+
+
+    def setInputExternalPortType(self, videoSource: Union[ATEMConstant, str, int], externalPortType: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Input Properties External Port Type
+
+        Args:
+            videoSource: see ATEMVideoSources
+            externalPortType: see ATEMExternalPortTypes
+        """
+        ...
+
+
+    def setMultiViewerPropertiesLayout(self, multiViewer: Union[ATEMConstant, str, int], layout: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set MultiViewer Properties Layout
+
+        Args:
+            multiViewer: see ATEMMultiViewers
+            layout: see ATEMMultiViewerLayouts
+        """
+        ...
+
+
+    def setMultiViewerInputVideoSource(self, multiViewer: Union[ATEMConstant, str, int], window: Union[ATEMConstant, str, int], videoSource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set MultiViewer Properties Video Source
+
+        Args:
+            multiViewer: see ATEMMultiViewers
+            window: see ATEMWindows
+            videoSource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setProgramInputVideoSource(self, mE: Union[ATEMConstant, str, int], videoSource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Program Input Video Source
+
+        Args:
+            mE: see ATEMMixEffects
+            videoSource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setPreviewInputVideoSource(self, mE: Union[ATEMConstant, str, int], videoSource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Preview Input Video Source
+
+        Args:
+            mE: see ATEMMixEffects
+            videoSource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setTransitionStyle(self, mE: Union[ATEMConstant, str, int], style: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Transition Style
+
+        Args:
+            mE: see ATEMMixEffects
+            style: see ATEMTransitionStyles
+        """
+        ...
+
+
+    def setTransitionNextTransition(self, mE: Union[ATEMConstant, str, int], nextTransition: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Transition Style Next Transition
+
+        Args:
+            mE: see ATEMMixEffects
+            nextTransition: see ATEMTransitionStyles
+        """
+        ...
+
+
+    def setTransitionPreviewEnabled(self, mE: Union[ATEMConstant, str, int], enabled: bool) -> ATEMCommandConfirmation:
+        """Set Transition Preview Enabled
+
+        Args:
+            mE: see ATEMMixEffects
+            enabled (bool): On/Off
+        """
+        ...
+
+
+    def setTransitionPosition(self, mE: Union[ATEMConstant, str, int], position: int) -> ATEMCommandConfirmation:
+        """Set Transition Preview Enabled
+
+        Args:
+            mE: see ATEMMixEffects
+            position (int): 0-9999
+        """
+        ...
+
+
+    def setTransitionMixRate(self, mE: Union[ATEMConstant, str, int], rate: int) -> ATEMCommandConfirmation:
+        """Set Transition Mix Rate
+
+        Args:
+            mE: see ATEMMixEffects
+            rate (int): 1-250 (frames)
+        """
+        ...
+
+
+    def setTransitionDipRate(self, mE: Union[ATEMConstant, str, int], rate: int) -> ATEMCommandConfirmation:
+        """Set Transition Dip Rate
+
+        Args:
+            mE: see ATEMMixEffects
+            rate (int): 1-250 (frames)
+        """
+        ...
+
+
+    def setTransitionDipInput(self, mE: Union[ATEMConstant, str, int], input_: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Transition Dip Input
+
+        Args:
+            mE: see ATEMMixEffects
+            input_: see ATEMVideoSources
+        """
+        ...
+
+
+    def setTransitionWipeRate(self, mE: Union[ATEMConstant, str, int], rate: int) -> ATEMCommandConfirmation:
+        """Set Transition Wipe Rate
+
+        Args:
+            mE: see ATEMMixEffects
+            rate (int): 1-250 (frames)
+        """
+        ...
+
+
+    def setTransitionWipePattern(self, mE: Union[ATEMConstant, str, int], pattern: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Transition Wipe Pattern
+
+        Args:
+            mE: see ATEMMixEffects
+            pattern: see ATEMPatternStyles
+        """
+        ...
+
+
+    def setTransitionWipeWidth(self, mE: Union[ATEMConstant, str, int], width: float) -> ATEMCommandConfirmation:
+        """Set Transition Wipe Width
+
+        Args:
+            mE: see ATEMMixEffects
+            width (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setTransitionWipeFillSource(self, mE: Union[ATEMConstant, str, int], fillSource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Transition Wipe Fill Source
+
+        Args:
+            mE: see ATEMMixEffects
+            fillSource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setTransitionWipeSymmetry(self, mE: Union[ATEMConstant, str, int], symmetry: float) -> ATEMCommandConfirmation:
+        """Set Transition Wipe Symmetry
+
+        Args:
+            mE: see ATEMMixEffects
+            symmetry (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setTransitionWipeSoftness(self, mE: Union[ATEMConstant, str, int], softness: float) -> ATEMCommandConfirmation:
+        """Set Transition Wipe Softness
+
+        Args:
+            mE: see ATEMMixEffects
+            softness (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setTransitionWipePositionX(self, mE: Union[ATEMConstant, str, int], positionX: float) -> ATEMCommandConfirmation:
+        """Set Transition Wipe Position X
+
+        Args:
+            mE: see ATEMMixEffects
+            positionX (float): 0.0-1.0
+        """
+        ...
+
+
+    def setTransitionWipePositionY(self, mE: Union[ATEMConstant, str, int], positionY: float) -> ATEMCommandConfirmation:
+        """Set Transition Wipe Position Y
+
+        Args:
+            mE: see ATEMMixEffects
+            positionY (float): 0.0-1.0
+        """
+        ...
+
+
+    def setTransitionWipeReverse(self, mE: Union[ATEMConstant, str, int], reverse: bool) -> ATEMCommandConfirmation:
+        """Set Transition Wipe Reverse
+
+        Args:
+            mE: see ATEMMixEffects
+            reverse (bool): On/Off
+        """
+        ...
+
+
+    def setTransitionWipeFlipFlop(self, mE: Union[ATEMConstant, str, int], flipFlop: bool) -> ATEMCommandConfirmation:
+        """Set Transition Wipe FlipFlop
+
+        Args:
+            mE: see ATEMMixEffects
+            flipFlop (bool): On/Off
+        """
+        ...
+
+
+    def setTransitionDVERate(self, mE: Union[ATEMConstant, str, int], rate: int) -> ATEMCommandConfirmation:
+        """Set Transition DVE Rate
+
+        Args:
+            mE: see ATEMMixEffects
+            rate (int): 1-250 (frames)
+        """
+        ...
+
+
+    def setTransitionDVEStyle(self, mE: Union[ATEMConstant, str, int], style: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Transition DVE Style
+
+        Args:
+            mE: see ATEMMixEffects
+            style: see ATEMDVETransitionStyles
+        """
+        ...
+
+
+    def setTransitionDVEFillSource(self, mE: Union[ATEMConstant, str, int], fillSource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Transition DVE Fill Source
+
+        Args:
+            mE: see ATEMMixEffects
+            fillSource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setTransitionDVEKeySource(self, mE: Union[ATEMConstant, str, int], keySource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Transition DVE Key Source
+
+        Args:
+            mE: see ATEMMixEffects
+            keySource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setTransitionDVEEnableKey(self, mE: Union[ATEMConstant, str, int], enableKey: bool) -> ATEMCommandConfirmation:
+        """Set Transition DVE Enable Key
+
+        Args:
+            mE: see ATEMMixEffects
+            enableKey (bool): On/Off
+        """
+        ...
+
+
+    def setTransitionDVEPreMultiplied(self, mE: Union[ATEMConstant, str, int], preMultiplied: bool) -> ATEMCommandConfirmation:
+        """Set Transition DVE Pre Multiplied
+
+        Args:
+            mE: see ATEMMixEffects
+            preMultiplied (bool): On/Off
+        """
+        ...
+
+
+    def setTransitionDVEClip(self, mE: Union[ATEMConstant, str, int], clip: float) -> ATEMCommandConfirmation:
+        """Set Transition DVE Clip
+
+        Args:
+            mE: see ATEMMixEffects
+            clip (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setTransitionDVEGain(self, mE: Union[ATEMConstant, str, int], gain: float) -> ATEMCommandConfirmation:
+        """Set Transition DVE Gain
+
+        Args:
+            mE: see ATEMMixEffects
+            gain (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setTransitionDVEInvertKey(self, mE: Union[ATEMConstant, str, int], invertKey: bool) -> ATEMCommandConfirmation:
+        """Set Transition DVE Invert Key
+
+        Args:
+            mE: see ATEMMixEffects
+            invertKey (bool): On/Off
+        """
+        ...
+
+
+    def setTransitionDVEReverse(self, mE: Union[ATEMConstant, str, int], reverse: bool) -> ATEMCommandConfirmation:
+        """Set Transition DVE Reverse
+
+        Args:
+            mE: see ATEMMixEffects
+            reverse (bool): On/Off
+        """
+        ...
+
+
+    def setTransitionDVEFlipFlop(self, mE: Union[ATEMConstant, str, int], flipFlop: bool) -> ATEMCommandConfirmation:
+        """Set Transition DVE FlipFlop
+
+        Args:
+            mE: see ATEMMixEffects
+            flipFlop (bool): On/Off
+        """
+        ...
+
+
+    def setTransitionStingerSource(self, mE: Union[ATEMConstant, str, int], source: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Transition Stinger Source
+
+        Args:
+            mE: see ATEMMixEffects
+            source: see ATEMMediaPlayers
+        """
+        ...
+
+
+    def setTransitionStingerPreMultiplied(self, mE: Union[ATEMConstant, str, int], preMultiplied: bool) -> ATEMCommandConfirmation:
+        """Set Transition Stinger Pre Multiplied
+
+        Args:
+            mE: see ATEMMixEffects
+            preMultiplied (bool): On/Off
+        """
+        ...
+
+
+    def setTransitionStingerClip(self, mE: Union[ATEMConstant, str, int], clip: float) -> ATEMCommandConfirmation:
+        """Set Transition Stinger Clip
+
+        Args:
+            mE: see ATEMMixEffects
+            clip (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setTransitionStingerGain(self, mE: Union[ATEMConstant, str, int], gain: float) -> ATEMCommandConfirmation:
+        """Set Transition Stinger Gain
+
+        Args:
+            mE: see ATEMMixEffects
+            gain (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setTransitionStingerInvertKey(self, mE: Union[ATEMConstant, str, int], invertKey: bool) -> ATEMCommandConfirmation:
+        """Set Transition Stinger Invert Key
+
+        Args:
+            mE: see ATEMMixEffects
+            invertKey (bool): On/Off
+        """
+        ...
+
+
+    def setTransitionStingerPreRoll(self, mE: Union[ATEMConstant, str, int], preRoll: int) -> ATEMCommandConfirmation:
+        """Set Transition Stinger Pre Roll
+
+        Args:
+            mE: see ATEMMixEffects
+            preRoll (int): frames
+        """
+        ...
+
+
+    def setTransitionStingerClipDuration(self, mE: Union[ATEMConstant, str, int], clipDuration: int) -> ATEMCommandConfirmation:
+        """Set Transition Stinger Clip Duration
+
+        Args:
+            mE: see ATEMMixEffects
+            clipDuration (int): frames
+        """
+        ...
+
+
+    def setTransitionStingerTriggerPoint(self, mE: Union[ATEMConstant, str, int], triggerPoint: int) -> ATEMCommandConfirmation:
+        """Set Transition Stinger Trigger Point
+
+        Args:
+            mE: see ATEMMixEffects
+            triggerPoint (int): frames
+        """
+        ...
+
+
+    def setTransitionStingerMixRate(self, mE: Union[ATEMConstant, str, int], mixRate: int) -> ATEMCommandConfirmation:
+        """Set Transition Stinger Mix Rate
+
+        Args:
+            mE: see ATEMMixEffects
+            mixRate (int): frames
+        """
+        ...
+
+
+    def setKeyerOnAirEnabled(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], enabled: bool) -> ATEMCommandConfirmation:
+        """Set Keyer On Air Enabled
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            enabled (bool): On/Off
+        """
+        ...
+
+
+    def setKeyerType(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], type_: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Key Type Type
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            type_: see ATEMKeyerTypes
+        """
+        ...
+
+
+    def setKeyerFlyEnabled(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], flyEnabled: bool) -> ATEMCommandConfirmation:
+        """Set Key Type Fly Enabled
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            flyEnabled (bool): On/Off
+        """
+        ...
+
+
+    def setKeyerMasked(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], masked: bool) -> ATEMCommandConfirmation:
+        """Set Key Mask Masked
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            masked (bool): On/Off
+        """
+        ...
+
+
+    def setKeyerTop(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], top: float) -> ATEMCommandConfirmation:
+        """Set Key Mask Top
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            top (float): -9.0-9.0
+        """
+        ...
+
+
+    def setKeyerBottom(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], bottom: float) -> ATEMCommandConfirmation:
+        """Set Key Mask Bottom
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            bottom (float): -9.0-9.0
+        """
+        ...
+
+
+    def setKeyerLeft(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], left: float) -> ATEMCommandConfirmation:
+        """Set Key Mask Left
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            left (float): -9.0-9.0
+        """
+        ...
+
+
+    def setKeyerRight(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], right: float) -> ATEMCommandConfirmation:
+        """Set Key Mask Right
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            right (float): -9.0-9.0
+        """
+        ...
+
+
+    def setKeyerFillSource(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], fillSource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Key Fill Fill Source
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            fillSource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setKeyerKeySource(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], keySource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Key Cut Key Source
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            keySource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setKeyLumaPreMultiplied(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], preMultiplied: bool) -> ATEMCommandConfirmation:
+        """Set Key Luma Pre Multiplied
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            preMultiplied (bool): On/Off
+        """
+        ...
+
+
+    def setKeyLumaClip(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], clip: float) -> ATEMCommandConfirmation:
+        """Set Key Luma Clip
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            clip (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setKeyLumaGain(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], gain: float) -> ATEMCommandConfirmation:
+        """Set Key Luma Gain
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            gain (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setKeyLumaInvertKey(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], invertKey: bool) -> ATEMCommandConfirmation:
+        """Set Key Luma Invert Key
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            invertKey (bool): On/Off
+        """
+        ...
+
+
+    def setKeyChromaHue(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], hue: float) -> ATEMCommandConfirmation:
+        """Set Key Chroma Hue
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            hue (float): 0.0-359.9 (degrees)
+        """
+        ...
+
+
+    def setKeyChromaGain(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], gain: float) -> ATEMCommandConfirmation:
+        """Set Key Chroma Gain
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            gain (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setKeyChromaYSuppress(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], ySuppress: float) -> ATEMCommandConfirmation:
+        """Set Key Chroma Y Suppress
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            ySuppress (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setKeyChromaLift(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], lift: float) -> ATEMCommandConfirmation:
+        """Set Key Chroma Lift
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            lift (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setKeyChromaNarrow(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], narrow: bool) -> ATEMCommandConfirmation:
+        """Set Key Chroma Narrow
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            narrow (bool): On/Off
+        """
+        ...
+
+
+    def setKeyPatternPattern(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], pattern: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Key Pattern Pattern
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            pattern: see ATEMPatternStyles
+        """
+        ...
+
+
+    def setKeyPatternSize(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], size: float) -> ATEMCommandConfirmation:
+        """Set Key Pattern Size
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            size (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setKeyPatternSymmetry(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], symmetry: float) -> ATEMCommandConfirmation:
+        """Set Key Pattern Symmetry
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            symmetry (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setKeyPatternSoftness(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], softness: float) -> ATEMCommandConfirmation:
+        """Set Key Pattern Softness
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            softness (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setKeyPatternPositionX(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], positionX: float) -> ATEMCommandConfirmation:
+        """Set Key Pattern Position X
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            positionX (float): 0.0-1.0
+        """
+        ...
+
+
+    def setKeyPatternPositionY(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], positionY: float) -> ATEMCommandConfirmation:
+        """Set Key Pattern Position Y
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            positionY (float): 0.0-1.0
+        """
+        ...
+
+
+    def setKeyPatternInvertPattern(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], invertPattern: bool) -> ATEMCommandConfirmation:
+        """Set Key Pattern Invert Pattern
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            invertPattern (bool): On/Off
+        """
+        ...
+
+
+    def setKeyDVESizeX(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], sizeX: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Size X
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            sizeX (float): 0.0-1.0
+        """
+        ...
+
+
+    def setKeyDVESizeY(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], sizeY: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Size Y
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            sizeY (float): 0.0-1.0
+        """
+        ...
+
+
+    def setKeyDVEPositionX(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], positionX: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Position X
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            positionX (float): 0.0-1.0
+        """
+        ...
+
+
+    def setKeyDVEPositionY(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], positionY: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Position Y
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            positionY (float): 0.0-1.0
+        """
+        ...
+
+
+    def setKeyDVERotation(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], rotation: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Rotation
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            rotation (float): 0.0-359.9 (degrees)
+        """
+        ...
+
+
+    def setKeyDVEBorderEnabled(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderEnabled: bool) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Enabled
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderEnabled (bool): On/Off
+        """
+        ...
+
+
+    def setKeyDVEShadow(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], shadow: bool) -> ATEMCommandConfirmation:
+        """Set Key DVE Shadow
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            shadow (bool): On/Off
+        """
+        ...
+
+
+    def setKeyDVEBorderBevel(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderBevel: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Bevel
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderBevel: see ATEMBorderBevels
+        """
+        ...
+
+
+    def setKeyDVEBorderOuterWidth(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderOuterWidth: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Outer Width
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderOuterWidth (float): 0.0-16.0
+        """
+        ...
+
+
+    def setKeyDVEBorderInnerWidth(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderInnerWidth: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Inner Width
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderInnerWidth (float): 0.0-16.0
+        """
+        ...
+
+
+    def setKeyDVEBorderOuterSoftness(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderOuterSoftness: int) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Outer Softness
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderOuterSoftness (int): 0-100 (%)
+        """
+        ...
+
+
+    def setKeyDVEBorderInnerSoftness(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderInnerSoftness: int) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Inner Softness
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderInnerSoftness (int): 0-100 (%)
+        """
+        ...
+
+
+    def setKeyDVEBorderBevelSoftness(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderBevelSoftness: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Bevel Softness
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderBevelSoftness (float): 0.0-1.0
+        """
+        ...
+
+
+    def setKeyDVEBorderBevelPosition(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderBevelPosition: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Bevel Position
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderBevelPosition (float): 0.0-1.0
+        """
+        ...
+
+
+    def setKeyDVEBorderOpacity(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderOpacity: int) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Opacity
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderOpacity (int): 0-100 (%)
+        """
+        ...
+
+
+    def setKeyDVEBorderHue(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderHue: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Hue
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderHue (float): 0.0-359.9 (degrees)
+        """
+        ...
+
+
+    def setKeyDVEBorderSaturation(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderSaturation: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Saturation
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderSaturation (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setKeyDVEBorderLuma(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], borderLuma: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Border Luma
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            borderLuma (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setKeyDVELightSourceDirection(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], lightSourceDirection: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Light Source Direction
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            lightSourceDirection (float): 0.0-359.9 (degrees)
+        """
+        ...
+
+
+    def setKeyDVELightSourceAltitude(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], lightSourceAltitude: int) -> ATEMCommandConfirmation:
+        """Set Key DVE Light Source Altitude
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            lightSourceAltitude (int): 10-100
+        """
+        ...
+
+
+    def setKeyDVEMasked(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], masked: bool) -> ATEMCommandConfirmation:
+        """Set Key DVE Masked
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            masked (bool): On/Off
+        """
+        ...
+
+
+    def setKeyDVETop(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], top: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Top
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            top (float): -9.0-9.0
+        """
+        ...
+
+
+    def setKeyDVEBottom(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], bottom: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Bottom
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            bottom (float): -9.0-9.0
+        """
+        ...
+
+
+    def setKeyDVELeft(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], left: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Left
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            left (float): -9.0-9.0
+        """
+        ...
+
+
+    def setKeyDVERight(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], right: float) -> ATEMCommandConfirmation:
+        """Set Key DVE Right
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            right (float): -9.0-9.0
+        """
+        ...
+
+
+    def setKeyDVERate(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], rate: int) -> ATEMCommandConfirmation:
+        """Set Key DVE Rate
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            rate (int): 1-250 (frames)
+        """
+        ...
+
+
+    def setKeyerFlyKeyFrame(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], keyFrame: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Keyer Fly Key Frame
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            keyFrame: see ATEMKeyFrames
+        """
+        ...
+
+
+    def setRunFlyingKeyKeyFrame(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], keyFrame: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Run Flying Key Key Frame
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            keyFrame: see ATEMKeyFrames
+        """
+        ...
+
+
+    def setRunFlyingKeyRuntoInfiniteindex(self, mE: Union[ATEMConstant, str, int], keyer: Union[ATEMConstant, str, int], runtoInfiniteindex: int) -> ATEMCommandConfirmation:
+        """Set Run Flying Key Run-to-Infinite-index
+
+        Args:
+            mE: see ATEMMixEffects
+            keyer: see ATEMKeyers
+            runtoInfiniteindex (int): index
+        """
+        ...
+
+
+    def setDownstreamKeyerFillSource(self, keyer: Union[ATEMConstant, str, int], fillSource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Fill Source
+
+        Args:
+            keyer: see ATEMKeyers
+            fillSource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setDownstreamKeyerKeySource(self, keyer: Union[ATEMConstant, str, int], keySource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Source
+
+        Args:
+            keyer: see ATEMKeyers
+            keySource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setDownstreamKeyerTie(self, keyer: Union[ATEMConstant, str, int], tie: bool) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Tie
+
+        Args:
+            keyer: see ATEMKeyers
+            tie (bool): On/Off
+        """
+        ...
+
+
+    def setDownstreamKeyerRate(self, keyer: Union[ATEMConstant, str, int], rate: int) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Rate
+
+        Args:
+            keyer: see ATEMKeyers
+            rate (int): 1-250 (frames)
+        """
+        ...
+
+
+    def setDownstreamKeyerPreMultiplied(self, keyer: Union[ATEMConstant, str, int], preMultiplied: bool) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Pre Multiplied
+
+        Args:
+            keyer: see ATEMKeyers
+            preMultiplied (bool): On/Off
+        """
+        ...
+
+
+    def setDownstreamKeyerClip(self, keyer: Union[ATEMConstant, str, int], clip: float) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Clip
+
+        Args:
+            keyer: see ATEMKeyers
+            clip (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setDownstreamKeyerGain(self, keyer: Union[ATEMConstant, str, int], gain: float) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Gain
+
+        Args:
+            keyer: see ATEMKeyers
+            gain (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setDownstreamKeyerInvertKey(self, keyer: Union[ATEMConstant, str, int], invertKey: bool) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Invert Key(??)
+
+        Args:
+            keyer: see ATEMKeyers
+            invertKey (bool): On/Off
+        """
+        ...
+
+
+    def setDownstreamKeyerMasked(self, keyer: Union[ATEMConstant, str, int], masked: bool) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Masked
+
+        Args:
+            keyer: see ATEMKeyers
+            masked (bool): On/Off
+        """
+        ...
+
+
+    def setDownstreamKeyerTop(self, keyer: Union[ATEMConstant, str, int], top: float) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Top
+
+        Args:
+            keyer: see ATEMKeyers
+            top (float): -9.0-9.0
+        """
+        ...
+
+
+    def setDownstreamKeyerBottom(self, keyer: Union[ATEMConstant, str, int], bottom: float) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Bottom
+
+        Args:
+            keyer: see ATEMKeyers
+            bottom (float): -9.0-9.0
+        """
+        ...
+
+
+    def setDownstreamKeyerLeft(self, keyer: Union[ATEMConstant, str, int], left: float) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Left
+
+        Args:
+            keyer: see ATEMKeyers
+            left (float): -9.0-9.0
+        """
+        ...
+
+
+    def setDownstreamKeyerRight(self, keyer: Union[ATEMConstant, str, int], right: float) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer Right
+
+        Args:
+            keyer: see ATEMKeyers
+            right (float): -9.0-9.0
+        """
+        ...
+
+
+    def setDownstreamKeyerOnAir(self, keyer: Union[ATEMConstant, str, int], onAir: bool) -> ATEMCommandConfirmation:
+        """Set Downstream Keyer On Air
+
+        Args:
+            keyer: see ATEMKeyers
+            onAir (bool): On/Off
+        """
+        ...
+
+
+    def setFadeToBlackRate(self, mE: Union[ATEMConstant, str, int], rate: int) -> ATEMCommandConfirmation:
+        """Set Fade-To-Black Rate
+
+        Args:
+            mE: see ATEMMixEffects
+            rate (int): 1-250 (frames)
+        """
+        ...
+
+
+    def setColorGeneratorHue(self, colorGenerator: Union[ATEMConstant, str, int], hue: float) -> ATEMCommandConfirmation:
+        """Set Color Generator Hue
+
+        Args:
+            colorGenerator: see ATEMColorGenerators
+            hue (float): 0.0-359.9 (degrees)
+        """
+        ...
+
+
+    def setColorGeneratorSaturation(self, colorGenerator: Union[ATEMConstant, str, int], saturation: float) -> ATEMCommandConfirmation:
+        """Set Color Generator Saturation
+
+        Args:
+            colorGenerator: see ATEMColorGenerators
+            saturation (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setColorGeneratorLuma(self, colorGenerator: Union[ATEMConstant, str, int], luma: float) -> ATEMCommandConfirmation:
+        """Set Color Generator Luma
+
+        Args:
+            colorGenerator: see ATEMColorGenerators
+            luma (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setAuxSourceInput(self, auxChannel: Union[ATEMConstant, str, int], input_: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Aux Source Input
+
+        Args:
+            auxChannel: see ATEMAUXChannels
+            input_: see ATEMVideoSources
+        """
+        ...
+
+
+    def setCameraControlIris(self, camera: Union[ATEMConstant, str, int], iris: int) -> ATEMCommandConfirmation:
+        """Set Camera Control Iris
+
+        Args:
+            camera: see ATEMCameras
+            iris (int): 0-2048
+        """
+        ...
+
+
+    def setCameraControlFocus(self, camera: Union[ATEMConstant, str, int], focus: int) -> ATEMCommandConfirmation:
+        """Set Camera Control Focus
+
+        Args:
+            camera: see ATEMCameras
+            focus (int): 0-65535
+        """
+        ...
+
+
+    def setCameraControlAutoFocus(self, camera: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Camera Control Auto focus
+
+        Args:
+            camera: see ATEMCameras
+        """
+        ...
+
+
+    def setCameraControlAutoIris(self, camera: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Camera Control Auto iris
+
+        Args:
+            camera: see ATEMCameras
+        """
+        ...
+
+
+    def setCameraControlWhiteBalance(self, camera: Union[ATEMConstant, str, int], whiteBalance: int) -> ATEMCommandConfirmation:
+        """Set Camera Control White Balance
+
+        Args:
+            camera: see ATEMCameras
+            whiteBalance (int): 3200: 3200K, 4500: 4500K, 5000: 5000K, 5600: 5600K, 6500: 6500K, 7500: 7500K
+        """
+        ...
+
+
+    def setCameraControlSharpeningLevel(self, camera: Union[ATEMConstant, str, int], detail: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Camera Control Detail level
+
+        Args:
+            camera: see ATEMCameras
+            detail: see ATEMCamerControlSharpeningLevels
+        """
+        ...
+
+
+    def setCameraControlZoomNormalized(self, camera: Union[ATEMConstant, str, int], zoomNormalized: float) -> ATEMCommandConfirmation:
+        """Set Camera Control Zoom Normalized
+
+        Args:
+            camera: see ATEMCameras
+            zoomNormalized (float): ?
+        """
+        ...
+
+
+    def setCameraControlZoomSpeed(self, camera: Union[ATEMConstant, str, int], zoomSpeed: float) -> ATEMCommandConfirmation:
+        """Set Camera Control Zoom
+
+        Args:
+            camera: see ATEMCameras
+            zoomSpeed (float): -1.0-1.0
+        """
+        ...
+
+
+    def setCameraControlColorbars(self, camera: Union[ATEMConstant, str, int], colorbars: int) -> ATEMCommandConfirmation:
+        """Set Camera Control Colorbars
+
+        Args:
+            camera: see ATEMCameras
+            colorbars (int): duration in secs (0=disable)
+        """
+        ...
+
+
+    def setCameraControlLift(self, camera: Union[ATEMConstant, str, int], liftR: float, liftG: float, liftB: float, liftY: float) -> ATEMCommandConfirmation:
+        """Set Camera Control Lift
+
+        Args:
+            camera: see ATEMCameras
+            liftR (float): -1.0-1.0
+            liftG (float): -1.0-1.0
+            liftB (float): -1.0-1.0
+            liftY (float): -1.0-1.0
+        """
+        ...
+
+
+    def setCameraControlGamma(self, camera: Union[ATEMConstant, str, int], gammaR: float, gammaG: float, gammaB: float, gammaY: float) -> ATEMCommandConfirmation:
+        """Set Camera Control Gamma
+
+        Args:
+            camera: see ATEMCameras
+            gammaR (float): -1.0-1.0
+            gammaG (float): -1.0-1.0
+            gammaB (float): -1.0-1.0
+            gammaY (float): -1.0-1.0
+        """
+        ...
+
+
+    def setCameraControlGain(self, camera: Union[ATEMConstant, str, int], gain: int) -> ATEMCommandConfirmation:
+        """Set Camera Control Gain
+
+        Args:
+            camera: see ATEMCameras
+            gain (int): 512: 0db, 1024: 6db, 2048: 12db, 4096: 18db
+        """
+        ...
+
+
+    def setCameraControlComponentGain(self, camera: Union[ATEMConstant, str, int], gainR: float, gainG: float, gainB: float, gainY: float) -> ATEMCommandConfirmation:
+        """Set Camera Control Component Gain
+
+        Args:
+            camera: see ATEMCameras
+            gainR (float): 0.0-16.0
+            gainG (float): 0.0-16.0
+            gainB (float): 0.0-16.0
+            gainY (float): 0.0-16.0
+        """
+        ...
+
+
+    def setCameraControlLumMix(self, camera: Union[ATEMConstant, str, int], lumMix: float) -> ATEMCommandConfirmation:
+        """Set Camera Control Lum Mix
+
+        Args:
+            camera: see ATEMCameras
+            lumMix (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setCameraControlShutter(self, camera: Union[ATEMConstant, str, int], shutter: float) -> ATEMCommandConfirmation:
+        """Set Camera Control Shutter
+
+        Args:
+            camera: see ATEMCameras
+            shutter (float): 1/50, 1/60, 1/75, 1/90, 1/100, 1/120, 1/150, 1/180, 1/250, 1/360, 1/500, 1/750, 1/1000, 1/1450, 1/2000
+        """
+        ...
+
+
+    def setCameraControlContrast(self, camera: Union[ATEMConstant, str, int], contrast: float) -> ATEMCommandConfirmation:
+        """Set Camera Control Contrast
+
+        Args:
+            camera: see ATEMCameras
+            contrast (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setCameraControlHueSaturation(self, camera: Union[ATEMConstant, str, int], hue: float, saturation: float) -> ATEMCommandConfirmation:
+        """Set Camera Control Hue/Saturation
+
+        Args:
+            camera: see ATEMCameras
+            hue (float): 0.0-359.9 degrees
+            saturation (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setCameraControlVideomode(self, camera: Union[ATEMConstant, str, int], fps: int, resolution: int, interlaced: int) -> ATEMCommandConfirmation:
+        """Set Camera Control Video Mode
+
+        Args:
+            camera: see ATEMCameras
+            fps (int): ?
+            resolution (int): ?
+            interlaced (int): ?
+        """
+        ...
+
+
+    def setClipPlayerPlaying(self, mediaPlayer: Union[ATEMConstant, str, int], playing: bool) -> ATEMCommandConfirmation:
+        """Set Clip Player Playing
+
+        Args:
+            mediaPlayer: see ATEMMediaPlayers
+            playing (bool): On/Off
+        """
+        ...
+
+
+    def setClipPlayerLoop(self, mediaPlayer: Union[ATEMConstant, str, int], loop: bool) -> ATEMCommandConfirmation:
+        """Set Clip Player Loop
+
+        Args:
+            mediaPlayer: see ATEMMediaPlayers
+            loop (bool): On/Off
+        """
+        ...
+
+
+    def setClipPlayerAtBeginning(self, mediaPlayer: Union[ATEMConstant, str, int], atBeginning: bool) -> ATEMCommandConfirmation:
+        """Set Clip Player At Beginning
+
+        Args:
+            mediaPlayer: see ATEMMediaPlayers
+            atBeginning (bool): On/Off
+        """
+        ...
+
+
+    def setClipPlayerClipFrame(self, mediaPlayer: Union[ATEMConstant, str, int], clipFrame: int) -> ATEMCommandConfirmation:
+        """Set Clip Player Clip Frame
+
+        Args:
+            mediaPlayer: see ATEMMediaPlayers
+            clipFrame (int): frame
+        """
+        ...
+
+
+    def setMediaPlayerSourceType(self, mediaPlayer: Union[ATEMConstant, str, int], type_: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Media Player Source Type
+
+        Args:
+            mediaPlayer: see ATEMMediaPlayers
+            type_: see ATEMMediaPlayerSourceTypes
+        """
+        ...
+
+
+    def setMediaPlayerSourceStillIndex(self, mediaPlayer: Union[ATEMConstant, str, int], stillIndex: int) -> ATEMCommandConfirmation:
+        """Set Media Player Source Still Index
+
+        Args:
+            mediaPlayer: see ATEMMediaPlayers
+            stillIndex (int): 0-x: Still 1-x
+        """
+        ...
+
+
+    def setMediaPlayerSourceClipIndex(self, mediaPlayer: Union[ATEMConstant, str, int], clipIndex: int) -> ATEMCommandConfirmation:
+        """Set Media Player Source Clip Index
+
+        Args:
+            mediaPlayer: see ATEMMediaPlayers
+            clipIndex (int): 0-x: Clip 1-x
+        """
+        ...
+
+
+    def setMediaPoolStorageClip1MaxLength(self, clip1MaxLength: int) -> ATEMCommandConfirmation:
+        """Set Media Pool Storage Clip 1 Max Length
+
+        Args:
+            clip1MaxLength (int): frames
+        """
+        ...
+
+
+    def setMacroAction(self, macro: Union[ATEMConstant, str, int], action: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Macro Action Action
+
+        Args:
+            macro: see ATEMMacros (to stop, use macros.stop)
+            action: see ATEMMacroActions
+        """
+        ...
+
+
+    def setMacroRunChangePropertiesLooping(self, looping: bool) -> ATEMCommandConfirmation:
+        """Set Macro Run Change Properties Looping
+
+        Args:
+            looping (bool): On/Off
+        """
+        ...
+
+
+    def setMacroAddPauseFrames(self, frames: int) -> ATEMCommandConfirmation:
+        """Set Macro Add Pause Frames
+
+        Args:
+            frames (int): number of frames
+        """
+        ...
+
+
+    def setSuperSourceFillSource(self, fillSource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Super Source Fill Source
+
+        Args:
+            fillSource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setSuperSourceKeySource(self, keySource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Super Source Key Source
+
+        Args:
+            keySource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setSuperSourceForeground(self, foreground: bool) -> ATEMCommandConfirmation:
+        """Set Super Source Foreground
+
+        Args:
+            foreground (bool): On/Off
+        """
+        ...
+
+
+    def setSuperSourcePreMultiplied(self, preMultiplied: bool) -> ATEMCommandConfirmation:
+        """Set Super Source Pre Multiplied
+
+        Args:
+            preMultiplied (bool): On/Off
+        """
+        ...
+
+
+    def setSuperSourceClip(self, clip: float) -> ATEMCommandConfirmation:
+        """Set Super Source Clip
+
+        Args:
+            clip (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setSuperSourceGain(self, gain: float) -> ATEMCommandConfirmation:
+        """Set Super Source Gain
+
+        Args:
+            gain (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setSuperSourceInvertKey(self, invertKey: bool) -> ATEMCommandConfirmation:
+        """Set Super Source Invert Key
+
+        Args:
+            invertKey (bool): On/Off
+        """
+        ...
+
+
+    def setSuperSourceBorderEnabled(self, borderEnabled: bool) -> ATEMCommandConfirmation:
+        """Set Super Source Border Enabled
+
+        Args:
+            borderEnabled (bool): On/Off
+        """
+        ...
+
+
+    def setSuperSourceBorderBevel(self, borderBevel: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Super Source Border Bevel
+
+        Args:
+            borderBevel: see ATEMBorderBevels
+        """
+        ...
+
+
+    def setSuperSourceBorderOuterWidth(self, borderOuterWidth: float) -> ATEMCommandConfirmation:
+        """Set Super Source Border Outer Width
+
+        Args:
+            borderOuterWidth (float): 0.0-16.0
+        """
+        ...
+
+
+    def setSuperSourceBorderInnerWidth(self, borderInnerWidth: float) -> ATEMCommandConfirmation:
+        """Set Super Source Border Inner Width
+
+        Args:
+            borderInnerWidth (float): 0.0-16.0
+        """
+        ...
+
+
+    def setSuperSourceBorderOuterSoftness(self, borderOuterSoftness: int) -> ATEMCommandConfirmation:
+        """Set Super Source Border Outer Softness
+
+        Args:
+            borderOuterSoftness (int): 0-100 (%)
+        """
+        ...
+
+
+    def setSuperSourceBorderInnerSoftness(self, borderInnerSoftness: int) -> ATEMCommandConfirmation:
+        """Set Super Source Border Inner Softness
+
+        Args:
+            borderInnerSoftness (int): 0-100 (%)
+        """
+        ...
+
+
+    def setSuperSourceBorderBevelSoftness(self, borderBevelSoftness: float) -> ATEMCommandConfirmation:
+        """Set Super Source Border Bevel Softness
+
+        Args:
+            borderBevelSoftness (float): 0.0-1.0
+        """
+        ...
+
+
+    def setSuperSourceBorderBevelPosition(self, borderBevelPosition: float) -> ATEMCommandConfirmation:
+        """Set Super Source Border Bevel Position
+
+        Args:
+            borderBevelPosition (float): 0.0-1.0
+        """
+        ...
+
+
+    def setSuperSourceBorderHue(self, borderHue: float) -> ATEMCommandConfirmation:
+        """Set Super Source Border Hue
+
+        Args:
+            borderHue (float): 0.0-359.9 (degrees)
+        """
+        ...
+
+
+    def setSuperSourceBorderSaturation(self, borderSaturation: float) -> ATEMCommandConfirmation:
+        """Set Super Source Border Saturation
+
+        Args:
+            borderSaturation (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setSuperSourceBorderLuma(self, borderLuma: float) -> ATEMCommandConfirmation:
+        """Set Super Source Border Luma
+
+        Args:
+            borderLuma (float): 0.0-100.0 (%)
+        """
+        ...
+
+
+    def setSuperSourceLightSourceDirection(self, lightSourceDirection: float) -> ATEMCommandConfirmation:
+        """Set Super Source Light Source Direction
+
+        Args:
+            lightSourceDirection (float): 0.0-359.9 (degrees)
+        """
+        ...
+
+
+    def setSuperSourceLightSourceAltitude(self, lightSourceAltitude: int) -> ATEMCommandConfirmation:
+        """Set Super Source Light Source Altitude
+
+        Args:
+            lightSourceAltitude (int): 10-100
+        """
+        ...
+
+
+    def setSuperSourceBoxParametersEnabled(self, box: Union[ATEMConstant, str, int], enabled: bool) -> ATEMCommandConfirmation:
+        """Set Super Source Box Parameters Enabled
+
+        Args:
+            box: see ATEMBoxes
+            enabled (bool): On/Off
+        """
+        ...
+
+
+    def setSuperSourceBoxParametersInputSource(self, box: Union[ATEMConstant, str, int], inputSource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Super Source Box Parameters Input Source
+
+        Args:
+            box: see ATEMBoxes
+            inputSource: see ATEMVideoSources
+        """
+        ...
+
+
+    def setSuperSourceBoxParametersPositionX(self, box: Union[ATEMConstant, str, int], positionX: float) -> ATEMCommandConfirmation:
+        """Set Super Source Box Parameters Position X
+
+        Args:
+            box: see ATEMBoxes
+            positionX (float): -48.0-48.0
+        """
+        ...
+
+
+    def setSuperSourceBoxParametersPositionY(self, box: Union[ATEMConstant, str, int], positionY: float) -> ATEMCommandConfirmation:
+        """Set Super Source Box Parameters Position Y
+
+        Args:
+            box: see ATEMBoxes
+            positionY (float): -27.0-27.0
+        """
+        ...
+
+
+    def setSuperSourceBoxParametersSize(self, box: Union[ATEMConstant, str, int], size: float) -> ATEMCommandConfirmation:
+        """Set Super Source Box Parameters Size
+
+        Args:
+            box: see ATEMBoxes
+            size (float): 0.07-1.0
+        """
+        ...
+
+
+    def setSuperSourceBoxParametersCropped(self, box: Union[ATEMConstant, str, int], cropped: bool) -> ATEMCommandConfirmation:
+        """Set Super Source Box Parameters Cropped
+
+        Args:
+            box: see ATEMBoxes
+            cropped (bool): On/Off
+        """
+        ...
+
+
+    def setSuperSourceBoxParametersCropTop(self, box: Union[ATEMConstant, str, int], cropTop: float) -> ATEMCommandConfirmation:
+        """Set Super Source Box Parameters Crop Top
+
+        Args:
+            box: see ATEMBoxes
+            cropTop (float): 0.0-18.0
+        """
+        ...
+
+
+    def setSuperSourceBoxParametersCropBottom(self, box: Union[ATEMConstant, str, int], cropBottom: float) -> ATEMCommandConfirmation:
+        """Set Super Source Box Parameters Crop Bottom
+
+        Args:
+            box: see ATEMBoxes
+            cropBottom (float): 0.0-18.0
+        """
+        ...
+
+
+    def setSuperSourceBoxParametersCropLeft(self, box: Union[ATEMConstant, str, int], cropLeft: float) -> ATEMCommandConfirmation:
+        """Set Super Source Box Parameters Crop Left
+
+        Args:
+            box: see ATEMBoxes
+            cropLeft (float): 0.0-32.0
+        """
+        ...
+
+
+    def setSuperSourceBoxParametersCropRight(self, box: Union[ATEMConstant, str, int], cropRight: float) -> ATEMCommandConfirmation:
+        """Set Super Source Box Parameters Crop Right
+
+        Args:
+            box: see ATEMBoxes
+            cropRight (float): 0.0-32.0
+        """
+        ...
+
+
+    def setAudioMixerInputMixOption(self, audioSource: Union[ATEMConstant, str, int], mixOption: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Audio Mixer Input Mix Option
+
+        Args:
+            audioSource: see ATEMAudioSources
+            mixOption: see ATEMAudioMixerInputMixOptions
+        """
+        ...
+
+
+    def setAudioMixerInputVolume(self, audioSource: Union[ATEMConstant, str, int], db: float) -> ATEMCommandConfirmation:
+        """Set Audio Mixer Input Volume
+
+        Args:
+            audioSource: see ATEMAudioSources
+            db (float): volume in dB
+        """
+        ...
+
+
+    def setAudioMixerInputBalance(self, audioSource: Union[ATEMConstant, str, int], balance: float) -> ATEMCommandConfirmation:
+        """Set Audio Mixer Input Balance
+
+        Args:
+            audioSource: see ATEMAudioSources
+            balance (float): -1.0-1.0: Left/Right Extremes
+        """
+        ...
+
+
+    def setAudioMixerMasterVolume(self, db: float) -> ATEMCommandConfirmation:
+        """Set Audio Mixer Master Volume
+
+        Args:
+            db (float): volume in dB
+        """
+        ...
+
+
+    def setAudioMixerMonitorMonitorAudio(self, monitorAudio: bool) -> ATEMCommandConfirmation:
+        """Set Audio Mixer Monitor Monitor Audio
+
+        Args:
+            monitorAudio (bool): On/Off
+        """
+        ...
+
+
+    def setAudioMixerMonitorVolume(self, db: float) -> ATEMCommandConfirmation:
+        """Set Audio Mixer Monitor Volume
+
+        Args:
+            db (float): volume in dB
+        """
+        ...
+
+
+    def setAudioMixerMonitorMute(self, mute: bool) -> ATEMCommandConfirmation:
+        """Set Audio Mixer Monitor Mute
+
+        Args:
+            mute (bool): On/Off
+        """
+        ...
+
+
+    def setAudioMixerMonitorSolo(self, solo: bool) -> ATEMCommandConfirmation:
+        """Set Audio Mixer Monitor Solo
+
+        Args:
+            solo (bool): On/Off
+        """
+        ...
+
+
+    def setAudioMixerMonitorSoloInput(self, soloInput: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Audio Mixer Monitor Solo Input
+
+        Args:
+            soloInput: see ATEMAudioSources
+        """
+        ...
+
+
+    def setAudioMixerMonitorDim(self, dim: bool) -> ATEMCommandConfirmation:
+        """Set Audio Mixer Monitor Dim
+
+        Args:
+            dim (bool): On/Off
+        """
+        ...
+
+
+    def setAudioLevelsEnable(self, enable: bool) -> ATEMCommandConfirmation:
+        """Set Audio Levels Enable
+
+        Args:
+            enable (bool): On/Off
+        """
+        ...
+
+
+    def setResetAudioMixerPeaksInputSource(self, inputSource: Union[ATEMConstant, str, int]) -> ATEMCommandConfirmation:
+        """Set Reset Audio Mixer Peaks Input Source
+
+        Args:
+            inputSource: see ATEMAudioSources
+        """
+        ...
+
+
+    def setResetAudioMixerPeaksMaster(self, master: bool) -> ATEMCommandConfirmation:
+        """Set Reset Audio Mixer Peaks Master
+
+        Args:
+            master (bool): Yes/No
+        """
+        ...
@@ -0,0 +1,1684 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""
+ATEMSetterLayouts: Blackmagic ATEM switcher setter layouts (declarative encoders).
+Part of the PyATEMMax library.
+Layouts do keep the order in https://www.skaarhoj.com/fileadmin/BMDPROTOCOL.html
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import re
+import struct
+
+from .ATEMCommandLayouts import _FIELD_FORMATS
+from .ATEMConstant import ATEMConstant, ATEMConstantList
+from .ATEMException import ATEMException
+from .ATEMProtocol import ATEMProtocol
+from .ATEMUtils import mapValue
+
+
+# Setter method type: setter(self, *args)
+ATEMSetterMethod = Callable[..., None]
+
+_ARG_NAME_RE = re.compile(r'^[A-Za-z]\w*$')
+
+_CONSTANT_ANNOTATION = "Union[ATEMConstant, str, int]"
+
+_ECHO_INDEX_RE = re.compile(r'\[([A-Za-z]\w*)\]')
+
+# Command header: command length, command string (data follows)
+_COMMAND_HEADER_FORMAT = '!H2x4s'
+
+
+# #######################################################################
+#
+#  Fields
+#
+
+class ATEMSetterField():
+    """A field in a setter layout
+
+    Args:
+        name (str): argument name (empty for fixed values)
+        offset (int): byte offset in the command data
+        fieldType (str): field type ('U8', 'S16', ...)
+        doc (str): argument description
+    """
+
+    annotation = ""
+
+    def __init__(self, name: str, offset: int, fieldType: str, doc: str = ""):
+        if fieldType not in _FIELD_FORMATS:
+            raise ATEMException(f"Invalid layout field type [{fieldType}] for [{name}]")
+
+        self.name = name
+        self.offset = offset
+        self.fieldType = fieldType
+        self.format = _FIELD_FORMATS[fieldType]
+        self.doc = doc
+
+
+    def expression(self, context: Dict[str, Any]) -> str:
+        """Get the Python expression converting the argument to its raw value
+
+        Args:
+            context (Dict[str, Any]): globals for the compiled setter (add needed objects here)
+        """
+
+        return self.name
+
+
+    def docLine(self) -> str:
+        """Get the argument description line for the setter docstring"""
+
+        return f"{self.name} ({self.annotation}): {self.doc}"
+
+
+class _FixedField(ATEMSetterField):
+    def __init__(self, offset: int, fieldType: str, value: int):
+        super().__init__("", offset, fieldType)
+        self.value = value
+
+    def expression(self, context: Dict[str, Any]) -> str:
+        return str(self.value)
+
+
+class _ValueField(ATEMSetterField):
+    def __init__(self, name: str, offset: int, fieldType: str, annotation: str, doc: str,
+                 factor: Optional[int] = None, convert: Optional[Callable[[Any], int]] = None):
+        super().__init__(name, offset, fieldType, doc)
+        self.annotation = annotation
+        self.factor = factor
+        self.convert = convert
+
+    def expression(self, context: Dict[str, Any]) -> str:
+        if self.convert is not None:
+            name = f"_convert{len(context)}"
+            context[name] = self.convert
+            return f"{name}({self.name})"
+        if self.factor is not None:
+            return f"int({self.name}*{self.factor})"
+        return self.name
+
+
+class _LookupField(ATEMSetterField):
+    annotation = _CONSTANT_ANNOTATION
+
+    def __init__(self, name: str, offset: int, listName: str, fieldType: str, doc: Optional[str]):
+        constList = getattr(ATEMProtocol, listName, None)
+        if not isinstance(constList, ATEMConstantList):
+            raise ATEMException(f"Invalid layout value list [{listName}] for [{name}]")
+        super().__init__(name, offset, fieldType, doc or f"see {constList.__class__.__name__}")
+        self.listName = listName
+
+    def expression(self, context: Dict[str, Any]) -> str:
+        name = f"_{self.listName}"
+        context[name] = getattr(ATEMProtocol, self.listName)
+        return f"{name}[{self.name}].value"
+
+    def docLine(self) -> str:
+        return f"{self.name}: {self.doc}"
+
+
+class _SourceField(ATEMSetterField):
+    annotation = _CONSTANT_ANNOTATION
+
+    def __init__(self, name: str, offset: int, getterName: str, doc: str):
+        super().__init__(name, offset, 'U16', doc)
+        self.getterName = getterName
+
+    def expression(self, context: Dict[str, Any]) -> str:
+        name = f"_{self.getterName}"
+        context[name] = getattr(ATEMProtocol, self.getterName)
+        return f"{name}({self.name})"
+
+    def docLine(self) -> str:
+        return f"{self.name}: {self.doc}"
+
+
+class _StringField(ATEMSetterField):
+    annotation = "str"
+
+    def __init__(self, name: str, offset: int, length: int, doc: str):
+        super().__init__(name, offset, 'U8', doc)
+        self.format = f"{length}s"
+
+    def expression(self, context: Dict[str, Any]) -> str:
+        return f"{self.name}.encode('utf8')"
+
+
+def mask(bit: int, fieldType: str = 'U8', offset: int = 0) -> ATEMSetterField:
+    """Bit to set in the command mask (tells the switcher which value has changed)"""
+
+    return _FixedField(offset, fieldType, 1 << bit)
+
+
+def fixed(offset: int, fieldType: str, value: int) -> ATEMSetterField:
+    """Fixed value (e.g. camera control category/parameter)"""
+
+    return _FixedField(offset, fieldType, value)
+
+
+def enum(name: str, offset: int, listName: str, fieldType: str = 'U8', doc: Optional[str] = None) -> ATEMSetterField:
+    """Value from a protocol list (ATEMConstant, name or value)"""
+
+    return _LookupField(name, offset, listName, fieldType, doc)
+
+
+def videoSource(name: str, offset: int) -> ATEMSetterField:
+    """Video source (U16)"""
+
+    return _SourceField(name, offset, 'getVideoSrc', "see ATEMVideoSources")
+
+
+def audioSource(name: str, offset: int) -> ATEMSetterField:
+    """Audio source (U16)"""
+
+    return _SourceField(name, offset, 'getAudioSrc', "see ATEMAudioSources")
+
+
+def boolean(name: str, offset: int, doc: str = "On/Off") -> ATEMSetterField:
+    """Boolean value (U8)"""
+
+    return _ValueField(name, offset, 'U8', "bool", doc)
+
+
+def integer(name: str, offset: int, fieldType: str, doc: str) -> ATEMSetterField:
+    """Integer value"""
+
+    return _ValueField(name, offset, fieldType, "int", doc)
+
+
+def number(name: str, offset: int, fieldType: str, factor: int, doc: str) -> ATEMSetterField:
+    """Floating point value, multiplied by a factor"""
+
+    return _ValueField(name, offset, fieldType, "float", doc, factor=factor)
+
+
+def mapped(name: str, offset: int, fieldType: str,
+           fromRange: Tuple[float, float], toRange: Tuple[int, int], doc: str) -> ATEMSetterField:
+    """Floating point value, mapped from an input range to an integer range"""
+
+    fromLow, fromHigh = fromRange
+    toLow, toHigh = toRange
+    return _ValueField(name, offset, fieldType, "float", doc,
+                       convert=lambda v: int(mapValue(v, fromLow, fromHigh, toLow, toHigh)))
+
+
+def volume(name: str, offset: int, doc: str) -> ATEMSetterField:
+    """Audio volume in dB (U16)"""
+
+    return _ValueField(name, offset, 'U16', "float", doc, convert=ATEMProtocol.audioDb2Word)
+
+
+def string(name: str, offset: int, length: int, doc: str) -> ATEMSetterField:
+    """String in a fixed size field (truncated or zero padded)"""
+
+    return _StringField(name, offset, length, doc)
+
+
+def stateEcho(cmdStr: str, path: str, argName: str) -> 'ATEMSetterEcho':
+    """State command the switcher sends back with the value set (confirms the command)"""
+
+    return ATEMSetterEcho(cmdStr, path, argName)
+
+
+# #######################################################################
+#
+#  Layouts
+#
+
+class ATEMSetterEcho():
+    """State command the switcher sends back when a setter command is applied
+
+    Args:
+        cmdStr (str): state command name
+        path (str): state value path, with argument names as indexes (e.g. 'programInput[mE].videoSource')
+        argName (str): argument with the value set
+    """
+
+    def __init__(self, cmdStr: str, path: str, argName: str):
+        self.cmdStr = cmdStr
+        self.path = path
+        self.argName = argName
+
+
+    def checkExpression(self, argPositions: Dict[str, int], methodName: str) -> str:
+        """Get the Python expression checking the switcher state (_s) against the packed values (_v)
+
+        Args:
+            argPositions (Dict[str, int]): position of each argument in the packed values
+            methodName (str): name of the setter method
+        """
+
+        def replaceIndex(match: Any) -> str:
+            argName = match.group(1)
+            if argName not in argPositions:
+                raise ATEMException(f"Invalid echo path index [{argName}] for [{methodName}]")
+            return f"[_v[{argPositions[argName]}]]"
+
+        if self.argName not in argPositions:
+            raise ATEMException(f"Invalid echo argument [{self.argName}] for [{methodName}]")
+
+        path = _ECHO_INDEX_RE.sub(replaceIndex, self.path)
+        return f"_raw(_s.{path}) == _v[{argPositions[self.argName]}]"
+
+
+class ATEMSetterLayout():
+    """Declarative layout of a setter command
+
+    Args:
+        cmdStr (str): command name
+        cmdBytes (int): size of the command data
+        summary (str): first line of the setter docstring
+        fields (ATEMSetterField): fields, arguments are taken in order
+        echo (ATEMSetterEcho, optional): state echo confirming the command (None: confirmed by the ack)
+    """
+
+    def __init__(self, cmdStr: str, cmdBytes: int, summary: str, *fields: ATEMSetterField,
+                 echo: Optional[ATEMSetterEcho] = None):
+        self.cmdStr = cmdStr
+        self.cmdBytes = cmdBytes
+        self.summary = summary
+        self.fields = fields
+        self.echo = echo
+        self.args: List[ATEMSetterField] = [ field for field in fields if field.name ]
+
+
+    def compile(self, methodName: str) -> ATEMSetterMethod:
+        """Compile the layout into a setter method
+
+        The setter converts all its arguments and then writes the whole
+        command (header and data) with a single struct.pack_into() call.
+
+        Args:
+            methodName (str): name of the setter method
+
+        Returns:
+            (ATEMSetterMethod): setter(self, *args)
+        """
+
+        for field in self.args:
+            if not _ARG_NAME_RE.match(field.name):
+                raise ATEMException(f"Invalid layout argument name [{field.name}] for [{methodName}]")
+
+        if len(self.cmdStr) != ATEMProtocol.cmdStrLen:
+            raise ATEMException(f"Invalid layout command [{self.cmdStr}] for [{methodName}]")
+
+        dataFormat = '!'
+        position = 0
+        for field in sorted(self.fields, key=lambda f: f.offset):
+            if field.offset < position:
+                raise ATEMException(f"Overlapping fields @offset[{field.offset}] in [{methodName}] layout")
+            if field.offset > position:
+                dataFormat += f"{field.offset - position}x"
+            dataFormat += field.format
+            position = struct.calcsize(dataFormat)
+
+        if position > self.cmdBytes:
+            raise ATEMException(f"Layout for [{methodName}] is larger than [{self.cmdStr}] ({self.cmdBytes} bytes)")
+        if position < self.cmdBytes:
+            dataFormat += f"{self.cmdBytes - position}x"
+
+        context: Dict[str, Any] = {
+            '__name__': __name__,
+            '_struct': struct.Struct(_COMMAND_HEADER_FORMAT + dataFormat[1:]),
+            'Union': Union,
+            'ATEMConstant': ATEMConstant,
+            }
+
+        sortedFields = sorted(self.fields, key=lambda f: f.offset)
+        values = [ str(ATEMProtocol.cmdHeaderLen + self.cmdBytes), repr(self.cmdStr.encode('latin-1')) ]
+        values += [ field.expression(context) for field in sortedFields ]
+        args = ''.join(f", {field.name}: {field.annotation}" for field in self.args)
+
+        lines = [ f"def {methodName}(self{args}) -> 'ATEMCommandConfirmation':" ]
+
+        if self.echo is None:
+            lines.append(f"    return self.switcher._packCommandPacket(_struct, ({', '.join(values)}))")
+        else:
+            # Packed values: command length, command string, fields (sorted by offset)
+            argPositions = { field.name: 2 + i for i, field in enumerate(sortedFields) if field.name }
+            context['_raw'] = _rawValue
+            lines.append(f"    return self.switcher._packCommandPacket(_struct, ({', '.join(values)}), _echo)")
+            lines.append("")
+            lines.append("def _echoCheck(_s, _v):")
+            lines.append(f"    return {self.echo.checkExpression(argPositions, methodName)}")
+            lines.append("")
+            lines.append(f"_echo = ({self.echo.cmdStr!r}, _echoCheck)")
+
+        source = '\n'.join(lines) + '\n'
+        exec(compile(source, f"<ATEMSetterLayout {methodName}>", 'exec'), context)   # pylint: disable=exec-used
+
+        setter = context[methodName]
+        setter.__doc__ = self._docString()
+        setter.source = source
+        return setter
+
+
+    def declaration(self, methodName: str) -> str:
+        """Get the source of the setter method declaration (see ATEMSetterDeclarations)
+
+        Args:
+            methodName (str): name of the setter method
+
+        Returns:
+            (str): method source (signature and docstring, indented for a class body)
+        """
+
+        args = ''.join(f", {field.name}: {field.annotation}" for field in self.args)
+        return f"    def {methodName}(self{args}) -> ATEMCommandConfirmation:\n" \
+               f'        """{self._docString()}"""\n' \
+               "        ...\n"
+
+
+    def _docString(self) -> str:
+        """Build the setter docstring (same format as hand written setters)"""
+
+        doc = f"{self.summary}\n\n"
+        if self.args:
+            doc += "        Args:\n"
+            doc += ''.join(f"            {field.docLine()}\n" for field in self.args)
+        return doc + "        "
+
+
+def _rawValue(value: Any) -> Any:
+    """Raw value of a state value (for echo checks)"""
+
+    return value.value if isinstance(value, ATEMConstant) else value
+
+
+# #######################################################################
+#
+#  Setter layouts
+#
+#  Setters not listed here are written by hand in ATEMSetterMethods.
+#
+
+SETTER_LAYOUTS: Dict[str, ATEMSetterLayout] = {
+
+    'setDownConverterMode': ATEMSetterLayout('CDcO', 4, 'Set Down Converter Mode',
+                enum('mode', 0, 'downConverterModes'),
+            ),
+
+    'setVideoModeFormat': ATEMSetterLayout('CVdM', 4, 'Set Video Mode Format',
+                enum('format_', 0, 'videoModeFormats'),
+            ),
+
+    'setInputLongName': ATEMSetterLayout('CInL', 32, 'Set Input Properties Long Name',
+                mask(0),
+                videoSource('videoSource', 2),
+                string('longName', 4, 20, 'long name'),
+            ),
+
+    'setInputShortName': ATEMSetterLayout('CInL', 32, 'Set Input Properties Short Name',
+                mask(1),
+                videoSource('videoSource', 2),
+                string('shortName', 24, 4, 'short name'),
+            ),
+
+    'setInputExternalPortType': ATEMSetterLayout('CInL', 32, 'Set Input Properties External Port Type',
+                mask(2),
+                videoSource('videoSource', 2),
+                enum('externalPortType', 28, 'externalPortTypes', 'U16'),
+            ),
+
+    'setMultiViewerPropertiesLayout': ATEMSetterLayout('CMvP', 4, 'Set MultiViewer Properties Layout',
+                mask(0),
+                enum('multiViewer', 1, 'multiViewers'),
+                enum('layout', 2, 'multiViewerLayouts'),
+            ),
+
+    'setMultiViewerInputVideoSource': ATEMSetterLayout('CMvI', 4, 'Set MultiViewer Properties Video Source',
+                enum('multiViewer', 0, 'multiViewers'),
+                enum('window', 1, 'windows'),
+                videoSource('videoSource', 2),
+            ),
+
+    'setProgramInputVideoSource': ATEMSetterLayout('CPgI', 4, 'Set Program Input Video Source',
+                enum('mE', 0, 'mixEffects'),
+                videoSource('videoSource', 2),
+                echo=stateEcho('PrgI', 'programInput[mE].videoSource', 'videoSource'),
+            ),
+
+    'setPreviewInputVideoSource': ATEMSetterLayout('CPvI', 4, 'Set Preview Input Video Source',
+                enum('mE', 0, 'mixEffects'),
+                videoSource('videoSource', 2),
+                echo=stateEcho('PrvI', 'previewInput[mE].videoSource', 'videoSource'),
+            ),
+
+    'setTransitionStyle': ATEMSetterLayout('CTTp', 4, 'Set Transition Style',
+                mask(0),
+                enum('mE', 1, 'mixEffects'),
+                enum('style', 2, 'transitionStyles'),
+                echo=stateEcho('TrSS', 'transition[mE].style', 'style'),
+            ),
+
+    'setTransitionNextTransition': ATEMSetterLayout('CTTp', 4, 'Set Transition Style Next Transition',
+                mask(1),
+                enum('mE', 1, 'mixEffects'),
+                enum('nextTransition', 3, 'transitionStyles'),
+            ),
+
+    'setTransitionPreviewEnabled': ATEMSetterLayout('CTPr', 4, 'Set Transition Preview Enabled',
+                enum('mE', 0, 'mixEffects'),
+                boolean('enabled', 1),
+            ),
+
+    'setTransitionPosition': ATEMSetterLayout('CTPs', 4, 'Set Transition Preview Enabled',
+                enum('mE', 0, 'mixEffects'),
+                integer('position', 2, 'U16', '0-9999'),
+            ),
+
+    'setTransitionMixRate': ATEMSetterLayout('CTMx', 4, 'Set Transition Mix Rate',
+                enum('mE', 0, 'mixEffects'),
+                integer('rate', 1, 'U8', '1-250 (frames)'),
+            ),
+
+    'setTransitionDipRate': ATEMSetterLayout('CTDp', 8, 'Set Transition Dip Rate',
+                mask(0),
+                enum('mE', 1, 'mixEffects'),
+                integer('rate', 2, 'U8', '1-250 (frames)'),
+            ),
+
+    'setTransitionDipInput': ATEMSetterLayout('CTDp', 8, 'Set Transition Dip Input',
+                mask(1),
+                enum('mE', 1, 'mixEffects'),
+                videoSource('input_', 4),
+            ),
+
+    'setTransitionWipeRate': ATEMSetterLayout('CTWp', 20, 'Set Transition Wipe Rate',
+                mask(0, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                integer('rate', 3, 'U8', '1-250 (frames)'),
+            ),
+
+    'setTransitionWipePattern': ATEMSetterLayout('CTWp', 20, 'Set Transition Wipe Pattern',
+                mask(1, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                enum('pattern', 4, 'patternStyles'),
+            ),
+
+    'setTransitionWipeWidth': ATEMSetterLayout('CTWp', 20, 'Set Transition Wipe Width',
+                mask(2, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                number('width', 6, 'U16', 100, '0.0-100.0 (%)'),
+            ),
+
+    'setTransitionWipeFillSource': ATEMSetterLayout('CTWp', 20, 'Set Transition Wipe Fill Source',
+                mask(3, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                videoSource('fillSource', 8),
+            ),
+
+    'setTransitionWipeSymmetry': ATEMSetterLayout('CTWp', 20, 'Set Transition Wipe Symmetry',
+                mask(4, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                number('symmetry', 10, 'U16', 100, '0.0-100.0 (%)'),
+            ),
+
+    'setTransitionWipeSoftness': ATEMSetterLayout('CTWp', 20, 'Set Transition Wipe Softness',
+                mask(5, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                number('softness', 12, 'U16', 100, '0.0-100.0 (%)'),
+            ),
+
+    'setTransitionWipePositionX': ATEMSetterLayout('CTWp', 20, 'Set Transition Wipe Position X',
+                mask(6, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                number('positionX', 14, 'U16', 10000, '0.0-1.0'),
+            ),
+
+    'setTransitionWipePositionY': ATEMSetterLayout('CTWp', 20, 'Set Transition Wipe Position Y',
+                mask(7, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                number('positionY', 16, 'U16', 10000, '0.0-1.0'),
+            ),
+
+    'setTransitionWipeReverse': ATEMSetterLayout('CTWp', 20, 'Set Transition Wipe Reverse',
+                mask(8, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                boolean('reverse', 18),
+            ),
+
+    'setTransitionWipeFlipFlop': ATEMSetterLayout('CTWp', 20, 'Set Transition Wipe FlipFlop',
+                mask(9, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                boolean('flipFlop', 19),
+            ),
+
+    'setTransitionDVERate': ATEMSetterLayout('CTDv', 20, 'Set Transition DVE Rate',
+                mask(0, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                integer('rate', 3, 'U8', '1-250 (frames)'),
+            ),
+
+    'setTransitionDVEStyle': ATEMSetterLayout('CTDv', 20, 'Set Transition DVE Style',
+                mask(2, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                enum('style', 5, 'dVETransitionStyles'),
+            ),
+
+    'setTransitionDVEFillSource': ATEMSetterLayout('CTDv', 20, 'Set Transition DVE Fill Source',
+                mask(3, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                videoSource('fillSource', 6),
+            ),
+
+    'setTransitionDVEKeySource': ATEMSetterLayout('CTDv', 20, 'Set Transition DVE Key Source',
+                mask(4, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                videoSource('keySource', 8),
+            ),
+
+    'setTransitionDVEEnableKey': ATEMSetterLayout('CTDv', 20, 'Set Transition DVE Enable Key',
+                mask(5, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                boolean('enableKey', 10),
+            ),
+
+    'setTransitionDVEPreMultiplied': ATEMSetterLayout('CTDv', 20, 'Set Transition DVE Pre Multiplied',
+                mask(6, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                boolean('preMultiplied', 11),
+            ),
+
+    'setTransitionDVEClip': ATEMSetterLayout('CTDv', 20, 'Set Transition DVE Clip',
+                mask(7, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                number('clip', 12, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setTransitionDVEGain': ATEMSetterLayout('CTDv', 20, 'Set Transition DVE Gain',
+                mask(8, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                number('gain', 14, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setTransitionDVEInvertKey': ATEMSetterLayout('CTDv', 20, 'Set Transition DVE Invert Key',
+                mask(9, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                boolean('invertKey', 16),
+            ),
+
+    'setTransitionDVEReverse': ATEMSetterLayout('CTDv', 20, 'Set Transition DVE Reverse',
+                mask(10, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                boolean('reverse', 17),
+            ),
+
+    'setTransitionDVEFlipFlop': ATEMSetterLayout('CTDv', 20, 'Set Transition DVE FlipFlop',
+                mask(11, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                boolean('flipFlop', 18),
+            ),
+
+    'setTransitionStingerSource': ATEMSetterLayout('CTSt', 20, 'Set Transition Stinger Source',
+                mask(0, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                enum('source', 3, 'mediaPlayers'),
+            ),
+
+    'setTransitionStingerPreMultiplied': ATEMSetterLayout('CTSt', 20, 'Set Transition Stinger Pre Multiplied',
+                mask(1, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                boolean('preMultiplied', 4),
+            ),
+
+    'setTransitionStingerClip': ATEMSetterLayout('CTSt', 20, 'Set Transition Stinger Clip',
+                mask(2, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                number('clip', 6, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setTransitionStingerGain': ATEMSetterLayout('CTSt', 20, 'Set Transition Stinger Gain',
+                mask(3, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                number('gain', 8, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setTransitionStingerInvertKey': ATEMSetterLayout('CTSt', 20, 'Set Transition Stinger Invert Key',
+                mask(4, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                boolean('invertKey', 10),
+            ),
+
+    'setTransitionStingerPreRoll': ATEMSetterLayout('CTSt', 20, 'Set Transition Stinger Pre Roll',
+                mask(5, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                integer('preRoll', 12, 'U16', 'frames'),
+            ),
+
+    'setTransitionStingerClipDuration': ATEMSetterLayout('CTSt', 20, 'Set Transition Stinger Clip Duration',
+                mask(6, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                integer('clipDuration', 14, 'U16', 'frames'),
+            ),
+
+    'setTransitionStingerTriggerPoint': ATEMSetterLayout('CTSt', 20, 'Set Transition Stinger Trigger Point',
+                mask(7, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                integer('triggerPoint', 16, 'U16', 'frames'),
+            ),
+
+    'setTransitionStingerMixRate': ATEMSetterLayout('CTSt', 20, 'Set Transition Stinger Mix Rate',
+                mask(8, 'U16'),
+                enum('mE', 2, 'mixEffects'),
+                integer('mixRate', 18, 'U16', 'frames'),
+            ),
+
+    'setKeyerOnAirEnabled': ATEMSetterLayout('CKOn', 4, 'Set Keyer On Air Enabled',
+                enum('mE', 0, 'mixEffects'),
+                enum('keyer', 1, 'keyers'),
+                boolean('enabled', 2),
+                echo=stateEcho('KeOn', 'keyer[mE][keyer].onAir.enabled', 'enabled'),
+            ),
+
+    'setKeyerType': ATEMSetterLayout('CKTp', 8, 'Set Key Type Type',
+                mask(0),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                enum('type_', 3, 'keyerTypes'),
+            ),
+
+    'setKeyerFlyEnabled': ATEMSetterLayout('CKTp', 8, 'Set Key Type Fly Enabled',
+                mask(1),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                boolean('flyEnabled', 4),
+            ),
+
+    'setKeyerMasked': ATEMSetterLayout('CKMs', 12, 'Set Key Mask Masked',
+                mask(0),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                boolean('masked', 3),
+            ),
+
+    'setKeyerTop': ATEMSetterLayout('CKMs', 12, 'Set Key Mask Top',
+                mask(1),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('top', 4, 'S16', 1000, '-9.0-9.0'),
+                fixed(3, 'U8', 1),
+            ),
+
+    'setKeyerBottom': ATEMSetterLayout('CKMs', 12, 'Set Key Mask Bottom',
+                mask(2),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('bottom', 6, 'S16', 1000, '-9.0-9.0'),
+            ),
+
+    'setKeyerLeft': ATEMSetterLayout('CKMs', 12, 'Set Key Mask Left',
+                mask(3),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                mapped('left', 8, 'S16', (-9.0, 9.0), (-16000, 16000), '-9.0-9.0'),
+            ),
+
+    'setKeyerRight': ATEMSetterLayout('CKMs', 12, 'Set Key Mask Right',
+                mask(4),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                mapped('right', 10, 'S16', (-9.0, 9.0), (-16000, 16000), '-9.0-9.0'),
+            ),
+
+    'setKeyerFillSource': ATEMSetterLayout('CKeF', 4, 'Set Key Fill Fill Source',
+                enum('mE', 0, 'mixEffects'),
+                enum('keyer', 1, 'keyers'),
+                videoSource('fillSource', 2),
+            ),
+
+    'setKeyerKeySource': ATEMSetterLayout('CKeC', 4, 'Set Key Cut Key Source',
+                enum('mE', 0, 'mixEffects'),
+                enum('keyer', 1, 'keyers'),
+                videoSource('keySource', 2),
+            ),
+
+    'setKeyLumaPreMultiplied': ATEMSetterLayout('CKLm', 12, 'Set Key Luma Pre Multiplied',
+                mask(0),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                boolean('preMultiplied', 3),
+            ),
+
+    'setKeyLumaClip': ATEMSetterLayout('CKLm', 12, 'Set Key Luma Clip',
+                mask(1),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('clip', 4, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setKeyLumaGain': ATEMSetterLayout('CKLm', 12, 'Set Key Luma Gain',
+                mask(2),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('gain', 6, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setKeyLumaInvertKey': ATEMSetterLayout('CKLm', 12, 'Set Key Luma Invert Key',
+                mask(3),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                boolean('invertKey', 8),
+            ),
+
+    'setKeyChromaHue': ATEMSetterLayout('CKCk', 16, 'Set Key Chroma Hue',
+                mask(0),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('hue', 4, 'U16', 10, '0.0-359.9 (degrees)'),
+            ),
+
+    'setKeyChromaGain': ATEMSetterLayout('CKCk', 16, 'Set Key Chroma Gain',
+                mask(1),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('gain', 6, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setKeyChromaYSuppress': ATEMSetterLayout('CKCk', 16, 'Set Key Chroma Y Suppress',
+                mask(2),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('ySuppress', 8, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setKeyChromaLift': ATEMSetterLayout('CKCk', 16, 'Set Key Chroma Lift',
+                mask(3),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('lift', 10, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setKeyChromaNarrow': ATEMSetterLayout('CKCk', 16, 'Set Key Chroma Narrow',
+                mask(4),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                boolean('narrow', 12),
+            ),
+
+    'setKeyPatternPattern': ATEMSetterLayout('CKPt', 16, 'Set Key Pattern Pattern',
+                mask(0),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                enum('pattern', 3, 'patternStyles'),
+            ),
+
+    'setKeyPatternSize': ATEMSetterLayout('CKPt', 16, 'Set Key Pattern Size',
+                mask(1),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('size', 4, 'U16', 100, '0.0-100.0 (%)'),
+            ),
+
+    'setKeyPatternSymmetry': ATEMSetterLayout('CKPt', 16, 'Set Key Pattern Symmetry',
+                mask(2),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('symmetry', 6, 'U16', 100, '0.0-100.0 (%)'),
+            ),
+
+    'setKeyPatternSoftness': ATEMSetterLayout('CKPt', 16, 'Set Key Pattern Softness',
+                mask(3),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('softness', 8, 'U16', 100, '0.0-100.0 (%)'),
+            ),
+
+    'setKeyPatternPositionX': ATEMSetterLayout('CKPt', 16, 'Set Key Pattern Position X',
+                mask(4),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('positionX', 10, 'U16', 10000, '0.0-1.0'),
+            ),
+
+    'setKeyPatternPositionY': ATEMSetterLayout('CKPt', 16, 'Set Key Pattern Position Y',
+                mask(5),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                number('positionY', 12, 'U16', 10000, '0.0-1.0'),
+            ),
+
+    'setKeyPatternInvertPattern': ATEMSetterLayout('CKPt', 16, 'Set Key Pattern Invert Pattern',
+                mask(6),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                boolean('invertPattern', 14),
+            ),
+
+    'setKeyDVESizeX': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Size X',
+                mask(0, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('sizeX', 8, 'S32', 1000, '0.0-1.0'),
+            ),
+
+    'setKeyDVESizeY': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Size Y',
+                mask(1, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('sizeY', 12, 'S32', 1000, '0.0-1.0'),
+            ),
+
+    'setKeyDVEPositionX': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Position X',
+                mask(2, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('positionX', 16, 'S32', 1000, '0.0-1.0'),
+            ),
+
+    'setKeyDVEPositionY': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Position Y',
+                mask(3, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('positionY', 20, 'S32', 1000, '0.0-1.0'),
+            ),
+
+    'setKeyDVERotation': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Rotation',
+                mask(4, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('rotation', 24, 'S32', 1000, '0.0-359.9 (degrees)'),
+            ),
+
+    'setKeyDVEBorderEnabled': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Enabled',
+                mask(5, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                boolean('borderEnabled', 28),
+            ),
+
+    'setKeyDVEShadow': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Shadow',
+                mask(6, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                boolean('shadow', 29),
+            ),
+
+    'setKeyDVEBorderBevel': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Bevel',
+                mask(7, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                enum('borderBevel', 30, 'borderBevels'),
+            ),
+
+    'setKeyDVEBorderOuterWidth': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Outer Width',
+                mask(8, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('borderOuterWidth', 32, 'U16', 100, '0.0-16.0'),
+            ),
+
+    'setKeyDVEBorderInnerWidth': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Inner Width',
+                mask(9, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('borderInnerWidth', 34, 'U16', 100, '0.0-16.0'),
+            ),
+
+    'setKeyDVEBorderOuterSoftness': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Outer Softness',
+                mask(10, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                integer('borderOuterSoftness', 36, 'U8', '0-100 (%)'),
+            ),
+
+    'setKeyDVEBorderInnerSoftness': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Inner Softness',
+                mask(11, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                integer('borderInnerSoftness', 37, 'U8', '0-100 (%)'),
+            ),
+
+    'setKeyDVEBorderBevelSoftness': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Bevel Softness',
+                mask(12, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('borderBevelSoftness', 38, 'U8', 100, '0.0-1.0'),
+            ),
+
+    'setKeyDVEBorderBevelPosition': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Bevel Position',
+                mask(13, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('borderBevelPosition', 39, 'U8', 100, '0.0-1.0'),
+            ),
+
+    'setKeyDVEBorderOpacity': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Opacity',
+                mask(14, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                integer('borderOpacity', 40, 'U8', '0-100 (%)'),
+            ),
+
+    'setKeyDVEBorderHue': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Hue',
+                mask(15, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('borderHue', 42, 'U16', 10, '0.0-359.9 (degrees)'),
+            ),
+
+    'setKeyDVEBorderSaturation': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Saturation',
+                mask(16, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('borderSaturation', 44, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setKeyDVEBorderLuma': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Border Luma',
+                mask(17, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('borderLuma', 46, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setKeyDVELightSourceDirection': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Light Source Direction',
+                mask(18, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('lightSourceDirection', 48, 'U16', 10, '0.0-359.9 (degrees)'),
+            ),
+
+    'setKeyDVELightSourceAltitude': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Light Source Altitude',
+                mask(19, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                integer('lightSourceAltitude', 50, 'U8', '10-100'),
+            ),
+
+    'setKeyDVEMasked': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Masked',
+                mask(20, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                boolean('masked', 51),
+            ),
+
+    'setKeyDVETop': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Top',
+                mask(21, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('top', 52, 'U16', 1000, '-9.0-9.0'),
+            ),
+
+    'setKeyDVEBottom': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Bottom',
+                mask(22, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                number('bottom', 54, 'U16', 1000, '-9.0-9.0'),
+            ),
+
+    'setKeyDVELeft': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Left',
+                mask(23, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                mapped('left', 56, 'S16', (-9.0, 9.0), (-16000, 16000), '-9.0-9.0'),
+            ),
+
+    'setKeyDVERight': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Right',
+                mask(24, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                mapped('right', 58, 'S16', (-9.0, 9.0), (-16000, 16000), '-9.0-9.0'),
+            ),
+
+    'setKeyDVERate': ATEMSetterLayout('CKDV', 64, 'Set Key DVE Rate',
+                mask(25, 'U32'),
+                enum('mE', 4, 'mixEffects'),
+                enum('keyer', 5, 'keyers'),
+                integer('rate', 60, 'U8', '1-250 (frames)'),
+            ),
+
+    'setKeyerFlyKeyFrame': ATEMSetterLayout('SFKF', 4, 'Set Keyer Fly Key Frame',
+                enum('mE', 0, 'mixEffects'),
+                enum('keyer', 1, 'keyers'),
+                enum('keyFrame', 2, 'keyFrames'),
+            ),
+
+    'setRunFlyingKeyKeyFrame': ATEMSetterLayout('RFlK', 8, 'Set Run Flying Key Key Frame',
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                enum('keyFrame', 4, 'keyFrames'),
+            ),
+
+    'setRunFlyingKeyRuntoInfiniteindex': ATEMSetterLayout('RFlK', 8, 'Set Run Flying Key Run-to-Infinite-index',
+                mask(1),
+                enum('mE', 1, 'mixEffects'),
+                enum('keyer', 2, 'keyers'),
+                integer('runtoInfiniteindex', 5, 'U8', 'index'),
+            ),
+
+    'setDownstreamKeyerFillSource': ATEMSetterLayout('CDsF', 4, 'Set Downstream Keyer Fill Source',
+                enum('keyer', 0, 'keyers'),
+                videoSource('fillSource', 2),
+            ),
+
+    'setDownstreamKeyerKeySource': ATEMSetterLayout('CDsC', 4, 'Set Downstream Keyer Source',
+                enum('keyer', 0, 'keyers'),
+                videoSource('keySource', 2),
+            ),
+
+    'setDownstreamKeyerTie': ATEMSetterLayout('CDsT', 4, 'Set Downstream Keyer Tie',
+                enum('keyer', 0, 'keyers'),
+                boolean('tie', 1),
+                echo=stateEcho('DskP', 'downstreamKeyer[keyer].tie', 'tie'),
+            ),
+
+    'setDownstreamKeyerRate': ATEMSetterLayout('CDsR', 4, 'Set Downstream Keyer Rate',
+                enum('keyer', 0, 'keyers'),
+                integer('rate', 1, 'U8', '1-250 (frames)'),
+            ),
+
+    'setDownstreamKeyerPreMultiplied': ATEMSetterLayout('CDsG', 12, 'Set Downstream Keyer Pre Multiplied',
+                mask(0),
+                enum('keyer', 1, 'keyers'),
+                boolean('preMultiplied', 2),
+            ),
+
+    'setDownstreamKeyerClip': ATEMSetterLayout('CDsG', 12, 'Set Downstream Keyer Clip',
+                mask(1),
+                enum('keyer', 1, 'keyers'),
+                number('clip', 4, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setDownstreamKeyerGain': ATEMSetterLayout('CDsG', 12, 'Set Downstream Keyer Gain',
+                mask(2),
+                enum('keyer', 1, 'keyers'),
+                number('gain', 6, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setDownstreamKeyerInvertKey': ATEMSetterLayout('CDsG', 12, 'Set Downstream Keyer Invert Key(??)',
+                mask(3),
+                enum('keyer', 1, 'keyers'),
+                boolean('invertKey', 8),
+            ),
+
+    'setDownstreamKeyerMasked': ATEMSetterLayout('CDsM', 12, 'Set Downstream Keyer Masked',
+                mask(0),
+                enum('keyer', 1, 'keyers'),
+                boolean('masked', 2),
+            ),
+
+    'setDownstreamKeyerTop': ATEMSetterLayout('CDsM', 12, 'Set Downstream Keyer Top',
+                mask(1),
+                enum('keyer', 1, 'keyers'),
+                number('top', 4, 'U16', 1000, '-9.0-9.0'),
+            ),
+
+    'setDownstreamKeyerBottom': ATEMSetterLayout('CDsM', 12, 'Set Downstream Keyer Bottom',
+                mask(2),
+                enum('keyer', 1, 'keyers'),
+                number('bottom', 6, 'U16', 1000, '-9.0-9.0'),
+            ),
+
+    'setDownstreamKeyerLeft': ATEMSetterLayout('CDsM', 12, 'Set Downstream Keyer Left',
+                mask(3),
+                enum('keyer', 1, 'keyers'),
+                mapped('left', 8, 'S16', (-9.0, 9.0), (-16000, 16000), '-9.0-9.0'),
+            ),
+
+    'setDownstreamKeyerRight': ATEMSetterLayout('CDsM', 12, 'Set Downstream Keyer Right',
+                mask(4),
+                enum('keyer', 1, 'keyers'),
+                mapped('right', 10, 'S16', (-9.0, 9.0), (-16000, 16000), '-9.0-9.0'),
+            ),
+
+    'setDownstreamKeyerOnAir': ATEMSetterLayout('CDsL', 4, 'Set Downstream Keyer On Air',
+                enum('keyer', 0, 'keyers'),
+                boolean('onAir', 1),
+                echo=stateEcho('DskS', 'downstreamKeyer[keyer].onAir', 'onAir'),
+            ),
+
+    'setFadeToBlackRate': ATEMSetterLayout('FtbC', 4, 'Set Fade-To-Black Rate',
+                mask(0),
+                enum('mE', 1, 'mixEffects'),
+                integer('rate', 2, 'U8', '1-250 (frames)'),
+            ),
+
+    'setColorGeneratorHue': ATEMSetterLayout('CClV', 8, 'Set Color Generator Hue',
+                mask(0),
+                enum('colorGenerator', 1, 'colorGenerators'),
+                number('hue', 2, 'U16', 10, '0.0-359.9 (degrees)'),
+            ),
+
+    'setColorGeneratorSaturation': ATEMSetterLayout('CClV', 8, 'Set Color Generator Saturation',
+                mask(1),
+                enum('colorGenerator', 1, 'colorGenerators'),
+                number('saturation', 4, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setColorGeneratorLuma': ATEMSetterLayout('CClV', 8, 'Set Color Generator Luma',
+                mask(2),
+                enum('colorGenerator', 1, 'colorGenerators'),
+                number('luma', 6, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setAuxSourceInput': ATEMSetterLayout('CAuS', 4, 'Set Aux Source Input',
+                mask(0),
+                enum('auxChannel', 1, 'auxChannels'),
+                videoSource('input_', 2),
+                echo=stateEcho('AuxS', 'auxSource[auxChannel].input', 'input_'),
+            ),
+
+    'setCameraControlIris': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Iris',
+                enum('camera', 0, 'cameras'),
+                integer('iris', 16, 'S16', '0-2048'),
+                fixed(1, 'U8', 0),
+                fixed(2, 'U8', 3),
+                fixed(4, 'U8', 0x80),
+                fixed(9, 'U8', 0x01),
+            ),
+
+    'setCameraControlFocus': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Focus',
+                enum('camera', 0, 'cameras'),
+                integer('focus', 16, 'S16', '0-65535'),
+                fixed(1, 'U8', 0),
+                fixed(2, 'U8', 0),
+                fixed(4, 'U8', 0x80),
+                fixed(9, 'U8', 0x01),
+            ),
+
+    'setCameraControlAutoFocus': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Auto focus',
+                enum('camera', 0, 'cameras'),
+                fixed(1, 'U8', 0),
+                fixed(2, 'U8', 1),
+                fixed(4, 'U8', 0x00),
+            ),
+
+    'setCameraControlAutoIris': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Auto iris',
+                enum('camera', 0, 'cameras'),
+                fixed(1, 'U8', 0),
+                fixed(2, 'U8', 5),
+                fixed(4, 'U8', 0x00),
+            ),
+
+    'setCameraControlWhiteBalance': ATEMSetterLayout('CCmd', 24, 'Set Camera Control White Balance',
+                enum('camera', 0, 'cameras'),
+                integer('whiteBalance', 16, 'S16', '3200: 3200K, 4500: 4500K, 5000: 5000K, 5600: 5600K, 6500: 6500K, 7500: 7500K'),
+                fixed(1, 'U8', 1),
+                fixed(2, 'U8', 2),
+                fixed(4, 'U8', 0x02),
+                fixed(9, 'U8', 0x01),
+            ),
+
+    'setCameraControlSharpeningLevel': ATEMSetterLayout('CCmd', 20, 'Set Camera Control Detail level',
+                enum('camera', 0, 'cameras'),
+                enum('detail', 16, 'camerControlSharpeningLevels'),
+                fixed(1, 'U8', 1),
+                fixed(2, 'U8', 8),
+                fixed(4, 'U8', 0x01),
+                fixed(7, 'U8', 0x01),
+                fixed(9, 'U8', 0x01),
+            ),
+
+    'setCameraControlZoomNormalized': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Zoom Normalized',
+                enum('camera', 0, 'cameras'),
+                number('zoomNormalized', 16, 'S16', 10, '?'),
+                fixed(1, 'U8', 0),
+                fixed(2, 'U8', 8),
+                fixed(4, 'U8', 0x80),
+                fixed(9, 'U8', 0x01),
+            ),
+
+    'setCameraControlZoomSpeed': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Zoom',
+                enum('camera', 0, 'cameras'),
+                mapped('zoomSpeed', 16, 'S16', (-1.0, 1.0), (-2048, 2048), '-1.0-1.0'),
+                fixed(1, 'U8', 0),
+                fixed(2, 'U8', 9),
+                fixed(4, 'U8', 0x80),
+                fixed(9, 'U8', 0x01),
+            ),
+
+    'setCameraControlColorbars': ATEMSetterLayout('CCmd', 20, 'Set Camera Control Colorbars',
+                enum('camera', 0, 'cameras'),
+                integer('colorbars', 16, 'U8', 'duration in secs (0=disable)'),
+                fixed(1, 'U8', 4),
+                fixed(2, 'U8', 4),
+                fixed(4, 'U8', 0x01),
+                fixed(7, 'U8', 0x01),
+                fixed(9, 'U8', 0x01),
+            ),
+
+    'setCameraControlLift': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Lift',
+                enum('camera', 0, 'cameras'),
+                mapped('liftR', 16, 'S16', (-1.0, 1.0), (-4096, 4096), '-1.0-1.0'),
+                mapped('liftG', 18, 'S16', (-1.0, 1.0), (-4096, 4096), '-1.0-1.0'),
+                mapped('liftB', 20, 'S16', (-1.0, 1.0), (-4096, 4096), '-1.0-1.0'),
+                mapped('liftY', 22, 'S16', (-1.0, 1.0), (-4096, 4096), '-1.0-1.0'),
+                fixed(1, 'U8', 8),
+                fixed(2, 'U8', 0),
+                fixed(4, 'U8', 0x80),
+                fixed(9, 'U8', 0x04),
+            ),
+
+    'setCameraControlGamma': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Gamma',
+                enum('camera', 0, 'cameras'),
+                mapped('gammaR', 16, 'S16', (-1.0, 1.0), (-8192, 8192), '-1.0-1.0'),
+                mapped('gammaG', 18, 'S16', (-1.0, 1.0), (-8192, 8192), '-1.0-1.0'),
+                mapped('gammaB', 20, 'S16', (-1.0, 1.0), (-8192, 8192), '-1.0-1.0'),
+                mapped('gammaY', 22, 'S16', (-1.0, 1.0), (-8192, 8192), '-1.0-1.0'),
+                fixed(1, 'U8', 8),
+                fixed(2, 'U8', 1),
+                fixed(4, 'U8', 0x80),
+                fixed(9, 'U8', 0x04),
+            ),
+
+    'setCameraControlGain': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Gain',
+                enum('camera', 0, 'cameras'),
+                integer('gain', 16, 'S16', '512: 0db, 1024: 6db, 2048: 12db, 4096: 18db'),
+                fixed(1, 'U8', 1),
+                fixed(2, 'U8', 1),
+                fixed(4, 'U8', 0x01),
+                fixed(7, 'U8', 0x01),
+                fixed(9, 'U8', 0x01),
+            ),
+
+    'setCameraControlComponentGain': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Component Gain',
+                enum('camera', 0, 'cameras'),
+                mapped('gainR', 16, 'S16', (0.0, 16.0), (0, 32767), '0.0-16.0'),
+                mapped('gainG', 18, 'S16', (0.0, 16.0), (0, 32767), '0.0-16.0'),
+                mapped('gainB', 20, 'S16', (0.0, 16.0), (0, 32767), '0.0-16.0'),
+                mapped('gainY', 22, 'S16', (0.0, 16.0), (0, 32767), '0.0-16.0'),
+                fixed(1, 'U8', 8),
+                fixed(2, 'U8', 2),
+                fixed(4, 'U8', 0x80),
+                fixed(9, 'U8', 0x04),
+            ),
+
+    'setCameraControlLumMix': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Lum Mix',
+                enum('camera', 0, 'cameras'),
+                mapped('lumMix', 16, 'S16', (0, 100), (0, 2048), '0.0-100.0 (%)'),
+                fixed(1, 'U8', 8),
+                fixed(2, 'U8', 5),
+                fixed(4, 'U8', 0x80),
+                fixed(9, 'U8', 0x01),
+            ),
+
+    'setCameraControlShutter': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Shutter',
+                enum('camera', 0, 'cameras'),
+                number('shutter', 18, 'S16', 1000000, '1/50, 1/60, 1/75, 1/90, 1/100, 1/120, 1/150, 1/180, 1/250, 1/360, 1/500, 1/750, 1/1000, 1/1450, 1/2000'),
+                fixed(1, 'U8', 1),
+                fixed(2, 'U8', 5),
+                fixed(4, 'U8', 0x03),
+                fixed(11, 'U8', 0x01),
+            ),
+
+    'setCameraControlContrast': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Contrast',
+                enum('camera', 0, 'cameras'),
+                mapped('contrast', 18, 'S16', (0, 100), (0, 4096), '0.0-100.0 (%)'),
+                fixed(1, 'U8', 8),
+                fixed(2, 'U8', 4),
+                fixed(4, 'U8', 0x80),
+                fixed(9, 'U8', 0x02),
+                fixed(16, 'U8', 4),
+                fixed(17, 'U8', 0),
+            ),
+
+    'setCameraControlHueSaturation': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Hue/Saturation',
+                enum('camera', 0, 'cameras'),
+                mapped('hue', 16, 'S16', (0, 360), (-2048, 2048), '0.0-359.9 degrees'),
+                mapped('saturation', 18, 'S16', (0, 100), (0, 4096), '0.0-100.0 (%)'),
+                fixed(1, 'U8', 8),
+                fixed(2, 'U8', 6),
+                fixed(4, 'U8', 0x80),
+                fixed(9, 'U8', 0x02),
+            ),
+
+    'setCameraControlVideomode': ATEMSetterLayout('CCmd', 24, 'Set Camera Control Video Mode',
+                enum('camera', 0, 'cameras'),
+                integer('fps', 16, 'U8', '?'),
+                integer('resolution', 18, 'U8', '?'),
+                integer('interlaced', 19, 'U8', '?'),
+                fixed(1, 'U8', 1),
+                fixed(2, 'U8', 0),
+                fixed(4, 'U8', 0x01),
+                fixed(7, 'U8', 0x05),
+                fixed(17, 'U8', 0x00),
+                fixed(20, 'U8', 0x00),
+            ),
+
+    'setClipPlayerPlaying': ATEMSetterLayout('SCPS', 8, 'Set Clip Player Playing',
+                mask(0),
+                enum('mediaPlayer', 1, 'mediaPlayers'),
+                boolean('playing', 2),
+            ),
+
+    'setClipPlayerLoop': ATEMSetterLayout('SCPS', 8, 'Set Clip Player Loop',
+                mask(1),
+                enum('mediaPlayer', 1, 'mediaPlayers'),
+                boolean('loop', 3),
+            ),
+
+    'setClipPlayerAtBeginning': ATEMSetterLayout('SCPS', 8, 'Set Clip Player At Beginning',
+                mask(2),
+                enum('mediaPlayer', 1, 'mediaPlayers'),
+                boolean('atBeginning', 4),
+            ),
+
+    'setClipPlayerClipFrame': ATEMSetterLayout('SCPS', 8, 'Set Clip Player Clip Frame',
+                mask(3),
+                enum('mediaPlayer', 1, 'mediaPlayers'),
+                integer('clipFrame', 6, 'U16', 'frame'),
+            ),
+
+    'setMediaPlayerSourceType': ATEMSetterLayout('MPSS', 8, 'Set Media Player Source Type',
+                mask(0),
+                enum('mediaPlayer', 1, 'mediaPlayers'),
+                enum('type_', 2, 'mediaPlayerSourceTypes'),
+                echo=stateEcho('MPCE', 'mediaPlayer.source[mediaPlayer].type', 'type_'),
+            ),
+
+    'setMediaPlayerSourceStillIndex': ATEMSetterLayout('MPSS', 8, 'Set Media Player Source Still Index',
+                mask(1),
+                enum('mediaPlayer', 1, 'mediaPlayers'),
+                integer('stillIndex', 3, 'U8', '0-x: Still 1-x'),
+                echo=stateEcho('MPCE', 'mediaPlayer.source[mediaPlayer].stillIndex', 'stillIndex'),
+            ),
+
+    'setMediaPlayerSourceClipIndex': ATEMSetterLayout('MPSS', 8, 'Set Media Player Source Clip Index',
+                mask(2),
+                enum('mediaPlayer', 1, 'mediaPlayers'),
+                integer('clipIndex', 4, 'U8', '0-x: Clip 1-x'),
+                echo=stateEcho('MPCE', 'mediaPlayer.source[mediaPlayer].clipIndex', 'clipIndex'),
+            ),
+
+    'setMediaPoolStorageClip1MaxLength': ATEMSetterLayout('CMPS', 4, 'Set Media Pool Storage Clip 1 Max Length',
+                integer('clip1MaxLength', 0, 'U16', 'frames'),
+            ),
+
+    'setMacroAction': ATEMSetterLayout('MAct', 4, 'Set Macro Action Action',
+                enum('macro', 0, 'macros', 'U16', doc='see ATEMMacros (to stop, use macros.stop)'),
+                enum('action', 2, 'macroActions'),
+            ),
+
+    'setMacroRunChangePropertiesLooping': ATEMSetterLayout('MRCP', 4, 'Set Macro Run Change Properties Looping',
+                mask(0),
+                boolean('looping', 1),
+            ),
+
+    'setMacroAddPauseFrames': ATEMSetterLayout('MSlp', 4, 'Set Macro Add Pause Frames',
+                integer('frames', 2, 'U16', 'number of frames'),
+            ),
+
+    'setSuperSourceFillSource': ATEMSetterLayout('CSSc', 36, 'Set Super Source Fill Source',
+                mask(0, 'U32'),
+                videoSource('fillSource', 4),
+            ),
+
+    'setSuperSourceKeySource': ATEMSetterLayout('CSSc', 36, 'Set Super Source Key Source',
+                mask(1, 'U32'),
+                videoSource('keySource', 6),
+            ),
+
+    'setSuperSourceForeground': ATEMSetterLayout('CSSc', 36, 'Set Super Source Foreground',
+                mask(2, 'U32'),
+                boolean('foreground', 8),
+            ),
+
+    'setSuperSourcePreMultiplied': ATEMSetterLayout('CSSc', 36, 'Set Super Source Pre Multiplied',
+                mask(3, 'U32'),
+                boolean('preMultiplied', 9),
+            ),
+
+    'setSuperSourceClip': ATEMSetterLayout('CSSc', 36, 'Set Super Source Clip',
+                mask(4, 'U32'),
+                number('clip', 10, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setSuperSourceGain': ATEMSetterLayout('CSSc', 36, 'Set Super Source Gain',
+                mask(5, 'U32'),
+                number('gain', 12, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setSuperSourceInvertKey': ATEMSetterLayout('CSSc', 36, 'Set Super Source Invert Key',
+                mask(6, 'U32'),
+                boolean('invertKey', 14),
+            ),
+
+    'setSuperSourceBorderEnabled': ATEMSetterLayout('CSSc', 36, 'Set Super Source Border Enabled',
+                mask(7, 'U32'),
+                boolean('borderEnabled', 15),
+            ),
+
+    'setSuperSourceBorderBevel': ATEMSetterLayout('CSSc', 36, 'Set Super Source Border Bevel',
+                mask(8, 'U32'),
+                enum('borderBevel', 16, 'borderBevels'),
+            ),
+
+    'setSuperSourceBorderOuterWidth': ATEMSetterLayout('CSSc', 36, 'Set Super Source Border Outer Width',
+                mask(9, 'U32'),
+                number('borderOuterWidth', 18, 'U16', 100, '0.0-16.0'),
+            ),
+
+    'setSuperSourceBorderInnerWidth': ATEMSetterLayout('CSSc', 36, 'Set Super Source Border Inner Width',
+                mask(10, 'U32'),
+                number('borderInnerWidth', 20, 'U16', 100, '0.0-16.0'),
+            ),
+
+    'setSuperSourceBorderOuterSoftness': ATEMSetterLayout('CSSc', 36, 'Set Super Source Border Outer Softness',
+                mask(11, 'U32'),
+                integer('borderOuterSoftness', 22, 'U8', '0-100 (%)'),
+            ),
+
+    'setSuperSourceBorderInnerSoftness': ATEMSetterLayout('CSSc', 36, 'Set Super Source Border Inner Softness',
+                mask(12, 'U32'),
+                integer('borderInnerSoftness', 23, 'U8', '0-100 (%)'),
+            ),
+
+    'setSuperSourceBorderBevelSoftness': ATEMSetterLayout('CSSc', 36, 'Set Super Source Border Bevel Softness',
+                mask(13, 'U32'),
+                number('borderBevelSoftness', 24, 'U8', 100, '0.0-1.0'),
+            ),
+
+    'setSuperSourceBorderBevelPosition': ATEMSetterLayout('CSSc', 36, 'Set Super Source Border Bevel Position',
+                mask(14, 'U32'),
+                number('borderBevelPosition', 25, 'U8', 100, '0.0-1.0'),
+            ),
+
+    'setSuperSourceBorderHue': ATEMSetterLayout('CSSc', 36, 'Set Super Source Border Hue',
+                mask(15, 'U32'),
+                number('borderHue', 26, 'U16', 10, '0.0-359.9 (degrees)'),
+            ),
+
+    'setSuperSourceBorderSaturation': ATEMSetterLayout('CSSc', 36, 'Set Super Source Border Saturation',
+                mask(16, 'U32'),
+                number('borderSaturation', 28, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setSuperSourceBorderLuma': ATEMSetterLayout('CSSc', 36, 'Set Super Source Border Luma',
+                mask(17, 'U32'),
+                number('borderLuma', 30, 'U16', 10, '0.0-100.0 (%)'),
+            ),
+
+    'setSuperSourceLightSourceDirection': ATEMSetterLayout('CSSc', 36, 'Set Super Source Light Source Direction',
+                mask(18, 'U32'),
+                number('lightSourceDirection', 32, 'U16', 10, '0.0-359.9 (degrees)'),
+            ),
+
+    'setSuperSourceLightSourceAltitude': ATEMSetterLayout('CSSc', 36, 'Set Super Source Light Source Altitude',
+                mask(19, 'U32'),
+                integer('lightSourceAltitude', 34, 'U8', '10-100'),
+            ),
+
+    'setSuperSourceBoxParametersEnabled': ATEMSetterLayout('CSBP', 24, 'Set Super Source Box Parameters Enabled',
+                mask(0, 'U16'),
+                enum('box', 2, 'boxes'),
+                boolean('enabled', 4),
+            ),
+
+    'setSuperSourceBoxParametersInputSource': ATEMSetterLayout('CSBP', 24, 'Set Super Source Box Parameters Input Source',
+                mask(1, 'U16'),
+                enum('box', 2, 'boxes'),
+                videoSource('inputSource', 4),
+            ),
+
+    'setSuperSourceBoxParametersPositionX': ATEMSetterLayout('CSBP', 24, 'Set Super Source Box Parameters Position X',
+                mask(2, 'U16'),
+                enum('box', 2, 'boxes'),
+                number('positionX', 8, 'S16', 100, '-48.0-48.0'),
+            ),
+
+    'setSuperSourceBoxParametersPositionY': ATEMSetterLayout('CSBP', 24, 'Set Super Source Box Parameters Position Y',
+                mask(3, 'U16'),
+                enum('box', 2, 'boxes'),
+                number('positionY', 10, 'S16', 100, '-27.0-27.0'),
+            ),
+
+    'setSuperSourceBoxParametersSize': ATEMSetterLayout('CSBP', 24, 'Set Super Source Box Parameters Size',
+                mask(4, 'U16'),
+                enum('box', 2, 'boxes'),
+                number('size', 12, 'U16', 1000, '0.07-1.0'),
+            ),
+
+    'setSuperSourceBoxParametersCropped': ATEMSetterLayout('CSBP', 24, 'Set Super Source Box Parameters Cropped',
+                mask(5, 'U16'),
+                enum('box', 2, 'boxes'),
+                boolean('cropped', 14),
+            ),
+
+    'setSuperSourceBoxParametersCropTop': ATEMSetterLayout('CSBP', 24, 'Set Super Source Box Parameters Crop Top',
+                mask(6, 'U16'),
+                enum('box', 2, 'boxes'),
+                number('cropTop', 16, 'U16', 1000, '0.0-18.0'),
+            ),
+
+    'setSuperSourceBoxParametersCropBottom': ATEMSetterLayout('CSBP', 24, 'Set Super Source Box Parameters Crop Bottom',
+                mask(7, 'U16'),
+                enum('box', 2, 'boxes'),
+                number('cropBottom', 18, 'U16', 1000, '0.0-18.0'),
+            ),
+
+    'setSuperSourceBoxParametersCropLeft': ATEMSetterLayout('CSBP', 24, 'Set Super Source Box Parameters Crop Left',
+                mask(8, 'U16'),
+                enum('box', 2, 'boxes'),
+                number('cropLeft', 20, 'U16', 1000, '0.0-32.0'),
+            ),
+
+    'setSuperSourceBoxParametersCropRight': ATEMSetterLayout('CSBP', 24, 'Set Super Source Box Parameters Crop Right',
+                mask(9, 'U16'),
+                enum('box', 2, 'boxes'),
+                number('cropRight', 22, 'U16', 1000, '0.0-32.0'),
+            ),
+
+    'setAudioMixerInputMixOption': ATEMSetterLayout('CAMI', 12, 'Set Audio Mixer Input Mix Option',
+                mask(0),
+                audioSource('audioSource', 2),
+                enum('mixOption', 4, 'audioMixerInputMixOptions'),
+                echo=stateEcho('AMIP', 'audioMixer.input[audioSource].mixOption', 'mixOption'),
+            ),
+
+    'setAudioMixerInputVolume': ATEMSetterLayout('CAMI', 12, 'Set Audio Mixer Input Volume',
+                mask(1),
+                audioSource('audioSource', 2),
+                volume('db', 6, 'volume in dB'),
+            ),
+
+    'setAudioMixerInputBalance': ATEMSetterLayout('CAMI', 12, 'Set Audio Mixer Input Balance',
+                mask(2),
+                audioSource('audioSource', 2),
+                number('balance', 8, 'S16', 10000, '-1.0-1.0: Left/Right Extremes'),
+            ),
+
+    'setAudioMixerMasterVolume': ATEMSetterLayout('CAMM', 8, 'Set Audio Mixer Master Volume',
+                mask(0),
+                volume('db', 2, 'volume in dB'),
+            ),
+
+    'setAudioMixerMonitorMonitorAudio': ATEMSetterLayout('CAMm', 12, 'Set Audio Mixer Monitor Monitor Audio',
+                mask(0),
+                boolean('monitorAudio', 1),
+            ),
+
+    'setAudioMixerMonitorVolume': ATEMSetterLayout('CAMm', 12, 'Set Audio Mixer Monitor Volume',
+                mask(1),
+                volume('db', 2, 'volume in dB'),
+            ),
+
+    'setAudioMixerMonitorMute': ATEMSetterLayout('CAMm', 12, 'Set Audio Mixer Monitor Mute',
+                mask(2),
+                boolean('mute', 4),
+            ),
+
+    'setAudioMixerMonitorSolo': ATEMSetterLayout('CAMm', 12, 'Set Audio Mixer Monitor Solo',
+                mask(3),
+                boolean('solo', 5),
+            ),
+
+    'setAudioMixerMonitorSoloInput': ATEMSetterLayout('CAMm', 12, 'Set Audio Mixer Monitor Solo Input',
+                mask(4),
+                audioSource('soloInput', 6),
+            ),
+
+    'setAudioMixerMonitorDim': ATEMSetterLayout('CAMm', 12, 'Set Audio Mixer Monitor Dim',
+                mask(5),
+                boolean('dim', 8),
+            ),
+
+    'setAudioLevelsEnable': ATEMSetterLayout('SALN', 4, 'Set Audio Levels Enable',
+                boolean('enable', 0),
+            ),
+
+    'setResetAudioMixerPeaksInputSource': ATEMSetterLayout('RAMP', 8, 'Set Reset Audio Mixer Peaks Input Source',
+                mask(1),
+                audioSource('inputSource', 2),
+            ),
+
+    'setResetAudioMixerPeaksMaster': ATEMSetterLayout('RAMP', 8, 'Set Reset Audio Mixer Peaks Master',
+                mask(2),
+                boolean('master', 4, 'Yes/No'),
+            ),
+}
+
+
+# Compiled setter methods for all setter layouts
+SETTER_METHODS: Dict[str, ATEMSetterMethod] = {
+    methodName: layout.compile(methodName) for methodName, layout in SETTER_LAYOUTS.items()
+}
+
+
+# #######################################################################
+#
+#  Setter declarations
+#
+#  Setter methods are compiled at runtime, ATEMSetterDeclarations declares
+#  them for linters and IDEs. Regenerate it after changing the layouts:
+#
+#    python tools/generate-setter-declarations.py
+#
+
+_DECLARATIONS_HEADER = '''#!/usr/bin/env python3
+# coding: utf-8
+"""
+ATEMSetterDeclarations: Blackmagic ATEM switcher setter declarations.
+Part of the PyATEMMax library.
+Generated from ATEMSetterLayouts by tools/generate-setter-declarations.py, do not edit.
+"""
+
+# pylint: disable=too-many-lines, too-many-public-methods, line-too-long, unnecessary-ellipsis
+
+from typing import Union
+
+from .ATEMCommandQueue import ATEMCommandConfirmation
+from .ATEMConstant import ATEMConstant
+
+
+class ATEMSetterDeclarations():
+    """Blackmagic ATEM switcher setter declarations
+
+    Signatures and docstrings of the setters compiled from ATEMSetterLayouts
+    (ATEMSetterMethods replaces these declarations with the compiled methods).
+    """
+'''
+
+
+def setterDeclarations() -> str:
+    """Get the source of the ATEMSetterDeclarations module
+
+    Returns:
+        (str): module source, one declaration for each setter layout
+    """
+
+    declarations = [ layout.declaration(methodName) for methodName, layout in SETTER_LAYOUTS.items() ]
+    return _DECLARATIONS_HEADER + ''.join(f"\n\n{declaration}" for declaration in declarations)
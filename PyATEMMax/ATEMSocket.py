@@ -12,6 +12,7 @@ import socket
 import logging
 
 from .ATEMProtocol import ATEMProtocol
+from .ATEMBuffer import ATEMBuffer
 from .ATEMUtils import hexStr
 
 
@@ -32,12 +33,34 @@ class ATEMUDPSocket():
         super().__init__()
 
         self.atem: ATEMProtocol = ATEMProtocol()
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self._socket.setblocking(False)
+        self._socket: Optional[socket.socket] = self._openSocket()
 
         self.connected = False
 
-        self._buffer = []
+        # Datagram buffer: preallocated once, filled by recv_into() and
+        #  handed to readers as memoryview slices (no per-byte copies).
+        self._buffer = bytearray(self.atem.inputBufferLength)
+        self._bufferView = memoryview(self._buffer)
+        self._bufferLen = 0     # Size of the datagram in the buffer
+        self._bufferPos = 0     # Read position inside the datagram
+
+
+    def _openSocket(self) -> Optional[socket.socket]:
+        """Open the underlying (non-blocking) UDP socket"""
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        return sock
+
+
+    def fileno(self) -> int:
+        """
+        Get the file descriptor of the underlying socket.
+
+        This makes the object usable with selectors.
+        """
+
+        return self._socket.fileno()
 
 
     def connect(self, ip: str) -> None:
@@ -86,14 +109,20 @@ class ATEMUDPSocket():
         From: https://www.arduino.cc/en/Reference/EthernetUDPParsePacket
         """
 
+        # Unread data from the previous datagram must be consumed (or flushed) first
+        if self._bufferPos < self._bufferLen:
+            return self.available()
+
         try:
-            data, _ = self._socket.recvfrom(10240)
+            received = self._socket.recv_into(self._buffer)
         except socket.error:
-            data = []
+            received = 0
 
-        if data:
-            self._buffer.extend(data)
-            self.log.debug(f"Received {len(data)} new bytes [{hexStr(data)}] - " \
+        self._bufferPos = 0
+        self._bufferLen = received
+
+        if received and self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"Received {received} new bytes [{hexStr(self._bufferView[:received])}] - " \
                             f" {self.available()} bytes available")
 
         return self.available()
@@ -108,30 +137,25 @@ class ATEMUDPSocket():
         From: https://www.arduino.cc/en/Reference/EthernetUDPAvailable
         """
 
-        return len(self._buffer)
+        return self._bufferLen - self._bufferPos
 
 
-    def read(self, buffer: List[int], maxSize: Optional[int] =None):
+    def read(self, buffer: ATEMBuffer, maxSize: Optional[int] =None):
         """
-        Read UDP data from the specified buffer.
+        Read UDP data into the specified buffer.
 
-        If no arguments are given, it will return the next character in the buffer.
+        The buffer is pointed to a memoryview slice of the received datagram,
+        so its contents are only valid until the next call to parsePacket().
 
         From: https://www.arduino.cc/en/Reference/EthernetUDPRead
         """
 
-        # Clear buffer before receiving
-        buffer[:] = []
+        count = self.available()
+        if maxSize and maxSize < count:
+            count = maxSize
 
-        # Get data from the internal buffer
-        count = 0
-        maxCount = maxSize if maxSize else 9999999999999
-        while count < maxCount:
-            if self.available():
-                buffer.append(self._buffer.pop(0))
-                count += 1
-            else:
-                break
+        buffer.setData(self._bufferView[self._bufferPos:self._bufferPos + count])
+        self._bufferPos += count
 
         return count
 
@@ -152,24 +176,49 @@ class ATEMUDPSocket():
 
         outbuf = outbuf[:length] if length else outbuf
 
-        self.log.debug(f"Sending buffer [{hexStr(outbuf)}]")
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"Sending buffer [{hexStr(outbuf)}]")
         return self._socket.send(outbuf)
 
 
-    def flushInputBuffer(self):
+    def flushInputBuffer(self) -> bytes:
         """Flush the input buffer"""
 
-        oldbuffer = [b for b in self._buffer]
-        self._buffer = []
+        oldbuffer = self.peek()
+        self._bufferPos = self._bufferLen
 
-        self.log.debug(f"Buffer flushed. Data: [{hexStr(oldbuffer)}]")
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"Buffer flushed. Data: [{hexStr(oldbuffer)}]")
         return oldbuffer
 
 
-    def peek(self):
+    def peek(self) -> bytes:
         """Get a copy of the input buffer"""
 
-        return [b for b in self._buffer]
+        return bytes(self._bufferView[self._bufferPos:self._bufferLen])
+
+
+    def datagram(self) -> bytes:
+        """Get a copy of the whole datagram in the buffer (read or not)"""
+
+        return bytes(self._bufferView[:self._bufferLen])
+
+
+    def loadDatagram(self, data: bytes) -> int:
+        """
+        Put a datagram in the buffer (to be read again).
+
+        Args:
+            data (bytes): datagram (from datagram())
+
+        Returns:
+            number of available bytes
+        """
+
+        self._buffer[:len(data)] = data
+        self._bufferLen = len(data)
+        self._bufferPos = 0
+        return self.available()
 
 
     def setLogLevel(self, level: int) -> None:
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""
+ATEMStateSnapshot: Blackmagic ATEM switcher state snapshots (read-only, copy-on-write).
+Part of the PyATEMMax library.
+"""
+
+# pylint: disable=protected-access
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import copy
+import re
+import time
+
+from .ATEMConstant import ATEMConstant, ATEMConstantList
+from .ATEMException import ATEMException
+from .ATEMValueDict import ATEMValueDict
+
+
+# State node changed by a command: (root attribute, child attribute or index value - None: whole root)
+ATEMStateNode = Tuple[str, Optional[Union[str, int]]]
+
+# State change paths: "programInput[0].videoSource", "tally.bySource.flags[1].program", "atemModel"
+_PATH_RE = re.compile(r'(\w+)(?:\.(\w+)|\[(-?\d+)\])?')
+
+# Values returned as they are by the snapshot views (and shared by the copies)
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, ATEMConstant, ATEMConstantList)
+_IMMUTABLE_CLASSES = frozenset((type(None), bool, int, float, complex, str, bytes, ATEMConstant, type))
+
+# Attributes of the state classes (all of them use __slots__), by class
+_classSlots: Dict[type, Optional[Tuple[str, ...]]] = {}
+
+# Default state roots, by class (shared by the first snapshot of all the switchers, never changed)
+_defaultRoots: Dict[type, Any] = {}
+
+
+def getStateNode(path: str) -> ATEMStateNode:
+    """Get the state node (first two levels) of a state change path
+
+    Args:
+        path (str): state change path (e.g. "keyer[0][1].fillSource")
+
+    Returns:
+        (ATEMStateNode): root attribute and child attribute or index (e.g. ("keyer", 0))
+    """
+
+    match = _PATH_RE.match(path)
+    if not match:
+        raise ATEMException(f"Wrong state path [{path}]")
+
+    root, attr, index = match.groups()
+    return root, attr if attr is not None else (int(index) if index is not None else None)
+
+
+def getDefaultRoot(cls: type) -> Any:
+    """Get the default value of a state root (for the first snapshot)
+
+    The value is created once per class and shared: snapshots never change
+    their roots (new snapshots copy the changed nodes).
+
+    Args:
+        cls (type): state root class (e.g. ProgramInputList)
+
+    Returns:
+        (Any): default value
+    """
+
+    root = _defaultRoots.get(cls)
+    if root is None:
+        root = _defaultRoots.setdefault(cls, cls())
+    return root
+
+
+def _getSlots(cls: type) -> Optional[Tuple[str, ...]]:
+    """Get all the slots of a class (None if its objects have a __dict__)"""
+
+    if cls not in _classSlots:
+        slots: Optional[List[str]] = []
+        for base in cls.__mro__[:-1]:   # Except object
+            if '__slots__' not in base.__dict__:
+                slots = None
+                break
+
+            baseSlots = base.__dict__['__slots__']
+            slots.extend((baseSlots,) if isinstance(baseSlots, str) else baseSlots)
+
+        _classSlots[cls] = tuple(slots) if slots is not None else None
+
+    return _classSlots[cls]
+
+
+def copyState(value: Any, memo: Optional[Dict[int, Any]] =None) -> Any:
+    """Copy a state object (faster than copy.deepcopy() for __slots__ classes)
+
+    Objects referenced more than once (such as the tally bitmaps and their
+    views) are copied once.
+
+    Args:
+        value (Any): state object
+        memo (Dict[int, Any], optional): objects already copied, by id
+
+    Returns:
+        (Any): deep copy of the object
+    """
+
+    if value.__class__ in _IMMUTABLE_CLASSES or isinstance(value, (_IMMUTABLE_TYPES, type)):
+        return value
+
+    if memo is None:
+        memo = {}
+    else:
+        clone = memo.get(id(value))
+        if clone is not None:
+            return clone
+
+    cls = value.__class__
+    if cls is bytearray:
+        clone = memo[id(value)] = bytearray(value)
+    elif cls is list:
+        clone = memo[id(value)] = []
+        clone.extend(copyState(item, memo) for item in value)
+    elif cls is dict:
+        clone = memo[id(value)] = {}
+        clone.update((key, copyState(item, memo)) for key, item in value.items())
+    else:
+        slots = _getSlots(cls)
+        if slots is None:
+            clone = memo[id(value)] = copy.deepcopy(value)
+        else:
+            clone = memo[id(value)] = cls.__new__(cls)
+            for slot in slots:
+                try:
+                    item = getattr(value, slot)
+                except AttributeError:  # Unset slot
+                    continue
+                setattr(clone, slot, item if item.__class__ in _IMMUTABLE_CLASSES else copyState(item, memo))
+
+    return clone
+
+
+def _copyNode(value: Any) -> Any:
+    """Copy a state object, sharing its children (the items of value dictionaries too)"""
+
+    cls = value.__class__
+    slots = _getSlots(cls)
+    if slots is None:
+        clone = copy.copy(value)
+    else:
+        clone = cls.__new__(cls)
+        for slot in slots:
+            if hasattr(value, slot):
+                setattr(clone, slot, getattr(value, slot))
+
+    if isinstance(clone, ATEMValueDict):
+        clone._data = dict(clone._data)
+
+    return clone
+
+
+def _view(value: Any) -> Any:
+    """Get a read-only view of a state value"""
+
+    if value.__class__ in _IMMUTABLE_CLASSES or isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, bytearray):
+        return bytes(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_view(item) for item in value)
+
+    return ATEMStateView(value)
+
+
+class ATEMStateView():
+    """Read-only view of a state object in an ATEMStateSnapshot
+
+    Attributes and items are read from the snapshot copy (and returned as
+    views too), setting them raises ATEMException. Reading never changes
+    the copy: value dictionary items not created yet are returned as
+    default items, but not stored.
+
+    Args:
+        target (Any): state object
+    """
+
+    __slots__ = ('_target',)
+
+    def __init__(self, target: Any):
+        object.__setattr__(self, '_target', target)
+
+    def __getattr__(self, name: str) -> Any:
+        return _view(getattr(self._target, name))
+
+    def __getitem__(self, key: Any) -> Any:
+        target = self._target
+        return _view(target.peek(key) if isinstance(target, ATEMValueDict) else target[key])
+
+    def __iter__(self) -> Iterator[Any]:
+        return (_view(item) for item in self._target)
+
+    def __len__(self) -> int:
+        return len(self._target)
+
+    def __eq__(self, other: Any) -> bool:
+        return self._target == (other._target if isinstance(other, ATEMStateView) else other)
+
+    __hash__ = None     # type: ignore
+
+    def __str__(self) -> str:
+        return str(self._target)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self._target, format_spec)
+
+    def __repr__(self) -> str:
+        return f"<ATEMStateView {self._target!r}>"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise ATEMException(f"State snapshots are read-only (setting [{name}])")
+
+    def __delattr__(self, name: str) -> None:
+        raise ATEMException(f"State snapshots are read-only (deleting [{name}])")
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        raise ATEMException(f"State snapshots are read-only (setting [{key}])")
+
+    def __delitem__(self, key: Any) -> None:
+        raise ATEMException(f"State snapshots are read-only (deleting [{key}])")
+
+
+class ATEMStateSnapshot():
+    """Read-only, consistent view of the whole switcher state
+
+    Snapshots are published by the comms thread after each packet, with all
+    its commands applied (see ATEMSwitcherState.snapshot()). They have the
+    same attributes as the switcher state (switcher.snapshot().programInput[0].videoSource),
+    returned as ATEMStateView objects.
+
+    A new snapshot only copies the state nodes (first two levels, such as
+    `keyer[0]` or `audioMixer.levels`) changed by the packet, the rest
+    is shared with the previous snapshot. Snapshots never change after they
+    are published (reading them doesn't either).
+
+    Args:
+        roots (Dict[str, Any]): state roots (copies, or default values, see getDefaultRoot()) by attribute name
+    """
+
+    __slots__ = ('_roots', 'time')
+
+    def __init__(self, roots: Dict[str, Any]):
+        object.__setattr__(self, '_roots', roots)
+
+        # Publication time (as time.time())
+        object.__setattr__(self, 'time', time.time())
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            root = self._roots[name]
+        except KeyError:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'") from None
+
+        return _view(root)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise ATEMException(f"State snapshots are read-only (setting [{name}])")
+
+    def __delattr__(self, name: str) -> None:
+        raise ATEMException(f"State snapshots are read-only (deleting [{name}])")
+
+    def __dir__(self) -> Iterable[str]:
+        return list(super().__dir__()) + list(self._roots)
+
+    def __repr__(self) -> str:
+        return f"<ATEMStateSnapshot time={self.time}>"
+
+    def _update(self, state: Any, nodes: Set[ATEMStateNode]) -> 'ATEMStateSnapshot':
+        """Create the next snapshot (copying the changed state nodes)
+
+        Args:
+            state (ATEMSwitcherState): switcher state
+            nodes (Set[ATEMStateNode]): state nodes changed since this snapshot
+
+        Returns:
+            (ATEMStateSnapshot): new snapshot (sharing the unchanged nodes with this one)
+        """
+
+        children: Dict[str, Set[Optional[Union[str, int]]]] = {}
+        for root, child in nodes:
+            children.setdefault(root, set()).add(child)
+
+        roots = dict(self._roots)
+        for name, changed in children.items():
+            if name not in roots:
+                continue
+
+            liveRoot = getattr(state, name)
+            if None in changed or isinstance(liveRoot, _IMMUTABLE_TYPES):
+                roots[name] = copyState(liveRoot)
+                continue
+
+            # Path copying: new root (sharing its other children), copies of the changed children
+            root = _copyNode(roots[name])
+
+            for child in changed:
+                if isinstance(child, int) and isinstance(liveRoot, ATEMValueDict):
+                    key = liveRoot.itemDict._byValue(child)
+                    if key in liveRoot._data:
+                        root._data[key] = copyState(liveRoot._data[key])
+                elif isinstance(child, str) and hasattr(liveRoot, child):
+                    setattr(root, child, copyState(getattr(liveRoot, child)))
+                else:
+                    root = copyState(liveRoot)
+                    break
+
+            roots[name] = root
+
+        return ATEMStateSnapshot(roots)
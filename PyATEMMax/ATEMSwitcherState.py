@@ -5,8 +5,11 @@ ATEMSwitcherState: Blackmagic ATEM switcher state data class.
 Part of the PyATEMMax library.
 """
 
-# pylint: disable=wildcard-import, unused-wildcard-import
+# pylint: disable=wildcard-import, unused-wildcard-import, protected-access
 
+from typing import Set
+
+from .ATEMStateSnapshot import ATEMStateSnapshot, ATEMStateNode, getDefaultRoot, getStateNode
 from .StateData import *
 
 
@@ -17,6 +20,8 @@ class ATEMSwitcherState():
     """
 
     def __init__(self):
+        attributes = set(vars(self))
+
         # Data
         self.atemModel: str = ""
         self.audioMixer: AudioMixer = AudioMixer()
@@ -47,3 +52,44 @@ class ATEMSwitcherState():
         self.videoMixer: VideoMixer = VideoMixer()
         self.videoMode: VideoMode = VideoMode()
         self.warningText: str = ""
+
+        # Published state snapshot (roots are copied when changed, see snapshot())
+        stateRoots = { name: getDefaultRoot(type(value)) for name, value in vars(self).items() if name not in attributes }
+        self._stateSnapshot: ATEMStateSnapshot = ATEMStateSnapshot(stateRoots)
+
+        # State nodes changed since the last snapshot
+        self._changedStateNodes: Set[ATEMStateNode] = set()
+
+
+    def snapshot(self) -> ATEMStateSnapshot:
+        """Get a read-only, consistent view of the switcher state
+
+        Snapshots are published after each packet received from the switcher,
+        with all its commands applied, so they never show half-applied changes
+        (e.g. a keyer with the new fill source and the old key source).
+        Getting one is just a reference read (no locks, no copies), and it
+        does not change after that: call snapshot() again for newer data.
+
+        Returns:
+            (ATEMStateSnapshot): last published snapshot
+        """
+
+        return self._stateSnapshot
+
+
+    def _markStateChange(self, path: str) -> None:
+        """Mark the state node of a change path for the next snapshot
+
+        Args:
+            path (str): state change path (e.g. "programInput[0].videoSource")
+        """
+
+        self._changedStateNodes.add(getStateNode(path))
+
+
+    def _publishStateSnapshot(self) -> None:
+        """Publish a new snapshot if the state changed (called after each packet)"""
+
+        if self._changedStateNodes:
+            self._stateSnapshot = self._stateSnapshot._update(self, self._changedStateNodes)
+            self._changedStateNodes = set()
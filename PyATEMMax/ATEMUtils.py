@@ -5,12 +5,10 @@ ATEMutils: PyATEMMAx internal utility methods.
 Part of the PyATEMMax library.
 """
 
-from typing import Dict, Tuple, Iterable, Any
+from typing import Tuple, Iterable
 
 import time
 
-from .ATEMConstant import ATEMConstantList
-
 
 def highLowBytes(val: int) -> Tuple[int, int]:
     """Get splitted high/low bytes
@@ -82,25 +80,6 @@ def hexStr(buf: Iterable[int]) -> str:
     return bufStr.strip()
 
 
-def getEmptyDict(value: Any, refDict: ATEMConstantList) -> Any:
-    """Generate an empty list filled with an initial value
-
-    Args:
-        value: value used to fill the list
-        count: amount of items
-
-    Returns:
-        filled list
-    """
-
-    if isinstance(value, type):
-        newDict: Dict[str, Any] = {refDict[k]: value() for k in refDict}
-    else:
-        newDict = {refDict[k]: value for k in refDict}
-
-    return newDict
-
-
 def hasTimedOut(_time: float, timeout: float) -> bool:
     """Check if an amount of time has elapsed
 
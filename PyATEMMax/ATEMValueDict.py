@@ -5,11 +5,10 @@ ATEMValueDict: Blackmagic ATEM switcher: Base classes for value dictionaries
 Part of the PyATEMMax library.
 """
 
-# pylint: disable=missing-class-docstring, wildcard-import, unused-wildcard-import
+# pylint: disable=missing-class-docstring, wildcard-import, unused-wildcard-import, protected-access
 
-from typing import Any, Optional, TypeVar, Generic
+from typing import Any, Dict, Optional, TypeVar, Generic
 
-from .ATEMUtils import getEmptyDict
 from .ATEMConstant import ATEMConstant, ATEMConstantList
 from .ATEMException import ATEMException
 
@@ -17,22 +16,55 @@ from .ATEMException import ATEMException
 ITEMTYPE = TypeVar('ITEMTYPE')
 
 class ATEMValueDict(Generic[ITEMTYPE]):
+    """Dictionary with an item (itemClass object) for each constant in itemDict
+
+    Items are created on first access (by the switcher data or the user),
+    so only the entries used by the switcher model take memory.
+    """
+
+    __slots__ = ('itemClass', 'itemDict', '_data')
+
     def __init__(self, itemClass: Any, itemDict: ATEMConstantList):
         self.itemClass = itemClass
         self.itemDict = itemDict
-        self._data = getEmptyDict(itemClass, itemDict)
+        self._data: Dict[ATEMConstant, ITEMTYPE] = {}
 
     def __getitem__(self, itemKey: Any) -> ITEMTYPE:
+        key = self._getKey(itemKey)
+
+        item = self._data.get(key)
+        if item is None:
+            # setdefault: the comms thread and the user may create the item at the same time
+            item = self._data.setdefault(key, self._createItem(key))
+        return item
+
+    def peek(self, itemKey: Any) -> ITEMTYPE:
+        """Get an item without creating it (a new default item, not stored, if not created yet)"""
+
+        key = self._getKey(itemKey)
+
+        item = self._data.get(key)
+        return item if item is not None else self._createItem(key)
+
+    def _getKey(self, itemKey: Any) -> ATEMConstant:
+        """Get the key an item is stored by (the first constant declared with its value)"""
+
         _key: Optional[Any] = None
 
         if isinstance(itemKey, int):
-            _key = self.itemDict.byValue(itemKey)
+            _key = self.itemDict._byValue(itemKey)
         elif isinstance(itemKey, str):
             _key = self.itemDict.byName(itemKey)
-        elif isinstance(itemKey, ATEMConstant):
+        elif isinstance(itemKey, ATEMConstant) and self.itemDict.byName(itemKey.name) is itemKey:
             _key = itemKey
 
-        if _key is None:
+        key = self.itemDict._byValue(_key) if _key is not None else None
+        if key is None:
             raise ATEMException(f"{itemKey} ({type(itemKey)}) is not a valid key for {self.itemClass.__name__}[]")
 
-        return self._data[_key]
+        return key
+
+    def _createItem(self, key: ATEMConstant) -> ITEMTYPE:
+        """Create the item for a key (on first access)"""
+
+        return self.itemClass()
@@ -21,12 +21,16 @@ class AudioMixer():
     #
 
     class Config():
+        __slots__ = ('audioChannels', 'hasMonitor')
+
         def __init__(self): # AudioMixer.Config
             self.audioChannels: int = 0
             self.hasMonitor: bool = False
 
 
     class Input():
+        __slots__ = ('balance', 'fromMediaPlayer', 'mixOption', 'plugtype', 'type', 'volume')
+
         def __init__(self): # AudioMixer.Input
             self.balance: float = 0.0
             self.fromMediaPlayer: bool = False
@@ -37,6 +41,8 @@ class AudioMixer():
 
 
     class InputList(ATEMValueDict[Input]):
+        __slots__ = ()
+
         def __init__(self): # AudioMixer.InputList
             super().__init__(AudioMixer.Input, ATEMProtocol.audioSources)
 
@@ -44,11 +50,15 @@ class AudioMixer():
     class Levels():
         class Master():
             class Peak():
+                __slots__ = ('left', 'right')
+
                 def __init__(self): # AudioMixer.Levels.Master.Peak
                     self.left: int = 0
                     self.right: int = 0
 
 
+            __slots__ = ('left', 'right', 'peak')
+
             def __init__(self): # AudioMixer.Levels.Master
                 self.left: int = 0
                 self.right: int = 0
@@ -57,11 +67,15 @@ class AudioMixer():
 
         class Source():
             class Peak():
+                __slots__ = ('left', 'right')
+
                 def __init__(self): # AudioMixer.Levels.Source.Peak
                     self.left: int = 0
                     self.right: int = 0
 
 
+            __slots__ = ('left', 'right', 'peak')
+
             def __init__(self): # AudioMixer.Levels.Source
                 self.left: int = 0
                 self.right: int = 0
@@ -69,10 +83,14 @@ class AudioMixer():
 
 
         class SourceList(ATEMValueDict[Source]):
+            __slots__ = ()
+
             def __init__(self): # AudioMixer.Levels.SourceList
                 super().__init__(AudioMixer.Levels.Source, ATEMProtocol.audioSources)
 
 
+        __slots__ = ('master', 'monitor', 'numSources', 'sources')
+
         def __init__(self): # AudioMixer.Levels
             self.master = AudioMixer.Levels.Master()
             self.monitor: int = 0
@@ -81,11 +99,15 @@ class AudioMixer():
 
 
     class Master():
+        __slots__ = ('volume',)
+
         def __init__(self): # AudioMixer.Master
             self.volume: float = 0
 
 
     class Monitor():
+        __slots__ = ('dim', 'monitorAudio', 'mute', 'solo', 'soloInput', 'volume')
+
         def __init__(self): # AudioMixer.Monitor
             self.dim: bool = False
             self.monitorAudio: bool = False
@@ -97,20 +119,28 @@ class AudioMixer():
 
     class Tally():
         class Source():
+            __slots__ = ('isMixedIn',)
+
             def __init__(self): # AudioMixer.Tally.Source
                 self.isMixedIn: bool = False
 
 
         class SourceList(ATEMValueDict[Source]):
+            __slots__ = ()
+
             def __init__(self): # AudioMixer.Tally.SourceList
                 super().__init__(AudioMixer.Tally.Source, ATEMProtocol.audioSources)
 
 
+        __slots__ = ('numSources', 'sources')
+
         def __init__(self): # AudioMixer.Tally
             self.numSources: int = 0
             self.sources: AudioMixer.Tally.SourceList = AudioMixer.Tally.SourceList()
 
 
+    __slots__ = ('config', 'input', 'levels', 'master', 'monitor', 'tally')
+
     def __init__(self): # AudioMixer
         self.config = AudioMixer.Config()
         self.input: AudioMixer.InputList = AudioMixer.InputList()
@@ -13,10 +13,14 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 
 
 class AuxSource():
+    __slots__ = ('input',)
+
     def __init__(self):
         self.input: ATEMConstant = ATEMConstant()
 
 
 class AuxSourceList(ATEMValueDict[AuxSource]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(AuxSource, ATEMProtocol.auxChannels)
@@ -13,6 +13,8 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 class CameraControl():
 
     class Gain():
+        __slots__ = ('value', 'b', 'g', 'r', 'y')
+
         def __init__(self): # CameraControl.Gain
             self.value: int = 0
             self.b: float = 0.0
@@ -22,6 +24,8 @@ class CameraControl():
 
 
     class Gamma():
+        __slots__ = ('b', 'g', 'r', 'y')
+
         def __init__(self): # CameraControl.Gamma
             self.b: float = 0.0
             self.g: float = 0.0
@@ -30,6 +34,8 @@ class CameraControl():
 
 
     class Lift():
+        __slots__ = ('b', 'g', 'r', 'y')
+
         def __init__(self): # CameraControl.Lift
             self.b: float = 0.0
             self.g: float = 0.0
@@ -38,11 +44,16 @@ class CameraControl():
 
 
     class Zoom():
+        __slots__ = ('normalized', 'speed')
+
         def __init__(self): # CameraControl.Zoom
             self.normalized: float = 0.0
             self.speed: float = 0.0
 
 
+    __slots__ = ('colorbars', 'contrast', 'focus', 'gain', 'gamma', 'hue', 'iris', 'lift', 'lumMix', 'saturation',
+                 'sharpeningLevel', 'shutter', 'whiteBalance', 'zoom')
+
     def __init__(self): # CameraControl
         self.colorbars: int = 0
         self.contrast: int = 0
@@ -61,5 +72,7 @@ class CameraControl():
 
 
 class CameraControlList(ATEMValueDict[CameraControl]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(CameraControl, ATEMProtocol.cameras)
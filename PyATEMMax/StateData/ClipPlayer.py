@@ -12,6 +12,8 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 
 
 class ClipPlayer():
+    __slots__ = ('atBeginning', 'clipFrame', 'loop', 'playing')
+
     def __init__(self):
         self.atBeginning: bool = False
         self.clipFrame: int = 0
@@ -20,5 +22,7 @@ class ClipPlayer():
 
 
 class ClipPlayerList(ATEMValueDict[ClipPlayer]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(ClipPlayer, ATEMProtocol.mediaPlayers)
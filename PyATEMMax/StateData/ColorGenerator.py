@@ -12,6 +12,8 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 
 
 class ColorGenerator():
+    __slots__ = ('hue', 'luma', 'saturation')
+
     def __init__(self):
         self.hue: float = 0.0
         self.luma: float = 0.0
@@ -19,5 +21,7 @@ class ColorGenerator():
 
 
 class ColorGeneratorList(ATEMValueDict[ColorGenerator]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(ColorGenerator, ATEMProtocol.colorGenerators)
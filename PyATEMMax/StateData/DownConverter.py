@@ -11,5 +11,7 @@ from PyATEMMax.ATEMConstant import ATEMConstant
 
 
 class DownConverter():
+    __slots__ = ('mode',)
+
     def __init__(self): # DownConverter
         self.mode:ATEMConstant = ATEMConstant()
@@ -13,6 +13,10 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 
 
 class DownStreamKeyer():
+    __slots__ = ('bottom', 'clip', 'fillSource', 'framesRemaining', 'gain', 'inTransition', 'invertKey',
+                 'isAutoTransitioning', 'keySource', 'left', 'masked', 'onAir', 'preMultiplied', 'rate', 'right', 'tie',
+                 'top')
+
     def __init__(self):
         self.bottom: float = 0.0
         self.clip: float = 0.0
@@ -34,5 +38,7 @@ class DownStreamKeyer():
 
 
 class DownStreamKeyerList(ATEMValueDict[DownStreamKeyer]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(DownStreamKeyer, ATEMProtocol.dsks)
@@ -14,16 +14,22 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 class FadeToBlack():
 
     class State():
+        __slots__ = ('framesRemaining', 'fullyBlack', 'inTransition')
+
         def __init__(self):
             self.framesRemaining: int = 0
             self.fullyBlack: bool = False
             self.inTransition: bool = False
 
+    __slots__ = ('rate', 'state')
+
     def __init__(self):
         self.rate: int = 0
         self.state: FadeToBlack.State = FadeToBlack.State()
 
 
 class FadeToBlackList(ATEMValueDict[FadeToBlack]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(FadeToBlack, ATEMProtocol.mixEffects)
@@ -14,6 +14,8 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 
 class InputProperties():
     class ExternalPortTypes():
+        __slots__ = ('sdi', 'hdmi', 'component', 'composite', 'sVideo')
+
         def __init__(self): # InputProperties.ExternalPortTypes
             self.sdi: bool = False
             self.hdmi: bool = False
@@ -23,6 +25,8 @@ class InputProperties():
 
 
     class Availability():
+        __slots__ = ('auxiliary', 'multiviewer', 'superSourceArt', 'superSourceBox', 'keySourcesEverywhere')
+
         def __init__(self): # InputProperties.Availability
             self.auxiliary: bool = False
             self.multiviewer: bool = False
@@ -32,11 +36,16 @@ class InputProperties():
 
 
     class MEAvailability():
+        __slots__ = ('mE1FillSources', 'mE2FillSources')
+
         def __init__(self): # InputProperties.MEAvailability
             self.mE1FillSources: bool = False
             self.mE2FillSources: bool = False
 
 
+    __slots__ = ('availability', 'availableExternalPortTypes', 'externalPortType', 'longName', 'mEAvailability',
+                 'portType', 'shortName')
+
     def __init__(self): # InputProperties
         self.availability: InputProperties.Availability = InputProperties.Availability()
         self.availableExternalPortTypes: InputProperties.ExternalPortTypes = InputProperties.ExternalPortTypes()
@@ -48,5 +57,7 @@ class InputProperties():
 
 
 class InputPropertiesList(ATEMValueDict[InputProperties]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(InputProperties, ATEMProtocol.videoSources)
@@ -14,6 +14,8 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 class Key():
 
     class Luma():
+        __slots__ = ('clip', 'gain', 'invertKey', 'preMultiplied')
+
         def __init__(self): # Key.Luma
             self.clip: float = 0.0
             self.gain: float = 0.0
@@ -22,11 +24,15 @@ class Key():
 
     class Pattern():
         class Position(): # Key.Pattern.Position
+            __slots__ = ('x', 'y')
+
             def __init__(self):
                 self.x: float = 0.0
                 self.y: float = 0.0
 
 
+        __slots__ = ('invertPattern', 'pattern', 'position', 'size', 'softness', 'symmetry')
+
         def __init__(self): # Key.Pattern
             self.invertPattern: bool = False
             self.pattern: ATEMConstant = ATEMConstant()
@@ -39,6 +45,8 @@ class Key():
     class DVE():
         class Border():
             class Bevel():
+                __slots__ = ('type', 'position', 'softness')
+
                 def __init__(self): # Key.DVE.Border.Bevel
                     self.type: ATEMConstant = ATEMConstant()
                     self.position: float = 0.0
@@ -46,17 +54,23 @@ class Key():
 
 
             class Inner():
+                __slots__ = ('softness', 'width')
+
                 def __init__(self): # Key.DVE.Border.Inner
                     self.softness: int = 0
                     self.width: float = 0.0
 
 
             class Outer():
+                __slots__ = ('softness', 'width')
+
                 def __init__(self): # Key.DVE.Border.Outer
                     self.softness: int = 0
                     self.width: float = 0.0
 
 
+            __slots__ = ('enabled', 'hue', 'luma', 'opacity', 'saturation', 'bevel', 'inner', 'outer')
+
             def __init__(self): # Key.DVE.Border
                 self.enabled: bool = False
                 self.hue: float = 0.0
@@ -69,23 +83,32 @@ class Key():
 
 
         class LightSource():
+            __slots__ = ('altitude', 'direction')
+
             def __init__(self): # Key.DVE.LightSource
                 self.altitude: int = 0
                 self.direction: float = 0.0
 
 
         class Position():
+            __slots__ = ('x', 'y')
+
             def __init__(self): # Key.DVE.Position
                 self.x: float = 0.0
                 self.y: float = 0.0
 
 
         class Size():
+            __slots__ = ('x', 'y')
+
             def __init__(self): # Key.DVE.Size
                 self.x: float = 0.0
                 self.y: float = 0.0
 
 
+        __slots__ = ('border', 'bottom', 'left', 'lightSource', 'masked', 'position', 'rate', 'right', 'rotation',
+                     'shadow', 'size', 'top')
+
         def __init__(self): # Key.DVE
             self.border:Key.DVE.Border = Key.DVE.Border()
             self.bottom: float = 0.0
@@ -102,6 +125,8 @@ class Key():
 
 
     class Chroma():
+        __slots__ = ('gain', 'hue', 'lift', 'narrow', 'ySuppress')
+
         def __init__(self): # Key.Chroma
             self.gain: float = 0.0
             self.hue: float = 0.0
@@ -110,6 +135,8 @@ class Key():
             self.ySuppress: float = 0.0
 
 
+    __slots__ = ('chroma', 'dVE', 'luma', 'pattern')
+
     def __init__(self): # Key
         self.chroma:Key.Chroma = Key.Chroma()
         self.dVE:Key.DVE = Key.DVE()
@@ -118,10 +145,14 @@ class Key():
 
 
 class MixEffectKeyList(ATEMValueDict[Key]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(Key, ATEMProtocol.keyers)
 
 
 class KeyList(ATEMValueDict[MixEffectKeyList]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(MixEffectKeyList, ATEMProtocol.mixEffects)
@@ -17,23 +17,31 @@ class Keyer():
             class Border():
 
                 class Bevel():
+                    __slots__ = ('position', 'softness')
+
                     def __init__(self): # Keyer.Fly.KeyFrame.Border.Bevel
                         self.position: float = 0.0
                         self.softness: float = 0.0
 
 
                 class Inner():
+                    __slots__ = ('softness', 'width')
+
                     def __init__(self): # Keyer.Fly.KeyFrame.Border.Inner
                         self.softness: int = 0
                         self.width: float = 0.0
 
 
                 class Outer():
+                    __slots__ = ('softness', 'width')
+
                     def __init__(self): # Keyer.Fly.KeyFrame.Border.Outer
                         self.softness: int = 0
                         self.width: float = 0.0
 
 
+                __slots__ = ('bevel', 'hue', 'inner', 'luma', 'opacity', 'outer', 'saturation')
+
                 def __init__(self): # Keyer.Fly.KeyFrame.Border
                     self.bevel: Keyer.Fly.KeyFrame.Border.Bevel = Keyer.Fly.KeyFrame.Border.Bevel()
                     self.hue: float = 0.0
@@ -45,23 +53,31 @@ class Keyer():
 
 
             class LightSource():
+                __slots__ = ('altitude', 'direction')
+
                 def __init__(self): # Keyer.Fly.KeyFrame.LightSource
                     self.altitude: int = 0
                     self.direction: float = 0.0
 
 
             class Position():
+                __slots__ = ('x', 'y')
+
                 def __init__(self): # Keyer.Fly.KeyFrame.Position
                     self.x: float = 0.0
                     self.y: float = 0.0
 
 
             class Size():
+                __slots__ = ('x', 'y')
+
                 def __init__(self): # Keyer.Fly.KeyFrame.Size
                     self.x: float = 0.0
                     self.y: float = 0.0
 
 
+            __slots__ = ('border', 'bottom', 'left', 'lightSource', 'position', 'right', 'rotation', 'size', 'top')
+
             def __init__(self): # Keyer.Fly.KeyFrame
                 self.border: Keyer.Fly.KeyFrame.Border = Keyer.Fly.KeyFrame.Border()
                 self.bottom: float = 0.0
@@ -75,11 +91,15 @@ class Keyer():
 
 
         class KeyFrameList(ATEMValueDict[KeyFrame]):
+            __slots__ = ()
+
             def __init__(self): # Keyer.Fly.KeyFrameList
                 super().__init__(Keyer.Fly.KeyFrame, ATEMProtocol.keyFrames)
 
 
         class IsAtKeyFrame():
+            __slots__ = ('a', 'b', 'full', 'runToInfinite')
+
             def __init__(self): # Keyer.Fly.IsAtKeyFrame
                 self.a:bool = False
                 self.b:bool = False
@@ -87,6 +107,8 @@ class Keyer():
                 self.runToInfinite:bool = False
 
 
+        __slots__ = ('enabled', 'isASet', 'isAtKeyFrame', 'isBSet', 'keyFrame', 'runtoInfiniteindex')
+
         def __init__(self): # Keyer.Fly
             self.enabled: bool = False
             self.isASet: bool = False
@@ -96,10 +118,14 @@ class Keyer():
             self.runtoInfiniteindex: int = 0
 
     class OnAir():
+        __slots__ = ('enabled',)
+
         def __init__(self): # Keyer.OnAir
             self.enabled: bool = False
 
 
+    __slots__ = ('bottom', 'fillSource', 'fly', 'keySource', 'left', 'masked', 'onAir', 'right', 'top', 'type')
+
     def __init__(self): # Keyer
         self.bottom: float = 0.0
         self.fillSource: ATEMConstant = ATEMConstant()
@@ -114,10 +140,14 @@ class Keyer():
 
 
 class MixEffectKeyerList(ATEMValueDict[Keyer]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(Keyer, ATEMProtocol.keyers)
 
 
 class KeyerList(ATEMValueDict[MixEffectKeyerList]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(MixEffectKeyerList, ATEMProtocol.mixEffects)
@@ -11,6 +11,8 @@ Part of the PyATEMMax library.
 class LastStateChange():
 
     class TimeCode():
+        __slots__ = ('hour', 'minute', 'second', 'frame')
+
         def __init__(self): # LastStateChange.TimeCode
             self.hour: int = 0
             self.minute: int = 0
@@ -23,5 +25,7 @@ class LastStateChange():
         def __format__(self, format_spec: str) -> str:
             return format(str(self), format_spec)
 
+    __slots__ = ('timeCode',)
+
     def __init__(self): # LastStateChange
         self.timeCode: LastStateChange.TimeCode = LastStateChange.TimeCode()
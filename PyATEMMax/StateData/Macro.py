@@ -14,10 +14,14 @@ class Macro():
 
     class RunStatus():
         class State():
+            __slots__ = ('running', 'waiting')
+
             def __init__(self): # Macro.RunStatus.State
                 self.running: bool = False
                 self.waiting: bool = False
 
+        __slots__ = ('index', 'isLooping', 'state')
+
         def __init__(self): # Macro.RunStatus
             self.index: int = 0
             self.isLooping: bool = False
@@ -25,27 +29,37 @@ class Macro():
 
 
     class RecordingStatus():
+        __slots__ = ('index', 'isRecording')
+
         def __init__(self): # Macro.RecordingStatus
             self.index: int = 0
             self.isRecording: bool = False
 
 
     class Properties():
+        __slots__ = ('isUsed', 'name')
+
         def __init__(self): # Macro.Properties
             self.isUsed: bool = False
             self.name: str = ""
 
 
     class PropertiesList(ATEMValueDict[Properties]):
+        __slots__ = ()
+
         def __init__(self): # Macro.PropertiesList
             super().__init__(Macro.Properties, ATEMProtocol.macros)
 
 
     class Pool():
+        __slots__ = ('banks',)
+
         def __init__(self): # Macro.Pool
             self.banks: int = 0
 
 
+    __slots__ = ('properties', 'pool', 'recordingStatus', 'runStatus')
+
     def __init__(self): # Macro
         self.properties: Macro.PropertiesList = Macro.PropertiesList()
         self.pool: Macro.Pool = Macro.Pool()
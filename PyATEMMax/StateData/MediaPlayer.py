@@ -15,17 +15,23 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 class MediaPlayer():
 
     class StillFile():
+        __slots__ = ('fileName', 'isUsed')
+
         def __init__(self):
             self.fileName: str = ""
             self.isUsed: bool = False
 
 
     class StillFileList(ATEMValueDict[StillFile]):
+        __slots__ = ()
+
         def __init__(self):
             super().__init__(MediaPlayer.StillFile, ATEMProtocol.stillBanks)
 
 
     class Source():
+        __slots__ = ('clipIndex', 'stillIndex', 'type')
+
         def __init__(self):
             self.clipIndex: int = 0
             self.stillIndex: int = 0
@@ -33,11 +39,15 @@ class MediaPlayer():
 
 
     class SourceList(ATEMValueDict[Source]):
+        __slots__ = ()
+
         def __init__(self):
             super().__init__(MediaPlayer.Source, ATEMProtocol.mediaPlayers)
 
 
     class ClipSource():
+        __slots__ = ('fileName', 'frames', 'isUsed')
+
         def __init__(self):
             self.fileName: str = ""
             self.frames: int = 0
@@ -45,21 +55,29 @@ class MediaPlayer():
 
 
     class ClipSourceList(ATEMValueDict[ClipSource]):
+        __slots__ = ()
+
         def __init__(self):
             super().__init__(MediaPlayer.ClipSource, ATEMProtocol.clipBanks)
 
 
     class AudioSource():
+        __slots__ = ('fileName', 'isUsed')
+
         def __init__(self):
             self.fileName: str = ""
             self.isUsed: bool = False
 
 
     class AudioSourceList(ATEMValueDict[AudioSource]):
+        __slots__ = ()
+
         def __init__(self):
             super().__init__(MediaPlayer.AudioSource, ATEMProtocol.clipBanks)
 
 
+    __slots__ = ('clipBanks', 'stillBanks', 'audioSource', 'clipSource', 'source', 'stillFile')
+
     def __init__(self): # MediaPlayer
         self.clipBanks: int = 0
         self.stillBanks: int = 0
@@ -9,6 +9,8 @@ Part of the PyATEMMax library.
 
 
 class MediaPoolStorage():
+    __slots__ = ('clip1MaxLength', 'clip2MaxLength')
+
     def __init__(self):
         self.clip1MaxLength: int = 0
         self.clip2MaxLength: int = 0
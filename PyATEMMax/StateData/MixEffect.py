@@ -14,12 +14,18 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 class MixEffect():
 
     class Config():
+        __slots__ = ('keyers',)
+
         def __init__(self): # MixEffect.Config
             self.keyers: int = 0
 
     class ConfigList(ATEMValueDict[Config]):
+        __slots__ = ()
+
         def __init__(self): # MixEffect.ConfigList
             super().__init__(MixEffect.Config, ATEMProtocol.mixEffects)
 
+    __slots__ = ('config',)
+
     def __init__(self): # MixEffect
         self.config: MixEffect.ConfigList = MixEffect.ConfigList()
@@ -14,35 +14,49 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 class MultiViewer():
 
     class Properties():
+        __slots__ = ('layout',)
+
         def __init__(self): # MultiViewer.Properties
             self.layout: ATEMConstant = ATEMConstant()
 
 
     class PropertiesList(ATEMValueDict[Properties]):
+        __slots__ = ()
+
         def __init__(self): # MultiViewer.PropertiesList
             super().__init__(MultiViewer.Properties, ATEMProtocol.multiViewers)
 
 
     class InputWindow():
+        __slots__ = ('videoSource',)
+
         def __init__(self): # MultiViewer.InputWindow
             self.videoSource: ATEMConstant = ATEMConstant()
 
 
     class InputWindowList(ATEMValueDict[InputWindow]):
+        __slots__ = ()
+
         def __init__(self): # MultiViewer.InputWindowList
             super().__init__(MultiViewer.InputWindow, ATEMProtocol.windows)
 
 
     class InputList(ATEMValueDict[InputWindowList]):
+        __slots__ = ()
+
         def __init__(self): # MultiViewer.InputList
             super().__init__(MultiViewer.InputWindowList, ATEMProtocol.multiViewers)
 
 
     class Config():
+        __slots__ = ('multiViewers',)
+
         def __init__(self): # MultiViewer.Config
             self.multiViewers: int = 0
 
 
+    __slots__ = ('config', 'input', 'properties')
+
     def __init__(self): # MultiViewer
         self.config: MultiViewer.Config = MultiViewer.Config()
         self.input: MultiViewer.InputList = MultiViewer.InputList()
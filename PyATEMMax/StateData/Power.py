@@ -10,10 +10,14 @@ Part of the PyATEMMax library.
 
 class Power():
     class Status():
+        __slots__ = ('main', 'backup')
+
         def __init__(self): # Power.Status
             self.main: bool = False
             self.backup: bool = False
 
 
+    __slots__ = ('status',)
+
     def __init__(self): # Power
         self.status:Power.Status = Power.Status()
@@ -13,9 +13,13 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 
 
 class PreviewInput():
+    __slots__ = ('videoSource',)
+
     def __init__(self):
         self.videoSource: ATEMConstant = ATEMConstant()
 
 class PreviewInputList(ATEMValueDict[PreviewInput]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(PreviewInput, ATEMProtocol.mixEffects)
@@ -13,9 +13,13 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 
 
 class ProgramInput():
+    __slots__ = ('videoSource',)
+
     def __init__(self):
         self.videoSource: ATEMConstant = ATEMConstant()
 
 class ProgramInputList(ATEMValueDict[ProgramInput]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(ProgramInput, ATEMProtocol.mixEffects)
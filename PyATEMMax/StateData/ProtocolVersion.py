@@ -9,6 +9,8 @@ Part of the PyATEMMax library.
 
 
 class ProtocolVersion():
+    __slots__ = ('major', 'minor')
+
     def __init__(self):
         self.major: int = 0
         self.minor: int = 0
@@ -19,6 +19,8 @@ class SuperSource():
     class BoxParameters():
 
         class Crop():
+            __slots__ = ('bottom', 'left', 'right', 'top')
+
             def __init__(self): # SuperSource.BoxParameters.Crop
                 self.bottom: float = 0.0
                 self.left: float = 0.0
@@ -27,11 +29,15 @@ class SuperSource():
 
 
         class Position():
+            __slots__ = ('x', 'y')
+
             def __init__(self): # SuperSource.BoxParameters.Position
                 self.x: float = 0.0
                 self.y: float = 0.0
 
 
+        __slots__ = ('crop', 'cropped', 'enabled', 'inputSource', 'position', 'size')
+
         def __init__(self): # SuperSource.BoxParameters
             self.crop: SuperSource.BoxParameters.Crop = SuperSource.BoxParameters.Crop()
             self.cropped: bool = False
@@ -42,12 +48,16 @@ class SuperSource():
 
 
     class BoxParametersList(ATEMValueDict[BoxParameters]):
+        __slots__ = ()
+
         def __init__(self): # SuperSource.BoxParametersList
             super().__init__(SuperSource.BoxParameters, ATEMProtocol.boxes)
 
 
     class Border():
         class Bevel():
+            __slots__ = ('value', 'position', 'softness')
+
             def __init__(self): # SuperSource.Border.Bevel
                 self.value: ATEMConstant = ATEMConstant()
                 self.position: float = 0.0
@@ -55,17 +65,23 @@ class SuperSource():
 
 
         class Inner():
+            __slots__ = ('softness', 'width')
+
             def __init__(self): # SuperSource.Border.Inner
                 self.softness: int = 0
                 self.width: float = 0.0
 
 
         class Outer():
+            __slots__ = ('softness', 'width')
+
             def __init__(self): # SuperSource.Border.Outer
                 self.softness: int = 0
                 self.width: float = 0.0
 
 
+        __slots__ = ('enabled', 'hue', 'luma', 'saturation', 'bevel', 'inner', 'outer')
+
         def __init__(self): # SuperSource.Border
             self.enabled: bool = False
             self.hue: float = 0.0
@@ -77,16 +93,23 @@ class SuperSource():
 
 
     class LightSource():
+        __slots__ = ('altitude', 'direction')
+
         def __init__(self): # SuperSource.LightSource
             self.altitude: int = 0
             self.direction: float = 0.0
 
 
     class Config():
+        __slots__ = ('boxes',)
+
         def __init__(self): # SuperSource.Config
             self.boxes: int = 0
 
 
+    __slots__ = ('border', 'clip', 'config', 'boxParameters', 'fillSource', 'foreground', 'gain', 'invertKey',
+                 'keySource', 'lightSource', 'preMultiplied')
+
     def __init__(self): # SuperSource
         self.border:SuperSource.Border = SuperSource.Border()
         self.clip: float = 0.0
@@ -7,19 +7,74 @@ Part of the PyATEMMax library.
 
 # pylint: disable=missing-class-docstring
 
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import struct
 
 from PyATEMMax.ATEMConstant import ATEMConstant
+from PyATEMMax.ATEMException import ATEMException
 from PyATEMMax.ATEMProtocol import ATEMProtocol
 from PyATEMMax.ATEMValueDict import ATEMValueDict
 
+# Tally flag bits (as received in TlIn/TlSr)
+PROGRAM_BIT = 0x01
+PREVIEW_BIT = 0x02
+
+# Position of each video source in the bySource tally bitmap
+_SOURCE_POSITIONS: Dict[int, int] = {}
+for _constant in ATEMProtocol.videoSources:
+    _SOURCE_POSITIONS.setdefault(_constant.value, len(_SOURCE_POSITIONS))
+
+_TLSR_ENTRY = struct.Struct('!HB')  # Video source, tally flags
+
+
+def _getChangedIndexes(old: Union[bytes, bytearray], new: Union[bytes, memoryview]) -> List[int]:
+    """Get the indexes of the bytes that differ between two bitmaps of the same size (XOR)"""
+
+    diff = int.from_bytes(old, 'little') ^ int.from_bytes(new, 'little')
+    indexes: List[int] = []
+    base = 0
+    while diff:
+        index = ((diff & -diff).bit_length() - 1) >> 3
+        indexes.append(base + index)
+        diff >>= (index + 1) << 3
+        base += index + 1
+
+    return indexes
+
 
 class Tally():
 
     class Flags():
-        def __init__(self): # Tally.Flags
-            self.program: bool = False
-            self.preview: bool = False
+        """Tally flags of a source: a view of its byte in a tally bitmap"""
+
+        __slots__ = ('_bits', '_index')
+
+        def __init__(self, bits: Optional[bytearray] =None, index: int =0): # Tally.Flags
+            self._bits: bytearray = bits if bits is not None else bytearray(1)
+            self._index: int = index
+
+        @property
+        def program(self) -> bool:
+            return bool(self._bits[self._index] & PROGRAM_BIT)
+
+        @program.setter
+        def program(self, value: bool) -> None:
+            self._setBit(PROGRAM_BIT, value)
+
+        @property
+        def preview(self) -> bool:
+            return bool(self._bits[self._index] & PREVIEW_BIT)
+
+        @preview.setter
+        def preview(self, value: bool) -> None:
+            self._setBit(PREVIEW_BIT, value)
+
+        def _setBit(self, bit: int, value: bool) -> None:
+            if value:
+                self._bits[self._index] |= bit
+            else:
+                self._bits[self._index] &= ~bit & 0xFF
 
         def __str__(self):
             if not self.program and not self.preview:
@@ -31,34 +86,147 @@ class Tally():
             return format(str(self), format_spec)
 
 
+    class FlagsList():
+        """Tally flags by index (views of the byIndex bitmap)"""
+
+        __slots__ = ('_bits',)
+
+        def __init__(self, bits: bytearray): # Tally.FlagsList
+            self._bits: bytearray = bits
+
+        def __len__(self) -> int:
+            return len(self._bits)
+
+        def __getitem__(self, index: Any) -> Any:
+            if isinstance(index, slice):
+                return [ Tally.Flags(self._bits, i) for i in range(*index.indices(len(self._bits))) ]
+
+            if index < 0:
+                index += len(self._bits)
+            if not 0 <= index < len(self._bits):
+                raise IndexError("tally index out of range")
+
+            return Tally.Flags(self._bits, index)
+
+        def __iter__(self) -> Iterator['Tally.Flags']:
+            return iter(self[:])
+
+
     class FlagsDict(ATEMValueDict[Flags]):
-        def __init__(self): # Tally.FlagsDict
+        """Tally flags by video source (views of the bySource bitmap)"""
+
+        __slots__ = ('_bits',)
+
+        def __init__(self, bits: bytearray): # Tally.FlagsDict
             super().__init__(Tally.Flags, ATEMProtocol.videoSources)
+            self._bits: bytearray = bits
+
+        def _createItem(self, key: ATEMConstant) -> 'Tally.Flags':
+            return Tally.Flags(self._bits, _SOURCE_POSITIONS[key.value])
 
 
     class ByIndex():
+        __slots__ = ('sources', 'bits', 'flags')
+
         def __init__(self): # Tally.ByIndex
             self.sources: int = 0
-            # WARNING: This is a list "by index", we cannot use an ATEMValueDict here...
-            self.flags: List[Tally.Flags] = [Tally.Flags() for _ in range(len(ATEMProtocol.videoSources))]
+            # Tally flags by index: one byte per index (PROGRAM_BIT, PREVIEW_BIT)
+            self.bits: bytearray = bytearray(len(ATEMProtocol.videoSources))
+            self.flags: Tally.FlagsList = Tally.FlagsList(self.bits)
+
+        def update(self, bits: memoryview) -> List[Tuple[int, int, int]]:
+            """Update the tally flags with a TlIn payload
+
+            Args:
+                bits (memoryview): tally flags by index (one byte per index)
+
+            Returns:
+                Changed indexes: (index, old flags, new flags)
+            """
+
+            bits = bits[:len(self.bits)]
+            count = len(bits)
+            old = bytes(self.bits[:count])
+            if old == bits:
+                return []
+
+            self.bits[:count] = bits
+            return [ (index, old[index], bits[index]) for index in _getChangedIndexes(old, bits) ]
 
 
     class SourceDict(ATEMValueDict[ATEMConstant]):
+        __slots__ = ()
+
         def __init__(self): # Tally.SourceDict
             super().__init__(ATEMConstant, ATEMProtocol.videoSources)
 
 
     class BySource():
+        __slots__ = ('sources', 'flags', '_bits', '_layout', '_videoSources', '_positions', '_lastFlags')
+
         def __init__(self): # Tally.BySource
             self.sources: int = 0
-            self.flags: Tally.FlagsDict = Tally.FlagsDict()
+            # Tally flags by video source: one byte per video source (PROGRAM_BIT, PREVIEW_BIT)
+            self._bits: bytearray = bytearray(len(_SOURCE_POSITIONS))
+            self.flags: Tally.FlagsDict = Tally.FlagsDict(self._bits)
+
+            # Last TlSr payload: video sources (flags cleared), video sources and their bitmap positions, flags
+            self._layout: bytes = b""
+            self._videoSources: List[int] = []
+            self._positions: List[int] = []
+            self._lastFlags: bytes = b""
+
+        def update(self, entries: memoryview) -> List[Tuple[int, int, int]]:
+            """Update the tally flags with a TlSr payload
+
+            The video source list is only decoded when it changes, then the
+            flags are compared with the previous ones (in payload order).
+
+            Args:
+                entries (memoryview): (video source, tally flags) entries
+
+            Returns:
+                Changed video sources: (video source, old flags, new flags)
+            """
+
+            data = bytes(entries)
+            flags = data[2::3]
+
+            layout = bytearray(data)
+            layout[2::3] = bytes(len(flags))
+            if layout != self._layout:
+                videoSources = [ videoSource for videoSource, _ in _TLSR_ENTRY.iter_unpack(data) ]
+                for videoSource in videoSources:
+                    if videoSource not in _SOURCE_POSITIONS:
+                        raise ATEMException(f"UNKNOWN {ATEMProtocol.videoSources.__class__.__name__} {videoSource}")
+
+                self._layout = bytes(layout)
+                self._videoSources = videoSources
+                self._positions = [ _SOURCE_POSITIONS[videoSource] for videoSource in videoSources ]
+                self._lastFlags = bytes(self._bits[position] for position in self._positions)
+
+            if flags == self._lastFlags:
+                return []
+
+            changes: List[Tuple[int, int, int]] = []
+            for index in _getChangedIndexes(self._lastFlags, flags):
+                position = self._positions[index]
+                changes.append((self._videoSources[index], self._bits[position], flags[index]))
+                self._bits[position] = flags[index]
+
+            self._lastFlags = flags
+            return changes
 
 
     class ChannelConfig():
+        __slots__ = ('tallyChannels',)
+
         def __init__(self): # Tally.ChannelConfig
             self.tallyChannels: int = 0
 
 
+    __slots__ = ('byIndex', 'bySource', 'channelConfig')
+
     def __init__(self): # Tally
         self.byIndex: Tally.ByIndex = Tally.ByIndex()
         self.bySource: Tally.BySource = Tally.BySource()
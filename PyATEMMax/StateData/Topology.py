@@ -9,6 +9,9 @@ Part of the PyATEMMax library.
 
 
 class Topology():
+    __slots__ = ('auxBusses', 'colorGenerators', 'downstreamKeyers', 'dVEs', 'hasSDOutput', 'mEs', 'sources',
+                 'stingers', 'superSources')
+
     def __init__(self): # Topology
         self.auxBusses: int = 0
         self.colorGenerators: int = 0
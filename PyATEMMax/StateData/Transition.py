@@ -13,12 +13,17 @@ from PyATEMMax.ATEMValueDict import ATEMValueDict
 
 class Transition():
     class Dip():
+        __slots__ = ('input', 'rate')
+
         def __init__(self): # Transition.Dip
             self.input: ATEMConstant = ATEMConstant()
             self.rate: int = 0
 
 
     class DVE():
+        __slots__ = ('clip', 'enableKey', 'fillSource', 'flipFlop', 'gain', 'invertKey', 'keySource', 'preMultiplied',
+                     'rate', 'reverse', 'style')
+
         def __init__(self): # Transition.DVE
             self.clip: float = 0.0
             self.enableKey: bool = False
@@ -34,16 +39,23 @@ class Transition():
 
 
     class Mix():
+        __slots__ = ('rate',)
+
         def __init__(self): # Transition.Mix
             self.rate: int = 0
 
 
     class Preview():
+        __slots__ = ('enabled',)
+
         def __init__(self): # Transition.Preview
             self.enabled: bool = False
 
 
     class Stinger():
+        __slots__ = ('clip', 'clipDuration', 'gain', 'invertKey', 'mixRate', 'preMultiplied', 'preRoll', 'source',
+                     'triggerPoint')
+
         def __init__(self): # Transition.Stinger
             self.clip: float = 0.0
             self.clipDuration: int = 0
@@ -58,11 +70,15 @@ class Transition():
 
     class Wipe():
         class Position():
+            __slots__ = ('x', 'y')
+
             def __init__(self): # Transition.Wipe.Position
                 self.x: float = 0.0
                 self.y: float = 0.0
 
 
+        __slots__ = ('fillSource', 'flipFlop', 'pattern', 'position', 'rate', 'reverse', 'softness', 'symmetry', 'width')
+
         def __init__(self): # Transition.Wipe
             self.fillSource: ATEMConstant = ATEMConstant()
             self.flipFlop: bool = False
@@ -76,6 +92,8 @@ class Transition():
 
 
     class Next():
+        __slots__ = ('background', 'key1', 'key2', 'key3', 'key4')
+
         def __init__(self): # Transition.Next
             self.background: bool = False
             self.key1: bool = False
@@ -85,6 +103,9 @@ class Transition():
 
 
 
+    __slots__ = ('dip', 'dVE', 'framesRemaining', 'mix', 'preview', 'stinger', 'wipe', 'inTransition', 'position',
+                 'style', 'nextTransition', 'styleNext', 'nextTransitionNext')
+
     def __init__(self): # Transition
         self.dip: Transition.Dip = Transition.Dip()
         self.dVE: Transition.DVE = Transition.DVE()
@@ -102,5 +123,7 @@ class Transition():
 
 
 class TransitionList(ATEMValueDict[Transition]):
+    __slots__ = ()
+
     def __init__(self): # TransitionList
         super().__init__(Transition, ATEMProtocol.mixEffects)
@@ -11,6 +11,10 @@ Part of the PyATEMMax library.
 class VideoMixer():
     class Config():
         class ModeFlags():
+            __slots__ = ('f525i59_94_NTSC', 'f625i_50_PAL', 'f525i59_94_NTSC_16_9', 'f625i_50_PAL_16_9', 'f720p50',
+                         'f720p59_94', 'f1080i50', 'f1080i59_94', 'f1080p23_98', 'f1080p24', 'f1080p25', 'f1080p29_97',
+                         'f1080p50', 'f1080p59_94', 'f2160p23_98', 'f2160p24', 'f2160p25', 'f2160p29_97')
+
             def __init__(self): # VideoMixer.Config.ModeFlags
                 self.f525i59_94_NTSC: bool = False
                 self.f625i_50_PAL: bool = False
@@ -31,8 +35,12 @@ class VideoMixer():
                 self.f2160p25: bool = False
                 self.f2160p29_97: bool = False
 
+        __slots__ = ('modes',)
+
         def __init__(self): # VideoMixer.Config
             self.modes:VideoMixer.Config.ModeFlags = VideoMixer.Config.ModeFlags()
 
+    __slots__ = ('config',)
+
     def __init__(self): # VideoMixer
         self.config:VideoMixer.Config = VideoMixer.Config()
@@ -11,5 +11,7 @@ from PyATEMMax.ATEMConstant import ATEMConstant
 
 
 class VideoMode():
+    __slots__ = ('format',)
+
     def __init__(self): # VideoMode
         self.format:ATEMConstant = ATEMConstant()
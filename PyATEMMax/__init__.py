@@ -7,7 +7,12 @@ PyATEMMax: Blackmagic ATEM switcher manager library
 # pyright: reportUnusedImport=false
 
 from .ATEMMax import ATEMMax
+from .ATEMAsyncMax import ATEMAsyncMax
+from .ATEMAudioMeter import ATEMAudioMeter
+from .ATEMFleet import ATEMFleet, ATEMFleetSwitcher
+from .ATEMDiscovery import discover, ATEMDiscoveredSwitcher
 from .ATEMProtocol import ATEMProtocol
+from .ATEMStateSnapshot import ATEMStateSnapshot, ATEMStateView
 from .ATEMProtocolEnums import *
 from .ATEMException import ATEMException
 from . import StateData
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""bench-buffer.py - PyATEMMax benchmark: ATEMBuffer get/set primitives.
+   Part of the PyATEMMax library.
+
+   Times each ATEMBuffer primitive (ns per call) on a command sized buffer.
+   Run it with --lib on another checkout to compare two versions."""
+
+import importlib
+import struct
+
+from benchutils import argumentParser, bestTime, importLibrary
+
+BUFFER_SIZE = 96
+
+parser = argumentParser("ATEMBuffer get/set primitives (ns/call)")
+parser.add_argument('-n', '--number', help='calls per run (default: 100000)', type=int, default=100000)
+args = parser.parse_args()
+
+importLibrary(args.lib)
+ATEMBuffer = importlib.import_module('PyATEMMax.ATEMBuffer').ATEMBuffer
+
+buf = ATEMBuffer(BUFFER_SIZE)
+buf.setString(20, 20, "Camera 1")
+packer = struct.Struct('!HHhhB')
+
+PRIMITIVES = {
+    'getU8': lambda: buf.getU8(10),
+    'getS8': lambda: buf.getS8(10),
+    'getU16': lambda: buf.getU16(10),
+    'getS16': lambda: buf.getS16(10),
+    'getU32': lambda: buf.getU32(10),
+    'getS32': lambda: buf.getS32(10),
+    'getU64': lambda: buf.getU64(10),
+    'getU8Flag': lambda: buf.getU8Flag(10, 1),
+    'getFloat': lambda: buf.getFloat(10, True, 16, 100),
+    'getString': lambda: buf.getString(20, 20),
+    'setU8': lambda: buf.setU8(10, 5),
+    'setS8': lambda: buf.setS8(10, -5),
+    'setU16': lambda: buf.setU16(10, 500),
+    'setS16': lambda: buf.setS16(10, -500),
+    'setU32': lambda: buf.setU32(10, 50000),
+    'setS32': lambda: buf.setS32(10, -50000),
+    'setU64': lambda: buf.setU64(10, 5000000),
+    'setU8Flag': lambda: buf.setU8Flag(10, 1),
+    'setFloat': lambda: buf.setFloat(10, True, 16, 100, -1.5),
+    'setString': lambda: buf.setString(20, 20, "Camera 1"),
+    'reset': buf.reset,
+    }
+
+# Whole struct primitives (not in every version)
+if hasattr(buf, 'unpack'):
+    PRIMITIVES['unpack'] = lambda: buf.unpack(packer, 10)
+    PRIMITIVES['pack'] = lambda: buf.pack(packer, 10, 1, 2, -3, -4, 5)
+
+for name, primitive in PRIMITIVES.items():
+    print(f"{name:10s} {bestTime(primitive, args.number) * 1e9:8.0f} ns")
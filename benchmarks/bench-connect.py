@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""bench-connect.py - PyATEMMax benchmark: connect time over a lossy link.
+   Part of the PyATEMMax library.
+
+   Connects to the UDP stand-in switcher (fakeswitcher.FakeSwitcher) and
+   reports the time until the initialization payload is complete
+   (waitForConnection()), for several loss ratios of the datagrams sent
+   by the switcher. The missed initialization packets are recovered with
+   resend requests, that can be lost too.
+
+   The payload is split in small datagrams (--length) to have more of them,
+   as with a large switcher.
+
+   Then, on a connection with --delivery-loss in both directions, it checks
+   (and times) the delivery of:
+   - commands: the last of --commands program input changes reaches the
+     switcher (lost command packets are retransmitted)
+   - state: the last of --commands PrgI state packets reaches the state
+     (lost state packets are asked for again with resend requests)"""
+
+from typing import Callable, List, Optional
+
+import statistics
+import struct
+import time
+
+from benchutils import argumentParser, importLibrary
+from fakeswitcher import FakeSwitcher, command, initPayload
+
+
+def waitedStr(waited: Optional[float], failure: str) -> str:
+    """Format a waitFor() result"""
+
+    return f"{waited * 1000:.1f}ms" if waited is not None else failure
+
+
+def lastProgramInput(standIn: FakeSwitcher) -> Optional[int]:
+    """Get the video source of the last program input change (CPgI) received by the stand-in switcher"""
+
+    received = [ data for _, name, data in list(standIn.commands) if name == 'CPgI' ]
+    return struct.unpack_from('!H', received[-1], 2)[0] if received else None
+
+
+def waitFor(condition: Callable[[], bool], timeout: float) -> Optional[float]:
+    """Wait until a condition is true
+
+    Args:
+        condition (Callable[[], bool]): condition to check
+        timeout (float): max seconds to wait
+
+    Returns:
+        (Optional[float]): seconds waited (None if the condition is still false)
+    """
+
+    start = time.perf_counter()
+    while not condition():
+        if time.perf_counter() - start > timeout:
+            return None
+        time.sleep(0.001)
+    return time.perf_counter() - start
+
+
+parser = argumentParser("Connect time over a lossy link (stand-in switcher)")
+parser.add_argument('-r', '--runs', help='connections per loss ratio (default: 10)', type=int, default=10)
+parser.add_argument('--length', help='max initialization datagram length (default: 300)', type=int, default=300)
+parser.add_argument('-t', '--timeout', help='connection timeout in seconds (default: 10)', type=float, default=10.0)
+parser.add_argument('-c', '--commands', help='commands and state packets for the delivery checks (default: 50)',
+                    type=int, default=50)
+parser.add_argument('--delivery-loss', help='loss ratio for the delivery checks (default: 0.2)', type=float, default=0.2)
+parser.add_argument('--loss', help='loss ratios (default: 0 0.05 0.1 0.2 0.3)', type=float, nargs='+',
+                    default=[0.0, 0.05, 0.1, 0.2, 0.3])
+args = parser.parse_args()
+
+PyATEMMax = importLibrary(args.lib)
+
+print(f"Initialization payload: {len(initPayload(maxLength=args.length))} datagrams")
+print(f"{'loss':>6} {'median':>9} {'max':>9} {'timeouts':>9} {'resend requests':>16}")
+
+for loss in args.loss:
+    times: List[float] = []
+    timeouts = 0
+    resendRequests = 0
+    for seed in range(args.runs):
+        fakeSwitcher = FakeSwitcher(loss=loss, seed=seed, maxLength=args.length)
+        fakeSwitcher.start()
+
+        switcher = PyATEMMax.ATEMMax()
+        connectStart = time.perf_counter()
+        switcher.connect("127.0.0.1")
+        if switcher.waitForConnection(infinite=False, timeout=args.timeout):
+            times.append(time.perf_counter() - connectStart)
+        else:
+            timeouts += 1
+        switcher.disconnect()
+
+        fakeSwitcher.stop()
+        resendRequests += fakeSwitcher.resendRequests
+
+    median = f"{statistics.median(times) * 1000:7.1f}ms" if times else "-"
+    worst = f"{max(times) * 1000:7.1f}ms" if times else "-"
+    print(f"{loss:6.2f} {median:>9} {worst:>9} {timeouts:>9} {resendRequests / args.runs:16.1f}")
+
+print()
+print(f"Delivery of {args.commands} commands/state packets with {args.delivery_loss:.2f} loss")
+
+fakeSwitcher = FakeSwitcher(loss=args.delivery_loss, commandLoss=args.delivery_loss, seed=0, maxLength=args.length)
+fakeSwitcher.start()
+switcher = PyATEMMax.ATEMMax()
+switcher.connect("127.0.0.1")
+if switcher.waitForConnection(infinite=False, timeout=args.timeout):
+    lastSource = args.commands % 20 + 1
+    for i in range(1, args.commands + 1):
+        switcher.setProgramInputVideoSource(0, i % 20 + 1)
+    delay = waitFor(lambda: lastProgramInput(fakeSwitcher) == lastSource, args.timeout)
+    print(f"  commands: {waitedStr(delay, 'LAST ONE LOST')}" \
+          f" (resend requests: {fakeSwitcher.resendRequests}, out of order packets: {fakeSwitcher.outOfOrder})")
+
+    for i in range(1, args.commands + 1):
+        fakeSwitcher.send([ command('PrgI', struct.pack('!BxH', 1, i % 20 + 1)) ])
+    delay = waitFor(lambda: switcher.programInput[1].videoSource.value == lastSource, args.timeout)
+    print(f"  state:    {waitedStr(delay, 'STALE')}" \
+          f" (resend requests: {fakeSwitcher.resendRequests})")
+else:
+    print("  connection timeout")
+
+switcher.disconnect()
+fakeSwitcher.stop()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""bench-decoders.py - PyATEMMax benchmark: command decode cost.
+   Part of the PyATEMMax library.
+
+   Times the decoding of one command (us per command) with:
+   - the previous field by field handlers (one ATEMBuffer call per field,
+     reproduced here as they were in ATEMCommandHandlers)
+   - the decoders compiled from ATEMCommandLayouts (one struct unpack per command)
+
+   Command data comes from the stand-in switcher initialization payload."""
+
+# pylint: disable=protected-access
+
+from typing import Any, Callable, Dict
+
+from benchutils import argumentParser, bestTime, importLibrary
+from fakeswitcher import initCommands
+
+COMMAND_HEADER_LENGTH = 8
+
+
+# #######################################################################
+#
+#  Previous handlers (h: ATEMCommandHandlers)
+#
+
+def handleSSrc(h: Any) -> None:
+    """Previous SSrc handler"""
+
+    h._d.superSource.fillSource = h._getBufVideoSource(0)
+    h._d.superSource.keySource = h._getBufVideoSource(2)
+    h._d.superSource.foreground = h._inBuf.getU8Flag(4, 0)
+    h._d.superSource.preMultiplied = h._inBuf.getU8Flag(5, 0)
+    h._d.superSource.clip = h._inBuf.getFloat(6, False, 16, 10)
+    h._d.superSource.gain = h._inBuf.getFloat(8, False, 16, 10)
+    h._d.superSource.invertKey = h._inBuf.getU8Flag(10, 0)
+    h._d.superSource.border.enabled = h._inBuf.getU8Flag(11, 0)
+    h._d.superSource.border.bevel.value = h._getBufEnum(12, 8, h._p.borderBevels)
+    h._d.superSource.border.outer.width = h._inBuf.getFloat(14, False, 16, 100)
+    h._d.superSource.border.inner.width = h._inBuf.getFloat(16, False, 16, 100)
+    h._d.superSource.border.outer.softness = h._inBuf.getU8(18)
+    h._d.superSource.border.inner.softness = h._inBuf.getU8(19)
+    h._d.superSource.border.bevel.softness = h._inBuf.getFloat(20, False, 8, 100)
+    h._d.superSource.border.bevel.position = h._inBuf.getFloat(21, False, 8, 100)
+    h._d.superSource.border.hue = h._inBuf.getFloat(22, False, 16, 10)
+    h._d.superSource.border.saturation = h._inBuf.getFloat(24, False, 16, 10)
+    h._d.superSource.border.luma = h._inBuf.getFloat(26, False, 16, 10)
+    h._d.superSource.lightSource.direction = h._inBuf.getFloat(28, False, 16, 10)
+    h._d.superSource.lightSource.altitude = h._inBuf.getU8(30)
+
+
+def handleSSBP(h: Any) -> None:
+    """Previous SSBP handler"""
+
+    box = h._getBufEnum(1, 8, h._p.boxes)
+    currentBox = h._d.superSource.boxParameters[box]
+    currentBox.enabled = h._inBuf.getU8Flag(2, 0)
+    currentBox.inputSource = h._getBufVideoSource(4)
+    currentBox.position.x = h._inBuf.getFloat(6, True, 16, 100)
+    currentBox.position.y = h._inBuf.getFloat(8, True, 16, 100)
+    currentBox.size = h._inBuf.getFloat(10, False, 16, 1000)
+    currentBox.cropped = h._inBuf.getU8Flag(12, 0)
+    currentBox.crop.top = h._inBuf.getFloat(14, False, 16, 1000)
+    currentBox.crop.bottom = h._inBuf.getFloat(16, False, 16, 1000)
+    currentBox.crop.left = h._inBuf.getFloat(18, False, 16, 1000)
+    currentBox.crop.right = h._inBuf.getFloat(20, False, 16, 1000)
+
+
+def handleKeDV(h: Any) -> None:
+    """Previous KeDV handler"""
+
+    mE = h._getBufMixEffect(0)
+    keyer = h._getBufKeyer(1)
+    h._d.key[mE][keyer].dVE.size.x = h._inBuf.getFloat(4, False, 32, 1000)
+    h._d.key[mE][keyer].dVE.size.y = h._inBuf.getFloat(8, False, 32, 1000)
+    h._d.key[mE][keyer].dVE.position.x = h._inBuf.getFloat(12, True, 32, 1000)
+    h._d.key[mE][keyer].dVE.position.y = h._inBuf.getFloat(16, True, 32, 1000)
+    h._d.key[mE][keyer].dVE.rotation = h._inBuf.getFloat(20, False, 32, 10)
+    h._d.key[mE][keyer].dVE.border.enabled = h._inBuf.getU8Flag(24, 0)
+    h._d.key[mE][keyer].dVE.shadow = h._inBuf.getU8Flag(25, 0)
+    h._d.key[mE][keyer].dVE.border.bevel.type = h._getBufEnum(26, 8, h._p.borderBevels)
+    h._d.key[mE][keyer].dVE.border.outer.width = h._inBuf.getFloat(28, False, 16, 100)
+    h._d.key[mE][keyer].dVE.border.inner.width = h._inBuf.getFloat(30, False, 16, 100)
+    h._d.key[mE][keyer].dVE.border.outer.softness = h._inBuf.getU8(32)
+    h._d.key[mE][keyer].dVE.border.inner.softness = h._inBuf.getU8(33)
+    h._d.key[mE][keyer].dVE.border.bevel.softness = h._inBuf.getFloat(34, False, 8, 100)
+    h._d.key[mE][keyer].dVE.border.bevel.position = h._inBuf.getFloat(35, False, 8, 100)
+    h._d.key[mE][keyer].dVE.border.opacity = h._inBuf.getU8(36)
+    h._d.key[mE][keyer].dVE.border.hue = h._inBuf.getFloat(38, False, 16, 10)
+    h._d.key[mE][keyer].dVE.border.saturation = h._inBuf.getFloat(40, False, 16, 10)
+    h._d.key[mE][keyer].dVE.border.luma = h._inBuf.getFloat(42, False, 16, 10)
+    h._d.key[mE][keyer].dVE.lightSource.direction = h._inBuf.getFloat(44, False, 16, 10)
+    h._d.key[mE][keyer].dVE.lightSource.altitude = h._inBuf.getU8(46)
+    h._d.key[mE][keyer].dVE.masked = h._inBuf.getU8Flag(47, 0)
+    h._d.key[mE][keyer].dVE.top = h._inBuf.getFloat(48, True, 16, 1000)
+    h._d.key[mE][keyer].dVE.bottom = h._inBuf.getFloat(50, True, 16, 1000)
+
+    value = h._inBuf.getS16(52)
+    h._d.key[mE][keyer].dVE.left = mapValue(value, -16000, 16000, -9.0, 9.0)
+
+    value = h._inBuf.getS16(54)
+    h._d.key[mE][keyer].dVE.right = mapValue(value, -16000, 16000, -9.0, 9.0)
+
+    h._d.key[mE][keyer].dVE.rate = h._inBuf.getU8(56)
+
+
+PREVIOUS_HANDLERS: Dict[str, Callable[[Any], None]] = {
+    'SSrc': handleSSrc,
+    'SSBP': handleSSBP,
+    'KeDV': handleKeDV,
+    }
+
+
+parser = argumentParser("Command decode cost (us/command)")
+parser.add_argument('-n', '--number', help='commands per run (default: 20000)', type=int, default=20000)
+args = parser.parse_args()
+
+PyATEMMax = importLibrary(args.lib)
+mapValue = PyATEMMax.ATEMUtils.mapValue
+
+# Command data (without the command header), first command of each type
+commandData: Dict[str, bytes] = {}
+for cmd in initCommands():
+    commandData.setdefault(cmd[4:8].decode('latin-1'), cmd[COMMAND_HEADER_LENGTH:])
+
+switcher = PyATEMMax.ATEMMax()
+commandHandlers = switcher._commandHandlers
+
+for cmdStr, previousHandler in PREVIOUS_HANDLERS.items():
+    switcher._inBuf.setData(commandData[cmdStr])
+    decoder = commandHandlers._handlers[cmdStr]
+
+    decoder()   # Create the state items
+    previous = bestTime(lambda: previousHandler(commandHandlers), args.number)      # pylint: disable=cell-var-from-loop
+    compiled = bestTime(decoder, args.number)
+    print(f"{cmdStr}: previous handler {previous * 1e6:6.2f} us, layout decoder {compiled * 1e6:6.2f} us " \
+          f"(x{previous / compiled:.1f})")
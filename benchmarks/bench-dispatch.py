@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""bench-dispatch.py - PyATEMMax benchmark: command handler dispatch.
+   Part of the PyATEMMax library.
+
+   Dispatches the commands of the initialization payload (data/init-payload.bin)
+   to their handlers and reports the commands dispatched per second, with:
+   - the previous handler lookup: `"_handle" + cmdStr in dir(handlers)` per command
+     (reproduced here, as it was in ATEMCommandHandlers._getHandler())
+   - the handler table built by ATEMCommandHandlers.registerAllHandlers()
+
+   Both run the same handlers on the same (preloaded) command data, so the
+   difference is the lookup."""
+
+# pylint: disable=protected-access
+
+from typing import Any, List, Tuple
+
+import os
+import struct
+
+from benchutils import argumentParser, bestTime, importLibrary
+from fakeswitcher import HEADER_LENGTH, readPayload
+
+PAYLOAD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "init-payload.bin")
+
+COMMAND_HEADER = struct.Struct('!H2x4s')    # Command length, command string
+
+
+def payloadCommands(path: str) -> List[Tuple[str, bytes]]:
+    """Get the commands in a payload file: (command string, command data)"""
+
+    found = []
+    for datagram in readPayload(path):
+        offset = HEADER_LENGTH
+        while offset < len(datagram):
+            length, cmdStr = COMMAND_HEADER.unpack_from(datagram, offset)
+            found.append((cmdStr.decode('latin-1'), datagram[offset + COMMAND_HEADER.size:offset + length]))
+            offset += length
+    return found
+
+
+def dirLookupHandler(handlers: Any, cmdStr: str) -> None:
+    """Previous ATEMCommandHandlers._mainHandler(): handler looked up with dir() on each command"""
+
+    handlers._sw._read2InBuf()
+    handlers.cmdStr = cmdStr
+
+    funcname = f"{handlers._HANDLER_PREFIX}{cmdStr}"
+    if funcname in dir(handlers):
+        getattr(handlers, funcname)()
+    else:
+        # Handlers compiled from layouts have no method (same call as the table)
+        handlers._handlers[cmdStr]()
+
+
+parser = argumentParser("Command handler dispatch (commands/sec)")
+parser.add_argument('-n', '--number', help='payload dispatches per run (default: 50)', type=int, default=50)
+parser.add_argument('-p', '--payload', help='payload file (default: data/init-payload.bin)', default=PAYLOAD_FILE)
+args = parser.parse_args()
+
+PyATEMMax = importLibrary(args.lib)
+
+commands = payloadCommands(args.payload)
+print(f"Payload: {len(commands)} commands ({args.payload})")
+
+switcher = PyATEMMax.ATEMMax()
+switcher._cmdLength = 0     # Command data is preloaded in the input buffer
+commandHandlers = switcher._commandHandlers
+inBuf = switcher._inBuf
+
+
+def dispatchTable() -> None:
+    for cmdStr, data in commands:
+        inBuf.setData(data)
+        switcher._parseGetCommands(cmdStr)
+
+
+def dispatchDirLookup() -> None:
+    for cmdStr, data in commands:
+        inBuf.setData(data)
+        dirLookupHandler(commandHandlers, cmdStr)
+
+
+dispatchTable()     # Create the state items
+
+for name, dispatch in (("dir() lookup (previous)", dispatchDirLookup), ("handler table", dispatchTable)):
+    seconds = bestTime(dispatch, args.number)
+    print(f"{name:24s} {len(commands) / seconds:12,.0f} commands/s ({seconds / len(commands) * 1e6:6.2f} us/command)")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""bench-events.py - PyATEMMax benchmark: event dispatch latency.
+   Part of the PyATEMMax library.
+
+   Measures the time from _eventThreadEventQ.put() to the callback entry
+   (and the CPU used by an idle event thread) for:
+   - the previous design: a thread polling its queues every millisecond
+     (reproduced here, as it was in ATEMConnectionManager)
+   - the event thread of ATEMMax (a blocking queue)"""
+
+# pylint: disable=protected-access
+
+from typing import Any, Callable, Dict, List
+
+import queue
+import statistics
+import threading
+import time
+
+from benchutils import argumentParser, importLibrary
+
+THREAD_EXIT_MSG = 'exit'
+
+
+class PollingEventThread():
+    """Event thread of the previous design (polls its event and command queues)"""
+
+    def __init__(self):
+        self._eventSubscriptions: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self._eventThreadCmdQ: queue.Queue[Any] = queue.Queue()
+        self._eventThreadEventQ: queue.Queue[Any] = queue.Queue()
+        self._eventThread = threading.Thread(target=self._eventThreadHandler)
+
+    def registerEvent(self, eventName: str, callback: Callable[[Dict[str, Any]], None]) -> None:
+        self._eventSubscriptions.setdefault(eventName, []).append(callback)
+
+    def start(self) -> None:
+        self._eventThread.start()
+
+    def stop(self) -> None:
+        self._eventThreadCmdQ.put(THREAD_EXIT_MSG)
+        self._eventThread.join()
+
+    def _eventThreadHandler(self) -> None:
+        while True:
+            self._emitEvents()
+
+            try:
+                msg = self._eventThreadCmdQ.get_nowait()
+                if msg == THREAD_EXIT_MSG:
+                    self._eventThreadCmdQ.task_done()
+                    break
+            except queue.Empty:
+                pass
+
+            time.sleep(0.001)
+
+    def _emitEvents(self) -> None:
+        while not self._eventThreadEventQ.empty():
+            event = self._eventThreadEventQ.get_nowait()
+            for callback in self._eventSubscriptions.get(event['name'], []):
+                callback(event['args'])
+            self._eventThreadEventQ.task_done()
+
+
+class SwitcherEventThread():
+    """Event thread of an ATEMMax object"""
+
+    def __init__(self, switcher: Any):
+        self._switcher = switcher
+        self._eventThreadEventQ = switcher._eventThreadEventQ
+
+    def registerEvent(self, eventName: str, callback: Callable[[Dict[str, Any]], None]) -> None:
+        self._switcher.registerEvent(eventName, callback)
+
+    def start(self) -> None:
+        self._switcher._eventThread.start()
+
+    def stop(self) -> None:
+        # Older versions have a separate command queue for the thread exit request
+        exitQueue = getattr(self._switcher, '_eventThreadCmdQ', self._eventThreadEventQ)
+        exitQueue.put(THREAD_EXIT_MSG)
+        self._switcher._eventThread.join()
+
+
+def measure(eventThread: Any, events: int, interval: float, idleTime: float) -> None:
+    """Measure the put() -> callback latency and the idle CPU time of an event thread"""
+
+    latencies: List[float] = []
+    eventThread.registerEvent('bench', lambda args: latencies.append(time.perf_counter() - args['sent']))
+    eventThread.start()
+
+    # Idle thread
+    cpuStart = time.process_time()
+    time.sleep(idleTime)
+    idleCpu = (time.process_time() - cpuStart) / idleTime
+
+    for _ in range(events):
+        eventThread._eventThreadEventQ.put({'name': 'bench', 'args': {'sent': time.perf_counter()}, 'key': None})
+        time.sleep(interval)
+
+    time.sleep(0.1)
+    eventThread.stop()
+
+    latencies.sort()
+    print(f"  put() -> callback: median {statistics.median(latencies) * 1e6:7.1f} us, " \
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:7.1f} us, max {latencies[-1] * 1e6:7.1f} us " \
+          f"({len(latencies)}/{events} events)")
+    print(f"  idle thread CPU: {idleCpu * 100:.1f}%")
+
+
+parser = argumentParser("Event dispatch latency (put() to callback)")
+parser.add_argument('-n', '--events', help='number of events (default: 1000)', type=int, default=1000)
+parser.add_argument('-i', '--interval', help='seconds between events (default: 0.002)', type=float, default=0.002)
+parser.add_argument('-t', '--idle', help='seconds measuring the idle thread CPU (default: 2)', type=float, default=2.0)
+args = parser.parse_args()
+
+PyATEMMax = importLibrary(args.lib)
+
+print("Polling thread (previous design):")
+measure(PollingEventThread(), args.events, args.interval, args.idle)
+
+print("ATEMMax event thread:")
+measure(SwitcherEventThread(PyATEMMax.ATEMMax()), args.events, args.interval, args.idle)
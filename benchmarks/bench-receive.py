@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""bench-receive.py - PyATEMMax benchmark: initialization payload parsing.
+   Part of the PyATEMMax library.
+
+   Feeds a captured initialization payload (data/init-payload.bin) to the
+   receive path of new switcher objects (socket read, packet header, command
+   parsing and handlers) and reports the bytes parsed per second.
+
+   The datagrams come from an in-memory socket, so no network is involved.
+   Run it with --lib on another checkout to compare two versions."""
+
+# pylint: disable=protected-access
+
+from typing import List, Optional, Tuple
+
+import os
+import time
+
+from benchutils import argumentParser, importLibrary
+from fakeswitcher import SESSION_ID, readPayload
+
+PAYLOAD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "init-payload.bin")
+
+
+class MemorySocket():
+    """Non-blocking UDP socket stand-in returning the payload datagrams"""
+
+    def __init__(self, datagrams: List[bytes]):
+        self._datagrams = list(reversed(datagrams))
+
+    def _next(self) -> bytes:
+        if not self._datagrams:
+            raise BlockingIOError()
+        return self._datagrams.pop()
+
+    def recvfrom(self, _bufsize: int) -> Tuple[bytes, Optional[Tuple[str, int]]]:
+        return self._next(), None
+
+    def recv_into(self, buffer: bytearray) -> int:
+        data = self._next()
+        buffer[:len(data)] = data
+        return len(data)
+
+    def send(self, data: bytes) -> int:
+        return len(data)
+
+
+parser = argumentParser("Initialization payload parsing (bytes/sec)")
+parser.add_argument('-n', '--sessions', help='number of sessions fed with the payload (default: 100)', type=int, default=100)
+parser.add_argument('-p', '--payload', help='payload file (default: data/init-payload.bin)', default=PAYLOAD_FILE)
+args = parser.parse_args()
+
+PyATEMMax = importLibrary(args.lib)
+
+payload = readPayload(args.payload)
+payloadBytes = sum(map(len, payload))
+print(f"Payload: {len(payload)} datagrams, {payloadBytes} bytes ({args.payload})")
+
+# Switchers ready to receive the payload (as if the handshake was done)
+switchers = []
+for _ in range(args.sessions):
+    switcher = PyATEMMax.ATEMMax()
+    switcher._neverConnected = False
+    switcher.switcherAlive = True
+    switcher.sessionID = SESSION_ID
+    switcher._lastContact = time.time()
+    switcher._connTimeout = 3600
+    switcher._missedInitializationPackets = [ 0xFF for _ in range(int((switcher.atem.maxInitPacketCount+7)/8)) ]
+    switcher._udp._socket = MemorySocket(payload)
+    switchers.append(switcher)
+
+start = time.perf_counter()
+for switcher in switchers:
+    switcher._runLoop()
+elapsed = time.perf_counter() - start
+
+for switcher in switchers:
+    if str(switcher.inputProperties[1].longName) != "Camera 1":
+        raise SystemExit("ERROR: the payload was not parsed")
+
+print(f"{args.sessions} sessions in {elapsed:.3f}s: {elapsed / args.sessions * 1000:.2f} ms per payload, " \
+      f"{args.sessions * payloadBytes / elapsed / 1e6:.2f} MB/s parsed")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""bench-sessions.py - PyATEMMax benchmark: fleet-scale sessions.
+   Part of the PyATEMMax library.
+
+   Creates --sessions ATEMMax objects (as a fleet of switchers would) and
+   reports the constructor time and the memory kept (tracemalloc) per session.
+
+   Then connects --connected sessions to the UDP stand-in switcher
+   (fakeswitcher.FakeSwitcher) and reports the memory kept per session with
+   the whole state received, and the time of some state attribute reads."""
+
+from typing import Any, List
+
+import gc
+import time
+import tracemalloc
+
+from benchutils import argumentParser, bestTime, importLibrary
+from fakeswitcher import FakeSwitcher
+
+
+parser = argumentParser("Fleet-scale sessions (constructor time and memory per session)")
+parser.add_argument('-s', '--sessions', help='number of sessions (default: 200)', type=int, default=200)
+parser.add_argument('-c', '--connected', help='number of connected sessions (default: 5)', type=int, default=5)
+parser.add_argument('-n', '--number', help='attribute reads per run (default: 200000)', type=int, default=200000)
+args = parser.parse_args()
+
+PyATEMMax = importLibrary(args.lib)
+PyATEMMax.ATEMMax()     # Warm up (module level tables, caches)
+
+# Constructor time
+sessions: List[Any] = []
+gc.collect()
+start = time.perf_counter()
+for _ in range(args.sessions):
+    sessions.append(PyATEMMax.ATEMMax())
+elapsed = time.perf_counter() - start
+print(f"Constructor: {elapsed / args.sessions * 1e6:9.1f} us/session ({args.sessions} sessions in {elapsed * 1000:.1f}ms)")
+sessions.clear()
+
+# Memory kept per session
+gc.collect()
+tracemalloc.start()
+before = tracemalloc.get_traced_memory()[0]
+for _ in range(args.sessions):
+    sessions.append(PyATEMMax.ATEMMax())
+gc.collect()
+used = tracemalloc.get_traced_memory()[0] - before
+tracemalloc.stop()
+print(f"Memory:      {used / args.sessions / 1024:9.1f} KB/session ({used / 1024 / 1024:.1f} MB for {args.sessions} sessions)")
+sessions.clear()
+
+# Memory kept per connected session (whole state received)
+fakeSwitcher = FakeSwitcher()
+fakeSwitcher.start()
+gc.collect()
+tracemalloc.start()
+before = tracemalloc.get_traced_memory()[0]
+for _ in range(args.connected):
+    switcher = PyATEMMax.ATEMMax()
+    switcher.connect("127.0.0.1")
+    if not switcher.waitForConnection(infinite=False, timeout=10):
+        raise SystemExit("Connection to the stand-in switcher timed out")
+    switcher.disconnect()
+    sessions.append(switcher)
+gc.collect()
+used = tracemalloc.get_traced_memory()[0] - before
+tracemalloc.stop()
+fakeSwitcher.stop()
+print(f"Connected:   {used / args.connected / 1024:9.1f} KB/session ({args.connected} sessions)")
+
+# State attribute reads
+switcher = sessions[0]
+dVE = switcher.key[0][0].dVE
+reads = {
+    'key[0][0].dVE.rotation': lambda: dVE.rotation,
+    'key[0][0].dVE.border.outer.width': lambda: dVE.border.outer.width,
+    'audioMixer.input[1].volume': lambda: switcher.audioMixer.input[1].volume,
+    }
+for name, read in reads.items():
+    print(f"Read {name:34} {bestTime(read, args.number) * 1e9:7.1f} ns")
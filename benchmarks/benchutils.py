@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""benchutils.py - PyATEMMax benchmark helpers.
+   Part of the PyATEMMax library."""
+
+from typing import Any, Callable
+
+import argparse
+import importlib
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def argumentParser(description: str) -> argparse.ArgumentParser:
+    """Get an argument parser with the common benchmark options
+
+    Args:
+        description (str): benchmark description (shown by --help)
+
+    Returns:
+        (argparse.ArgumentParser): parser, with a --lib option
+    """
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('-l', '--lib', help='folder of the PyATEMMax checkout to benchmark (default: this one)', default=ROOT)
+    return parser
+
+
+def importLibrary(lib: str) -> Any:
+    """Import PyATEMMax from a checkout folder
+
+    To compare two versions, run the benchmark against both checkouts, e.g.
+    `git worktree add /tmp/before <commit>` and then `--lib /tmp/before`.
+
+    Args:
+        lib (str): checkout folder (the one with the PyATEMMax package in it)
+
+    Returns:
+        (module): the PyATEMMax package
+    """
+
+    sys.path.insert(0, os.path.abspath(lib))
+    module = importlib.import_module('PyATEMMax')
+    print(f"PyATEMMax from {os.path.dirname(os.path.dirname(os.path.abspath(module.__file__)))}")
+    return module
+
+
+def bestTime(func: Callable[[], Any], number: int, repeat: int =5) -> float:
+    """Get the best time of a call (in seconds) out of several runs
+
+    Args:
+        func (Callable[[], Any]): function to time
+        number (int): calls per run
+        repeat (int, optional): number of runs
+
+    Returns:
+        (float): seconds per call (best run)
+    """
+
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
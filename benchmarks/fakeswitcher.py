@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""fakeswitcher.py - Local stand-in for an ATEM switcher (for benchmarks).
+   Part of the PyATEMMax library.
+
+   Builds the initialization payload of a 2 M/E switcher (topology, input
+   properties, M/E, keyer, multiviewer, media, macro, audio and tally state)
+   as it's sent on the wire, and serves it on UDP (FakeSwitcher) over a
+   lossy link (seeded random datagram loss in both directions).
+
+   python fakeswitcher.py --write data/init-payload.bin
+   (writes the payload used by the receive benchmark)
+
+   python fakeswitcher.py --serve --loss 0.1
+   (serves the payload on 127.0.0.1, losing 10% of the datagrams)"""
+
+from typing import Dict, List, Optional, Tuple
+
+import argparse
+import random
+import socket
+import struct
+import threading
+import time
+
+# Packet header flags
+ACK_REQUEST = 0x01
+HELLO = 0x02
+RESEND = 0x04
+REQUEST_NEXT = 0x08
+ACK = 0x10
+
+HEADER = struct.Struct('!HHHHHH')   # Flags + length, session ID, ack ID, remote ID, unknown, packet ID
+HEADER_LENGTH = HEADER.size
+
+SESSION_ID = 0x8123
+
+# Max datagram size used by the switcher for the initialization payload
+MAX_PACKET_LENGTH = 1420
+
+# UDP port of the switchers (see ATEMProtocol.UDPPort)
+UDP_PORT = 9910
+
+# Packet IDs are 15 bit
+PACKET_ID_MASK = 0x7FFF
+
+# Audio sources of the switcher: inputs, XLR, RCA and media players
+AUDIO_SOURCES = list(range(1, 21)) + [1001, 1201, 2001, 2002]
+
+
+def command(name: str, payload: bytes) -> bytes:
+    """Build a command (header and payload, padded to 4 bytes)"""
+
+    payload = bytes(payload)
+    if len(payload) % 4:
+        payload += bytes(4 - len(payload) % 4)
+    return struct.pack('!HH4s', 8 + len(payload), 0, name.encode()) + payload
+
+
+def initCommands(numInputs: int =40, numMixEffects: int =2) -> List[bytes]:
+    """Build the initialization commands of the switcher (InCm not included)"""
+
+    commands = []
+    commands.append(command('_ver', struct.pack('!HH', 2, 30)))
+    commands.append(command('_pin', b'ATEM Fake Switcher'.ljust(44, b'\0')))
+    commands.append(command('_top', bytes([numMixEffects, numInputs, 2, 6, 2, 1, 1, 1, 0, 1, 0, 0])))
+    for mE in range(numMixEffects):
+        commands.append(command('_MeC', bytes([mE, 4, 0, 0])))
+    commands.append(command('_AMC', bytes([len(AUDIO_SOURCES), 1, 0, 0])))
+
+    for i in range(1, numInputs + 1):
+        data = bytearray(36)
+        struct.pack_into('!H', data, 0, i)
+        data[2:22] = f'Camera {i}'.encode().ljust(20, b'\0')
+        data[22:26] = f'CAM{i}'.encode()[:4].ljust(4, b'\0')
+        data[27] = 1
+        data[34] = 0x1f
+        data[35] = 3
+        commands.append(command('InPr', data))
+
+    for mE in range(numMixEffects):
+        commands.append(command('PrgI', struct.pack('!BxH', mE, 1)))
+        commands.append(command('PrvI', struct.pack('!BxH', mE, 2)))
+        commands.append(command('TrSS', bytes([mE, 0, 1, 0, 1, 0, 0, 0])))
+        commands.append(command('TrPs', struct.pack('!BBBxHxx', mE, 0, 25, 0)))
+        for keyer in range(4):
+            data = bytearray(20)
+            data[0], data[1] = mE, keyer
+            struct.pack_into('!HH', data, 6, 3, 4)
+            commands.append(command('KeBP', data))
+            commands.append(command('KeOn', bytes([mE, keyer, 0, 0])))
+            data = bytearray(60)
+            data[0], data[1] = mE, keyer
+            struct.pack_into('!LLll', data, 4, 500, 500, 1000, -1000)
+            commands.append(command('KeDV', data))
+
+    commands.append(command('SSrc', struct.pack('!HH', 5, 6) + bytes(32)))
+    for box in range(4):
+        commands.append(command('SSBP', bytes([0, box, 1, 0]) + struct.pack('!Hhh', box + 1, 100, -100) + bytes(16)))
+
+    for dsk in range(2):
+        commands.append(command('DskB', struct.pack('!BxHH', dsk, 3, 4)))
+        commands.append(command('DskP', bytes([dsk]) + bytes(19)))
+        commands.append(command('DskS', bytes([dsk, 0, 0, 0, 0, 0, 0, 0])))
+
+    for audioSource in AUDIO_SOURCES:
+        data = bytearray(16)
+        struct.pack_into('!H', data, 0, audioSource)
+        data[2] = 1
+        data[7] = 1
+        data[8] = 1
+        struct.pack_into('!Hh', data, 10, 32768, 0)
+        commands.append(command('AMIP', data))
+
+    for multiViewer in range(2):
+        commands.append(command('MvPr', bytes([multiViewer, 0, 0, 0])))
+        for window in range(10):
+            commands.append(command('MvIn', struct.pack('!BBH', multiViewer, window, window + 1)))
+
+    for colorGenerator in range(2):
+        commands.append(command('ColV', struct.pack('!BxHHH', colorGenerator, 1800, 500, 500)))
+
+    for mediaPlayer in range(2):
+        commands.append(command('MPCE', bytes([mediaPlayer, 1, mediaPlayer, 0])))
+
+    for still in range(20):
+        name = f'Still {still + 1}.png'.encode()
+        commands.append(command('MPfe', bytes([0, 0, 0, still, 1]) + bytes(18) + bytes([len(name)]) + name))
+
+    for macro in range(100):
+        name = f'Macro {macro + 1}'.encode() if macro < 10 else b''
+        commands.append(command('MPrp', bytes([0, macro, 1 if name else 0, 0, 0, len(name), 0, 0]) + name))
+
+    commands.append(command('AuxS', struct.pack('!BxH', 0, 1)))
+    commands.append(command('TlIn', struct.pack('!H', numInputs) + bytes([1, 2] + [0] * (numInputs - 2))))
+    data = struct.pack('!H', numInputs)
+    for i in range(1, numInputs + 1):
+        data += struct.pack('!HB', i, 1 if i == 1 else (2 if i == 2 else 0))
+    commands.append(command('TlSr', data))
+    commands.append(command('Time', bytes([10, 20, 30, 4, 0, 0, 0, 0])))
+
+    return commands
+
+
+def packCommands(commands: List[bytes], maxLength: int =MAX_PACKET_LENGTH) -> List[bytes]:
+    """Group commands in packet payloads (up to maxLength bytes per packet, header included)"""
+
+    payloads, current = [], b''
+    for cmd in commands:
+        if current and len(current) + len(cmd) > maxLength - HEADER_LENGTH:
+            payloads.append(current)
+            current = b''
+        current += cmd
+    if current:
+        payloads.append(current)
+    return payloads
+
+
+def packet(flags: int, payload: bytes =b'', packetId: int =0, ackId: int =0, remoteId: int =0,
+           sessionId: int =SESSION_ID) -> bytes:
+    """Build a packet (header and payload)"""
+
+    length = HEADER_LENGTH + len(payload)
+    return HEADER.pack((flags << 11) | length, sessionId, ackId, remoteId, 0, packetId) + payload
+
+
+def initPayload(numInputs: int =40, numMixEffects: int =2, maxLength: int =MAX_PACKET_LENGTH) -> List[bytes]:
+    """Build the initialization payload datagrams (packet IDs from 1, InCm in the last one)"""
+
+    commands = initCommands(numInputs, numMixEffects) + [ command('InCm', bytes(4)) ]
+    payloads = packCommands(commands, maxLength)
+    return [ packet(ACK_REQUEST, payload, packetId) for packetId, payload in enumerate(payloads, 1) ]
+
+
+def readPayload(path: str) -> List[bytes]:
+    """Read datagrams written by writePayload() (split by the length in their headers)"""
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    datagrams = []
+    offset = 0
+    while offset < len(data):
+        length = HEADER.unpack_from(data, offset)[0] & 0x7FF
+        datagrams.append(data[offset:offset + length])
+        offset += length
+    return datagrams
+
+
+def writePayload(path: str, datagrams: List[bytes]) -> None:
+    """Write datagrams to a file, one after the other"""
+
+    with open(path, 'wb') as f:
+        f.write(b''.join(datagrams))
+
+
+# #######################################################################
+#
+#  UDP stand-in switcher
+#
+
+class FakeSwitcher(threading.Thread):
+    """Stand-in switcher serving one client on UDP (in its own thread)
+
+    - Answers the hello handshake and sends the initialization payload.
+    - Resends the packets asked for with requestNextAfter (flagged RESEND).
+    - Acks the client packets, in order: out of order packets (a previous one
+      was lost) are dropped and the last one in order is acked again, the
+      same way a switcher does. Duplicates are acked and not applied.
+    - Sends an empty keepalive packet every keepAlive seconds.
+
+    Datagrams are lost at random (seeded, so runs can be repeated):
+    `loss` of the ones sent to the client (resends included) and
+    `commandLoss` of the ones received from it.
+
+    Args:
+        ip (str, optional): address to listen on
+        loss (float, optional): ratio of datagrams sent to the client that are lost
+        commandLoss (float, optional): ratio of datagrams received from the client that are lost
+        seed (int, optional): random seed for the losses
+        maxLength (int, optional): max initialization datagram length (smaller: more datagrams)
+        keepAlive (float, optional): seconds between keepalive packets
+    """
+
+    def __init__(self, ip: str ="127.0.0.1", loss: float =0.0, commandLoss: float =0.0, seed: int =1,
+                 maxLength: int =MAX_PACKET_LENGTH, keepAlive: float =0.5):
+        super().__init__(daemon=True)
+
+        self.loss = loss
+        self.commandLoss = commandLoss
+        self.keepAlive = keepAlive
+        self.initPackets = initPayload(maxLength=maxLength)
+
+        # Commands received from the client (in order): (packet ID, command name, command data)
+        self.commands: List[Tuple[int, str, bytes]] = []
+
+        # Counters: datagrams lost (both directions), resend requests received, out of order packets dropped
+        self.lost = 0
+        self.resendRequests = 0
+        self.outOfOrder = 0
+
+        self._random = random.Random(seed)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((ip, UDP_PORT))
+        self._socket.settimeout(0.01)
+        self._running = True
+        self._lock = threading.Lock()
+
+        self._client: Optional[Tuple[str, int]] = None
+        self._sent: Dict[int, bytes] = {}   # Packets sent, by packet ID (for resends)
+        self._packetId = 0                  # Last packet ID sent
+        self._clientPacketId = 0            # Last client packet ID applied
+        self._payloadSent = False
+        self._lastKeepAlive = 0.0
+
+
+    def stop(self) -> None:
+        """Stop the switcher (and close its socket)"""
+
+        self._running = False
+        self.join()
+        self._socket.close()
+
+
+    def send(self, commands: List[bytes]) -> int:
+        """Send a state packet to the client (it can be lost too)
+
+        Args:
+            commands (List[bytes]): commands (see command())
+
+        Returns:
+            (int): packet ID
+        """
+
+        with self._lock:
+            return self._sendPacket(b''.join(commands))
+
+
+    def run(self) -> None:
+        while self._running:
+            if self._payloadSent and time.monotonic() - self._lastKeepAlive > self.keepAlive:
+                with self._lock:
+                    self._sendPacket(b'')
+                self._lastKeepAlive = time.monotonic()
+
+            try:
+                data, address = self._socket.recvfrom(2048)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+
+            with self._lock:
+                self._receive(data, address)
+
+
+    def _receive(self, data: bytes, address: Tuple[str, int]) -> None:
+        """Process a datagram from the client"""
+
+        flags = data[0] >> 3
+        if flags & HELLO:
+            self._client = address
+            self._sent = {}
+            self._packetId = 0
+            self._clientPacketId = 0
+            self._payloadSent = False
+            sessionId = struct.unpack_from('!H', data, 2)[0]
+            self._sendTo(packet(HELLO, bytes([2, 0, 0, 7, 0, 0, 0, 0]), sessionId=sessionId))
+            return
+
+        if self._isLost(self.commandLoss):
+            return
+
+        if flags & ACK and not self._payloadSent and not flags & ACK_REQUEST:
+            # Hello ack: send the initialization payload
+            for datagram in self.initPackets:
+                self._packetId = HEADER.unpack_from(datagram)[5]
+                self._sent[self._packetId] = datagram
+                self._sendTo(datagram, self.loss)
+            self._payloadSent = True
+            self._lastKeepAlive = time.monotonic()
+            return
+
+        if flags & REQUEST_NEXT:
+            self.resendRequests += 1
+            datagram = self._sent.get((HEADER.unpack_from(data)[3] + 1) & PACKET_ID_MASK)
+            if datagram is not None:
+                self._sendTo(bytes([datagram[0] | (RESEND << 3)]) + datagram[1:], self.loss)
+            return
+
+        if flags & ACK_REQUEST:
+            packetId = HEADER.unpack_from(data)[5]
+            if packetId == (self._clientPacketId + 1) & PACKET_ID_MASK:
+                self._clientPacketId = packetId
+                offset = HEADER_LENGTH
+                while offset + 8 <= len(data):
+                    length, _, name = struct.unpack_from('!HH4s', data, offset)
+                    if length < 8:
+                        break
+                    self.commands.append((packetId, name.decode('latin-1'), data[offset + 8:offset + length]))
+                    offset += length
+            elif packetId != self._clientPacketId:
+                self.outOfOrder += 1
+            self._sendTo(packet(ACK, ackId=self._clientPacketId), self.loss)
+
+
+    def _sendPacket(self, payload: bytes) -> int:
+        """Send a new packet to the client (ack requested)"""
+
+        self._packetId = (self._packetId + 1) & PACKET_ID_MASK
+        datagram = packet(ACK_REQUEST, payload, self._packetId)
+        self._sent[self._packetId] = datagram
+        if self._client is not None:
+            self._sendTo(datagram, self.loss)
+        return self._packetId
+
+
+    def _sendTo(self, datagram: bytes, loss: float =0.0) -> None:
+        """Send a datagram to the client (unless it's lost)"""
+
+        if not self._isLost(loss):
+            self._socket.sendto(datagram, self._client)
+
+
+    def _isLost(self, loss: float) -> bool:
+        """Is the next datagram lost?"""
+
+        if loss and self._random.random() < loss:
+            self.lost += 1
+            return True
+        return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for an ATEM switcher")
+    parser.add_argument('-w', '--write', help='write the initialization payload to a file', metavar='FILE')
+    parser.add_argument('-s', '--serve', help='serve the initialization payload on UDP', action='store_true')
+    parser.add_argument('--ip', help='address to listen on (default: 127.0.0.1)', default='127.0.0.1')
+    parser.add_argument('--loss', help='ratio of datagrams lost (default: 0)', type=float, default=0.0)
+    args = parser.parse_args()
+
+    if args.write:
+        written = initPayload()
+        writePayload(args.write, written)
+        print(f"{len(written)} datagrams, {sum(map(len, written))} bytes written to {args.write}")
+    elif args.serve:
+        switcher = FakeSwitcher(args.ip, args.loss, args.loss)
+        switcher.start()
+        print(f"Serving on {args.ip}:{UDP_PORT} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            switcher.stop()
+    else:
+        parser.print_help()
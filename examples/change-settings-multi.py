@@ -41,28 +41,40 @@ if args.program is not None:
 if args.preview is not None:
     print(f"[{time.ctime()}] - PVW Video source: {args.preview} on m/e {args.mixeffect}")
 
-switcher = PyATEMMax.ATEMMax()
-count = 0
+fleet = PyATEMMax.ATEMFleet()
 
-print(f"[{time.ctime()}] Starting settings update")
+print(f"[{time.ctime()}] Connecting to {len(SWITCHERS)} switchers")
+fleet.connect(SWITCHERS)
+fleet.waitForConnection(infinite=False)
+
+connected = [ ip for ip in SWITCHERS if fleet[ip].connected ]
 for ip in SWITCHERS:
-    print(f"[{time.ctime()}] Connecting to {ip}", end="\r")
+    if ip not in connected:
+        print(f"[{time.ctime()}] ERROR: no response from {ip}")
 
-    switcher.connect(ip)
-    if switcher.waitForConnection(infinite=False):
-        if args.mastervolume is not None:
-            switcher.setAudioMixerMasterVolume(args.mastervolume)
+print(f"[{time.ctime()}] Starting settings update")
+updated = { ip: True for ip in connected }
 
-        if args.program is not None:
-            switcher.setProgramInputVideoSource(args.mixeffect, args.program)
+def changeSetting(setter, *setterArgs):
+    results = fleet.apply(setter, *setterArgs, switchers=connected, timeout=2)
+    for ip, confirmed in results.items():
+        updated[ip] = updated[ip] and confirmed
 
-        if args.preview is not None:
-            switcher.setPreviewInputVideoSource(args.mixeffect, args.preview)
+if args.mastervolume is not None:
+    changeSetting("setAudioMixerMasterVolume", args.mastervolume)
 
-        print(f"[{time.ctime()}] Settings updated on {switcher.atemModel} at {ip}")
-        count += 1
+if args.program is not None:
+    changeSetting("setProgramInputVideoSource", args.mixeffect, args.program)
+
+if args.preview is not None:
+    changeSetting("setPreviewInputVideoSource", args.mixeffect, args.preview)
+
+for ip in connected:
+    if updated[ip]:
+        print(f"[{time.ctime()}] Settings updated on {fleet[ip].atemModel} at {ip}")
     else:
-        print(f"[{time.ctime()}] ERROR: no response from {ip}")
-    switcher.disconnect()
+        print(f"[{time.ctime()}] ERROR: settings not confirmed by {ip}")
+
+fleet.disconnect()
 
-print(f"[{time.ctime()}] FINISHED: {count}/{len(SWITCHERS)} switchers updated.")
+print(f"[{time.ctime()}] FINISHED: {sum(updated.values())}/{len(SWITCHERS)} switchers updated.")
@@ -19,25 +19,24 @@ print(f"[{time.ctime()}] Scanning network range {args.range}.* for ATEM switcher
 switcher = PyATEMMax.ATEMMax()
 count = 0
 
-for i in range(1,255):
-    ip = f"{args.range}.{i}"
-    print(f"[{time.ctime()}] Checking {ip}", end="\r")
-
-    switcher.connect(ip)
-    if switcher.waitForConnection(infinite=False, waitForFullHandshake=False):
-        # If the switcher answered the handshake we can wait a bit longer...
-        if switcher.waitForConnection(infinite=False):
-            # Now we have all switcher settings!
-            pvw = switcher.previewInput[args.mixeffect].videoSource
-            pgm = switcher.programInput[args.mixeffect].videoSource
-            pvwName = switcher.inputProperties[pvw].shortName
-            pgmName = switcher.inputProperties[pgm].shortName
-
-            print(f"[{time.ctime()}] {switcher.atemModel} found at {ip}"
-                    f" - Master Volume: {switcher.audioMixer.master.volume}dB"
-                    f" - PVW: {pvwName}"
-                    f" - PGM: {pgmName}" )
-            count += 1
+for found in PyATEMMax.discover(args.range, query=True):
+    if found.bookStatus == 3:
+        print(f"[{time.ctime()}] {found.atemModel or 'ATEM switcher'} found at {found.ip} - fully booked")
+        continue
+
+    switcher.connect(found.ip)
+    if switcher.waitForConnection(infinite=False):
+        # Now we have all switcher settings!
+        pvw = switcher.previewInput[args.mixeffect].videoSource
+        pgm = switcher.programInput[args.mixeffect].videoSource
+        pvwName = switcher.inputProperties[pvw].shortName
+        pgmName = switcher.inputProperties[pgm].shortName
+
+        print(f"[{time.ctime()}] {found.atemModel} ({found.protocolVersion}) found at {found.ip}"
+                f" - Master Volume: {switcher.audioMixer.master.volume}dB"
+                f" - PVW: {pvwName}"
+                f" - PGM: {pgmName}" )
+        count += 1
     switcher.disconnect()
 
 print(f"[{time.ctime()}] FINISHED: {count} ATEM switchers found.")
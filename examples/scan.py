@@ -15,17 +15,9 @@ args = parser.parse_args()
 
 print(f"[{time.ctime()}] Scanning network range {args.range}.* for ATEM switchers")
 
-switcher = PyATEMMax.ATEMMax()
-count = 0
+switchers = PyATEMMax.discover(args.range)
 
-for i in range(1,255):
-    ip = f"{args.range}.{i}"
-    print(f"[{time.ctime()}] Checking {ip}", end="\r")
+for switcher in switchers:
+    print(f"[{time.ctime()}] ATEM switcher found at {switcher.ip}")
 
-    switcher.ping(ip)
-    if switcher.waitForConnection():
-        print(f"[{time.ctime()}] ATEM switcher found at {ip}")
-        count += 1
-    switcher.disconnect()
-
-print(f"[{time.ctime()}] FINISHED: {count} ATEM switchers found.")
+print(f"[{time.ctime()}] FINISHED: {len(switchers)} ATEM switchers found.")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""generate-setter-declarations.py - PyATEMMax development script.
+   Part of the PyATEMMax library.
+
+   Writes PyATEMMax/ATEMSetterDeclarations.py (signatures and docstrings of
+   the setters compiled from ATEMSetterLayouts, for linters and IDEs).
+   Run it after changing the setter layouts."""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PyATEMMax.ATEMSetterLayouts import setterDeclarations   # pylint: disable=wrong-import-position
+
+OUTPUT_FILE = os.path.join(ROOT, "PyATEMMax", "ATEMSetterDeclarations.py")
+
+parser = argparse.ArgumentParser()
+parser.add_argument('-c', '--check', help='only check that the file is up to date', action='store_true')
+args = parser.parse_args()
+
+source = setterDeclarations()
+
+current = ""
+if os.path.exists(OUTPUT_FILE):
+    with open(OUTPUT_FILE, encoding='utf-8') as f:
+        current = f.read()
+
+if args.check:
+    if current != source:
+        print(f"{OUTPUT_FILE} is out of date, run {os.path.basename(__file__)}")
+        sys.exit(1)
+    print(f"{OUTPUT_FILE} is up to date")
+    sys.exit(0)
+
+if current == source:
+    print(f"{OUTPUT_FILE} is up to date")
+else:
+    with open(OUTPUT_FILE, "w", encoding='utf-8') as f:
+        f.write(source)
+    print(f"{OUTPUT_FILE} written")